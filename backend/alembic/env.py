@@ -22,7 +22,7 @@ from app.models import Base
 # Import all models to ensure they're registered with Base.metadata
 from app.models.deal import DealSource, Category, Deal
 from app.models.user import User, UserKeyword, UserDevice
-from app.models.interaction import Bookmark, Notification
+from app.models.interaction import Bookmark, Notification, NotificationOutbox, NotificationRollup
 from app.models.analytics import PriceHistory, DealStatistics, DealKeyword
 from app.models.crawler import CrawlerRun, CrawlerError, CrawlerState
 from app.models.blacklist import Blacklist
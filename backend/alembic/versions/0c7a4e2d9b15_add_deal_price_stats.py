@@ -0,0 +1,55 @@
+"""Add deal_price_stats for precomputed per-deal price statistics
+
+Revision ID: 0c7a4e2d9b15
+Revises: b6d1e9f3a274
+Create Date: 2026-10-19 19:41:05.226930
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0c7a4e2d9b15'
+down_revision: Union[str, None] = 'b6d1e9f3a274'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'deal_price_stats',
+        sa.Column('deal_id', sa.Integer(), nullable=False),
+        sa.Column('min_price', sa.Integer(), nullable=False),
+        sa.Column('max_price', sa.Integer(), nullable=False),
+        sa.Column('price_sum', sa.BigInteger(), nullable=False),
+        sa.Column('record_count', sa.Integer(), nullable=False),
+        sa.Column('last_price', sa.Integer(), nullable=False),
+        sa.Column('first_recorded_at', sa.DateTime(), nullable=False),
+        sa.Column('last_recorded_at', sa.DateTime(), nullable=False),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(['deal_id'], ['deals.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('deal_id')
+    )
+
+    # Backfill from existing price history
+    op.execute(
+        """
+        INSERT INTO deal_price_stats
+            (deal_id, min_price, max_price, price_sum, record_count, last_price,
+             first_recorded_at, last_recorded_at, created_at, updated_at)
+        SELECT
+            deal_id, MIN(price), MAX(price), SUM(price), COUNT(*),
+            (array_agg(price ORDER BY recorded_at DESC, id DESC))[1],
+            MIN(recorded_at), MAX(recorded_at), NOW(), NOW()
+        FROM price_history
+        GROUP BY deal_id
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('deal_price_stats')
@@ -0,0 +1,78 @@
+"""Add notification outbox table
+
+Revision ID: 3b8e51c0d2a4
+Revises: 067f9f6d5c9a
+Create Date: 2026-10-19 10:12:31.204118
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3b8e51c0d2a4'
+down_revision: Union[str, None] = '067f9f6d5c9a'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    outbox_status = sa.Enum('PENDING', 'DELIVERED', 'FAILED', name='outboxstatus')
+
+    op.create_table(
+        'notification_outbox',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('notification_id', sa.Integer(), nullable=False),
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('deal_id', sa.Integer(), nullable=True),
+        sa.Column('payload', postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+        sa.Column('status', outbox_status, nullable=False),
+        sa.Column('available_at', sa.DateTime(), nullable=False),
+        sa.Column('attempts', sa.Integer(), nullable=False),
+        sa.Column('delivered_at', sa.DateTime(), nullable=True),
+        sa.Column('last_error', sa.Text(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(['notification_id'], ['notifications.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('notification_id')
+    )
+    op.create_index(op.f('ix_notification_outbox_id'), 'notification_outbox', ['id'], unique=False)
+    op.create_index(
+        'idx_notification_outbox_pending',
+        'notification_outbox',
+        ['available_at', 'id'],
+        unique=False,
+        postgresql_where=sa.text("status = 'PENDING'")
+    )
+
+    # Carry over DND-scheduled notifications that were waiting for the old
+    # send_scheduled_notifications sweep.
+    op.execute(
+        """
+        INSERT INTO notification_outbox
+            (notification_id, user_id, deal_id, payload, status, available_at,
+             attempts, created_at, updated_at)
+        SELECT
+            n.id, n.user_id, n.deal_id,
+            jsonb_build_object(
+                'title', n.title,
+                'body', n.body,
+                'data', jsonb_build_object('deal_id', n.deal_id::text, 'type', 'scheduled')
+            ),
+            'PENDING', n.scheduled_for, 0, NOW(), NOW()
+        FROM notifications n
+        WHERE n.status = 'PENDING' AND n.scheduled_for IS NOT NULL
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('idx_notification_outbox_pending', table_name='notification_outbox')
+    op.drop_index(op.f('ix_notification_outbox_id'), table_name='notification_outbox')
+    op.drop_table('notification_outbox')
+    sa.Enum(name='outboxstatus').drop(op.get_bind(), checkfirst=True)
@@ -0,0 +1,133 @@
+"""Partition price_history by month and add daily price rollups
+
+Revision ID: 5e9b3c7d1a68
+Revises: 0c7a4e2d9b15
+Create Date: 2026-10-19 20:26:51.904417
+
+"""
+from datetime import date
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.utils.partitioning import ensure_monthly_partitions, month_start
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5e9b3c7d1a68'
+down_revision: Union[str, None] = '0c7a4e2d9b15'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+OLD_PRICE_HISTORY_INDEXES = [
+    'ix_price_history_id',
+    'ix_price_history_deal_id',
+    'ix_price_history_mall_product_id',
+    'ix_price_history_recorded_at',
+    'idx_price_history_product',
+    'idx_price_history_deal_recorded',
+]
+
+PRICE_HISTORY_COLUMNS = (
+    'id, deal_id, mall_name, mall_product_id, product_name, price, original_price, '
+    'discount_rate, recorded_at, created_at, updated_at'
+)
+
+
+def _price_history_columns():
+    return [
+        sa.Column('id', sa.Integer(), server_default=sa.text("nextval('price_history_id_seq'::regclass)"), nullable=False),
+        sa.Column('deal_id', sa.Integer(), nullable=False),
+        sa.Column('mall_name', sa.String(length=100), nullable=True),
+        sa.Column('mall_product_id', sa.String(length=255), nullable=True),
+        sa.Column('product_name', sa.String(length=500), nullable=True),
+        sa.Column('price', sa.Integer(), nullable=False),
+        sa.Column('original_price', sa.Integer(), nullable=True),
+        sa.Column('discount_rate', sa.Float(), nullable=True),
+        sa.Column('recorded_at', sa.DateTime(), nullable=False),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(['deal_id'], ['deals.id'], ondelete='CASCADE'),
+    ]
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+
+    # Keep the ID sequence alive while the old table is replaced
+    op.execute("ALTER SEQUENCE price_history_id_seq OWNED BY NONE")
+    op.rename_table('price_history', 'price_history_old')
+    op.execute("ALTER TABLE price_history_old DROP CONSTRAINT IF EXISTS price_history_pkey")
+    op.execute("ALTER TABLE price_history_old DROP CONSTRAINT IF EXISTS price_history_deal_id_fkey")
+    for index in OLD_PRICE_HISTORY_INDEXES:
+        op.execute(f"DROP INDEX IF EXISTS {index}")
+
+    op.create_table(
+        'price_history',
+        *_price_history_columns(),
+        sa.PrimaryKeyConstraint('id', 'recorded_at', name='price_history_pkey'),
+        postgresql_partition_by='RANGE (recorded_at)'
+    )
+    op.execute("ALTER SEQUENCE price_history_id_seq OWNED BY price_history.id")
+
+    # Partitions for all existing history plus upcoming months
+    oldest = bind.execute(sa.text("SELECT MIN(recorded_at) FROM price_history_old")).scalar()
+    ensure_monthly_partitions(bind, 'price_history', 3, start=month_start(oldest or date.today()))
+
+    op.execute(
+        f"INSERT INTO price_history ({PRICE_HISTORY_COLUMNS}) "
+        f"SELECT {PRICE_HISTORY_COLUMNS} FROM price_history_old"
+    )
+    op.drop_table('price_history_old')
+
+    op.create_index('idx_price_history_product', 'price_history', ['mall_product_id', 'recorded_at'], unique=False)
+    op.create_index('idx_price_history_deal_recorded', 'price_history', ['deal_id', 'recorded_at'], unique=False)
+
+    op.create_table(
+        'price_history_daily',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('deal_id', sa.Integer(), nullable=False),
+        sa.Column('day', sa.Date(), nullable=False),
+        sa.Column('min_price', sa.Integer(), nullable=False),
+        sa.Column('max_price', sa.Integer(), nullable=False),
+        sa.Column('close_price', sa.Integer(), nullable=False),
+        sa.Column('record_count', sa.Integer(), nullable=False),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(['deal_id'], ['deals.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('deal_id', 'day', name='uq_price_history_daily_deal_day')
+    )
+    op.create_index(op.f('ix_price_history_daily_id'), 'price_history_daily', ['id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_price_history_daily_id'), table_name='price_history_daily')
+    op.drop_table('price_history_daily')
+
+    op.execute("ALTER SEQUENCE price_history_id_seq OWNED BY NONE")
+    op.rename_table('price_history', 'price_history_partitioned')
+    op.execute("ALTER TABLE price_history_partitioned DROP CONSTRAINT IF EXISTS price_history_pkey")
+    op.execute("DROP INDEX IF EXISTS idx_price_history_product")
+    op.execute("DROP INDEX IF EXISTS idx_price_history_deal_recorded")
+
+    op.create_table(
+        'price_history',
+        *_price_history_columns(),
+        sa.PrimaryKeyConstraint('id', name='price_history_pkey')
+    )
+    op.execute("ALTER SEQUENCE price_history_id_seq OWNED BY price_history.id")
+    op.execute(
+        f"INSERT INTO price_history ({PRICE_HISTORY_COLUMNS}) "
+        f"SELECT {PRICE_HISTORY_COLUMNS} FROM price_history_partitioned"
+    )
+    op.drop_table('price_history_partitioned')  # drops its partitions too
+
+    op.create_index(op.f('ix_price_history_id'), 'price_history', ['id'], unique=False)
+    op.create_index(op.f('ix_price_history_deal_id'), 'price_history', ['deal_id'], unique=False)
+    op.create_index(op.f('ix_price_history_mall_product_id'), 'price_history', ['mall_product_id'], unique=False)
+    op.create_index(op.f('ix_price_history_recorded_at'), 'price_history', ['recorded_at'], unique=False)
+    op.create_index('idx_price_history_product', 'price_history', ['mall_product_id', 'recorded_at'], unique=False)
+    op.create_index('idx_price_history_deal_recorded', 'price_history', ['deal_id', 'recorded_at'], unique=False)
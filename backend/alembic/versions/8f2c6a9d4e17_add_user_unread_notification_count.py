@@ -0,0 +1,44 @@
+"""Add denormalized unread notification counter to users
+
+Revision ID: 8f2c6a9d4e17
+Revises: 3b8e51c0d2a4
+Create Date: 2026-10-19 11:02:47.583920
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8f2c6a9d4e17'
+down_revision: Union[str, None] = '3b8e51c0d2a4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        'users',
+        sa.Column('unread_notification_count', sa.Integer(), nullable=False, server_default='0')
+    )
+
+    # Seed counters from existing notifications
+    op.execute(
+        """
+        UPDATE users
+        SET unread_notification_count = counts.unread
+        FROM (
+            SELECT user_id, COUNT(*) AS unread
+            FROM notifications
+            WHERE read_at IS NULL
+            GROUP BY user_id
+        ) AS counts
+        WHERE users.id = counts.user_id
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_column('users', 'unread_notification_count')
@@ -0,0 +1,33 @@
+"""Add deals.canonical_deal_id for near-duplicate clustering
+
+Revision ID: 9a4f2b8e6c31
+Revises: 5e9b3c7d1a68
+Create Date: 2026-10-19 21:08:13.370582
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9a4f2b8e6c31'
+down_revision: Union[str, None] = '5e9b3c7d1a68'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('deals', sa.Column('canonical_deal_id', sa.Integer(), nullable=True))
+    op.create_foreign_key(
+        'deals_canonical_deal_id_fkey', 'deals', 'deals',
+        ['canonical_deal_id'], ['id'], ondelete='SET NULL'
+    )
+    op.create_index(op.f('ix_deals_canonical_deal_id'), 'deals', ['canonical_deal_id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_deals_canonical_deal_id'), table_name='deals')
+    op.drop_constraint('deals_canonical_deal_id_fkey', 'deals', type_='foreignkey')
+    op.drop_column('deals', 'canonical_deal_id')
@@ -0,0 +1,31 @@
+"""Add deals.search_vector for tokenized full-text search
+
+Revision ID: a93d4f6b2c18
+Revises: e5b8c2a7f341
+Create Date: 2026-10-19 16:41:09.227351
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a93d4f6b2c18'
+down_revision: Union[str, None] = 'e5b8c2a7f341'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Filled by crawlers for new deals; run app.tasks.search.backfill_search_vectors
+    # for existing ones before enabling SEARCH_USE_TSVECTOR
+    op.add_column('deals', sa.Column('search_vector', postgresql.TSVECTOR(), nullable=True))
+    op.create_index('idx_deals_search_vector', 'deals', ['search_vector'], unique=False, postgresql_using='gin')
+
+
+def downgrade() -> None:
+    op.drop_index('idx_deals_search_vector', table_name='deals', postgresql_using='gin')
+    op.drop_column('deals', 'search_vector')
@@ -0,0 +1,106 @@
+"""Add deals_archive and let bookmarks outlive archived deals
+
+Revision ID: b2e7d4f19c53
+Revises: 9a4f2b8e6c31
+Create Date: 2026-10-19 22:37:41.518204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b2e7d4f19c53'
+down_revision: Union[str, None] = '9a4f2b8e6c31'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+DEAL_COLUMNS = (
+    "id, source_id, external_id, url, title, content, author, thumbnail_url, "
+    "product_name, mall_name, mall_product_url, mall_product_id, "
+    "price, original_price, discount_rate, price_signal, "
+    "upvotes, downvotes, comment_count, view_count, bookmark_count, hot_score, "
+    "ai_summary, ai_summary_generated_at, comments, comments_fetched_at, "
+    "category_id, canonical_deal_id, is_active, is_blocked, block_reason, "
+    "published_at, expires_at, created_at, updated_at, deleted_at"
+)
+
+
+def upgrade() -> None:
+    op.create_table(
+        'deals_archive',
+        sa.Column('id', sa.Integer(), autoincrement=False, nullable=False),
+        sa.Column('source_id', sa.Integer(), nullable=False),
+        sa.Column('external_id', sa.String(length=255), nullable=False),
+        sa.Column('url', sa.String(length=500), nullable=False),
+        sa.Column('title', sa.Text(), nullable=False),
+        sa.Column('content', sa.Text(), nullable=True),
+        sa.Column('author', sa.String(length=100), nullable=True),
+        sa.Column('thumbnail_url', sa.String(length=500), nullable=True),
+        sa.Column('product_name', sa.String(length=500), nullable=True),
+        sa.Column('mall_name', sa.String(length=100), nullable=True),
+        sa.Column('mall_product_url', sa.String(length=500), nullable=True),
+        sa.Column('mall_product_id', sa.String(length=255), nullable=True),
+        sa.Column('price', sa.Integer(), nullable=True),
+        sa.Column('original_price', sa.Integer(), nullable=True),
+        sa.Column('discount_rate', sa.Float(), nullable=True),
+        sa.Column('price_signal', sa.String(length=20), nullable=True),
+        sa.Column('upvotes', sa.Integer(), nullable=False),
+        sa.Column('downvotes', sa.Integer(), nullable=False),
+        sa.Column('comment_count', sa.Integer(), nullable=False),
+        sa.Column('view_count', sa.Integer(), nullable=False),
+        sa.Column('bookmark_count', sa.Integer(), nullable=False),
+        sa.Column('hot_score', sa.Float(), nullable=False),
+        sa.Column('ai_summary', sa.Text(), nullable=True),
+        sa.Column('ai_summary_generated_at', sa.DateTime(), nullable=True),
+        sa.Column('comments', sa.JSON(), nullable=True),
+        sa.Column('comments_fetched_at', sa.DateTime(), nullable=True),
+        sa.Column('category_id', sa.Integer(), nullable=True),
+        sa.Column('canonical_deal_id', sa.Integer(), nullable=True),
+        sa.Column('is_active', sa.Boolean(), nullable=False),
+        sa.Column('is_blocked', sa.Boolean(), nullable=False),
+        sa.Column('block_reason', sa.String(length=255), nullable=True),
+        sa.Column('published_at', sa.DateTime(), nullable=False),
+        sa.Column('expires_at', sa.DateTime(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(), nullable=False),
+        sa.Column('deleted_at', sa.DateTime(), nullable=True),
+        sa.Column('archived_at', sa.DateTime(), nullable=False),
+        sa.Column('keywords', postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+        sa.Column('statistics', postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+        sa.Column('price_points', postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+        sa.Column('price_stats', postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+        sa.ForeignKeyConstraint(['category_id'], ['categories.id'], ),
+        sa.ForeignKeyConstraint(['source_id'], ['deal_sources.id'], ),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_deals_archive_archived_at'), 'deals_archive', ['archived_at'], unique=False)
+    op.create_index('idx_deals_archive_source_external', 'deals_archive', ['source_id', 'external_id'], unique=False)
+
+    # Bookmarks keep pointing at deals moved to the archive
+    op.drop_constraint('bookmarks_deal_id_fkey', 'bookmarks', type_='foreignkey')
+
+
+def downgrade() -> None:
+    # Move archived deals back (their child rows were not kept as rows),
+    # then drop bookmarks of deals that no longer exist anywhere
+    op.execute(
+        f"""
+        INSERT INTO deals ({DEAL_COLUMNS})
+        SELECT {DEAL_COLUMNS} FROM deals_archive
+        ON CONFLICT (id) DO NOTHING
+        """
+    )
+    op.execute("DELETE FROM bookmarks b WHERE NOT EXISTS (SELECT 1 FROM deals d WHERE d.id = b.deal_id)")
+    op.create_foreign_key(
+        'bookmarks_deal_id_fkey', 'bookmarks', 'deals',
+        ['deal_id'], ['id'], ondelete='CASCADE'
+    )
+
+    op.drop_index('idx_deals_archive_source_external', table_name='deals_archive')
+    op.drop_index(op.f('ix_deals_archive_archived_at'), table_name='deals_archive')
+    op.drop_table('deals_archive')
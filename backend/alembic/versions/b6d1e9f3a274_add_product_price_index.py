@@ -0,0 +1,75 @@
+"""Add product_price_index for product-level price signals
+
+Revision ID: b6d1e9f3a274
+Revises: f2c8e6a41d97
+Create Date: 2026-10-19 19:03:27.841265
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b6d1e9f3a274'
+down_revision: Union[str, None] = 'f2c8e6a41d97'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Mirrors app.services.price product keys (PRODUCT_NAME_PATTERN, PRODUCT_NAME_MIN_LENGTH)
+NORMALIZED_NAME = "regexp_replace(lower(product_name), '[^0-9a-z가-힣]+', '', 'g')"
+
+
+def upgrade() -> None:
+    op.create_table(
+        'product_price_index',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('product_key', sa.String(length=600), nullable=False),
+        sa.Column('min_price', sa.Integer(), nullable=False),
+        sa.Column('max_price', sa.Integer(), nullable=False),
+        sa.Column('price_sum', sa.BigInteger(), nullable=False),
+        sa.Column('record_count', sa.Integer(), nullable=False),
+        sa.Column('last_price', sa.Integer(), nullable=False),
+        sa.Column('window_start', sa.DateTime(), nullable=False),
+        sa.Column('last_recorded_at', sa.DateTime(), nullable=False),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('product_key')
+    )
+    op.create_index(op.f('ix_product_price_index_id'), 'product_price_index', ['id'], unique=False)
+    op.create_index(op.f('ix_product_price_index_window_start'), 'product_price_index', ['window_start'], unique=False)
+
+    # Backfill from the last 90 days of price history
+    op.execute(
+        f"""
+        INSERT INTO product_price_index
+            (product_key, min_price, max_price, price_sum, record_count, last_price,
+             window_start, last_recorded_at, created_at, updated_at)
+        SELECT
+            product_key, MIN(price), MAX(price), SUM(price), COUNT(*),
+            (array_agg(price ORDER BY recorded_at DESC))[1],
+            MIN(recorded_at), MAX(recorded_at), NOW(), NOW()
+        FROM (
+            SELECT concat('mall:', coalesce(mall_name, ''), ':', mall_product_id) AS product_key,
+                   price, recorded_at
+            FROM price_history
+            WHERE recorded_at >= NOW() - INTERVAL '90 days'
+              AND mall_product_id IS NOT NULL AND mall_product_id != ''
+            UNION ALL
+            SELECT concat('name:', {NORMALIZED_NAME}) AS product_key, price, recorded_at
+            FROM price_history
+            WHERE recorded_at >= NOW() - INTERVAL '90 days'
+              AND length({NORMALIZED_NAME}) >= 4
+        ) keyed
+        GROUP BY product_key
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_product_price_index_window_start'), table_name='product_price_index')
+    op.drop_index(op.f('ix_product_price_index_id'), table_name='product_price_index')
+    op.drop_table('product_price_index')
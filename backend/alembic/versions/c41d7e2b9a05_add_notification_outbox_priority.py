@@ -0,0 +1,45 @@
+"""Add priority lanes to notification outbox
+
+Revision ID: c41d7e2b9a05
+Revises: 8f2c6a9d4e17
+Create Date: 2026-10-19 11:48:05.917342
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c41d7e2b9a05'
+down_revision: Union[str, None] = '8f2c6a9d4e17'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        'notification_outbox',
+        sa.Column('priority', sa.SmallInteger(), nullable=False, server_default='1')
+    )
+    op.drop_index('idx_notification_outbox_pending', table_name='notification_outbox')
+    op.create_index(
+        'idx_notification_outbox_pending',
+        'notification_outbox',
+        ['priority', 'available_at', 'id'],
+        unique=False,
+        postgresql_where=sa.text("status = 'PENDING'")
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('idx_notification_outbox_pending', table_name='notification_outbox')
+    op.create_index(
+        'idx_notification_outbox_pending',
+        'notification_outbox',
+        ['available_at', 'id'],
+        unique=False,
+        postgresql_where=sa.text("status = 'PENDING'")
+    )
+    op.drop_column('notification_outbox', 'priority')
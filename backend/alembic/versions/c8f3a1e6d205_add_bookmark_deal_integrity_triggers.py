@@ -0,0 +1,35 @@
+"""Enforce bookmarks.deal_id against deals and deals_archive with triggers
+
+Revision ID: c8f3a1e6d205
+Revises: b2e7d4f19c53
+Create Date: 2026-10-20 10:14:32.871406
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+from app.utils.deal_references import drop_bookmark_triggers, ensure_bookmark_triggers
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c8f3a1e6d205'
+down_revision: Union[str, None] = 'b2e7d4f19c53'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Bookmarks orphaned while deal_id had no constraint at all
+    op.execute(
+        """
+        DELETE FROM bookmarks b
+        WHERE NOT EXISTS (SELECT 1 FROM deals d WHERE d.id = b.deal_id)
+          AND NOT EXISTS (SELECT 1 FROM deals_archive a WHERE a.id = b.deal_id)
+        """
+    )
+    ensure_bookmark_triggers(op.get_bind())
+
+
+def downgrade() -> None:
+    drop_bookmark_triggers(op.get_bind())
@@ -0,0 +1,171 @@
+"""Partition notifications by month and add notification rollups
+
+Revision ID: d7a3f9e14b62
+Revises: c41d7e2b9a05
+Create Date: 2026-10-19 13:02:44.381906
+
+"""
+from datetime import date
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from app.utils.partitioning import ensure_monthly_partitions, month_start
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd7a3f9e14b62'
+down_revision: Union[str, None] = 'c41d7e2b9a05'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+OLD_NOTIFICATION_INDEXES = [
+    'ix_notifications_id',
+    'ix_notifications_user_id',
+    'ix_notifications_deal_id',
+    'ix_notifications_status',
+    'idx_notifications_user_created',
+    'idx_notifications_status_created',
+    'idx_notifications_scheduled',
+    'idx_notifications_pending',
+]
+
+NOTIFICATION_COLUMNS = (
+    'id, user_id, deal_id, title, body, matched_keywords, status, scheduled_for, '
+    'read_at, sent_at, delivered_at, clicked_at, error_message, push_response, '
+    'created_at, updated_at'
+)
+
+
+def _notification_columns():
+    return [
+        sa.Column('id', sa.Integer(), server_default=sa.text("nextval('notifications_id_seq'::regclass)"), nullable=False),
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('deal_id', sa.Integer(), nullable=True),
+        sa.Column('title', sa.String(length=255), nullable=False),
+        sa.Column('body', sa.Text(), nullable=False),
+        sa.Column('matched_keywords', postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+        sa.Column('status', postgresql.ENUM(name='notificationstatus', create_type=False), nullable=False),
+        sa.Column('scheduled_for', sa.DateTime(), nullable=True),
+        sa.Column('read_at', sa.DateTime(), nullable=True),
+        sa.Column('sent_at', sa.DateTime(), nullable=True),
+        sa.Column('delivered_at', sa.DateTime(), nullable=True),
+        sa.Column('clicked_at', sa.DateTime(), nullable=True),
+        sa.Column('error_message', sa.Text(), nullable=True),
+        sa.Column('push_response', postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(['deal_id'], ['deals.id'], ondelete='SET NULL'),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+    ]
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+
+    # Outbox rows can no longer reference notifications.id (the partitioned
+    # key includes created_at); per-deal dedupe moves to the outbox.
+    op.drop_constraint('notification_outbox_notification_id_fkey', 'notification_outbox', type_='foreignkey')
+    op.create_unique_constraint(
+        'uq_notification_outbox_user_deal', 'notification_outbox', ['user_id', 'deal_id']
+    )
+
+    # Keep the ID sequence alive while the old table is replaced
+    op.execute("ALTER SEQUENCE notifications_id_seq OWNED BY NONE")
+    op.rename_table('notifications', 'notifications_old')
+    op.execute("ALTER TABLE notifications_old DROP CONSTRAINT IF EXISTS notifications_pkey")
+    for index in OLD_NOTIFICATION_INDEXES:
+        op.execute(f"DROP INDEX IF EXISTS {index}")
+
+    op.create_table(
+        'notifications',
+        *_notification_columns(),
+        sa.PrimaryKeyConstraint('id', 'created_at', name='notifications_pkey'),
+        postgresql_partition_by='RANGE (created_at)'
+    )
+    op.execute("ALTER SEQUENCE notifications_id_seq OWNED BY notifications.id")
+
+    # Partitions for all existing history plus upcoming months
+    oldest = bind.execute(sa.text("SELECT MIN(created_at) FROM notifications_old")).scalar()
+    ensure_monthly_partitions(bind, 'notifications', 3, start=month_start(oldest or date.today()))
+
+    op.execute(
+        f"INSERT INTO notifications ({NOTIFICATION_COLUMNS}) "
+        f"SELECT {NOTIFICATION_COLUMNS} FROM notifications_old"
+    )
+    op.drop_table('notifications_old')
+
+    op.create_index('idx_notifications_user_created', 'notifications', ['user_id', 'created_at'], unique=False)
+    op.create_index(op.f('ix_notifications_deal_id'), 'notifications', ['deal_id'], unique=False)
+
+    # Outbox rows share created_at with their notification (partition pruning
+    # in the dispatcher and retention both rely on it)
+    op.execute(
+        """
+        UPDATE notification_outbox o
+        SET created_at = n.created_at
+        FROM notifications n
+        WHERE n.id = o.notification_id AND o.created_at <> n.created_at
+        """
+    )
+
+    op.create_table(
+        'notification_rollups',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('month', sa.Date(), nullable=False),
+        sa.Column('keyword', sa.String(length=100), nullable=True),
+        sa.Column('total_count', sa.Integer(), nullable=False),
+        sa.Column('sent_count', sa.Integer(), nullable=False),
+        sa.Column('read_count', sa.Integer(), nullable=False),
+        sa.Column('clicked_count', sa.Integer(), nullable=False),
+        sa.Column('failed_count', sa.Integer(), nullable=False),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_notification_rollups_id'), 'notification_rollups', ['id'], unique=False)
+    op.create_index('idx_notification_rollups_user_month', 'notification_rollups', ['user_id', 'month'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('idx_notification_rollups_user_month', table_name='notification_rollups')
+    op.drop_index(op.f('ix_notification_rollups_id'), table_name='notification_rollups')
+    op.drop_table('notification_rollups')
+
+    op.execute("ALTER SEQUENCE notifications_id_seq OWNED BY NONE")
+    op.rename_table('notifications', 'notifications_partitioned')
+    op.execute("ALTER TABLE notifications_partitioned DROP CONSTRAINT IF EXISTS notifications_pkey")
+    op.execute("DROP INDEX IF EXISTS idx_notifications_user_created")
+    op.execute("DROP INDEX IF EXISTS ix_notifications_deal_id")
+
+    op.create_table(
+        'notifications',
+        *_notification_columns(),
+        sa.PrimaryKeyConstraint('id', name='notifications_pkey')
+    )
+    op.execute("ALTER SEQUENCE notifications_id_seq OWNED BY notifications.id")
+    op.execute(
+        f"INSERT INTO notifications ({NOTIFICATION_COLUMNS}) "
+        f"SELECT {NOTIFICATION_COLUMNS} FROM notifications_partitioned"
+    )
+    op.drop_table('notifications_partitioned')  # drops its partitions too
+
+    op.create_index(op.f('ix_notifications_id'), 'notifications', ['id'], unique=False)
+    op.create_index(op.f('ix_notifications_user_id'), 'notifications', ['user_id'], unique=False)
+    op.create_index(op.f('ix_notifications_deal_id'), 'notifications', ['deal_id'], unique=False)
+    op.create_index(op.f('ix_notifications_status'), 'notifications', ['status'], unique=False)
+    op.create_index('idx_notifications_user_created', 'notifications', ['user_id', 'created_at'], unique=False)
+    op.create_index('idx_notifications_status_created', 'notifications', ['status', 'created_at'], unique=False)
+    op.create_index('idx_notifications_scheduled', 'notifications', ['status', 'scheduled_for'], unique=False)
+    op.create_unique_constraint('uq_notification_user_deal', 'notifications', ['user_id', 'deal_id'])
+
+    op.drop_constraint('uq_notification_outbox_user_deal', 'notification_outbox', type_='unique')
+    op.create_foreign_key(
+        'notification_outbox_notification_id_fkey', 'notification_outbox', 'notifications',
+        ['notification_id'], ['id'], ondelete='CASCADE'
+    )
@@ -0,0 +1,38 @@
+"""Add keyset pagination indexes on deals
+
+Revision ID: e5b8c2a7f341
+Revises: d7a3f9e14b62
+Create Date: 2026-10-19 15:20:37.518204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5b8c2a7f341'
+down_revision: Union[str, None] = 'd7a3f9e14b62'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+FEED_PREDICATE = "is_active = true AND is_blocked = false AND deleted_at IS NULL"
+SORT_KEYS = ['hot_score', 'published_at', 'price', 'bookmark_count']
+
+
+def upgrade() -> None:
+    for key in SORT_KEYS:
+        op.create_index(
+            f'idx_deals_keyset_{key}',
+            'deals',
+            [key, 'id'],
+            unique=False,
+            postgresql_where=sa.text(FEED_PREDICATE)
+        )
+
+
+def downgrade() -> None:
+    for key in SORT_KEYS:
+        op.drop_index(f'idx_deals_keyset_{key}', table_name='deals')
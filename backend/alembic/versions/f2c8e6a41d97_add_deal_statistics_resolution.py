@@ -0,0 +1,28 @@
+"""Add deal_statistics.resolution for engagement snapshot rollups
+
+Revision ID: f2c8e6a41d97
+Revises: a93d4f6b2c18
+Create Date: 2026-10-19 18:12:44.503118
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f2c8e6a41d97'
+down_revision: Union[str, None] = 'a93d4f6b2c18'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('deal_statistics', sa.Column('resolution', sa.String(length=10), server_default='raw', nullable=False))
+    op.create_index('idx_deal_stats_resolution_snapshot', 'deal_statistics', ['resolution', 'snapshot_at'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('idx_deal_stats_resolution_snapshot', table_name='deal_statistics')
+    op.drop_column('deal_statistics', 'resolution')
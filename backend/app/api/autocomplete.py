@@ -0,0 +1,43 @@
+"""
+Autocomplete API endpoint.
+Suggests popular keywords while the user types, for deal search and for
+registering notification keywords.
+"""
+from fastapi import APIRouter, Query
+
+from app.schemas.deal import AutocompleteResponse, AutocompleteSuggestion
+from app.services.autocomplete import AutocompleteService
+
+
+router = APIRouter(prefix="/api/v1/autocomplete", tags=["autocomplete"])
+
+
+@router.get(
+    "",
+    response_model=AutocompleteResponse,
+    summary="Suggest keywords for a prefix"
+)
+def autocomplete(
+    q: str = Query(..., min_length=1, max_length=50, description="Typed prefix"),
+    limit: int = Query(10, ge=1, le=20, description="Maximum suggestions")
+):
+    """
+    Suggest keywords starting with the typed text, most popular first.
+
+    Suggestions come from a Redis prefix index over deal keywords (weighted
+    by how many recent deals mention them) and registered user keywords
+    (weighted by how many users follow them). The database is never
+    queried, so this is safe to call on every keystroke.
+
+    - **q**: Typed prefix (case-insensitive)
+    - **limit**: Maximum suggestions (default: 10, max: 20)
+    """
+    suggestions = AutocompleteService.suggest(q, limit)
+
+    return AutocompleteResponse(
+        query=q,
+        suggestions=[
+            AutocompleteSuggestion(term=term, weight=weight)
+            for term, weight in suggestions
+        ]
+    )
@@ -12,9 +12,10 @@ from app.schemas.interaction import (
     BookmarkResponse,
     BookmarkListResponse
 )
-from app.schemas.deal import DealResponse
+from app.services.deal_cards import DealCardService
 from app.services.bookmark import BookmarkService
 from app.utils.auth import get_current_user
+from app.utils.read_routing import get_read_db
 
 
 router = APIRouter(prefix="/api/v1/bookmarks", tags=["bookmarks"])
@@ -69,7 +70,7 @@ def get_bookmarks(
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(20, ge=1, le=100, description="Items per page"),
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
 ):
     """
     Get paginated bookmarks for the authenticated user.
@@ -101,9 +102,10 @@ def get_bookmarks(
             "created_at": bookmark.created_at
         }
 
-        # Include deal information if available
-        if bookmark.deal:
-            bookmark_dict["deal"] = DealResponse.model_validate(bookmark.deal).model_dump()
+        # Include deal information if available (archived deals included)
+        deal = bookmark.deal or result["archived_deals"].get(bookmark.deal_id)
+        if deal:
+            bookmark_dict["deal"] = DealCardService.from_deal(deal)
 
         bookmarks_with_deals.append(BookmarkResponse(**bookmark_dict))
 
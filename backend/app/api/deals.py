@@ -1,32 +1,56 @@
 """
 Deal API endpoints.
 Provides endpoints for listing, searching, and viewing deals.
+
+Endpoints use sync sessions and are declared with plain `def`, so FastAPI
+runs them in its threadpool and a slow query never blocks the event loop.
+All of them are read-only and read from the replica (get_read_db).
 """
-from typing import List, Optional
+from typing import List, Optional, Set
 from datetime import datetime, timedelta
-from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import desc, asc, func, or_, text
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from sqlalchemy.orm import Session, joinedload, load_only, undefer
+from sqlalchemy import func, or_, text
 from math import ceil
 
-from app.models.database import get_db
-from app.models.deal import Deal, DealSource, Category
+from app.models.deal import Deal
 from app.models.analytics import PriceHistory
 from app.models.user import User
 from app.schemas.deal import (
-    DealResponse,
     DealListResponse,
     DealDetailResponse,
+    DealBatchResponse,
+    RisingDealsResponse,
     DealSourceResponse,
     CategoryResponse,
+    CategoryTreeNode,
+    PriceHistoryResponse,
     PriceHistoryWithStats,
     PriceStatistics,
     AISummaryResponse
 )
 from app.services.bookmark import BookmarkService
+from app.services.deal_statistics import DealStatisticsService
 from app.services.price import PriceService
+from app.services.price_retention import PriceHistoryRetentionService
 from app.services.ai_summary import AISummaryService
+from app.services.archive import DealArchiveService
+from app.services.deal_cards import (
+    DealCardService,
+    InvalidFieldsError,
+    DEAL_FIELDS,
+    DETAIL_FIELDS,
+    CARD_FIELDS,
+    dumps,
+    parse_fields
+)
+from app.services.feed_cache import HotFeedCache
+from app.services.reference_cache import ReferenceCache
+from app.services.response_cache import ResponseCache, FEED_TAG, deal_tag, list_tags
+from app.services.search import DealSearchService
 from app.utils.auth import get_current_user_optional
+from app.utils.pagination import keyset_paginate, InvalidCursorError
+from app.utils.read_routing import get_read_db
 from app.tasks.ai_summary import generate_deal_summary
 from app.config import settings
 
@@ -38,65 +62,132 @@ router = APIRouter(prefix="/api/v1", tags=["deals"])
 # ============================================================================
 
 @router.get("/deals", response_model=DealListResponse)
-async def get_deals(
+def get_deals(
+    request: Request,
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(20, ge=1, le=100, description="Items per page"),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page (overrides page)"),
+    include_total: Optional[bool] = Query(None, description="Count all matching deals (default: only for page requests)"),
     source_id: Optional[int] = Query(None, description="Filter by deal source ID"),
     category_id: Optional[int] = Query(None, description="Filter by category ID"),
     sort_by: str = Query("hot_score", regex="^(hot_score|published_at|price|bookmark_count)$", description="Sort field"),
     order: str = Query("desc", regex="^(asc|desc)$", description="Sort order"),
-    db: Session = Depends(get_db)
+    fields: Optional[str] = Query(None, description="Comma-separated deal fields to return (default: full card)"),
+    db: Session = Depends(get_read_db)
 ):
     """
     Get paginated list of deals.
 
     - **page**: Page number (default: 1)
     - **page_size**: Number of items per page (default: 20, max: 100)
+    - **cursor**: Keyset cursor from the previous response's next_cursor;
+      every page costs the same regardless of depth
+    - **include_total**: Also return total/total_pages (default: true for
+      page requests, false for cursor requests)
     - **source_id**: Filter by deal source (optional)
     - **category_id**: Filter by category (optional)
     - **sort_by**: Sort by field (hot_score, published_at, price, bookmark_count)
     - **order**: Sort order (asc, desc)
+    - **fields**: Sparse fieldset, e.g. `title,price,thumbnail_url,source`;
+      only these columns are read and returned (id is always included).
+      content is null in list cards unless requested here
+
+    Responses are cached per query and invalidated when crawlers write
+    deals; send If-None-Match to revalidate. On a miss, the default view
+    (hot_score desc, optionally one source or category) is served from the
+    Redis hot feed; other orderings and deep pages query the database.
     """
-    # Base query with filters
-    query = db.query(Deal).options(
-        joinedload(Deal.source),
-        joinedload(Deal.category)
-    ).filter(
+    selected = _parse_fields(fields, DEAL_FIELDS)
+
+    return ResponseCache.respond(
+        request,
+        tags=list_tags(source_id),
+        render=lambda: _render_deal_list(
+            db, page, page_size, cursor, include_total, source_id, category_id, sort_by, order, selected
+        )
+    )
+
+
+def _parse_fields(fields: Optional[str], allowed: List[str]) -> Optional[List[str]]:
+    """Parse a fields query parameter, rejecting unknown fields with 400."""
+    try:
+        return parse_fields(fields, allowed)
+    except InvalidFieldsError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+def _render_deal_list(
+    db: Session,
+    page: int,
+    page_size: int,
+    cursor: Optional[str],
+    include_total: Optional[bool],
+    source_id: Optional[int],
+    category_id: Optional[int],
+    sort_by: str,
+    order: str,
+    fields: Optional[List[str]] = None
+) -> str:
+    """Render one page of the deal list as DealListResponse JSON."""
+    if sort_by == "hot_score" and order == "desc" and not (source_id and category_id):
+        cached = HotFeedCache.get_page(
+            db,
+            source_id=source_id,
+            category_id=category_id,
+            page=page,
+            page_size=page_size,
+            cursor=cursor,
+            include_total=include_total if include_total is not None else cursor is None,
+            fields=fields
+        )
+        if cached is not None:
+            return cached
+
+    # Base filters
+    filters = [
         Deal.is_active == True,
         Deal.is_blocked == False,
         Deal.deleted_at == None
-    )
+    ]
 
-    # Apply filters
+    # Apply filters (outside one source's list, duplicates collapse into
+    # their canonical deal)
     if source_id:
-        query = query.filter(Deal.source_id == source_id)
+        filters.append(Deal.source_id == source_id)
+    else:
+        filters.append(Deal.canonical_deal_id == None)
 
     if category_id:
-        query = query.filter(Deal.category_id == category_id)
+        filters.append(Deal.category_id == category_id)
 
-    # Get total count before pagination
-    total = query.count()
+    # Count only when asked (always for legacy page requests by default)
+    count_total = include_total if include_total is not None else cursor is None
+    total = db.query(func.count(Deal.id)).filter(*filters).scalar() if count_total else None
 
-    # Apply sorting
+    # Keyset pagination on (sort_by, id) over projected card columns;
+    # page numbers fall back to OFFSET
     sort_column = getattr(Deal, sort_by)
-    if order == "desc":
-        query = query.order_by(desc(sort_column))
-    else:
-        query = query.order_by(asc(sort_column))
-
-    # Apply pagination
-    offset = (page - 1) * page_size
-    deals = query.offset(offset).limit(page_size).all()
-
-    # Calculate total pages
-    total_pages = ceil(total / page_size) if total > 0 else 0
+    try:
+        rows, next_cursor = keyset_paginate(
+            DealCardService.query(db, fields, extra_columns=[sort_column]).filter(*filters),
+            sort_by=sort_by,
+            sort_column=sort_column,
+            id_column=Deal.id,
+            order=order,
+            page_size=page_size,
+            cursor=cursor,
+            offset=(page - 1) * page_size
+        )
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
-    return DealListResponse(
-        deals=deals,
+    return DealCardService.list_payload(
+        [DealCardService.from_row(row, fields) for row in rows],
         total=total,
-        page=page,
+        page=None if cursor else page,
         page_size=page_size,
-        total_pages=total_pages
+        total_pages=(ceil(total / page_size) if total > 0 else 0) if total is not None else None,
+        next_cursor=next_cursor
     )
 
 
@@ -106,74 +197,239 @@ async def get_deals(
 # NOTE: This must come BEFORE the /deals/{deal_id} endpoint to avoid route conflicts
 
 @router.get("/deals/search", response_model=DealListResponse)
-async def search_deals(
+def search_deals(
+    request: Request,
     keyword: str = Query(..., min_length=2, description="Search keyword"),
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(20, ge=1, le=100, description="Items per page"),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page (overrides page)"),
+    include_total: Optional[bool] = Query(None, description="Count all matching deals (default: only for page requests)"),
     source_id: Optional[int] = Query(None, description="Filter by deal source ID"),
     category_id: Optional[int] = Query(None, description="Filter by category ID"),
-    db: Session = Depends(get_db)
+    fields: Optional[str] = Query(None, description="Comma-separated deal fields to return (default: full card)"),
+    db: Session = Depends(get_read_db)
 ):
     """
-    Search deals by keyword using PostgreSQL full-text search with pg_trgm.
+    Search deals by keyword, ranked by relevance × recency × hotness.
+
+    Candidates match by pg_trgm word similarity or substring (or the
+    tokenized search_vector when SEARCH_USE_TSVECTOR is on); only the top
+    SEARCH_MAX_RESULTS are ranked.
 
     - **keyword**: Search keyword (min 2 characters)
     - **page**: Page number (default: 1)
     - **page_size**: Number of items per page (default: 20, max: 100)
+    - **cursor**: Cursor from the previous response's next_cursor
+    - **include_total**: Also return total/total_pages, capped at
+      SEARCH_MAX_RESULTS (default: true for page requests, false for cursor
+      requests)
     - **source_id**: Filter by deal source (optional)
     - **category_id**: Filter by category (optional)
+    - **fields**: Sparse fieldset (see GET /deals)
     """
-    # Base query with LIKE-based search for Korean text compatibility
-    query = db.query(Deal).options(
-        joinedload(Deal.source),
-        joinedload(Deal.category)
-    ).filter(
-        Deal.is_active == True,
-        Deal.is_blocked == False,
-        Deal.deleted_at == None,
-        or_(
-            Deal.title.contains(keyword),  # LIKE %keyword%
-            Deal.product_name.contains(keyword)
+    selected = _parse_fields(fields, DEAL_FIELDS)
+
+    return ResponseCache.respond(
+        request,
+        tags=list_tags(source_id),
+        render=lambda: _render_deal_search(
+            db, keyword, page, page_size, cursor, include_total, source_id, category_id, selected
         )
     )
 
-    # Apply filters
-    if source_id:
-        query = query.filter(Deal.source_id == source_id)
 
-    if category_id:
-        query = query.filter(Deal.category_id == category_id)
+def _render_deal_search(
+    db: Session,
+    keyword: str,
+    page: int,
+    page_size: int,
+    cursor: Optional[str],
+    include_total: Optional[bool],
+    source_id: Optional[int],
+    category_id: Optional[int],
+    fields: Optional[List[str]] = None
+) -> str:
+    """Render one page of ranked search results as DealListResponse JSON."""
+    # Count only when asked (always for legacy page requests by default)
+    count_total = include_total if include_total is not None else cursor is None
+
+    try:
+        cards, total, next_cursor = DealSearchService.search(
+            db,
+            keyword=keyword,
+            page=page,
+            page_size=page_size,
+            cursor=cursor,
+            include_total=count_total,
+            source_id=source_id,
+            category_id=category_id,
+            fields=fields
+        )
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
-    # Get total count before pagination
-    total = query.count()
+    return DealCardService.list_payload(
+        cards,
+        total=total,
+        page=None if cursor else page,
+        page_size=page_size,
+        total_pages=(ceil(total / page_size) if total > 0 else 0) if total is not None else None,
+        next_cursor=next_cursor
+    )
 
-    # Sort by relevance (hot_score as proxy for relevance)
-    query = query.order_by(desc(Deal.hot_score))
 
-    # Apply pagination
-    offset = (page - 1) * page_size
-    deals = query.offset(offset).limit(page_size).all()
+# ============================================================================
+# Rising Deals Endpoint
+# ============================================================================
 
-    # Calculate total pages
-    total_pages = ceil(total / page_size) if total > 0 else 0
+@router.get("/deals/rising", response_model=RisingDealsResponse)
+def get_rising_deals(
+    request: Request,
+    hours: int = Query(6, ge=1, le=72, description="Window to measure engagement growth over"),
+    limit: int = Query(20, ge=1, le=100, description="Maximum deals"),
+    db: Session = Depends(get_read_db)
+):
+    """
+    Get deals heating up fastest: engagement (votes, comments, views)
+    gained per hour over the last `hours`, from engagement snapshots.
 
-    return DealListResponse(
-        deals=deals,
-        total=total,
-        page=page,
-        page_size=page_size,
-        total_pages=total_pages
+    - **hours**: Window length (default: 6, max: 72)
+    - **limit**: Maximum deals (default: 20, max: 100)
+    """
+    return ResponseCache.respond(
+        request,
+        tags=[FEED_TAG],
+        render=lambda: _render_rising_deals(db, hours, limit)
+    )
+
+
+def _render_rising_deals(db: Session, hours: int, limit: int) -> str:
+    """Render rising deals as RisingDealsResponse JSON."""
+    ranked = DealStatisticsService.rising_deals(db, hours=hours, limit=limit)
+    velocities = dict(ranked)
+
+    cards = DealCardService.load_by_ids(db, [deal_id for deal_id, _ in ranked])
+    for card in cards:
+        card["velocity"] = round(velocities[card["id"]], 2)
+
+    return dumps({"deals": cards, "hours": hours})
+
+
+# ============================================================================
+# Batch Lookup Endpoint
+# ============================================================================
+
+BATCH_MAX_IDS = 100
+BATCH_EXTRA_FIELDS = ["price_stats", "is_bookmarked"]
+
+
+@router.get("/deals:batch", response_model=DealBatchResponse)
+def get_deals_batch(
+    request: Request,
+    ids: str = Query(..., description=f"Comma-separated deal IDs (max {BATCH_MAX_IDS})"),
+    fields: Optional[str] = Query(None, description="Comma-separated deal fields to return (default: full card)"),
+    db: Session = Depends(get_read_db),
+    current_user: Optional[User] = Depends(get_current_user_optional)
+):
+    """
+    Get many deals in one request (notification and bookmark lists).
+
+    - **ids**: Comma-separated deal IDs, e.g. `12,7,31` (max 100). Deals are
+      returned in this order; unknown or deleted IDs are listed in missing_ids
+    - **fields**: Sparse fieldset (see GET /deals), plus price_stats and
+      is_bookmarked
+    - If authenticated, includes bookmark status (one query for all deals)
+
+    Deals come from one query and carry price statistics instead of the
+    price history. Responses are cached until one of the deals changes.
+    """
+    deal_ids = _parse_ids(ids)
+    selected = _parse_fields(fields, DEAL_FIELDS + BATCH_EXTRA_FIELDS)
+    extras = BATCH_EXTRA_FIELDS if selected is None else [f for f in BATCH_EXTRA_FIELDS if f in selected]
+
+    bookmarked = set()
+    if current_user and "is_bookmarked" in extras:
+        bookmarked = BookmarkService.get_bookmarked_deal_ids(db, current_user.id, deal_ids)
+
+    return ResponseCache.respond(
+        request,
+        tags=[deal_tag(deal_id) for deal_id in deal_ids],
+        render=lambda: _render_deal_batch(
+            db,
+            deal_ids,
+            bookmarked,
+            None if selected is None else [f for f in selected if f in DEAL_FIELDS],
+            extras
+        ),
+        variant="bookmarked=" + ",".join(str(deal_id) for deal_id in sorted(bookmarked)),
+        vary="Authorization"
     )
 
 
+def _parse_ids(ids: str) -> List[int]:
+    """Parse a comma-separated ID list (deduplicated, order kept), rejecting bad input with 400."""
+    try:
+        deal_ids = list(dict.fromkeys(int(value) for value in ids.split(",") if value.strip()))
+    except ValueError:
+        raise HTTPException(status_code=400, detail="ids must be comma-separated integers")
+
+    if not deal_ids:
+        raise HTTPException(status_code=400, detail="ids must not be empty")
+    if len(deal_ids) > BATCH_MAX_IDS:
+        raise HTTPException(status_code=400, detail=f"At most {BATCH_MAX_IDS} ids per request")
+
+    return deal_ids
+
+
+def _render_deal_batch(
+    db: Session,
+    deal_ids: List[int],
+    bookmarked: Set[int],
+    fields: Optional[List[str]],
+    extras: List[str]
+) -> str:
+    """Render deals in the requested order as DealBatchResponse JSON."""
+    rows = DealCardService.query(db, fields).filter(
+        Deal.id.in_(deal_ids),
+        Deal.deleted_at == None
+    ).all()
+    cards = {row.id: DealCardService.from_row(row, fields) for row in rows}
+
+    stats = PriceService.get_price_statistics_bulk(db, cards.keys()) if "price_stats" in extras else {}
+
+    # Deals moved to the archive (e.g. old bookmarks) render from there
+    archived = DealArchiveService.get_archived_many(db, [deal_id for deal_id in deal_ids if deal_id not in cards])
+    for deal_id, deal in archived.items():
+        cards[deal_id] = DealCardService.from_deal(deal, fields)
+        stats[deal_id] = deal.price_stats
+
+    deals = []
+    for deal_id in deal_ids:
+        card = cards.get(deal_id)
+        if card is None:
+            continue
+        if "price_stats" in extras:
+            card["price_stats"] = stats.get(deal_id)
+        if "is_bookmarked" in extras:
+            card["is_bookmarked"] = deal_id in bookmarked
+        deals.append(card)
+
+    return dumps({
+        "deals": deals,
+        "missing_ids": [deal_id for deal_id in deal_ids if deal_id not in cards],
+    })
+
+
 # ============================================================================
 # Deal Detail Endpoint
 # ============================================================================
 
 @router.get("/deals/{deal_id}", response_model=DealDetailResponse)
-async def get_deal(
+def get_deal(
     deal_id: int,
-    db: Session = Depends(get_db),
+    request: Request,
+    fields: Optional[str] = Query(None, description="Comma-separated deal fields to return (default: all)"),
+    db: Session = Depends(get_read_db),
     current_user: Optional[User] = Depends(get_current_user_optional)
 ):
     """
@@ -181,47 +437,104 @@ async def get_deal(
 
     - **deal_id**: The ID of the deal to retrieve
     - If authenticated, includes bookmark status
+    - **fields**: Sparse fieldset, e.g. `title,price,price_history`; columns,
+      price history and bookmark status are only loaded when requested
+
+    Responses are cached per deal (and bookmark state) until a crawler
+    updates the deal; send If-None-Match to revalidate.
     """
-    deal = db.query(Deal).options(
-        joinedload(Deal.source),
-        joinedload(Deal.category),
-        joinedload(Deal.price_history)
-    ).filter(
+    selected = _parse_fields(fields, DETAIL_FIELDS) or DETAIL_FIELDS
+
+    is_bookmarked = bool(current_user) and "is_bookmarked" in selected and BookmarkService.check_is_bookmarked(
+        db=db,
+        user_id=current_user.id,
+        deal_id=deal_id
+    )
+
+    return ResponseCache.respond(
+        request,
+        tags=[deal_tag(deal_id)],
+        render=lambda: _render_deal_detail(db, deal_id, is_bookmarked, selected),
+        variant=f"bookmarked={int(is_bookmarked)}",
+        vary="Authorization"
+    )
+
+
+def _render_deal_detail(
+    db: Session,
+    deal_id: int,
+    is_bookmarked: bool,
+    fields: List[str] = DETAIL_FIELDS
+) -> str:
+    """Render a deal with its latest 30 price records as DealDetailResponse JSON."""
+    # Only the requested columns (content and ai_summary are deferred on the model)
+    options = [load_only(*[getattr(Deal, field) for field in CARD_FIELDS if field in fields])]
+    if "source" in fields:
+        options.append(joinedload(Deal.source))
+    if "category" in fields:
+        options.append(joinedload(Deal.category))
+
+    deal = db.query(Deal).options(*options).filter(
         Deal.id == deal_id,
         Deal.deleted_at == None
     ).first()
 
     if not deal:
-        raise HTTPException(status_code=404, detail="Deal not found")
+        return _render_archived_deal_detail(db, deal_id, is_bookmarked, fields)
+
+    response = DealCardService.from_deal(deal, fields)
 
-    # Format price history for response
-    price_history = []
-    if deal.price_history:
-        price_history = [
+    if "price_history" in fields:
+        # Latest 30 price records, sorted and limited in SQL
+        history = db.query(PriceHistory).filter(
+            PriceHistory.deal_id == deal_id
+        ).order_by(PriceHistory.recorded_at.desc()).limit(30).all()
+
+        response["price_history"] = [
             {
                 "price": ph.price,
                 "original_price": ph.original_price,
                 "discount_rate": ph.discount_rate,
                 "recorded_at": ph.recorded_at.isoformat()
             }
-            for ph in sorted(deal.price_history, key=lambda x: x.recorded_at, reverse=True)[:30]
+            for ph in history
         ]
 
-    # Convert to response model
-    response = DealDetailResponse.model_validate(deal)
-    response.price_history = price_history
+    if "is_bookmarked" in fields:
+        response["is_bookmarked"] = is_bookmarked
 
-    # Check bookmark status if user is authenticated
-    if current_user:
-        response.is_bookmarked = BookmarkService.check_is_bookmarked(
-            db=db,
-            user_id=current_user.id,
-            deal_id=deal_id
-        )
-    else:
-        response.is_bookmarked = False
+    return dumps(response)
 
-    return response
+
+def _render_archived_deal_detail(
+    db: Session,
+    deal_id: int,
+    is_bookmarked: bool,
+    fields: List[str]
+) -> str:
+    """Render an archived deal as DealDetailResponse JSON (daily prices as its history)."""
+    deal = DealArchiveService.get_archived(db, deal_id)
+
+    if not deal:
+        raise HTTPException(status_code=404, detail="Deal not found")
+
+    response = DealCardService.from_deal(deal, fields)
+
+    if "price_history" in fields:
+        response["price_history"] = [
+            {
+                "price": point["close_price"],
+                "original_price": None,
+                "discount_rate": None,
+                "recorded_at": f"{point['day']}T00:00:00"
+            }
+            for point in (deal.price_points or [])[:30]
+        ]
+
+    if "is_bookmarked" in fields:
+        response["is_bookmarked"] = is_bookmarked
+
+    return dumps(response)
 
 
 @router.get(
@@ -229,17 +542,21 @@ async def get_deal(
     response_model=PriceHistoryWithStats,
     summary="Get price history for a deal"
 )
-async def get_deal_price_history(
+def get_deal_price_history(
     deal_id: int,
     days: int = Query(30, ge=1, le=365, description="Days to look back"),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
 ):
     """
     Get price history with statistical summary.
 
+    Windows longer than PRICE_HISTORY_RAW_WINDOW_DAYS return one point per
+    day (closing price with the day's min/max) instead of every record.
+
     Returns:
-    - **history**: List of price records (ordered by date DESC)
+    - **history**: List of price records or daily points (ordered by date DESC)
     - **statistics**: Price statistics including lowest, highest, average, current, record_count, and price_signal
+    - **resolution**: "raw" or "day"
     """
     # Check if deal exists
     deal = db.query(Deal).filter(
@@ -250,12 +567,30 @@ async def get_deal_price_history(
     if not deal:
         raise HTTPException(status_code=404, detail="Deal not found")
 
-    # Query price history for specified period
+    # Query price history for specified period (prunes older partitions)
     cutoff_date = datetime.utcnow() - timedelta(days=days)
-    history = db.query(PriceHistory).filter(
-        PriceHistory.deal_id == deal_id,
-        PriceHistory.recorded_at >= cutoff_date
-    ).order_by(PriceHistory.recorded_at.desc()).all()
+
+    if days > settings.PRICE_HISTORY_RAW_WINDOW_DAYS:
+        resolution = "day"
+        points = PriceHistoryRetentionService.get_daily_points(db, deal_id, cutoff_date)
+        history = [
+            PriceHistoryResponse(
+                deal_id=deal_id,
+                price=point["close_price"],
+                min_price=point["min_price"],
+                max_price=point["max_price"],
+                recorded_at=datetime.combine(point["day"], datetime.min.time())
+            )
+            for point in points
+        ]
+        record_count = sum(point["record_count"] for point in points)
+    else:
+        resolution = "raw"
+        history = db.query(PriceHistory).filter(
+            PriceHistory.deal_id == deal_id,
+            PriceHistory.recorded_at >= cutoff_date
+        ).order_by(PriceHistory.recorded_at.desc()).all()
+        record_count = len(history)
 
     # Get price statistics
     stats = PriceService.get_price_statistics(db, deal)
@@ -267,9 +602,10 @@ async def get_deal_price_history(
             highest_price=stats.get("highest"),
             average_price=stats.get("average"),
             current_price=deal.price,
-            record_count=len(history),
+            record_count=record_count,
             price_signal=deal.price_signal
-        )
+        ),
+        resolution=resolution
     )
 
 
@@ -282,10 +618,10 @@ async def get_deal_price_history(
     response_model=AISummaryResponse,
     summary="Get or generate AI summary for a deal"
 )
-async def get_deal_summary(
+def get_deal_summary(
     deal_id: int,
     force_regenerate: bool = Query(False, description="Force regenerate summary"),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
 ):
     """
     Get AI-generated 3-line summary of deal and comments.
@@ -299,8 +635,11 @@ async def get_deal_summary(
     - **generating**: Summary is being generated asynchronously
     - **not_configured**: AI service not configured (dry-run mode)
     """
-    # Get deal
-    deal = db.query(Deal).filter(
+    # Get deal (summary and comments are deferred columns)
+    deal = db.query(Deal).options(
+        undefer(Deal.ai_summary),
+        undefer(Deal.comments)
+    ).filter(
         Deal.id == deal_id,
         Deal.deleted_at == None
     ).first()
@@ -344,23 +683,20 @@ async def get_deal_summary(
 # ============================================================================
 
 @router.get("/sources", response_model=List[DealSourceResponse])
-async def get_deal_sources(
+def get_deal_sources(
+    request: Request,
     is_active: Optional[bool] = Query(None, description="Filter by active status"),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
 ):
     """
     Get list of all deal sources (communities).
 
     - **is_active**: Filter by active status (optional)
-    """
-    query = db.query(DealSource)
-
-    if is_active is not None:
-        query = query.filter(DealSource.is_active == is_active)
 
-    sources = query.order_by(DealSource.id).all()
-
-    return sources
+    Served from the in-process reference cache with a long-lived
+    Cache-Control header and an ETag.
+    """
+    return ReferenceCache.respond(request, db, "sources", is_active)
 
 
 # ============================================================================
@@ -368,20 +704,31 @@ async def get_deal_sources(
 # ============================================================================
 
 @router.get("/categories", response_model=List[CategoryResponse])
-async def get_categories(
+def get_categories(
+    request: Request,
     is_active: Optional[bool] = Query(None, description="Filter by active status"),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
 ):
     """
     Get list of all categories.
 
     - **is_active**: Filter by active status (optional)
+
+    Served from the in-process reference cache with a long-lived
+    Cache-Control header and an ETag.
     """
-    query = db.query(Category)
+    return ReferenceCache.respond(request, db, "categories", is_active)
 
-    if is_active is not None:
-        query = query.filter(Category.is_active == is_active)
 
-    categories = query.order_by(Category.id).all()
+@router.get("/categories/tree", response_model=List[CategoryTreeNode])
+def get_category_tree(
+    request: Request,
+    db: Session = Depends(get_read_db)
+):
+    """
+    Get all categories as a tree (via parent_id), root categories first.
 
-    return categories
+    Served from the in-process reference cache with a long-lived
+    Cache-Control header and an ETag.
+    """
+    return ReferenceCache.respond(request, db, "category_tree")
@@ -16,6 +16,7 @@ from app.schemas.user import (
 )
 from app.services.keyword import KeywordService
 from app.utils.auth import get_current_user
+from app.utils.read_routing import get_read_db
 
 
 router = APIRouter(prefix="/api/v1/users/keywords", tags=["keywords"])
@@ -136,7 +137,7 @@ def create_keywords_batch(
 )
 def get_keywords(
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
 ):
     """
     Get all active keywords for the authenticated user.
@@ -2,14 +2,17 @@
 API endpoints for personalized matched deals.
 Provides keyword-based deal recommendations for authenticated users.
 """
-from fastapi import APIRouter, Depends, Query
+from typing import Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from sqlalchemy.orm import Session
 
-from app.models.database import get_db
 from app.models.user import User
-from app.schemas.deal import DealListResponse, DealResponse
+from app.schemas.deal import DealListResponse
+from app.services.deal_cards import DealCardService
 from app.services.matcher import KeywordMatcher
 from app.utils.auth import get_current_user
+from app.utils.pagination import InvalidCursorError
+from app.utils.read_routing import get_read_db
 
 
 router = APIRouter(prefix="/api/v1/users/matched-deals", tags=["matched-deals"])
@@ -24,9 +27,11 @@ router = APIRouter(prefix="/api/v1/users/matched-deals", tags=["matched-deals"])
 def get_matched_deals(
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(20, ge=1, le=100, description="Items per page"),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page (overrides page)"),
+    include_total: Optional[bool] = Query(None, description="Count all matching deals (default: only for page requests)"),
     days: int = Query(7, ge=1, le=30, description="Number of days to look back"),
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
 ):
     """
     Get personalized deal feed based on user's keywords.
@@ -39,6 +44,9 @@ def get_matched_deals(
     **Parameters:**
     - **page**: Page number (default: 1)
     - **page_size**: Items per page (default: 20, max: 100)
+    - **cursor**: Keyset cursor from the previous response's next_cursor
+    - **include_total**: Also return total/total_pages (default: true for
+      page requests, false for cursor requests)
     - **days**: Look back N days (default: 7, max: 30)
 
     **Returns:**
@@ -54,18 +62,25 @@ def get_matched_deals(
     - Returns empty list if user has no active inclusion keywords
     - Respects user's exclusion keywords (NOT conditions)
     """
-    result = KeywordMatcher.match_user_to_deals(
-        db=db,
-        user=current_user,
-        page=page,
-        page_size=page_size,
-        days=days
-    )
+    try:
+        result = KeywordMatcher.match_user_to_deals(
+            db=db,
+            user=current_user,
+            page=page,
+            page_size=page_size,
+            days=days,
+            cursor=cursor,
+            include_total=include_total if include_total is not None else cursor is None
+        )
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
-    return DealListResponse(
-        deals=[DealResponse.model_validate(deal) for deal in result["deals"]],
+    body = DealCardService.list_payload(
+        [DealCardService.from_deal(deal) for deal in result["deals"]],
         total=result["total"],
         page=result["page"],
         page_size=result["page_size"],
-        total_pages=result["total_pages"]
+        total_pages=result["total_pages"],
+        next_cursor=result["next_cursor"]
     )
+    return Response(content=body, media_type="application/json")
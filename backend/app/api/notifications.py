@@ -78,9 +78,15 @@ def get_unread_count(
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
-    """Get the unread notification count for the authenticated user."""
-    count = NotificationService.get_unread_count(db, current_user.id)
-    return NotificationUnreadCountResponse(unread_count=count)
+    """
+    Get the unread notification count for the authenticated user.
+
+    Served from the counter on the already-loaded user row, so badge
+    polling costs no query beyond authentication.
+    """
+    return NotificationUnreadCountResponse(
+        unread_count=current_user.unread_notification_count or 0
+    )
 
 
 @router.post(
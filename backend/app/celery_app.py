@@ -15,7 +15,14 @@ celery_app = Celery(
     backend=settings.CELERY_RESULT_BACKEND,
     include=[
         "app.tasks.crawler",
-        "app.tasks.notification"
+        "app.tasks.notification",
+        "app.tasks.feed",
+        "app.tasks.search",
+        "app.tasks.statistics",
+        "app.tasks.price",
+        "app.tasks.blacklist",
+        "app.tasks.category",
+        "app.tasks.archive"
     ]
 )
 
@@ -66,18 +73,136 @@ celery_app.conf.beat_schedule = {
             "expires": 240
         }
     },
-    # Send scheduled notifications every 10 minutes
-    "send-scheduled-notifications-every-10-minutes": {
-        "task": "app.tasks.notification.send_scheduled_notifications",
-        "schedule": crontab(minute="*/10"),
+    # Drain each notification lane every minute (DND-scheduled rows, retries,
+    # and anything a crawler-triggered dispatch left behind)
+    "dispatch-notification-outbox-high-every-minute": {
+        "task": "app.tasks.notification.dispatch_notification_outbox",
+        "schedule": 60.0,
+        "kwargs": {"lane": "high"},
+        "options": {
+            "queue": "notification.high",
+            "expires": 50
+        }
+    },
+    "dispatch-notification-outbox-normal-every-minute": {
+        "task": "app.tasks.notification.dispatch_notification_outbox",
+        "schedule": 60.0,
+        "kwargs": {"lane": "normal"},
+        "options": {
+            "queue": "notification",
+            "expires": 50
+        }
+    },
+    "dispatch-notification-outbox-bulk-every-minute": {
+        "task": "app.tasks.notification.dispatch_notification_outbox",
+        "schedule": 60.0,
+        "kwargs": {"lane": "bulk"},
+        "options": {
+            "queue": "notification.bulk",
+            "expires": 50
+        }
+    },
+    # Reconcile denormalized unread notification counters hourly
+    "reconcile-unread-counts-hourly": {
+        "task": "app.tasks.notification.reconcile_unread_counts",
+        "schedule": crontab(minute=15),
+        "options": {
+            "expires": 1800
+        }
+    },
+    # Pre-create notification partitions and retire expired ones daily
+    "maintain-notification-partitions-daily": {
+        "task": "app.tasks.notification.maintain_notification_partitions",
+        "schedule": crontab(hour=3, minute=30),
+        "options": {
+            "expires": 3600
+        }
+    },
+    # Decay hot scores of all listed deals and re-index the updated ones in
+    # the Redis hot feed every 10 minutes (crawlers update both
+    # incrementally in between)
+    "recompute-hot-scores-every-10-minutes": {
+        "task": "app.tasks.feed.recompute_hot_scores",
+        "schedule": 600.0,
         "options": {
             "expires": 540
         }
     },
+    # Rebuild the Redis hot feed from the database hourly, so drift from
+    # missed incremental updates (Redis outages, manual edits) self-heals
+    "rebuild-hot-feed-hourly": {
+        "task": "app.tasks.feed.rebuild_hot_feed",
+        "schedule": crontab(minute=25),
+        "options": {
+            "expires": 1800
+        }
+    },
+    # Roll engagement snapshots up to hourly/daily rows hourly
+    "rollup-deal-statistics-hourly": {
+        "task": "app.tasks.statistics.rollup_deal_statistics",
+        "schedule": crontab(minute=5),
+        "options": {
+            "expires": 1800
+        }
+    },
+    # Pre-create price history partitions and roll up expired ones daily
+    "maintain-price-history-partitions-daily": {
+        "task": "app.tasks.price.maintain_price_history_partitions",
+        "schedule": crontab(hour=3, minute=50),
+        "options": {
+            "expires": 3600
+        }
+    },
+    # Recompute product price index rows whose 90-day window expired, daily
+    "refresh-product-price-index-daily": {
+        "task": "app.tasks.price.refresh_product_price_index",
+        "schedule": crontab(hour=4, minute=10),
+        "options": {
+            "expires": 3600
+        }
+    },
+    # Move old, not recently bookmarked deals to deals_archive daily
+    "archive-old-deals-daily": {
+        "task": "app.tasks.archive.archive_old_deals",
+        "schedule": crontab(hour=4, minute=30),
+        "options": {
+            "expires": 3600
+        }
+    },
+    # Re-apply blacklist rules to recent deals when they changed (a version
+    # check otherwise)
+    "reevaluate-blacklist-every-5-minutes": {
+        "task": "app.tasks.blacklist.reevaluate_blacklist",
+        "schedule": 300.0,
+        "options": {
+            "expires": 240
+        }
+    },
+    # Rebuild the keyword autocomplete index hourly (ingest and keyword
+    # registration update it incrementally in between)
+    "rebuild-autocomplete-index-hourly": {
+        "task": "app.tasks.search.rebuild_autocomplete_index",
+        "schedule": crontab(minute=45),
+        "options": {
+            "expires": 1800
+        }
+    },
 }
 
-# Configure task routes (optional, for future use)
+# Configure task routes
+# Outbox dispatchers are sent to a per-lane queue explicitly
+# (notification.high / notification / notification.bulk); run a dedicated
+# worker for notification.high so bulk fan-out cannot delay it:
+#   celery -A app.celery_app worker -Q notification.high
+#   celery -A app.celery_app worker -Q notification,notification.bulk
 celery_app.conf.task_routes = {
     "app.tasks.crawler.*": {"queue": "crawler"},
     "app.tasks.notification.*": {"queue": "notification"},
+    "app.tasks.feed.*": {"queue": "crawler"},
+    "app.tasks.search.*": {"queue": "crawler"},
+    "app.tasks.statistics.*": {"queue": "crawler"},
+    "app.tasks.price.*": {"queue": "crawler"},
+    "app.tasks.blacklist.*": {"queue": "crawler"},
+    "app.tasks.category.*": {"queue": "crawler"},
+    "app.tasks.archive.*": {"queue": "crawler"},
 }
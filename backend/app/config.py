@@ -15,9 +15,79 @@ class Settings(BaseSettings):
     DATABASE_MAX_OVERFLOW: int = 10
     DATABASE_ECHO: bool = False
 
+    # Read replica for read-only API endpoints (unset: reads use DATABASE_URL)
+    DATABASE_REPLICA_URL: Optional[str] = None
+    DATABASE_REPLICA_POOL_SIZE: int = 20
+    DATABASE_REPLICA_MAX_OVERFLOW: int = 10
+    READ_YOUR_WRITES_SECONDS: int = 5  # a user's reads stay on the primary this long after a write
+
     # Redis settings
     REDIS_URL: str = "redis://localhost:6379/0"
 
+    # Hot feed cache (Redis sorted sets behind the default /deals view)
+    HOT_FEED_ENABLED: bool = True
+    HOT_FEED_SIZE: int = 1000  # top-K deals kept per feed (global, per source, per category)
+    HOT_FEED_CARD_TTL: int = 24 * 3600  # seconds a pre-serialized deal card is kept
+
+    # Hot score decay (periodic set-based recomputation of Deal.hot_score)
+    HOT_SCORE_RECOMPUTE_BATCH_SIZE: int = 5000  # deal id range per UPDATE
+    HOT_SCORE_MIN_CHANGE: float = 0.5  # only write scores that moved this much (one hour of decay)
+
+    # Engagement snapshots (deal_statistics) and their rollups
+    STATS_RAW_RETENTION_HOURS: int = 24  # per-crawl snapshots, then hourly
+    STATS_HOURLY_RETENTION_DAYS: int = 7  # hourly snapshots, then daily
+    STATS_DAILY_RETENTION_DAYS: int = 90  # daily snapshots, then deleted
+
+    # Near-duplicate deal detection (MinHash + LSH index in Redis)
+    DEDUPE_ENABLED: bool = True
+    DEDUPE_WINDOW_HOURS: int = 48  # deals posted this recently are duplicate candidates
+    DEDUPE_MIN_SIMILARITY: float = 0.7  # min estimated title token similarity (Jaccard)
+    DEDUPE_MIN_CONTAINMENT: float = 0.85  # with matching known prices: min share of the shorter title's tokens
+    DEDUPE_BANDS: int = 20  # LSH bands; signature size is DEDUPE_BANDS * DEDUPE_BAND_ROWS
+    DEDUPE_BAND_ROWS: int = 3
+    DEDUPE_PRICE_TOLERANCE: float = 0.03  # max relative price difference
+
+    # Blacklist engine (compiled rules per process, batch re-evaluation)
+    BLACKLIST_VERSION_CHECK_SECONDS: int = 30  # how often a process checks the rule set version
+    BLACKLIST_REEVALUATE_DAYS: int = 30  # re-evaluate deals published this recently
+    BLACKLIST_REEVALUATE_BATCH_SIZE: int = 5000  # deal id range per chunk
+
+    # Category classifier (keyword rules per category slug)
+    CATEGORY_CLASSIFIER_ENABLED: bool = True
+    CATEGORY_BACKFILL_BATCH_SIZE: int = 5000  # deal id range per chunk
+
+    # Deal archive (old deals moved to deals_archive)
+    ARCHIVE_AFTER_DAYS: int = 180  # archive deals published before this many days ago
+    ARCHIVE_BOOKMARK_GRACE_DAYS: int = 30  # ...unless bookmarked this recently
+    ARCHIVE_BATCH_SIZE: int = 1000  # deals moved per transaction
+
+    # Response cache (tag-invalidated deal list/detail responses, with ETags)
+    RESPONSE_CACHE_ENABLED: bool = True
+    RESPONSE_CACHE_TTL: int = 300  # seconds; writes invalidate earlier via tags
+    RESPONSE_CACHE_REPLICA_LAG_SECONDS: int = 5  # with a replica, don't store responses this long after an invalidation
+
+    # Reference data cache (in-process deal sources and categories)
+    REFERENCE_CACHE_TTL: int = 300  # seconds a process reuses its snapshot
+    REFERENCE_CACHE_MAX_AGE: int = 3600  # Cache-Control max-age of /sources and /categories
+
+    # Deal search ranking (score = relevance × recency × hotness)
+    SEARCH_USE_TSVECTOR: bool = False  # match candidates on deals.search_vector instead of trigrams
+    SEARCH_MAX_RESULTS: int = 500  # top-K ranked per query; totals are capped here
+    SEARCH_WORD_SIMILARITY_THRESHOLD: float = 0.4  # pg_trgm word similarity cutoff for %>
+    SEARCH_SUBSTRING_RELEVANCE: float = 0.8  # minimum relevance of a substring match
+    SEARCH_RECENCY_HALF_LIFE_HOURS: float = 72.0
+    SEARCH_RECENCY_WEIGHT: float = 0.5  # share of the score subject to recency decay
+    SEARCH_HOTNESS_WEIGHT: float = 0.1  # boost per ln(1 + hot_score)
+
+    # Keyword autocomplete (Redis prefix index over deal and user keywords)
+    AUTOCOMPLETE_ENABLED: bool = True
+    AUTOCOMPLETE_WINDOW_DAYS: int = 30  # deal keywords from deals published this recently
+    AUTOCOMPLETE_MIN_DEAL_COUNT: int = 2  # skip deal keywords seen in fewer deals (rebuild only)
+    AUTOCOMPLETE_USER_KEYWORD_WEIGHT: float = 5.0  # weight per user following a keyword
+    AUTOCOMPLETE_TOP_PREFIX_LENGTH: int = 2  # prefixes up to this length use precomputed top-K
+    AUTOCOMPLETE_TOP_K: int = 20
+    AUTOCOMPLETE_SCAN_LIMIT: int = 200  # terms ranked per lookup for longer prefixes
+
     # JWT settings
     SECRET_KEY: str = "your-secret-key-here-change-in-production"
     ALGORITHM: str = "HS256"
@@ -33,9 +103,34 @@ class Settings(BaseSettings):
 
     # Push notification settings
     FCM_SERVER_KEY: Optional[str] = None
+    FCM_SEND_URL: str = "https://fcm.googleapis.com/fcm/send"  # point at a mock server for load tests
     APNS_CERT_PATH: Optional[str] = None
     APNS_KEY_PATH: Optional[str] = None
 
+    # Notification outbox dispatcher
+    NOTIFICATION_OUTBOX_BATCH_SIZE: int = 100  # rows claimed per transaction
+    NOTIFICATION_OUTBOX_MAX_BATCHES: int = 50  # batches per dispatcher run
+    NOTIFICATION_OUTBOX_MAX_ATTEMPTS: int = 5
+    NOTIFICATION_OUTBOX_RETRY_DELAY: int = 30  # seconds, multiplied by attempt count
+    NOTIFICATION_OUTBOX_LEASE_SECONDS: int = 300  # claimed rows stay hidden this long while being sent
+
+    # Notification priority lanes and backpressure
+    NOTIFICATION_HIGH_PRIORITY_MAX_MATCHES: int = 50  # rare keyword matches go first
+    NOTIFICATION_BULK_MIN_MATCHES: int = 1000  # mass matches go to the bulk lane
+    NOTIFICATION_HOT_SCORE_BOOST: float = 100.0  # hot deals move up one lane
+    NOTIFICATION_BACKLOG_THRESHOLD: int = 5000  # due outbox rows before matching defers
+    NOTIFICATION_BACKPRESSURE_DELAY: int = 60  # seconds to defer matching
+    NOTIFICATION_BACKPRESSURE_MAX_DEFERRALS: int = 10
+
+    # Price history partitioning, retention and downsampling
+    PRICE_HISTORY_PARTITION_MONTHS_AHEAD: int = 3  # monthly partitions created in advance
+    PRICE_HISTORY_RETENTION_DAYS: int = 90  # older partitions are rolled up to daily rows and dropped
+    PRICE_HISTORY_RAW_WINDOW_DAYS: int = 31  # longer price-history windows return daily points
+
+    # Notification history partitioning and retention
+    NOTIFICATION_PARTITION_MONTHS_AHEAD: int = 3  # monthly partitions created in advance
+    NOTIFICATION_RETENTION_MONTHS: int = 6  # older partitions are rolled up and dropped
+
     # AI Summarization settings
     AI_SERVICE_PROVIDER: str = "openai"  # "openai" | "claude" | "none"
     AI_API_KEY: Optional[str] = None
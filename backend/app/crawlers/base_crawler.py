@@ -10,9 +10,18 @@ from typing import List, Dict, Any, Optional
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError
 
-from app.models import CrawlerRun, CrawlerError, CrawlerState, CrawlerStatus, Deal, DealSource
+from app.models import CrawlerRun, CrawlerError, CrawlerState, CrawlerStatus, Deal
 from app.models.analytics import PriceHistory
+from app.schemas.deal import DealSourceResponse
 from app.services.price import PriceService
+from app.services.blacklist import BlacklistEngine, TARGET_FIELDS
+from app.services.category_classifier import CategoryClassifier
+from app.services.deal_statistics import DealStatisticsService, engagement_counters
+from app.services.dedupe import DuplicateDetector
+from app.services.feed_cache import HotFeedCache
+from app.services.reference_cache import ReferenceCache
+from app.services.response_cache import ResponseCache
+from app.services.search import search_vector_expression
 from app.config import settings
 
 
@@ -41,10 +50,12 @@ class BaseCrawler(ABC):
             "skipped": 0,
             "errors": 0,
         }
+        # Engagement snapshots buffered for one bulk insert per run
+        self._pending_snapshots: List[Dict[str, Any]] = []
 
-    def _get_or_create_source(self) -> DealSource:
-        """Get or create the deal source from database."""
-        source = self.db.query(DealSource).filter_by(name=self.source_name).first()
+    def _get_or_create_source(self) -> DealSourceResponse:
+        """Get the deal source from the in-process reference cache."""
+        source = ReferenceCache.get_source_by_name(self.db, self.source_name)
         if not source:
             raise ValueError(f"Deal source '{self.source_name}' not found in database")
         return source
@@ -95,6 +106,18 @@ class BaseCrawler(ABC):
             self.db.commit()
             self.stats["errors"] += 1
 
+    def _flush_snapshots(self):
+        """Bulk insert buffered engagement snapshots."""
+        if not self._pending_snapshots:
+            return
+        try:
+            DealStatisticsService.insert_snapshots(self.db, self._pending_snapshots)
+            self.db.commit()
+        except Exception as e:
+            self.db.rollback()
+            print(f"⚠️ Failed to save {len(self._pending_snapshots)} engagement snapshots: {e}")
+        self._pending_snapshots = []
+
     def _get_crawler_state(self) -> Dict:
         """Get saved crawler state from database."""
         state = self.db.query(CrawlerState).filter_by(source_id=self.source.id).first()
@@ -122,11 +145,14 @@ class BaseCrawler(ABC):
         Save or update a deal in the database.
 
         Args:
-            deal_data: Dictionary with deal information
+            deal_data: Dictionary with deal information (may include a
+                "board_category" label, used for classification only)
 
         Returns:
             Created or updated Deal object, or None if skipped
         """
+        board_category = deal_data.pop("board_category", None)
+
         try:
             # Check if deal already exists
             existing_deal = (
@@ -139,6 +165,8 @@ class BaseCrawler(ABC):
             )
 
             if existing_deal:
+                counters_before = engagement_counters(existing_deal)
+
                 # Check for price changes
                 price_changed = False
                 current_price = deal_data.get("price")
@@ -148,6 +176,25 @@ class BaseCrawler(ABC):
                     existing_deal.original_price = deal_data.get("original_price")
                     existing_deal.discount_rate = deal_data.get("discount_rate")
 
+                # Posts are edited after they are listed: keep their text
+                # current and re-apply the blacklist when it changed
+                text_changed = False
+                for field in TARGET_FIELDS:
+                    value = deal_data.get(field)
+                    if value is not None and value != getattr(existing_deal, field):
+                        setattr(existing_deal, field, value)
+                        text_changed = True
+
+                if text_changed:
+                    existing_deal.search_vector = search_vector_expression(
+                        existing_deal.title, existing_deal.product_name
+                    )
+                    if BlacklistEngine.apply(self.db, existing_deal):
+                        if existing_deal.is_blocked:
+                            print(f"🚫 Blocked deal {deal_data['external_id']} ({existing_deal.block_reason})")
+                        else:
+                            print(f"✅ Unblocked deal {deal_data['external_id']}")
+
                 # Update existing deal metrics
                 existing_deal.upvotes = deal_data.get("upvotes", existing_deal.upvotes)
                 existing_deal.downvotes = deal_data.get("downvotes", existing_deal.downvotes)
@@ -157,6 +204,10 @@ class BaseCrawler(ABC):
                 # Recalculate hot score
                 existing_deal.calculate_hot_score()
 
+                # Snapshot engagement only when a counter moved
+                if engagement_counters(existing_deal) != counters_before:
+                    self._pending_snapshots.append(DealStatisticsService.snapshot(existing_deal))
+
                 # Record price history and update signal if price changed
                 if price_changed:
                     self._record_price_history(existing_deal, deal_data)
@@ -165,6 +216,8 @@ class BaseCrawler(ABC):
                         existing_deal.price_signal = new_signal
 
                 self.db.commit()
+                HotFeedCache.index_deal(existing_deal)
+                ResponseCache.invalidate_deal(existing_deal.id, self.source.id)
                 self.stats["updated"] += 1
                 return existing_deal
             else:
@@ -174,15 +227,36 @@ class BaseCrawler(ABC):
                     **deal_data
                 )
 
-                # Calculate initial hot score
+                # Calculate initial hot score and search tokens
                 deal.calculate_hot_score()
+                deal.search_vector = search_vector_expression(deal.title, deal.product_name)
+
+                if deal.category_id is None and CategoryClassifier.is_enabled():
+                    deal.category_id = CategoryClassifier.classify(
+                        self.db, deal.title, deal.product_name, board_category
+                    )
+
+                # Blacklisted deals are stored blocked (never listed or notified)
+                blacklisted = BlacklistEngine.get(self.db).match_deal(deal)
+                if blacklisted:
+                    deal.is_blocked = True
+                    deal.block_reason = blacklisted.block_reason
+                    print(f"🚫 Blocked deal {deal_data['external_id']} ({deal.block_reason})")
+                else:
+                    # Cluster under an earlier post of the same deal, if any
+                    deal.canonical_deal_id = DuplicateDetector.find_canonical(deal)
 
                 self.db.add(deal)
                 self.db.commit()
                 self.db.refresh(deal)
+                if not deal.is_blocked:
+                    DuplicateDetector.index_deal(deal)
+                self._pending_snapshots.append(DealStatisticsService.snapshot(deal))
 
-                # Record initial price history
+                # Record initial price history; a reposted product already
+                # has a signal from its earlier prices
                 self._record_price_history(deal, deal_data)
+                deal.price_signal = PriceService.calculate_price_signal(self.db, deal)
                 self.db.commit()
 
                 # Fetch comments if supported by crawler
@@ -201,6 +275,8 @@ class BaseCrawler(ABC):
                             url=deal_data['url']
                         )
 
+                HotFeedCache.index_deal(deal, is_new=True)
+                ResponseCache.invalidate_deal(deal.id, self.source.id)
                 self.stats["new_created"] += 1
                 return deal
 
@@ -248,7 +324,7 @@ class BaseCrawler(ABC):
                 recorded_at=datetime.utcnow()
             )
 
-            self.db.add(price_record)
+            PriceService.record_price(self.db, price_record)
             # Commit is handled by caller (_save_deal)
 
         except Exception as e:
@@ -318,6 +394,8 @@ class BaseCrawler(ABC):
                 self._save_deal(deal_data)
                 self._respect_rate_limit()
 
+            self._flush_snapshots()
+
             # Mark as successful
             self._complete_crawler_run(
                 CrawlerStatus.SUCCESS if self.stats["errors"] == 0
@@ -332,6 +410,7 @@ class BaseCrawler(ABC):
 
         except Exception as e:
             print(f"❌ Crawler failed: {e}")
+            self._flush_snapshots()
             self._log_error(type(e).__name__, str(e))
             self._complete_crawler_run(CrawlerStatus.FAILED)
             raise
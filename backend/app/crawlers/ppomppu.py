@@ -218,6 +218,7 @@ class PpomppuCrawler(BaseCrawler):
                 "mall_product_url": mall_info["mall_url"],
                 "upvotes": upvotes,
                 "downvotes": downvotes,
+                "board_category": category,
             }
 
             return deal_data
@@ -228,6 +228,7 @@ class RuliwebCrawler(BaseCrawler):
                 "mall_product_url": mall_info["mall_url"],
                 "upvotes": upvotes,
                 "downvotes": 0,
+                "board_category": divsn_cell.get_text(strip=True) if divsn_cell else None,
             }
 
         except Exception as e:
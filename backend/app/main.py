@@ -5,12 +5,13 @@ from sqlalchemy import text
 
 from app.config import settings
 from app.models.database import engine, get_db, init_db
+from app.services.notification_queue import NotificationQueueMonitor
 from app.models import Base
 
 # Import all models to ensure they're registered
 from app.models.deal import DealSource, Category, Deal
 from app.models.user import User, UserKeyword, UserDevice
-from app.models.interaction import Bookmark, Notification
+from app.models.interaction import Bookmark, Notification, NotificationOutbox, NotificationRollup
 from app.models.analytics import PriceHistory, DealStatistics, DealKeyword
 from app.models.crawler import CrawlerRun, CrawlerError, CrawlerState
 from app.models.blacklist import Blacklist
@@ -22,6 +23,7 @@ from app.api.keywords import router as keywords_router
 from app.api.bookmarks import router as bookmarks_router
 from app.api.matched_deals import router as matched_deals_router
 from app.api.notifications import router as notifications_router
+from app.api.autocomplete import router as autocomplete_router
 
 
 # Create FastAPI application
@@ -49,6 +51,7 @@ app.include_router(keywords_router)
 app.include_router(bookmarks_router)
 app.include_router(matched_deals_router)
 app.include_router(notifications_router)
+app.include_router(autocomplete_router)
 
 
 @app.on_event("startup")
@@ -87,7 +90,7 @@ async def root():
 
 
 @app.get("/health")
-async def health_check(db: Session = Depends(get_db)):
+def health_check(db: Session = Depends(get_db)):
     """
     Health check endpoint with database connection test.
     Returns health status and database connectivity.
@@ -104,3 +107,13 @@ async def health_check(db: Session = Depends(get_db)):
         "database": db_status,
         "environment": settings.ENVIRONMENT
     }
+
+
+@app.get("/health/notifications")
+def notification_queue_health(db: Session = Depends(get_db)):
+    """
+    Notification queue metrics.
+    Returns outbox depth and lag per priority lane, broker queue lengths,
+    and whether matching is currently backing off.
+    """
+    return NotificationQueueMonitor.get_metrics(db)
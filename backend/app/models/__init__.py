@@ -9,10 +9,16 @@ from app.models.base import TimestampMixin, SoftDeleteMixin
 
 from app.models.deal import DealSource, Category, Deal
 from app.models.user import User, UserKeyword, UserDevice, AuthProvider, Gender
-from app.models.interaction import Bookmark, Notification, NotificationStatus
-from app.models.analytics import PriceHistory, DealStatistics, DealKeyword
+from app.models.interaction import (
+    Bookmark, Notification, NotificationStatus, NotificationOutbox, OutboxStatus,
+    NotificationRollup
+)
+from app.models.analytics import (
+    PriceHistory, PriceHistoryDaily, DealPriceStats, ProductPriceIndex, DealStatistics, DealKeyword
+)
 from app.models.crawler import CrawlerRun, CrawlerError, CrawlerState, CrawlerStatus
 from app.models.blacklist import Blacklist
+from app.models.archive import DealArchive
 
 # Export all models
 __all__ = [
@@ -40,8 +46,14 @@ __all__ = [
     "Bookmark",
     "Notification",
     "NotificationStatus",
+    "NotificationOutbox",
+    "OutboxStatus",
+    "NotificationRollup",
     # Analytics models
     "PriceHistory",
+    "PriceHistoryDaily",
+    "DealPriceStats",
+    "ProductPriceIndex",
     "DealStatistics",
     "DealKeyword",
     # Crawler models
@@ -51,4 +63,6 @@ __all__ = [
     "CrawlerStatus",
     # Blacklist model
     "Blacklist",
+    # Archive model
+    "DealArchive",
 ]
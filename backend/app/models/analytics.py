@@ -1,29 +1,37 @@
 """
-Analytics and tracking models: PriceHistory, DealStatistics, DealKeyword
+Analytics and tracking models: PriceHistory, PriceHistoryDaily,
+DealPriceStats, ProductPriceIndex, DealStatistics, DealKeyword
 Supports price signals and keyword matching.
 """
 from sqlalchemy import (
-    Column, Integer, String, Float, DateTime, ForeignKey,
-    Index, UniqueConstraint, Text
+    Column, Integer, BigInteger, String, Float, Date, DateTime, ForeignKey,
+    Index, UniqueConstraint, PrimaryKeyConstraint, Sequence, Text
 )
 from sqlalchemy.orm import relationship
 from app.models.database import Base
 from app.models.base import TimestampMixin
 
 
+price_history_id_seq = Sequence("price_history_id_seq")
+
+
 class PriceHistory(Base, TimestampMixin):
     """
     Historical price data for price signal calculation.
     Tracks price changes over time for each product.
+
+    Range-partitioned by month on recorded_at (see app/utils/partitioning.py);
+    partitions older than PRICE_HISTORY_RETENTION_DAYS are rolled up into
+    price_history_daily and dropped.
     """
     __tablename__ = "price_history"
 
-    id = Column(Integer, primary_key=True, index=True)
-    deal_id = Column(Integer, ForeignKey("deals.id", ondelete="CASCADE"), nullable=False, index=True)
+    id = Column(Integer, price_history_id_seq, nullable=False)
+    deal_id = Column(Integer, ForeignKey("deals.id", ondelete="CASCADE"), nullable=False)
 
     # Product identification (may be same product from different deals)
     mall_name = Column(String(100), nullable=True)
-    mall_product_id = Column(String(255), nullable=True, index=True)
+    mall_product_id = Column(String(255), nullable=True)
     product_name = Column(String(500), nullable=True)
 
     # Price data
@@ -32,26 +40,122 @@ class PriceHistory(Base, TimestampMixin):
     discount_rate = Column(Float, nullable=True)
 
     # Timestamp
-    recorded_at = Column(DateTime, nullable=False, index=True)
+    recorded_at = Column(DateTime, nullable=False)
 
     # Relationships
     deal = relationship("Deal", back_populates="price_history")
 
     # Indexes
     __table_args__ = (
+        # The partition key must be part of the primary key
+        PrimaryKeyConstraint("id", "recorded_at", name="price_history_pkey"),
         # Index for product price history lookups
         Index("idx_price_history_product", "mall_product_id", "recorded_at"),
         Index("idx_price_history_deal_recorded", "deal_id", "recorded_at"),
+        {"postgresql_partition_by": "RANGE (recorded_at)"},
     )
 
     def __repr__(self):
         return f"<PriceHistory {self.product_name}: ₩{self.price:,}>"
 
 
+class PriceHistoryDaily(Base, TimestampMixin):
+    """
+    Daily price rollups kept after price_history partitions are dropped.
+    One row per deal and day with a recorded price.
+    """
+    __tablename__ = "price_history_daily"
+
+    id = Column(Integer, primary_key=True, index=True)
+    deal_id = Column(Integer, ForeignKey("deals.id", ondelete="CASCADE"), nullable=False)
+    day = Column(Date, nullable=False)
+
+    # Day's prices
+    min_price = Column(Integer, nullable=False)
+    max_price = Column(Integer, nullable=False)
+    close_price = Column(Integer, nullable=False)  # Last price recorded that day
+    record_count = Column(Integer, nullable=False)
+
+    # Constraints & Indexes
+    __table_args__ = (
+        UniqueConstraint("deal_id", "day", name="uq_price_history_daily_deal_day"),
+    )
+
+    def __repr__(self):
+        return f"<PriceHistoryDaily deal={self.deal_id} {self.day}: ₩{self.close_price:,}>"
+
+
+class DealPriceStats(Base, TimestampMixin):
+    """
+    Running aggregate of a deal's price history (one row per deal), updated
+    with each recorded price so statistics don't scan the history.
+    """
+    __tablename__ = "deal_price_stats"
+
+    deal_id = Column(Integer, ForeignKey("deals.id", ondelete="CASCADE"), primary_key=True)
+
+    # Aggregates over every recorded price of the deal
+    min_price = Column(Integer, nullable=False)
+    max_price = Column(Integer, nullable=False)
+    price_sum = Column(BigInteger, nullable=False)
+    record_count = Column(Integer, nullable=False)
+    last_price = Column(Integer, nullable=False)
+
+    first_recorded_at = Column(DateTime, nullable=False)
+    last_recorded_at = Column(DateTime, nullable=False)
+
+    # Relationships
+    deal = relationship("Deal", back_populates="price_stats")
+
+    @property
+    def avg_price(self) -> float:
+        return self.price_sum / self.record_count
+
+    def __repr__(self):
+        return f"<DealPriceStats deal={self.deal_id}: {self.record_count} records>"
+
+
+class ProductPriceIndex(Base, TimestampMixin):
+    """
+    Rolling price aggregate per product, shared by every deal of it.
+
+    A product is keyed by its mall product ID ("mall:<mall>:<id>") and by its
+    normalized product name ("name:<name>"), so a product reposted in a new
+    thread starts with its earlier prices. Rows are updated incrementally as
+    price history is recorded and recomputed once their window (from
+    window_start) exceeds the price signal period (see app.services.price).
+    """
+    __tablename__ = "product_price_index"
+
+    id = Column(Integer, primary_key=True, index=True)
+    product_key = Column(String(600), unique=True, nullable=False)
+
+    # Aggregates over the prices recorded since window_start
+    min_price = Column(Integer, nullable=False)
+    max_price = Column(Integer, nullable=False)
+    price_sum = Column(BigInteger, nullable=False)
+    record_count = Column(Integer, nullable=False)
+    last_price = Column(Integer, nullable=False)
+
+    window_start = Column(DateTime, nullable=False, index=True)
+    last_recorded_at = Column(DateTime, nullable=False)
+
+    @property
+    def avg_price(self) -> float:
+        return self.price_sum / self.record_count
+
+    def __repr__(self):
+        return f"<ProductPriceIndex {self.product_key}: ₩{self.min_price:,}-₩{self.max_price:,}>"
+
+
 class DealStatistics(Base, TimestampMixin):
     """
     Time-series engagement snapshots for trend analysis.
     Captures engagement metrics at different points in time.
+
+    Crawlers append "raw" snapshots when a deal's counters change; the
+    rollup job keeps the last snapshot of each hour, then of each day, as
+    "hour" and "day" rows (see app.services.deal_statistics).
     """
     __tablename__ = "deal_statistics"
 
@@ -69,12 +173,17 @@ class DealStatistics(Base, TimestampMixin):
     # Snapshot timestamp
     snapshot_at = Column(DateTime, nullable=False, index=True)
 
+    # Resolution: "raw" (one per changed crawl), "hour" or "day" (rollups)
+    resolution = Column(String(10), nullable=False, default="raw", server_default="raw")
+
     # Relationships
     deal = relationship("Deal", back_populates="statistics")
 
     # Indexes
     __table_args__ = (
         Index("idx_deal_stats_snapshot", "deal_id", "snapshot_at"),
+        # Index for rollups and windowed (rising deals) scans
+        Index("idx_deal_stats_resolution_snapshot", "resolution", "snapshot_at"),
     )
 
     def __repr__(self):
@@ -0,0 +1,92 @@
+"""
+Archive model: DealArchive
+Old deals moved out of the hot deals table (see app.services.archive).
+"""
+from sqlalchemy import Column, Integer, String, Float, Boolean, Text, DateTime, JSON, ForeignKey, Index
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import relationship, deferred
+from app.models.database import Base
+
+
+class DealArchive(Base):
+    """
+    Archived deals: the deals columns (same names and ids, without the
+    search vector and its indexes) plus the deal's child rows as JSON, so an
+    archived deal renders like a live one.
+    """
+    __tablename__ = "deals_archive"
+
+    id = Column(Integer, primary_key=True, autoincrement=False)  # Original deals.id
+
+    # Source information
+    source_id = Column(Integer, ForeignKey("deal_sources.id"), nullable=False)
+    external_id = Column(String(255), nullable=False)
+    url = Column(String(500), nullable=False)
+
+    # Content fields
+    title = Column(Text, nullable=False)
+    content = deferred(Column(Text, nullable=True))
+    author = Column(String(100), nullable=True)
+    thumbnail_url = Column(String(500), nullable=True)
+
+    # Product information
+    product_name = Column(String(500), nullable=True)
+    mall_name = Column(String(100), nullable=True)
+    mall_product_url = Column(String(500), nullable=True)
+    mall_product_id = Column(String(255), nullable=True)
+
+    # Pricing
+    price = Column(Integer, nullable=True)
+    original_price = Column(Integer, nullable=True)
+    discount_rate = Column(Float, nullable=True)
+    price_signal = Column(String(20), nullable=True)
+
+    # Engagement metrics (as of archiving)
+    upvotes = Column(Integer, nullable=False, default=0)
+    downvotes = Column(Integer, nullable=False, default=0)
+    comment_count = Column(Integer, nullable=False, default=0)
+    view_count = Column(Integer, nullable=False, default=0)
+    bookmark_count = Column(Integer, nullable=False, default=0)
+    hot_score = Column(Float, nullable=False, default=0.0)
+
+    # AI summary and comments
+    ai_summary = deferred(Column(Text, nullable=True))
+    ai_summary_generated_at = Column(DateTime, nullable=True)
+    comments = deferred(Column(JSON, nullable=True))
+    comments_fetched_at = Column(DateTime, nullable=True)
+
+    # Classification (no FK on canonical_deal_id: the canonical deal may
+    # still be live or archived separately)
+    category_id = Column(Integer, ForeignKey("categories.id"), nullable=True)
+    canonical_deal_id = Column(Integer, nullable=True)
+
+    # Status flags
+    is_active = Column(Boolean, nullable=False, default=True)
+    is_blocked = Column(Boolean, nullable=False, default=False)
+    block_reason = Column(String(255), nullable=True)
+
+    # Timestamps (copied from deals)
+    published_at = Column(DateTime, nullable=False)
+    expires_at = Column(DateTime, nullable=True)
+    created_at = Column(DateTime, nullable=False)
+    updated_at = Column(DateTime, nullable=False)
+    deleted_at = Column(DateTime, nullable=True)
+    archived_at = Column(DateTime, nullable=False, index=True)
+
+    # Child rows at archiving time
+    keywords = deferred(Column(JSONB, nullable=True))  # [{keyword, source}]
+    statistics = deferred(Column(JSONB, nullable=True))  # engagement snapshots, oldest first
+    price_points = deferred(Column(JSONB, nullable=True))  # daily prices, newest first
+    price_stats = Column(JSONB, nullable=True)  # PriceStatistics fields
+
+    # Relationships
+    source = relationship("DealSource")
+    category = relationship("Category")
+
+    # Indexes
+    __table_args__ = (
+        Index("idx_deals_archive_source_external", "source_id", "external_id"),
+    )
+
+    def __repr__(self):
+        return f"<DealArchive {self.id}: {self.title[:30]}>"
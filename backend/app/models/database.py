@@ -1,6 +1,13 @@
 """
 Core database engine and session management.
 Provides SQLAlchemy engine, session factory, and base class for all models.
+
+Sessions are synchronous: endpoints that use them are plain `def`, which
+FastAPI runs in its threadpool, so no query ever blocks the event loop.
+
+Read-only endpoints take their session from get_read_session (via
+app.utils.read_routing.get_read_db), which uses a separate engine and pool
+on DATABASE_REPLICA_URL when one is configured.
 """
 from sqlalchemy import create_engine, event, text
 from sqlalchemy.orm import sessionmaker, scoped_session, declarative_base, Session
@@ -28,6 +35,30 @@ SessionLocal = sessionmaker(
     bind=engine
 )
 
+# Read replica engine with its own pool; its transactions are read-only so
+# a write routed there by mistake fails instead of going unnoticed
+if settings.DATABASE_REPLICA_URL:
+    replica_engine = create_engine(
+        settings.DATABASE_REPLICA_URL,
+        poolclass=QueuePool,
+        pool_size=settings.DATABASE_REPLICA_POOL_SIZE,
+        max_overflow=settings.DATABASE_REPLICA_MAX_OVERFLOW,
+        pool_pre_ping=True,
+        pool_recycle=3600,
+        echo=settings.DATABASE_ECHO,
+        connect_args={
+            "options": "-c timezone=utc -c default_transaction_read_only=on"
+        }
+    )
+    ReplicaSessionLocal = sessionmaker(
+        autocommit=False,
+        autoflush=False,
+        bind=replica_engine
+    )
+else:
+    replica_engine = engine
+    ReplicaSessionLocal = SessionLocal
+
 # Scoped session for thread-safe access
 db_session = scoped_session(SessionLocal)
 
@@ -51,6 +82,25 @@ def get_db():
         db.close()
 
 
+def has_replica() -> bool:
+    """Check if reads can be routed to a separate replica."""
+    return replica_engine is not engine
+
+
+def get_read_session(use_primary: bool = False) -> Session:
+    """
+    Create a session for read-only work: on the replica unless use_primary
+    is set (or no replica is configured).
+
+    Args:
+        use_primary: Read from the primary (e.g. right after the user wrote)
+
+    Returns:
+        New Session (caller closes it)
+    """
+    return SessionLocal() if use_primary else ReplicaSessionLocal()
+
+
 def init_db():
     """
     Initialize database by creating all tables.
@@ -60,9 +110,11 @@ def init_db():
     from app.models import (
         Deal, DealSource, Category, Blacklist,
         User, UserKeyword, UserDevice,
-        Bookmark, Notification,
-        PriceHistory, DealStatistics, DealKeyword,
-        CrawlerRun, CrawlerError, CrawlerState
+        Bookmark, Notification, NotificationOutbox, NotificationRollup,
+        PriceHistory, PriceHistoryDaily, DealPriceStats, ProductPriceIndex,
+        DealStatistics, DealKeyword,
+        CrawlerRun, CrawlerError, CrawlerState,
+        DealArchive
     )
 
     # Ensure optional extension required by trigram indexes exists.
@@ -73,6 +125,21 @@ def init_db():
     # Create all tables
     Base.metadata.create_all(bind=engine)
 
+    # Partitioned tables need their current partitions before any insert
+    from app.utils.partitioning import ensure_monthly_partitions
+    with engine.begin() as conn:
+        ensure_monthly_partitions(
+            conn, "notifications", settings.NOTIFICATION_PARTITION_MONTHS_AHEAD
+        )
+        ensure_monthly_partitions(
+            conn, "price_history", settings.PRICE_HISTORY_PARTITION_MONTHS_AHEAD
+        )
+
+    # bookmarks.deal_id has no foreign key (deals move to deals_archive)
+    from app.utils.deal_references import ensure_bookmark_triggers
+    with engine.begin() as conn:
+        ensure_bookmark_triggers(conn)
+
 
 def drop_db():
     """
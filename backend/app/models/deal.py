@@ -5,14 +5,22 @@ Core domain models for hot deal aggregation.
 from datetime import datetime
 from sqlalchemy import (
     Column, Integer, String, Text, Boolean, DateTime, Float, ForeignKey,
-    Index, UniqueConstraint, CheckConstraint, text, JSON
+    Index, UniqueConstraint, CheckConstraint, text, JSON, func, literal, cast
 )
-from sqlalchemy.orm import relationship
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.orm import relationship, deferred
 from sqlalchemy.ext.hybrid import hybrid_property
 from app.models.database import Base
 from app.models.base import TimestampMixin, SoftDeleteMixin
 
 
+# Hot score weights (shared by Deal.calculate_hot_score and Deal.hot_score_expression)
+HOT_SCORE_VOTE_WEIGHT = 10
+HOT_SCORE_COMMENT_WEIGHT = 5
+HOT_SCORE_VIEW_DIVISOR = 100
+HOT_SCORE_DECAY_PER_HOUR = 0.5
+
+
 class DealSource(Base, TimestampMixin):
     """
     Korean community sites we crawl for hot deals.
@@ -73,7 +81,7 @@ class Deal(Base, TimestampMixin, SoftDeleteMixin):
 
     # Content fields
     title = Column(Text, nullable=False)
-    content = Column(Text, nullable=True)
+    content = deferred(Column(Text, nullable=True))  # Heavy: loaded only when accessed or undeferred
     author = Column(String(100), nullable=True)
     thumbnail_url = Column(String(500), nullable=True)
 
@@ -100,16 +108,20 @@ class Deal(Base, TimestampMixin, SoftDeleteMixin):
     hot_score = Column(Float, nullable=False, default=0.0, index=True)
 
     # AI-generated summary
-    ai_summary = Column(Text, nullable=True)  # 3-line summary
+    ai_summary = deferred(Column(Text, nullable=True))  # 3-line summary
     ai_summary_generated_at = Column(DateTime, nullable=True)  # AI summary generation timestamp
 
     # Comments data
-    comments = Column(JSON, nullable=True)  # Comment data as JSON array
+    comments = deferred(Column(JSON, nullable=True))  # Comment data as JSON array
     comments_fetched_at = Column(DateTime, nullable=True)  # Comment fetch timestamp
 
     # Classification
     category_id = Column(Integer, ForeignKey("categories.id"), nullable=True, index=True)
 
+    # Near-duplicate clustering: earliest deal of the cluster, NULL if this
+    # deal is canonical (see app.services.dedupe)
+    canonical_deal_id = Column(Integer, ForeignKey("deals.id", ondelete="SET NULL"), nullable=True, index=True)
+
     # Status flags
     is_active = Column(Boolean, nullable=False, default=True, index=True)
     is_blocked = Column(Boolean, nullable=False, default=False)  # Blocked by blacklist
@@ -119,12 +131,21 @@ class Deal(Base, TimestampMixin, SoftDeleteMixin):
     published_at = Column(DateTime, nullable=False, index=True)
     expires_at = Column(DateTime, nullable=True)
 
+    # Search (tokenized title + product name, see app.services.search)
+    search_vector = deferred(Column(TSVECTOR, nullable=True))
+
     # Relationships
     source = relationship("DealSource", back_populates="deals")
     category = relationship("Category", back_populates="deals")
-    bookmarks = relationship("Bookmark", back_populates="deal", cascade="all, delete-orphan")
+    bookmarks = relationship(
+        "Bookmark",
+        back_populates="deal",
+        cascade="all, delete-orphan",
+        primaryjoin="Deal.id == foreign(Bookmark.deal_id)"
+    )
     notifications = relationship("Notification", back_populates="deal", cascade="all, delete-orphan")
     price_history = relationship("PriceHistory", back_populates="deal", cascade="all, delete-orphan")
+    price_stats = relationship("DealPriceStats", back_populates="deal", uselist=False, cascade="all, delete-orphan")
     statistics = relationship("DealStatistics", back_populates="deal", cascade="all, delete-orphan")
     keywords = relationship("DealKeyword", back_populates="deal", cascade="all, delete-orphan")
 
@@ -156,8 +177,37 @@ class Deal(Base, TimestampMixin, SoftDeleteMixin):
             postgresql_ops={"product_name": "gin_trgm_ops"}
         ),
 
+        # Index for tokenized full-text search
+        Index(
+            "idx_deals_search_vector",
+            "search_vector",
+            postgresql_using="gin"
+        ),
+
         # Index for category filtering
         Index("idx_deals_category_published", "category_id", "published_at"),
+
+        # Keyset pagination: one (sort key, id) index per sort_by option
+        Index(
+            "idx_deals_keyset_hot_score",
+            "hot_score", "id",
+            postgresql_where=text("is_active = true AND is_blocked = false AND deleted_at IS NULL")
+        ),
+        Index(
+            "idx_deals_keyset_published_at",
+            "published_at", "id",
+            postgresql_where=text("is_active = true AND is_blocked = false AND deleted_at IS NULL")
+        ),
+        Index(
+            "idx_deals_keyset_price",
+            "price", "id",
+            postgresql_where=text("is_active = true AND is_blocked = false AND deleted_at IS NULL")
+        ),
+        Index(
+            "idx_deals_keyset_bookmark_count",
+            "bookmark_count", "id",
+            postgresql_where=text("is_active = true AND is_blocked = false AND deleted_at IS NULL")
+        ),
     )
 
     @hybrid_property
@@ -179,13 +229,28 @@ class Deal(Base, TimestampMixin, SoftDeleteMixin):
         """
         age = self.age_hours
         score = (
-            (self.upvotes - self.downvotes) * 10 +
-            self.comment_count * 5 +
-            (self.view_count / 100) -
-            (age * 0.5)
+            (self.upvotes - self.downvotes) * HOT_SCORE_VOTE_WEIGHT +
+            self.comment_count * HOT_SCORE_COMMENT_WEIGHT +
+            (self.view_count / HOT_SCORE_VIEW_DIVISOR) -
+            (age * HOT_SCORE_DECAY_PER_HOUR)
         )
         self.hot_score = max(0, score)  # Ensure non-negative
         return self.hot_score
 
+    @classmethod
+    def hot_score_expression(cls, now: datetime):
+        """
+        SQL expression of calculate_hot_score for every row at time `now`
+        (naive UTC, like published_at), for set-based recomputation.
+        """
+        age_hours = func.extract("epoch", literal(now, DateTime) - cls.published_at) / 3600.0
+        score = (
+            (cls.upvotes - cls.downvotes) * HOT_SCORE_VOTE_WEIGHT +
+            cls.comment_count * HOT_SCORE_COMMENT_WEIGHT +
+            cls.view_count / float(HOT_SCORE_VIEW_DIVISOR) -
+            age_hours * HOT_SCORE_DECAY_PER_HOUR
+        )
+        return func.greatest(0.0, cast(score, Float))
+
     def __repr__(self):
         return f"<Deal {self.id}: {self.title[:50]}>"
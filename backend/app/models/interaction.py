@@ -1,11 +1,12 @@
 """
-User interaction models: Bookmark, Notification
-Tracks user engagement with deals.
+User interaction models: Bookmark, Notification, NotificationOutbox,
+NotificationRollup
+Tracks user engagement with deals and push delivery.
 """
 from datetime import datetime
 from sqlalchemy import (
-    Column, Integer, String, Boolean, DateTime, ForeignKey,
-    Index, UniqueConstraint, Enum as SQLEnum, Text
+    Column, Integer, SmallInteger, String, Boolean, Date, DateTime, ForeignKey,
+    Index, UniqueConstraint, PrimaryKeyConstraint, Sequence, Enum as SQLEnum, Text, text
 )
 from sqlalchemy.orm import relationship
 from sqlalchemy.dialects.postgresql import JSONB
@@ -23,6 +24,13 @@ class NotificationStatus(str, enum.Enum):
     CLICKED = "clicked"
 
 
+class OutboxStatus(str, enum.Enum):
+    """Notification outbox row delivery state."""
+    PENDING = "pending"
+    DELIVERED = "delivered"
+    FAILED = "failed"
+
+
 class Bookmark(Base, TimestampMixin):
     """
     User's saved/bookmarked deals.
@@ -31,13 +39,15 @@ class Bookmark(Base, TimestampMixin):
 
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
-    deal_id = Column(Integer, ForeignKey("deals.id", ondelete="CASCADE"), nullable=False, index=True)
+    # No FK: bookmarks outlive deals moved to deals_archive (see app.services.archive);
+    # triggers check it against deals and deals_archive (app.utils.deal_references)
+    deal_id = Column(Integer, nullable=False, index=True)
 
     notes = Column(Text, nullable=True)  # Optional user notes
 
-    # Relationships
+    # Relationships (deal is None once the deal is archived)
     user = relationship("User", back_populates="bookmarks")
-    deal = relationship("Deal", back_populates="bookmarks")
+    deal = relationship("Deal", back_populates="bookmarks", primaryjoin="foreign(Bookmark.deal_id) == Deal.id")
 
     # Constraints
     __table_args__ = (
@@ -50,14 +60,24 @@ class Bookmark(Base, TimestampMixin):
         return f"<Bookmark user={self.user_id} deal={self.deal_id}>"
 
 
+# Shared with notification_outbox, which reserves notification IDs up front
+notification_id_seq = Sequence("notifications_id_seq")
+
+
 class Notification(Base, TimestampMixin):
     """
     Push notification history and delivery tracking.
+
+    Range-partitioned by month on created_at (see app/utils/partitioning.py);
+    partitions older than NOTIFICATION_RETENTION_MONTHS are rolled up into
+    notification_rollups and dropped. Per-deal deduplication lives on
+    notification_outbox, since a unique (user_id, deal_id) constraint cannot
+    span partitions.
     """
     __tablename__ = "notifications"
 
-    id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
+    id = Column(Integer, notification_id_seq, nullable=False)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     deal_id = Column(Integer, ForeignKey("deals.id", ondelete="SET NULL"), nullable=True, index=True)
 
     # Notification content
@@ -69,8 +89,7 @@ class Notification(Base, TimestampMixin):
     status = Column(
         SQLEnum(NotificationStatus),
         nullable=False,
-        default=NotificationStatus.PENDING,
-        index=True
+        default=NotificationStatus.PENDING
     )
     scheduled_for = Column(DateTime, nullable=True)  # DND scheduled delivery time
     read_at = Column(DateTime, nullable=True)  # When user read the notification
@@ -88,11 +107,85 @@ class Notification(Base, TimestampMixin):
 
     # Constraints & Indexes
     __table_args__ = (
-        UniqueConstraint("user_id", "deal_id", name="uq_notification_user_deal"),
+        # The partition key must be part of the primary key
+        PrimaryKeyConstraint("id", "created_at", name="notifications_pkey"),
+        # User notification list: newest first per user
         Index("idx_notifications_user_created", "user_id", "created_at"),
-        Index("idx_notifications_status_created", "status", "created_at"),
-        Index("idx_notifications_scheduled", "status", "scheduled_for"),
+        {"postgresql_partition_by": "RANGE (created_at)"},
     )
 
     def __repr__(self):
         return f"<Notification {self.id}: {self.title[:30]}>"
+
+
+class NotificationOutbox(Base, TimestampMixin):
+    """
+    Transactional outbox for push delivery.
+    Written in the same transaction as its Notification and drained by the
+    outbox dispatcher, so a push is only sent for committed notifications.
+    """
+    __tablename__ = "notification_outbox"
+
+    id = Column(Integer, primary_key=True, index=True)
+    # No foreign key: notifications is partitioned and its key includes
+    # created_at. Rows are removed with their partition by the retention job.
+    notification_id = Column(Integer, nullable=False, unique=True)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    deal_id = Column(Integer, nullable=True)
+
+    # Push content: {"title": ..., "body": ..., "data": {...}}
+    payload = Column(JSONB, nullable=False)
+
+    # Delivery lane: 0 = high, 1 = normal, 2 = bulk (see services/outbox.py)
+    priority = Column(SmallInteger, nullable=False, default=1)
+
+    # Delivery state
+    status = Column(SQLEnum(OutboxStatus), nullable=False, default=OutboxStatus.PENDING)
+    available_at = Column(DateTime, nullable=False)  # Not sent before this (DND / retry backoff)
+    attempts = Column(Integer, nullable=False, default=0)
+    delivered_at = Column(DateTime, nullable=True)
+    last_error = Column(Text, nullable=True)
+
+    # Constraints & Indexes
+    __table_args__ = (
+        # User is notified about a deal only once
+        UniqueConstraint("user_id", "deal_id", name="uq_notification_outbox_user_deal"),
+        # Dispatcher claim query: pending rows per lane ordered by availability
+        Index(
+            "idx_notification_outbox_pending",
+            "priority", "available_at", "id",
+            postgresql_where=text("status = 'PENDING'")
+        ),
+    )
+
+    def __repr__(self):
+        return f"<NotificationOutbox {self.id}: notification={self.notification_id} {self.status.value}>"
+
+
+class NotificationRollup(Base, TimestampMixin):
+    """
+    Monthly delivery counts kept after notification partitions are dropped.
+    One row per user and month with keyword NULL (all notifications), plus
+    one row per matched keyword.
+    """
+    __tablename__ = "notification_rollups"
+
+    id = Column(Integer, primary_key=True, index=True)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    month = Column(Date, nullable=False)  # First day of the rolled-up month
+    keyword = Column(String(100), nullable=True)  # NULL = per-user total
+
+    # Delivery counts
+    total_count = Column(Integer, nullable=False, default=0)
+    sent_count = Column(Integer, nullable=False, default=0)  # Sent, delivered or clicked
+    read_count = Column(Integer, nullable=False, default=0)
+    clicked_count = Column(Integer, nullable=False, default=0)
+    failed_count = Column(Integer, nullable=False, default=0)
+
+    # Indexes
+    __table_args__ = (
+        Index("idx_notification_rollups_user_month", "user_id", "month"),
+    )
+
+    def __repr__(self):
+        return f"<NotificationRollup user={self.user_id} {self.month} {self.keyword or '*'}>"
@@ -58,6 +58,10 @@ class User(Base, TimestampMixin, SoftDeleteMixin):
     dnd_start_time = Column(Time, nullable=False, default=time(23, 0))  # 11:00 PM
     dnd_end_time = Column(Time, nullable=False, default=time(7, 0))     # 7:00 AM
 
+    # Denormalized unread notification badge (maintained by NotificationService,
+    # periodically reconciled against the notifications table)
+    unread_notification_count = Column(Integer, nullable=False, default=0)
+
     # Account status
     is_active = Column(Boolean, nullable=False, default=True)
     last_login_at = Column(DateTime, nullable=True)
@@ -25,6 +25,7 @@ from app.schemas.deal import (
     PriceSignal,
     DealSourceResponse,
     CategoryResponse,
+    CategoryTreeNode,
     DealBase,
     DealCreate,
     DealUpdate,
@@ -33,6 +34,12 @@ from app.schemas.deal import (
     DealDetailResponse,
     DealFeedParams,
     PriceHistoryResponse,
+    RisingDeal,
+    RisingDealsResponse,
+    DealBatchItem,
+    DealBatchResponse,
+    AutocompleteSuggestion,
+    AutocompleteResponse,
 )
 
 # Interaction schemas
@@ -74,6 +81,7 @@ __all__ = [
     "PriceSignal",
     "DealSourceResponse",
     "CategoryResponse",
+    "CategoryTreeNode",
     "DealBase",
     "DealCreate",
     "DealUpdate",
@@ -82,6 +90,12 @@ __all__ = [
     "DealDetailResponse",
     "DealFeedParams",
     "PriceHistoryResponse",
+    "RisingDeal",
+    "RisingDealsResponse",
+    "DealBatchItem",
+    "DealBatchResponse",
+    "AutocompleteSuggestion",
+    "AutocompleteResponse",
     # Interaction schemas
     "BookmarkCreate",
     "BookmarkUpdate",
@@ -20,6 +20,31 @@ class PriceSignal(str, enum.Enum):
     HIGH = "high"        # 🔴 비쌈 (expensive)
 
 
+def normalize_url(value: Any) -> Optional[str]:
+    """
+    Normalize a scraped URL before validation: protocol-relative URLs get
+    https, and anything that isn't an absolute http(s) URL becomes None.
+    """
+    if value in (None, ""):
+        return None
+
+    if not isinstance(value, str):
+        return None
+
+    normalized = value.strip()
+    if not normalized:
+        return None
+
+    if normalized.startswith("//"):
+        normalized = "https:" + normalized
+
+    parsed = urlparse(normalized)
+    if parsed.scheme not in {"http", "https"} or not parsed.netloc:
+        return None
+
+    return normalized
+
+
 # ============================================================================
 # DealSource Schemas
 # ============================================================================
@@ -53,6 +78,11 @@ class CategoryResponse(BaseModel):
         from_attributes = True
 
 
+class CategoryTreeNode(CategoryResponse):
+    """Schema for a category with its subcategories."""
+    children: List["CategoryTreeNode"] = []
+
+
 # ============================================================================
 # Deal Schemas
 # ============================================================================
@@ -73,24 +103,7 @@ class DealBase(BaseModel):
     @field_validator("thumbnail_url", "mall_product_url", mode="before")
     @classmethod
     def _normalize_url(cls, value: Any):
-        if value in (None, ""):
-            return None
-
-        if not isinstance(value, str):
-            return None
-
-        normalized = value.strip()
-        if not normalized:
-            return None
-
-        if normalized.startswith("//"):
-            normalized = "https:" + normalized
-
-        parsed = urlparse(normalized)
-        if parsed.scheme not in {"http", "https"} or not parsed.netloc:
-            return None
-
-        return normalized
+        return normalize_url(value)
 
 
 class DealCreate(DealBase):
@@ -138,6 +151,9 @@ class DealResponse(DealBase):
     # Category
     category_id: Optional[int] = None
 
+    # Earliest post of the same deal on any source (None: this is it)
+    canonical_deal_id: Optional[int] = None
+
     # Status
     is_active: bool
 
@@ -154,12 +170,17 @@ class DealResponse(DealBase):
 
 
 class DealListResponse(BaseModel):
-    """Schema for paginated deal list response."""
+    """
+    Schema for paginated deal list response.
+    Pass next_cursor back as `cursor` for the next page; total and
+    total_pages are only set when the total was counted.
+    """
     deals: List[DealResponse]
-    total: int
-    page: int
+    total: Optional[int] = None
+    page: Optional[int] = None
     page_size: int
-    total_pages: int
+    total_pages: Optional[int] = None
+    next_cursor: Optional[str] = None
 
 
 class DealDetailResponse(DealResponse):
@@ -192,12 +213,18 @@ class DealFeedParams(BaseModel):
 # ============================================================================
 
 class PriceHistoryResponse(BaseModel):
-    """Schema for price history response."""
-    id: int
+    """
+    Schema for price history response.
+    Daily points (long windows) have no id; price is the day's closing
+    price and min_price/max_price its range.
+    """
+    id: Optional[int] = None
     deal_id: int
     price: int
     original_price: Optional[int] = None
     discount_rate: Optional[float] = None
+    min_price: Optional[int] = None
+    max_price: Optional[int] = None
     recorded_at: datetime
 
     class Config:
@@ -218,11 +245,59 @@ class PriceHistoryWithStats(BaseModel):
     """Price history with statistical summary."""
     history: List[PriceHistoryResponse]
     statistics: PriceStatistics
+    resolution: str = "raw"  # "raw" (every record) or "day" (one point per day)
 
     class Config:
         from_attributes = True
 
 
+# ============================================================================
+# Rising Deals Schemas
+# ============================================================================
+
+class RisingDeal(DealResponse):
+    """Deal with its recent engagement velocity."""
+    velocity: float  # Engagement points gained per hour
+
+
+class RisingDealsResponse(BaseModel):
+    """Schema for rising deals response."""
+    deals: List[RisingDeal]
+    hours: int
+
+
+# ============================================================================
+# Batch Lookup Schemas
+# ============================================================================
+
+class DealBatchItem(DealResponse):
+    """Deal in a batch lookup: price statistics instead of the price history."""
+    price_stats: Optional[PriceStatistics] = None
+    is_bookmarked: Optional[bool] = None
+
+
+class DealBatchResponse(BaseModel):
+    """Schema for batch deal lookup response."""
+    deals: List[DealBatchItem]
+    missing_ids: List[int] = []  # Requested IDs that don't exist or were deleted
+
+
+# ============================================================================
+# Autocomplete Schemas
+# ============================================================================
+
+class AutocompleteSuggestion(BaseModel):
+    """A suggested keyword and its popularity weight."""
+    term: str
+    weight: float
+
+
+class AutocompleteResponse(BaseModel):
+    """Schema for autocomplete suggestions."""
+    query: str
+    suggestions: List[AutocompleteSuggestion]
+
+
 # ============================================================================
 # AI Summary Schemas
 # ============================================================================
@@ -0,0 +1,224 @@
+"""
+Deal archive service.
+Moves deals published before ARCHIVE_AFTER_DAYS (and not bookmarked within
+ARCHIVE_BOOKMARK_GRACE_DAYS) out of the deals table into deals_archive,
+keeping the hot table and its indexes small.
+
+Each chunk is one transaction of two set-based statements: an INSERT ...
+SELECT copying the deal columns plus its keywords, engagement snapshots,
+daily price points and price statistics as JSON, then a DELETE of the
+deals (child rows go with them via ON DELETE CASCADE). Bookmarks have no
+foreign key to deals and keep pointing at the archived id (triggers keep
+them consistent, see app.utils.deal_references); reads fall back to
+deals_archive when a deal is gone (see app.api.deals).
+"""
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, Optional, Set
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session, joinedload, undefer
+
+from app.config import settings
+from app.models.archive import DealArchive
+from app.models.deal import Deal
+
+
+# Columns copied as-is (all deal columns the archive has; not search_vector)
+ARCHIVED_COLUMNS = [
+    column.name for column in DealArchive.__table__.columns
+    if column.name in Deal.__table__.columns
+]
+
+CANDIDATES_QUERY = text(
+    """
+    SELECT d.id
+    FROM deals d
+    WHERE d.id > :after_id
+      AND d.published_at < :cutoff
+      AND NOT EXISTS (
+          SELECT 1 FROM bookmarks b
+          WHERE b.deal_id = d.id AND b.created_at >= :bookmarked_since
+      )
+    ORDER BY d.id
+    LIMIT :batch_size
+    FOR UPDATE OF d SKIP LOCKED
+    """
+)
+
+COPY_QUERY = text(
+    f"""
+    INSERT INTO deals_archive
+        ({", ".join(ARCHIVED_COLUMNS)}, archived_at, keywords, statistics, price_points, price_stats)
+    SELECT
+        {", ".join(f"d.{column}" for column in ARCHIVED_COLUMNS)},
+        :archived_at,
+        (
+            SELECT jsonb_agg(jsonb_build_object('keyword', k.keyword, 'source', k.source) ORDER BY k.id)
+            FROM deal_keywords k
+            WHERE k.deal_id = d.id
+        ),
+        (
+            SELECT jsonb_agg(jsonb_build_object(
+                'snapshot_at', s.snapshot_at, 'resolution', s.resolution,
+                'upvotes', s.upvotes, 'downvotes', s.downvotes,
+                'comment_count', s.comment_count, 'view_count', s.view_count,
+                'bookmark_count', s.bookmark_count, 'hot_score', s.hot_score
+            ) ORDER BY s.snapshot_at)
+            FROM deal_statistics s
+            WHERE s.deal_id = d.id
+        ),
+        (
+            SELECT jsonb_agg(jsonb_build_object(
+                'day', p.day, 'min_price', p.min_price, 'max_price', p.max_price,
+                'close_price', p.close_price, 'record_count', p.record_count
+            ) ORDER BY p.day DESC)
+            FROM (
+                -- Raw rows win for days present in both (as in get_daily_points)
+                SELECT DISTINCT ON (day) day, min_price, max_price, close_price, record_count
+                FROM (
+                    SELECT
+                        recorded_at::date AS day, MIN(price) AS min_price, MAX(price) AS max_price,
+                        (array_agg(price ORDER BY recorded_at DESC, id DESC))[1] AS close_price,
+                        COUNT(*) AS record_count, 0 AS rank
+                    FROM price_history
+                    WHERE deal_id = d.id
+                    GROUP BY recorded_at::date
+                    UNION ALL
+                    SELECT day, min_price, max_price, close_price, record_count, 1
+                    FROM price_history_daily
+                    WHERE deal_id = d.id
+                ) points
+                ORDER BY day, rank
+            ) p
+        ),
+        CASE WHEN ps.record_count > 0 THEN jsonb_build_object(
+            'lowest_price', ps.min_price, 'highest_price', ps.max_price,
+            'average_price', ps.price_sum / ps.record_count, 'current_price', d.price,
+            'record_count', ps.record_count, 'price_signal', d.price_signal
+        ) ELSE jsonb_build_object(
+            'lowest_price', d.price, 'highest_price', d.price,
+            'average_price', d.price, 'current_price', d.price,
+            'record_count', 0, 'price_signal', d.price_signal
+        ) END
+    FROM deals d
+    LEFT JOIN deal_price_stats ps ON ps.deal_id = d.id
+    WHERE d.id = ANY(:ids)
+    ON CONFLICT (id) DO NOTHING
+    """
+)
+
+DELETE_QUERY = text("DELETE FROM deals WHERE id = ANY(:ids) RETURNING id, source_id")
+
+
+class DealArchiveService:
+    """Service class for moving old deals to deals_archive and reading them back."""
+
+    @staticmethod
+    def archive_deals(
+        db: Session,
+        older_than_days: Optional[int] = None,
+        bookmark_grace_days: Optional[int] = None,
+        batch_size: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        Move old deals to deals_archive in chunks of batch_size deals.
+
+        Args:
+            db: Database session (committed after each chunk)
+            older_than_days: Archive deals published before this many days ago
+                (default: ARCHIVE_AFTER_DAYS)
+            bookmark_grace_days: Keep deals bookmarked this recently
+                (default: ARCHIVE_BOOKMARK_GRACE_DAYS)
+            batch_size: Deals per chunk (default: ARCHIVE_BATCH_SIZE)
+
+        Returns:
+            Dictionary with archived/batch counts and the IDs and source IDs
+            of archived deals (for cache invalidation)
+        """
+        older_than_days = older_than_days or settings.ARCHIVE_AFTER_DAYS
+        if bookmark_grace_days is None:
+            bookmark_grace_days = settings.ARCHIVE_BOOKMARK_GRACE_DAYS
+        batch_size = batch_size or settings.ARCHIVE_BATCH_SIZE
+
+        now = datetime.utcnow()
+        params = {
+            "cutoff": now - timedelta(days=older_than_days),
+            "bookmarked_since": now - timedelta(days=bookmark_grace_days),
+            "batch_size": batch_size,
+        }
+
+        batches = 0
+        archived = 0
+        deal_ids: Set[int] = set()
+        source_ids: Set[int] = set()
+        after_id = 0
+
+        while True:
+            ids = db.execute(CANDIDATES_QUERY, {**params, "after_id": after_id}).scalars().all()
+            if not ids:
+                db.commit()
+                break
+
+            db.execute(COPY_QUERY, {"ids": ids, "archived_at": now})
+            deleted = db.execute(DELETE_QUERY, {"ids": ids}).all()
+            db.commit()
+
+            batches += 1
+            archived += len(deleted)
+            deal_ids.update(row.id for row in deleted)
+            source_ids.update(row.source_id for row in deleted)
+            after_id = ids[-1]
+
+        return {
+            "archived": archived,
+            "batches": batches,
+            "deal_ids": deal_ids,
+            "source_ids": source_ids,
+        }
+
+    @staticmethod
+    def get_archived(db: Session, deal_id: int) -> Optional[DealArchive]:
+        """
+        Get an archived deal that wasn't deleted before archiving.
+
+        Args:
+            db: Database session
+            deal_id: Original deal ID
+
+        Returns:
+            DealArchive or None
+        """
+        return db.query(DealArchive).options(
+            undefer(DealArchive.ai_summary),
+            undefer(DealArchive.price_points)
+        ).filter(
+            DealArchive.id == deal_id,
+            DealArchive.deleted_at == None
+        ).first()
+
+    @staticmethod
+    def get_archived_many(db: Session, deal_ids: Iterable[int]) -> Dict[int, DealArchive]:
+        """
+        Get many archived deals with one query (see get_archived).
+
+        Args:
+            db: Database session
+            deal_ids: Original deal IDs
+
+        Returns:
+            Dictionary of deal_id -> DealArchive for the IDs found
+        """
+        deal_ids = list(deal_ids)
+        if not deal_ids:
+            return {}
+
+        archived = db.query(DealArchive).options(
+            joinedload(DealArchive.source),
+            joinedload(DealArchive.category),
+            undefer(DealArchive.ai_summary)
+        ).filter(
+            DealArchive.id.in_(deal_ids),
+            DealArchive.deleted_at == None
+        ).all()
+
+        return {deal.id: deal for deal in archived}
@@ -0,0 +1,259 @@
+"""
+Keyword autocomplete service.
+Suggests popular terms for a typed prefix from a Redis prefix index built
+over DealKeyword terms (weighted by recent deal frequency) and registered
+UserKeyword terms (weighted by the number of users following them).
+
+Keys:
+    ac:lex              sorted set of every term, all scored 0, so
+                        ZRANGEBYLEX returns the terms starting with a prefix
+    ac:weights          hash term -> weight
+    ac:top:<prefix>     sorted set of the AUTOCOMPLETE_TOP_K heaviest terms
+                        for each prefix of up to AUTOCOMPLETE_TOP_PREFIX_LENGTH
+                        characters (short prefixes match too many terms to
+                        rank on the fly)
+    ac:top:prefixes     set of prefixes that have an ac:top key
+
+Lookups are one or two Redis round trips and never touch PostgreSQL.
+"""
+from datetime import datetime, timedelta
+from typing import Dict, List, Tuple
+
+import redis
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.models.analytics import DealKeyword
+from app.models.deal import Deal
+from app.models.user import UserKeyword
+from app.utils.redis_client import get_redis
+
+
+LEX_KEY = "ac:lex"
+WEIGHTS_KEY = "ac:weights"
+TOP_KEY_PREFIX = "ac:top:"
+TOP_PREFIXES_KEY = "ac:top:prefixes"
+
+# Sorts after any UTF-8 encoded character, closing a ZRANGEBYLEX prefix range
+LEX_MAX_SUFFIX = "\U0010ffff"
+
+MIN_TERM_LENGTH = 2
+MAX_TERM_LENGTH = 50
+WRITE_CHUNK = 5000
+
+
+def normalize_term(value: str) -> str:
+    """Lowercase and collapse whitespace (same normalization as user keywords)."""
+    return " ".join(value.lower().strip().split())
+
+
+def _prefixes(term: str) -> List[str]:
+    return [term[:i] for i in range(1, min(len(term), settings.AUTOCOMPLETE_TOP_PREFIX_LENGTH) + 1)]
+
+
+class AutocompleteService:
+    """Service class for prefix-indexed keyword suggestions."""
+
+    @staticmethod
+    def is_enabled() -> bool:
+        """Check if autocomplete is enabled."""
+        return settings.AUTOCOMPLETE_ENABLED
+
+    @staticmethod
+    def suggest(prefix: str, limit: int = 10) -> List[Tuple[str, float]]:
+        """
+        Suggest terms starting with a prefix, heaviest first.
+
+        Args:
+            prefix: Typed text
+            limit: Maximum suggestions
+
+        Returns:
+            List of (term, weight); empty if nothing matches or Redis is down
+        """
+        prefix = normalize_term(prefix)
+        if not prefix or not AutocompleteService.is_enabled():
+            return []
+
+        try:
+            client = get_redis()
+
+            if len(prefix) <= settings.AUTOCOMPLETE_TOP_PREFIX_LENGTH:
+                entries = client.zrevrange(TOP_KEY_PREFIX + prefix, 0, limit - 1, withscores=True)
+                return [(term, weight) for term, weight in entries]
+
+            terms = client.zrangebylex(
+                LEX_KEY, f"[{prefix}", f"[{prefix}{LEX_MAX_SUFFIX}",
+                start=0, num=settings.AUTOCOMPLETE_SCAN_LIMIT
+            )
+            if not terms:
+                return []
+
+            weights = client.hmget(WEIGHTS_KEY, terms)
+        except redis.RedisError as e:
+            print(f"⚠️ Autocomplete lookup failed: {e}")
+            return []
+
+        ranked = sorted(
+            ((term, float(weight or 0)) for term, weight in zip(terms, weights)),
+            key=lambda item: (-item[1], item[0])
+        )
+        return ranked[:limit]
+
+    @staticmethod
+    def add_terms(increments: Dict[str, float]) -> None:
+        """
+        Incrementally add weight to terms (ingest and keyword registration).
+        Never raises: the hourly rebuild repairs anything missed.
+
+        Args:
+            increments: Mapping of raw term -> weight to add
+        """
+        if not AutocompleteService.is_enabled():
+            return
+
+        terms: Dict[str, float] = {}
+        for raw, weight in increments.items():
+            term = normalize_term(raw)
+            if MIN_TERM_LENGTH <= len(term) <= MAX_TERM_LENGTH:
+                terms[term] = terms.get(term, 0) + weight
+        if not terms:
+            return
+
+        top_k = settings.AUTOCOMPLETE_TOP_K
+
+        try:
+            client = get_redis()
+
+            pipe = client.pipeline(transaction=False)
+            for term, weight in terms.items():
+                pipe.hincrbyfloat(WEIGHTS_KEY, term, weight)
+            new_weights = pipe.execute()
+
+            pipe = client.pipeline(transaction=False)
+            pipe.zadd(LEX_KEY, {term: 0 for term in terms})
+            prefixes = set()
+            for term, weight in zip(terms, new_weights):
+                for prefix in _prefixes(term):
+                    pipe.zadd(TOP_KEY_PREFIX + prefix, {term: float(weight)})
+                    prefixes.add(prefix)
+            for prefix in prefixes:
+                pipe.zremrangebyrank(TOP_KEY_PREFIX + prefix, 0, -(top_k + 1))
+            pipe.sadd(TOP_PREFIXES_KEY, *prefixes)
+            pipe.execute()
+        except redis.RedisError as e:
+            print(f"⚠️ Autocomplete update failed: {e}")
+
+    @staticmethod
+    def collect_weights(db: Session) -> Dict[str, float]:
+        """
+        Compute term weights from the database.
+
+        Deal keywords count once per deal published within
+        AUTOCOMPLETE_WINDOW_DAYS (terms seen in fewer than
+        AUTOCOMPLETE_MIN_DEAL_COUNT deals are skipped); active inclusion user
+        keywords add AUTOCOMPLETE_USER_KEYWORD_WEIGHT per user.
+
+        Args:
+            db: Database session
+
+        Returns:
+            Mapping of normalized term -> weight
+        """
+        cutoff = datetime.utcnow() - timedelta(days=settings.AUTOCOMPLETE_WINDOW_DAYS)
+        weights: Dict[str, float] = {}
+
+        deal_terms = db.query(
+            func.lower(DealKeyword.keyword),
+            func.count(func.distinct(DealKeyword.deal_id))
+        ).join(
+            Deal, Deal.id == DealKeyword.deal_id
+        ).filter(
+            Deal.published_at >= cutoff,
+            Deal.is_blocked == False,
+            Deal.deleted_at == None
+        ).group_by(
+            func.lower(DealKeyword.keyword)
+        ).having(
+            func.count(func.distinct(DealKeyword.deal_id)) >= settings.AUTOCOMPLETE_MIN_DEAL_COUNT
+        )
+        for keyword, count in deal_terms:
+            term = normalize_term(keyword)
+            weights[term] = weights.get(term, 0) + count
+
+        user_terms = db.query(
+            UserKeyword.keyword,
+            func.count(func.distinct(UserKeyword.user_id))
+        ).filter(
+            UserKeyword.is_active == True,
+            UserKeyword.is_inclusion == True
+        ).group_by(UserKeyword.keyword)
+        for keyword, count in user_terms:
+            term = normalize_term(keyword)
+            weights[term] = weights.get(term, 0) + count * settings.AUTOCOMPLETE_USER_KEYWORD_WEIGHT
+
+        return {
+            term: weight for term, weight in weights.items()
+            if MIN_TERM_LENGTH <= len(term) <= MAX_TERM_LENGTH
+        }
+
+    @staticmethod
+    def rebuild(db: Session) -> Dict[str, int]:
+        """
+        Rebuild the whole prefix index from the database.
+        Every key is written under a temporary name and swapped in with
+        RENAME, so lookups never see a half-built index.
+
+        Args:
+            db: Database session
+
+        Returns:
+            Dictionary with term and prefix counts
+        """
+        weights = AutocompleteService.collect_weights(db)
+        top_k = settings.AUTOCOMPLETE_TOP_K
+
+        # Heaviest top_k terms per short prefix
+        tops: Dict[str, List[Tuple[str, float]]] = {}
+        for term, weight in sorted(weights.items(), key=lambda item: -item[1]):
+            for prefix in _prefixes(term):
+                bucket = tops.setdefault(prefix, [])
+                if len(bucket) < top_k:
+                    bucket.append((term, weight))
+
+        client = get_redis()
+        items = list(weights.items())
+
+        pipe = client.pipeline(transaction=False)
+        pipe.delete(LEX_KEY + ":rebuild", WEIGHTS_KEY + ":rebuild")
+        for start in range(0, len(items), WRITE_CHUNK):
+            chunk = dict(items[start:start + WRITE_CHUNK])
+            pipe.zadd(LEX_KEY + ":rebuild", {term: 0 for term in chunk})
+            pipe.hset(WEIGHTS_KEY + ":rebuild", mapping=chunk)
+        for prefix, bucket in tops.items():
+            pipe.delete(f"{TOP_KEY_PREFIX}{prefix}:rebuild")
+            pipe.zadd(f"{TOP_KEY_PREFIX}{prefix}:rebuild", dict(bucket))
+        pipe.execute()
+
+        stale_prefixes = set(client.smembers(TOP_PREFIXES_KEY)) - set(tops)
+
+        pipe = client.pipeline(transaction=True)
+        if items:
+            pipe.rename(LEX_KEY + ":rebuild", LEX_KEY)
+            pipe.rename(WEIGHTS_KEY + ":rebuild", WEIGHTS_KEY)
+        else:
+            pipe.delete(LEX_KEY, WEIGHTS_KEY)
+        for prefix in tops:
+            pipe.rename(f"{TOP_KEY_PREFIX}{prefix}:rebuild", TOP_KEY_PREFIX + prefix)
+        for prefix in stale_prefixes:
+            pipe.delete(TOP_KEY_PREFIX + prefix)
+        pipe.delete(TOP_PREFIXES_KEY)
+        if tops:
+            pipe.sadd(TOP_PREFIXES_KEY, *tops.keys())
+        pipe.execute()
+
+        return {
+            "terms": len(weights),
+            "prefixes": len(tops),
+        }
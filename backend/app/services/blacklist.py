@@ -0,0 +1,337 @@
+"""
+Blacklist engine.
+Applies the active Blacklist rules to deals: crawlers evaluate every new
+deal before insert (matches are stored blocked, so feeds, search and
+notifications never see them) and every existing deal whose text changed
+on a re-crawl, and a batch job re-evaluates recent deals when the rules
+change.
+
+All rules are compiled into one snapshot per process: per target field,
+the keyword rules become a single trie-shaped regex (one pass over the
+text whatever the number of keywords, case-insensitive) and the regex rules
+one combined alternation. Each snapshot carries the version of the rule set
+(a fingerprint of the blacklist table); get() re-checks it at most every
+BLACKLIST_VERSION_CHECK_SECONDS and recompiles only when it changed.
+"""
+import re
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from sqlalchemy import func, text, update
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.models.blacklist import Blacklist
+from app.models.deal import Deal
+from app.utils.keyword_pattern import keyword_pattern
+from app.utils.redis_client import get_redis
+
+
+TARGET_FIELDS = ("title", "content", "author")
+
+# block_reason written by the engine (only these deals are unblocked again
+# when their rule goes away)
+BLOCK_REASON_PREFIX = "blacklist #"
+
+# Version of the rules the last re-evaluation applied
+APPLIED_VERSION_KEY = "blacklist:applied_version"
+
+# Regexes with backreferences can't share a combined pattern (group numbers
+# shift), so they are searched on their own
+BACKREFERENCE_PATTERN = re.compile(r"\\[1-9]|\(\?P=")
+
+VERSION_QUERY = text(
+    """
+    SELECT md5(coalesce(string_agg(
+        concat_ws(':', id, is_active, pattern_type, target_field, pattern), E'\\n'
+        ORDER BY id
+    ), ''))
+    FROM blacklist
+    """
+)
+
+
+class BlacklistMatch:
+    """The rule a deal matched."""
+
+    __slots__ = ("rule_id", "field", "reason")
+
+    def __init__(self, rule_id: int, field: str, reason: Optional[str]):
+        self.rule_id = rule_id
+        self.field = field
+        self.reason = reason
+
+    @property
+    def block_reason(self) -> str:
+        """Value for Deal.block_reason."""
+        reason = f"{BLOCK_REASON_PREFIX}{self.rule_id}"
+        if self.reason:
+            reason += f": {self.reason}"
+        return reason[:255]
+
+
+class BlacklistRules:
+    """Active blacklist rules compiled for matching, as of one version."""
+
+    def __init__(self, version: str, rules: List[Blacklist]):
+        self.version = version
+        self.checked_at = time.monotonic()
+        self.rule_count = 0
+
+        self.keywords: Dict[str, Tuple[re.Pattern, Dict[str, Blacklist]]] = {}
+        self.regexes: Dict[str, Tuple[Optional[re.Pattern], List[Tuple[re.Pattern, Blacklist]]]] = {}
+        self.standalone: Dict[str, List[Tuple[re.Pattern, Blacklist]]] = {}
+
+        keywords: Dict[str, Dict[str, Blacklist]] = {}
+        regexes: Dict[str, List[Tuple[re.Pattern, Blacklist]]] = {}
+
+        for rule in rules:
+            if rule.target_field not in TARGET_FIELDS:
+                print(f"⚠️ Blacklist rule #{rule.id}: unknown target field {rule.target_field!r}")
+                continue
+
+            if rule.pattern_type == "keyword":
+                keyword = rule.pattern.strip().lower()
+                if keyword:
+                    keywords.setdefault(rule.target_field, {}).setdefault(keyword, rule)
+                    self.rule_count += 1
+            elif rule.pattern_type == "regex":
+                try:
+                    compiled = re.compile(rule.pattern, re.IGNORECASE)
+                except re.error as e:
+                    print(f"⚠️ Blacklist rule #{rule.id}: invalid regex ({e})")
+                    continue
+                if BACKREFERENCE_PATTERN.search(rule.pattern):
+                    self.standalone.setdefault(rule.target_field, []).append((compiled, rule))
+                else:
+                    regexes.setdefault(rule.target_field, []).append((compiled, rule))
+                self.rule_count += 1
+            else:
+                print(f"⚠️ Blacklist rule #{rule.id}: unknown pattern type {rule.pattern_type!r}")
+
+        for field, by_keyword in keywords.items():
+            self.keywords[field] = (re.compile(keyword_pattern(by_keyword)), by_keyword)
+
+        for field, compiled_rules in regexes.items():
+            try:
+                combined = re.compile(
+                    "|".join(f"(?:{rule.pattern})" for _, rule in compiled_rules),
+                    re.IGNORECASE
+                )
+            except re.error:
+                combined = None  # e.g. the same group name in two rules: search one by one
+            self.regexes[field] = (combined, compiled_rules)
+
+    def match(self, values: Dict[str, Optional[str]]) -> Optional[BlacklistMatch]:
+        """
+        Find the first rule matching a deal's fields.
+
+        Args:
+            values: Field name -> text (title, content, author)
+
+        Returns:
+            BlacklistMatch, or None if the deal is clean
+        """
+        for field in TARGET_FIELDS:
+            value = values.get(field)
+            if not value:
+                continue
+
+            if field in self.keywords:
+                pattern, by_keyword = self.keywords[field]
+                found = pattern.search(value.lower())
+                if found:
+                    rule = by_keyword[found.group(0)]
+                    return BlacklistMatch(rule.id, field, rule.reason)
+
+            if field in self.regexes:
+                combined, compiled_rules = self.regexes[field]
+                if combined is None or combined.search(value):
+                    # Rare path: find which rule it was
+                    for compiled, rule in compiled_rules:
+                        if compiled.search(value):
+                            return BlacklistMatch(rule.id, field, rule.reason)
+
+            for compiled, rule in self.standalone.get(field, ()):
+                if compiled.search(value):
+                    return BlacklistMatch(rule.id, field, rule.reason)
+
+        return None
+
+    def match_deal(self, deal: Deal) -> Optional[BlacklistMatch]:
+        """Find the first rule matching a deal (see match)."""
+        return self.match({field: getattr(deal, field) for field in TARGET_FIELDS})
+
+
+class BlacklistEngine:
+    """Service class for compiled blacklist rules and deal (re-)evaluation."""
+
+    _rules: Optional[BlacklistRules] = None
+    _lock = threading.Lock()
+
+    @staticmethod
+    def get_version(db: Session) -> str:
+        """Fingerprint of the whole rule set (changes on any rule edit)."""
+        return db.execute(VERSION_QUERY).scalar()
+
+    @staticmethod
+    def get(db: Session) -> BlacklistRules:
+        """
+        Get this process's compiled rules, recompiling if the rule set's
+        version changed (checked at most every BLACKLIST_VERSION_CHECK_SECONDS).
+
+        Args:
+            db: Database session (only used on a version check)
+
+        Returns:
+            BlacklistRules
+        """
+        rules = BlacklistEngine._rules
+        if rules is not None and time.monotonic() - rules.checked_at < settings.BLACKLIST_VERSION_CHECK_SECONDS:
+            return rules
+
+        with BlacklistEngine._lock:
+            rules = BlacklistEngine._rules
+            if rules is not None and time.monotonic() - rules.checked_at < settings.BLACKLIST_VERSION_CHECK_SECONDS:
+                return rules
+
+            version = BlacklistEngine.get_version(db)
+            if rules is not None and rules.version == version:
+                rules.checked_at = time.monotonic()
+                return rules
+
+            rules = BlacklistRules(
+                version,
+                db.query(Blacklist).filter(Blacklist.is_active == True).order_by(Blacklist.id).all()
+            )
+            BlacklistEngine._rules = rules
+            print(f"🚫 Compiled {rules.rule_count} blacklist rules (version {version[:8]})")
+            return rules
+
+    @staticmethod
+    def invalidate() -> None:
+        """Drop this process's compiled rules (call after writing rules)."""
+        BlacklistEngine._rules = None
+
+    @staticmethod
+    def apply(db: Session, deal: Deal) -> bool:
+        """
+        Re-apply the rules to an existing deal (e.g. after its text was
+        edited): a matching deal is blocked, a deal blocked by a rule that
+        no longer matches is unblocked (deals blocked for other reasons are
+        left alone). The caller commits.
+
+        Args:
+            db: Database session
+            deal: Deal to evaluate
+
+        Returns:
+            True if the deal's blocked state changed
+        """
+        found = BlacklistEngine.get(db).match_deal(deal)
+        engine_blocked = deal.is_blocked and (deal.block_reason or "").startswith(BLOCK_REASON_PREFIX)
+
+        if found and (not deal.is_blocked or engine_blocked):
+            changed = not deal.is_blocked
+            deal.is_blocked = True
+            deal.block_reason = found.block_reason
+            return changed
+        if not found and engine_blocked:
+            deal.is_blocked = False
+            deal.block_reason = None
+            return True
+        return False
+
+    @staticmethod
+    def reevaluate(
+        db: Session,
+        days: Optional[int] = None,
+        batch_size: Optional[int] = None,
+        force: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Re-apply the current rules to recent deals: newly matching deals are
+        blocked, deals blocked by a rule that no longer matches are unblocked
+        (deals blocked for other reasons are left alone). Skipped when the
+        rules haven't changed since the last run, unless forced.
+
+        Args:
+            db: Database session (committed after each chunk)
+            days: Re-evaluate deals published this recently
+                (default: BLACKLIST_REEVALUATE_DAYS)
+            batch_size: Id range per chunk (default: BLACKLIST_REEVALUATE_BATCH_SIZE)
+            force: Run even if the rules are unchanged
+
+        Returns:
+            Dictionary with blocked/unblocked counts and the IDs and source
+            IDs of changed deals (for cache invalidation)
+        """
+        BlacklistEngine.invalidate()
+        rules = BlacklistEngine.get(db)
+
+        if not force:
+            try:
+                if get_redis().get(APPLIED_VERSION_KEY) == rules.version:
+                    return {"status": "unchanged", "blocked": 0, "unblocked": 0, "deal_ids": set(), "source_ids": set()}
+            except Exception as e:
+                print(f"⚠️ Blacklist version lookup failed: {e}")
+
+        days = days or settings.BLACKLIST_REEVALUATE_DAYS
+        batch_size = batch_size or settings.BLACKLIST_REEVALUATE_BATCH_SIZE
+        since = datetime.utcnow() - timedelta(days=days)
+
+        candidates = (Deal.deleted_at == None, Deal.published_at >= since)
+        min_id, max_id = db.query(func.min(Deal.id), func.max(Deal.id)).filter(*candidates).one()
+
+        blocked = 0
+        unblocked = 0
+        deal_ids: Set[int] = set()
+        source_ids: Set[int] = set()
+
+        if min_id is not None:
+            for start in range(min_id, max_id + 1, batch_size):
+                rows = db.query(
+                    Deal.id, Deal.source_id, Deal.title, Deal.content, Deal.author,
+                    Deal.is_blocked, Deal.block_reason
+                ).filter(
+                    Deal.id >= start,
+                    Deal.id < start + batch_size,
+                    *candidates
+                ).all()
+
+                changes = []
+                for row in rows:
+                    found = rules.match({field: getattr(row, field) for field in TARGET_FIELDS})
+                    engine_blocked = row.is_blocked and (row.block_reason or "").startswith(BLOCK_REASON_PREFIX)
+
+                    if found and not row.is_blocked:
+                        changes.append({"id": row.id, "is_blocked": True, "block_reason": found.block_reason})
+                        blocked += 1
+                    elif found and engine_blocked and row.block_reason != found.block_reason:
+                        changes.append({"id": row.id, "is_blocked": True, "block_reason": found.block_reason})
+                    elif not found and engine_blocked:
+                        changes.append({"id": row.id, "is_blocked": False, "block_reason": None})
+                        unblocked += 1
+                    else:
+                        continue
+                    deal_ids.add(row.id)
+                    source_ids.add(row.source_id)
+
+                if changes:
+                    db.execute(update(Deal), changes)
+                db.commit()
+
+        try:
+            get_redis().set(APPLIED_VERSION_KEY, rules.version)
+        except Exception as e:
+            print(f"⚠️ Blacklist version update failed: {e}")
+
+        return {
+            "status": "applied",
+            "blocked": blocked,
+            "unblocked": unblocked,
+            "deal_ids": deal_ids,
+            "source_ids": source_ids
+        }
@@ -2,13 +2,18 @@
 Bookmark management service.
 Handles business logic for adding, retrieving, and deleting bookmarks.
 """
-from typing import Dict, Optional
+from typing import Dict, Iterable, Optional, Set
 from sqlalchemy.orm import Session, joinedload
 from sqlalchemy.exc import IntegrityError
 from math import ceil
 
 from app.models.interaction import Bookmark
+from app.models.archive import DealArchive
 from app.models.deal import Deal
+from app.services.archive import DealArchiveService
+from app.services.feed_cache import HotFeedCache
+from app.services.response_cache import ResponseCache
+from app.utils.read_routing import mark_user_write
 
 
 class BookmarkService:
@@ -22,7 +27,7 @@ class BookmarkService:
         notes: Optional[str] = None
     ) -> Bookmark:
         """
-        Add a new bookmark for a user.
+        Add a new bookmark for a user (the deal may be archived).
 
         Args:
             db: Database session
@@ -36,11 +41,16 @@ class BookmarkService:
         Raises:
             ValueError: If deal doesn't exist or already bookmarked
         """
-        # Check if deal exists
+        # Check if deal exists (in deals or deals_archive)
         deal = db.query(Deal).filter(
             Deal.id == deal_id,
             Deal.deleted_at == None
         ).first()
+        if deal is None:
+            deal = db.query(DealArchive).filter(
+                DealArchive.id == deal_id,
+                DealArchive.deleted_at == None
+            ).first()
 
         if not deal:
             raise ValueError("Deal not found")
@@ -60,6 +70,12 @@ class BookmarkService:
 
             db.commit()
             db.refresh(new_bookmark)
+            # bookmark_count is shown in the detail and in every list card,
+            # including the pre-rendered hot feed cards
+            ResponseCache.invalidate_deal(deal_id, deal.source_id)
+            if isinstance(deal, Deal) and HotFeedCache.is_enabled():
+                HotFeedCache.reindex(db, [deal_id])
+            mark_user_write(user_id)
 
             return new_bookmark
 
@@ -84,12 +100,14 @@ class BookmarkService:
             page_size: Number of items per page
 
         Returns:
-            Dictionary with bookmarks, pagination info
+            Dictionary with bookmarks, pagination info and archived_deals
+            (deal_id -> DealArchive for bookmarks whose deal was archived)
         """
         # Base query with eager loading to prevent N+1
         query = db.query(Bookmark).options(
             joinedload(Bookmark.deal).joinedload(Deal.source),
-            joinedload(Bookmark.deal).joinedload(Deal.category)
+            joinedload(Bookmark.deal).joinedload(Deal.category),
+            joinedload(Bookmark.deal).undefer(Deal.ai_summary)
         ).filter(
             Bookmark.user_id == user_id
         )
@@ -103,8 +121,13 @@ class BookmarkService:
             Bookmark.created_at.desc()
         ).offset(offset).limit(page_size).all()
 
+        archived_deals = DealArchiveService.get_archived_many(
+            db, [bookmark.deal_id for bookmark in bookmarks if bookmark.deal is None]
+        )
+
         return {
             "bookmarks": bookmarks,
+            "archived_deals": archived_deals,
             "total": total,
             "page": page,
             "page_size": page_size,
@@ -138,11 +161,19 @@ class BookmarkService:
 
         # Decrement bookmark count
         deal = db.query(Deal).filter(Deal.id == bookmark.deal_id).first()
+        if deal is None:
+            deal = db.query(DealArchive).filter(DealArchive.id == bookmark.deal_id).first()
         if deal and deal.bookmark_count > 0:
             deal.bookmark_count -= 1
 
+        deal_id = bookmark.deal_id
+        source_id = deal.source_id if deal else None
         db.delete(bookmark)
         db.commit()
+        ResponseCache.invalidate_deal(deal_id, source_id)
+        if isinstance(deal, Deal) and HotFeedCache.is_enabled():
+            HotFeedCache.reindex(db, [deal_id])
+        mark_user_write(user_id)
 
     @staticmethod
     def check_is_bookmarked(
@@ -167,3 +198,31 @@ class BookmarkService:
         ).first() is not None
 
         return exists
+
+    @staticmethod
+    def get_bookmarked_deal_ids(
+        db: Session,
+        user_id: int,
+        deal_ids: Iterable[int]
+    ) -> Set[int]:
+        """
+        Check bookmark status of many deals with a single IN query.
+
+        Args:
+            db: Database session
+            user_id: User ID
+            deal_ids: Deal IDs to check
+
+        Returns:
+            Set of the given deal IDs the user has bookmarked
+        """
+        deal_ids = list(deal_ids)
+        if not deal_ids:
+            return set()
+
+        rows = db.query(Bookmark.deal_id).filter(
+            Bookmark.user_id == user_id,
+            Bookmark.deal_id.in_(deal_ids)
+        ).all()
+
+        return {row.deal_id for row in rows}
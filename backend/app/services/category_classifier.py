@@ -0,0 +1,260 @@
+"""
+Deal category classifier.
+Assigns a category to new deals at ingest from keyword rules per category
+slug (see seed_categories), and backfills deals ingested without one.
+
+All keywords of all categories are compiled once per process into a single
+keyword_pattern regex, so a title is scanned once however many rules there
+are. Each distinct keyword found in the title or product name scores 1 for
+its category; the board category label some sources show (e.g. ppomppu's
+"[컴퓨터]") adds BOARD_HINT_WEIGHT. The highest score wins; on a tie the
+keyword found later in the title wins, since Korean titles end with the
+head noun ("캠핑 의자" is furniture). Deals without any keyword stay
+uncategorized.
+
+A keyword inside a longer one matches as the longer one ("아이스크림" is not
+"크림", "키보드" is not "보드"), which keeps short keywords usable.
+"""
+import re
+from typing import Any, Dict, Optional, Set, Tuple
+
+from sqlalchemy import func, update
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.models.deal import Deal
+from app.services.reference_cache import ReferenceCache
+from app.utils.keyword_pattern import keyword_pattern
+
+
+# Lowercase keywords per category slug; a keyword must belong to one category
+CATEGORY_KEYWORDS: Dict[str, Tuple[str, ...]] = {
+    "digital": (
+        "노트북", "맥북", "lg그램", "lg 그램", "갤럭시북", "데스크탑", "컴퓨터", "본체", "모니터",
+        "키보드", "마우스", "ssd", "hdd", "nvme", "외장하드", "usb", "메모리", "ddr4", "ddr5",
+        "그래픽카드", "rtx", "gtx", "라데온", "cpu", "라이젠", "인텔", "메인보드", "파워서플라이",
+        "공유기", "nas", "아이폰", "갤럭시", "스마트폰", "휴대폰", "자급제", "아이패드", "태블릿",
+        "에어팟", "버즈", "이어폰", "헤드폰", "헤드셋", "스마트워치", "애플워치", "충전기",
+        "보조배터리", "웹캠", "프린터", "sd카드", "카메라",
+    ),
+    "electronics": (
+        "tv", "티비", "냉장고", "김치냉장고", "세탁기", "건조기", "청소기", "에어컨", "선풍기",
+        "서큘레이터", "공기청정기", "가습기", "제습기", "전자레인지", "에어프라이어", "오븐",
+        "식기세척기", "정수기", "밥솥", "전기포트", "믹서기", "블렌더", "드라이기", "면도기",
+        "전동칫솔", "안마기", "사운드바", "스피커", "프로젝터", "커피머신", "인덕션", "전기매트",
+    ),
+    "food": (
+        "라면", "생수", "커피", "원두", "우유", "과자", "초콜릿", "견과", "닭가슴살", "삼겹살",
+        "돼지고기", "소고기", "한우", "김치", "만두", "치킨", "피자", "햄버거", "음료", "탄산수",
+        "콜라", "사이다", "주스", "맥주", "와인", "위스키", "비타민", "유산균", "프로틴",
+        "단백질", "홍삼", "영양제", "과일", "햇반", "즉석밥", "간편식", "밀키트", "아이스크림",
+        "쌀", "참치", "두유", "요거트", "식품",
+    ),
+    "beauty": (
+        "화장품", "스킨", "로션", "크림", "선크림", "썬크림", "에센스", "세럼", "앰플", "토너",
+        "클렌징", "마스크팩", "파운데이션", "립스틱", "틴트", "향수", "샴푸", "린스",
+        "트리트먼트", "바디워시", "바디로션", "핸드크림", "염색약",
+    ),
+    "fashion": (
+        "의류", "티셔츠", "셔츠", "맨투맨", "후드", "니트", "패딩", "자켓", "재킷", "코트",
+        "바지", "청바지", "슬랙스", "레깅스", "원피스", "스커트", "양말", "속옷", "운동화",
+        "스니커즈", "신발", "구두", "샌들", "슬리퍼", "가방", "백팩", "지갑", "모자", "벨트",
+        "나이키", "아디다스", "뉴발란스", "유니클로", "시계",
+    ),
+    "living": (
+        "휴지", "화장지", "물티슈", "세제", "섬유유연제", "수세미", "칫솔", "치약", "생리대",
+        "프라이팬", "냄비", "텀블러", "밀폐용기", "수건", "타월", "이불", "베개", "쓰레기봉투",
+        "건전지", "방향제", "탈취제", "지퍼백", "주방용품", "식기", "생활용품",
+    ),
+    "books": (
+        "도서", "전자책", "이북", "소설", "만화", "웹툰", "음반", "앨범", "블루레이", "교재",
+        "문제집", "잡지", "밀리의서재", "리디북스",
+    ),
+    "sports": (
+        "골프", "캠핑", "텐트", "등산", "자전거", "헬스", "요가", "필라테스", "덤벨", "러닝",
+        "수영", "낚시", "스키", "스노우보드", "테니스", "배드민턴", "축구", "농구", "야구",
+        "운동", "아웃도어",
+    ),
+    "furniture": (
+        "가구", "의자", "책상", "소파", "침대", "매트리스", "수납장", "선반", "행거", "옷장",
+        "조명", "스탠드", "커튼", "러그", "카펫", "인테리어", "식탁", "책장",
+    ),
+    "baby": (
+        "유아", "아기", "기저귀", "분유", "젖병", "유모차", "카시트", "장난감", "완구", "레고",
+        "아동", "키즈", "육아",
+    ),
+    "pet": (
+        "반려동물", "강아지", "고양이", "사료", "캣타워", "배변패드", "애견", "애묘", "츄르",
+    ),
+    "culture": (
+        "여행", "항공권", "호텔", "숙박", "리조트", "영화", "예매", "공연", "티켓", "콘서트",
+        "뮤지컬", "전시회", "입장권", "넷플릭스", "유튜브 프리미엄", "상품권", "기프티콘",
+    ),
+    "automotive": (
+        "자동차", "차량용", "차량", "블랙박스", "타이어", "엔진오일", "와이퍼", "세차", "카매트",
+        "주유", "하이패스", "내비게이션", "네비게이션",
+    ),
+    "games": (
+        "게임", "닌텐도", "스위치", "플스", "ps5", "ps4", "플레이스테이션", "xbox", "엑스박스",
+        "스팀", "steam", "게임패드", "컨트롤러", "듀얼센스", "조이콘",
+    ),
+}
+
+# Board category labels (lowercase keywords) shown by some sources
+BOARD_CATEGORY_HINTS: Dict[str, str] = {
+    "컴퓨터": "digital", "디지털": "digital", "pc": "digital", "하드웨어": "digital",
+    "모바일": "digital", "가전": "electronics", "a/v": "electronics", "식품": "food",
+    "음식": "food", "건강": "food", "화장품": "beauty", "뷰티": "beauty", "의류": "fashion",
+    "잡화": "fashion", "패션": "fashion", "생활": "living", "도서": "books", "서적": "books",
+    "등산": "sports", "캠핑": "sports", "스포츠": "sports", "가구": "furniture",
+    "육아": "baby", "유아": "baby", "반려": "pet", "여행": "culture", "상품권": "culture",
+    "쿠폰": "culture", "자동차": "automotive", "게임": "games",
+}
+BOARD_HINT_WEIGHT = 2.0
+
+KEYWORD_SLUGS: Dict[str, str] = {
+    keyword: slug for slug, keywords in CATEGORY_KEYWORDS.items() for keyword in keywords
+}
+KEYWORD_REGEX = re.compile(keyword_pattern(KEYWORD_SLUGS))
+BOARD_HINT_REGEX = re.compile(keyword_pattern(BOARD_CATEGORY_HINTS))
+
+
+class CategoryClassifier:
+    """Service class for rule-based deal categorization."""
+
+    @staticmethod
+    def is_enabled() -> bool:
+        """Check if ingest-time classification is enabled."""
+        return settings.CATEGORY_CLASSIFIER_ENABLED
+
+    @staticmethod
+    def classify_slug(
+        title: Optional[str],
+        product_name: Optional[str] = None,
+        board_category: Optional[str] = None
+    ) -> Optional[str]:
+        """
+        Classify a deal to a category slug.
+
+        Args:
+            title: Deal title
+            product_name: Product name, if known
+            board_category: Source board's category label, if any
+
+        Returns:
+            Category slug, or None if no rule matched
+        """
+        text = (title or "").lower()
+        if product_name:
+            text += " " + product_name.lower()
+
+        # slug -> (score, position of its last keyword)
+        scores: Dict[str, Tuple[float, int]] = {}
+        seen: Set[str] = set()
+        for found in KEYWORD_REGEX.finditer(text):
+            keyword = found.group(0)
+            if keyword in seen:
+                continue
+            seen.add(keyword)
+            slug = KEYWORD_SLUGS[keyword]
+            score, _ = scores.get(slug, (0.0, 0))
+            scores[slug] = (score + 1.0, found.start())
+
+        if board_category:
+            found = BOARD_HINT_REGEX.search(board_category.lower())
+            if found:
+                slug = BOARD_CATEGORY_HINTS[found.group(0)]
+                score, position = scores.get(slug, (0.0, -1))
+                scores[slug] = (score + BOARD_HINT_WEIGHT, position)
+
+        if not scores:
+            return None
+        return max(scores, key=scores.get)
+
+    @staticmethod
+    def classify(
+        db: Session,
+        title: Optional[str],
+        product_name: Optional[str] = None,
+        board_category: Optional[str] = None
+    ) -> Optional[int]:
+        """
+        Classify a deal to an active category (see classify_slug).
+
+        Args:
+            db: Database session (only used to reload the reference cache)
+            title: Deal title
+            product_name: Product name, if known
+            board_category: Source board's category label, if any
+
+        Returns:
+            Category ID, or None if unmatched or the category is missing/inactive
+        """
+        slug = CategoryClassifier.classify_slug(title, product_name, board_category)
+        if slug is None:
+            return None
+
+        category = ReferenceCache.get_category_by_slug(db, slug)
+        if category is None or not category.is_active:
+            return None
+        return category.id
+
+    @staticmethod
+    def backfill(
+        db: Session,
+        batch_size: Optional[int] = None,
+        reclassify: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Classify existing deals in id-range chunks (from title and product
+        name; board labels aren't stored).
+
+        Args:
+            db: Database session (committed after each chunk)
+            batch_size: Id range per chunk (default: CATEGORY_BACKFILL_BATCH_SIZE)
+            reclassify: Also re-classify deals that already have a category
+                (those the rules don't match keep it)
+
+        Returns:
+            Dictionary with scanned/classified counts and the IDs and source
+            IDs of changed deals (for cache invalidation)
+        """
+        batch_size = batch_size or settings.CATEGORY_BACKFILL_BATCH_SIZE
+
+        candidates = [Deal.deleted_at == None]
+        if not reclassify:
+            candidates.append(Deal.category_id == None)
+
+        min_id, max_id = db.query(func.min(Deal.id), func.max(Deal.id)).filter(*candidates).one()
+
+        scanned = 0
+        classified = 0
+        deal_ids: Set[int] = set()
+        source_ids: Set[int] = set()
+
+        if min_id is not None:
+            for start in range(min_id, max_id + 1, batch_size):
+                rows = db.query(
+                    Deal.id, Deal.source_id, Deal.category_id, Deal.title, Deal.product_name
+                ).filter(
+                    Deal.id >= start,
+                    Deal.id < start + batch_size,
+                    *candidates
+                ).all()
+
+                changes = []
+                for row in rows:
+                    category_id = CategoryClassifier.classify(db, row.title, row.product_name)
+                    if category_id is not None and category_id != row.category_id:
+                        changes.append({"id": row.id, "category_id": category_id})
+                        deal_ids.add(row.id)
+                        source_ids.add(row.source_id)
+
+                if changes:
+                    db.execute(update(Deal), changes)
+                db.commit()
+
+                scanned += len(rows)
+                classified += len(changes)
+
+        return {"scanned": scanned, "classified": classified, "deal_ids": deal_ids, "source_ids": source_ids}
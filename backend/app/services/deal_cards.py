@@ -0,0 +1,231 @@
+"""
+Deal card service.
+Fast path for serializing deal lists: selects only the columns a list card
+needs (never content or the comments JSON), builds plain dicts from the
+result tuples and encodes them with orjson, skipping ORM hydration and
+Pydantic validation.
+
+Cards have the same shape and field order as DealResponse, except that
+content is always null (list cards never show the post body; the detail
+endpoint does).
+
+Endpoints accept a sparse fieldset (fields=title,price,source) that
+selects and emits only the named top-level fields; id is always included.
+Heavy columns (content, ai_summary, comments) are deferred on the model, so
+they are only read from PostgreSQL when a fieldset or endpoint asks for them.
+"""
+from typing import Any, Dict, Iterable, List, Optional
+
+import orjson
+from pydantic import HttpUrl, ValidationError
+from sqlalchemy.orm import Session
+
+from app.models.deal import Deal, DealSource, Category
+from app.schemas.deal import normalize_url
+
+
+# Deal fields in DealResponse order ("content" is emitted as null)
+CARD_FIELDS = [
+    "title", "content", "author", "thumbnail_url", "product_name", "mall_name",
+    "mall_product_url", "price", "original_price", "discount_rate",
+    "id", "source_id", "url",
+    "upvotes", "downvotes", "comment_count", "view_count", "bookmark_count", "hot_score",
+    "price_signal", "ai_summary", "category_id", "canonical_deal_id", "is_active", "published_at", "created_at",
+]
+SOURCE_FIELDS = ["id", "name", "display_name", "base_url", "color_code", "is_active"]
+CATEGORY_FIELDS = ["id", "name", "slug", "parent_id", "is_active"]
+
+URL_FIELDS = {"thumbnail_url", "mall_product_url"}
+SKIPPED_FIELDS = {"content"}
+
+# Top-level fields selectable with fields= (list cards and detail)
+DEAL_FIELDS = CARD_FIELDS + ["source", "category"]
+DETAIL_FIELDS = DEAL_FIELDS + ["price_history", "is_bookmarked"]
+
+SOURCE_COLUMNS = [getattr(DealSource, field).label(f"source__{field}") for field in SOURCE_FIELDS]
+CATEGORY_COLUMNS = [getattr(Category, field).label(f"category__{field}") for field in CATEGORY_FIELDS]
+
+CARD_COLUMNS = (
+    [getattr(Deal, field) for field in CARD_FIELDS if field not in SKIPPED_FIELDS]
+    + SOURCE_COLUMNS
+    + CATEGORY_COLUMNS
+)
+
+
+class InvalidFieldsError(ValueError):
+    """Raised when a fields parameter names an unknown field."""
+
+
+def parse_fields(value: Optional[str], allowed: List[str]) -> Optional[List[str]]:
+    """
+    Parse a comma-separated sparse fieldset.
+
+    Args:
+        value: fields query parameter (e.g. "title,price,source")
+        allowed: Selectable field names, in output order
+
+    Returns:
+        Requested fields in output order (id always included), or None for
+        the endpoint's default fields
+
+    Raises:
+        InvalidFieldsError: If a field is unknown
+    """
+    if not value or not value.strip():
+        return None
+
+    requested = {field.strip() for field in value.split(",") if field.strip()}
+    unknown = requested - set(allowed)
+    if unknown:
+        raise InvalidFieldsError(f"Unknown fields: {', '.join(sorted(unknown))}")
+
+    requested.add("id")
+    return [field for field in allowed if field in requested]
+
+
+def project_card(card: Dict[str, Any], fields: Optional[List[str]]) -> Dict[str, Any]:
+    """Keep only the requested fields of a default card."""
+    if fields is None:
+        return card
+    return {field: card[field] for field in fields}
+
+
+def dumps(payload: Any) -> str:
+    """Encode a response payload as a JSON string with orjson."""
+    return orjson.dumps(payload).decode()
+
+
+def _card_url(value: Any) -> Optional[str]:
+    """Normalize and canonicalize a URL exactly as DealResponse's HttpUrl fields do."""
+    normalized = normalize_url(value)
+    if normalized is None:
+        return None
+    try:
+        return str(HttpUrl(normalized))
+    except ValidationError:
+        return None
+
+
+def _deal_value(field: str, value: Any) -> Any:
+    return _card_url(value) if field in URL_FIELDS else value
+
+
+class DealCardService:
+    """Service class for projected, orjson-encoded deal list cards."""
+
+    @staticmethod
+    def query(db: Session, fields: Optional[List[str]] = None, extra_columns: Iterable = ()):
+        """
+        Query selecting card columns of deals with their source and category.
+        Rows keep Deal column names (id, hot_score, ...) so keyset_paginate
+        works on them unchanged.
+
+        Args:
+            db: Database session
+            fields: Sparse fieldset from parse_fields (None: default card)
+            extra_columns: Deal columns needed besides the fieldset (e.g. the
+                sort column for keyset cursors)
+        """
+        if fields is None:
+            columns = list(CARD_COLUMNS)
+        else:
+            columns = [getattr(Deal, field) for field in CARD_FIELDS if field in fields]
+            if "source" in fields:
+                columns += SOURCE_COLUMNS
+            if "category" in fields:
+                columns += CATEGORY_COLUMNS
+
+        selected = {column.key for column in columns}
+        columns += [column for column in extra_columns if column.key not in selected]
+
+        query = db.query(*columns).select_from(Deal)
+        if fields is None or "source" in fields:
+            query = query.join(DealSource, DealSource.id == Deal.source_id)
+        if fields is None or "category" in fields:
+            query = query.outerjoin(Category, Category.id == Deal.category_id)
+        return query
+
+    @staticmethod
+    def from_row(row, fields: Optional[List[str]] = None) -> Dict[str, Any]:
+        """Build a card dict from a row of DealCardService.query."""
+        card = {}
+        for field in CARD_FIELDS:
+            if fields is None:
+                card[field] = None if field in SKIPPED_FIELDS else _deal_value(field, getattr(row, field))
+            elif field in fields:
+                card[field] = _deal_value(field, getattr(row, field))
+
+        if fields is None or "source" in fields:
+            card["source"] = {field: getattr(row, f"source__{field}") for field in SOURCE_FIELDS}
+        if fields is None or "category" in fields:
+            card["category"] = (
+                {field: getattr(row, f"category__{field}") for field in CATEGORY_FIELDS}
+                if row.category__id is not None else None
+            )
+        return card
+
+    @staticmethod
+    def from_deal(deal: Deal, fields: Optional[List[str]] = None) -> Dict[str, Any]:
+        """
+        Build a card dict from a Deal instance (source/category lazy-load if
+        needed). Only the fieldset's columns are read, so unloaded deferred
+        columns stay unloaded.
+        """
+        card = {}
+        for field in CARD_FIELDS:
+            if fields is None:
+                card[field] = None if field in SKIPPED_FIELDS else _deal_value(field, getattr(deal, field))
+            elif field in fields:
+                card[field] = _deal_value(field, getattr(deal, field))
+
+        if fields is None or "source" in fields:
+            source = deal.source
+            card["source"] = {field: getattr(source, field) for field in SOURCE_FIELDS} if source else None
+        if fields is None or "category" in fields:
+            category = deal.category
+            card["category"] = {field: getattr(category, field) for field in CATEGORY_FIELDS} if category else None
+        return card
+
+    @staticmethod
+    def load_by_ids(
+        db: Session,
+        deal_ids: Iterable[int],
+        fields: Optional[List[str]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Load cards for deal ids, in the given order (missing ids are skipped).
+
+        Args:
+            db: Database session
+            deal_ids: Deal IDs
+            fields: Sparse fieldset (None: default card)
+
+        Returns:
+            List of card dicts
+        """
+        deal_ids = list(deal_ids)
+        if not deal_ids:
+            return []
+
+        rows = DealCardService.query(db, fields).filter(Deal.id.in_(deal_ids)).all()
+        cards = {row.id: DealCardService.from_row(row, fields) for row in rows}
+        return [cards[deal_id] for deal_id in deal_ids if deal_id in cards]
+
+    @staticmethod
+    def list_payload(
+        cards: List[Dict[str, Any]],
+        total: Optional[int],
+        page: Optional[int],
+        page_size: int,
+        total_pages: Optional[int],
+        next_cursor: Optional[str]
+    ) -> str:
+        """Encode a DealListResponse-shaped payload."""
+        return dumps({
+            "deals": cards,
+            "total": total,
+            "page": page,
+            "page_size": page_size,
+            "total_pages": total_pages,
+            "next_cursor": next_cursor,
+        })
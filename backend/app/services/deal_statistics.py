@@ -0,0 +1,216 @@
+"""
+Deal engagement statistics service.
+Captures engagement snapshots into deal_statistics, rolls them up to keep
+the table bounded and ranks "rising" deals by engagement velocity.
+
+Resolutions:
+    raw     appended by crawlers (about every 5 minutes) when a deal's
+            counters change; kept STATS_RAW_RETENTION_HOURS
+    hour    last snapshot of each hour; kept STATS_HOURLY_RETENTION_DAYS
+    day     last snapshot of each day; kept STATS_DAILY_RETENTION_DAYS
+
+Counters are cumulative, so the last snapshot of a bucket summarizes it.
+"""
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import delete, func, insert, literal, select
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.models.analytics import DealStatistics
+from app.models.deal import (
+    Deal,
+    HOT_SCORE_VOTE_WEIGHT,
+    HOT_SCORE_COMMENT_WEIGHT,
+    HOT_SCORE_VIEW_DIVISOR,
+)
+
+
+# Counters compared to decide whether a crawl produced a new snapshot
+# (hot_score is stored but not compared: it decays on every crawl)
+COUNTER_FIELDS = ("upvotes", "downvotes", "comment_count", "view_count", "bookmark_count")
+SNAPSHOT_FIELDS = COUNTER_FIELDS + ("hot_score",)
+
+# Shortest span a velocity is measured over, so two snapshots minutes apart
+# don't produce extreme rates
+MIN_VELOCITY_SPAN_HOURS = 1.0
+
+
+def engagement_counters(deal: Deal) -> Tuple[int, ...]:
+    """Current counter values of a deal (compare before/after a crawl update)."""
+    return tuple(getattr(deal, field) or 0 for field in COUNTER_FIELDS)
+
+
+class DealStatisticsService:
+    """Service class for engagement snapshots, rollups and rising deals."""
+
+    @staticmethod
+    def snapshot(deal: Deal, snapshot_at: Optional[datetime] = None) -> Dict[str, Any]:
+        """
+        Build a raw snapshot row for bulk insertion.
+
+        Args:
+            deal: Deal (must be loaded; read before commit expires it)
+            snapshot_at: Snapshot time (default: utcnow)
+
+        Returns:
+            Row dictionary for insert_snapshots
+        """
+        row = {field: getattr(deal, field) or 0 for field in SNAPSHOT_FIELDS}
+        row["deal_id"] = deal.id
+        row["snapshot_at"] = snapshot_at or datetime.utcnow()
+        row["resolution"] = "raw"
+        return row
+
+    @staticmethod
+    def insert_snapshots(db: Session, rows: List[Dict[str, Any]]) -> int:
+        """
+        Insert snapshot rows in one executemany (caller commits).
+
+        Args:
+            db: Database session
+            rows: Rows from snapshot()
+
+        Returns:
+            Number of rows inserted
+        """
+        if not rows:
+            return 0
+        db.execute(insert(DealStatistics), rows)
+        return len(rows)
+
+    @staticmethod
+    def _rollup(db: Session, source: str, target: str, bucket: str, cutoff: datetime, now: datetime) -> int:
+        """Replace `source` rows older than cutoff with the last row per deal and bucket."""
+        bucket_start = func.date_trunc(bucket, DealStatistics.snapshot_at)
+        columns = ["deal_id", *SNAPSHOT_FIELDS, "snapshot_at", "resolution", "created_at", "updated_at"]
+
+        latest = select(
+            DealStatistics.deal_id,
+            *[getattr(DealStatistics, field) for field in SNAPSHOT_FIELDS],
+            DealStatistics.snapshot_at,
+            literal(target),
+            literal(now),
+            literal(now)
+        ).where(
+            DealStatistics.resolution == source,
+            DealStatistics.snapshot_at < cutoff
+        ).distinct(
+            DealStatistics.deal_id, bucket_start
+        ).order_by(
+            DealStatistics.deal_id, bucket_start, DealStatistics.snapshot_at.desc()
+        )
+
+        rolled = db.execute(insert(DealStatistics).from_select(columns, latest)).rowcount
+        db.execute(
+            delete(DealStatistics).where(
+                DealStatistics.resolution == source,
+                DealStatistics.snapshot_at < cutoff
+            )
+        )
+        return rolled
+
+    @staticmethod
+    def rollup(db: Session, now: Optional[datetime] = None) -> Dict[str, int]:
+        """
+        Downsample old snapshots: raw -> hour -> day, then drop expired days.
+        Only complete buckets are rolled up; each level commits separately.
+
+        Args:
+            db: Database session
+            now: Reference time (default: utcnow)
+
+        Returns:
+            Dictionary with rows written per level and days deleted
+        """
+        now = now or datetime.utcnow()
+
+        hour_cutoff = (now - timedelta(hours=settings.STATS_RAW_RETENTION_HOURS)).replace(
+            minute=0, second=0, microsecond=0
+        )
+        hourly = DealStatisticsService._rollup(db, "raw", "hour", "hour", hour_cutoff, now)
+        db.commit()
+
+        day_cutoff = (now - timedelta(days=settings.STATS_HOURLY_RETENTION_DAYS)).replace(
+            hour=0, minute=0, second=0, microsecond=0
+        )
+        daily = DealStatisticsService._rollup(db, "hour", "day", "day", day_cutoff, now)
+        db.commit()
+
+        expired = db.execute(
+            delete(DealStatistics).where(
+                DealStatistics.resolution == "day",
+                DealStatistics.snapshot_at < now - timedelta(days=settings.STATS_DAILY_RETENTION_DAYS)
+            )
+        ).rowcount
+        db.commit()
+
+        return {"hourly": hourly, "daily": daily, "expired": expired}
+
+    @staticmethod
+    def rising_deals(
+        db: Session,
+        hours: int = 6,
+        limit: int = 20,
+        now: Optional[datetime] = None
+    ) -> List[Tuple[int, float]]:
+        """
+        Rank listed deals by engagement velocity over the last `hours`.
+
+        Engagement is the hot score without its time decay; velocity is its
+        growth between a deal's first and last snapshot in the window, per
+        hour (spans under MIN_VELOCITY_SPAN_HOURS count as that long).
+
+        Args:
+            db: Database session
+            hours: Window length
+            limit: Maximum deals
+            now: Reference time (default: utcnow)
+
+        Returns:
+            List of (deal_id, velocity), fastest first
+        """
+        since = (now or datetime.utcnow()) - timedelta(hours=hours)
+
+        engagement = (
+            (DealStatistics.upvotes - DealStatistics.downvotes) * HOT_SCORE_VOTE_WEIGHT +
+            DealStatistics.comment_count * HOT_SCORE_COMMENT_WEIGHT +
+            DealStatistics.view_count / float(HOT_SCORE_VIEW_DIVISOR)
+        )
+        window = {"partition_by": DealStatistics.deal_id, "order_by": DealStatistics.snapshot_at}
+
+        ranked = select(
+            DealStatistics.deal_id,
+            DealStatistics.snapshot_at,
+            engagement.label("engagement"),
+            func.first_value(engagement).over(**window).label("first_engagement"),
+            func.first_value(DealStatistics.snapshot_at).over(**window).label("first_at"),
+            func.row_number().over(
+                partition_by=DealStatistics.deal_id,
+                order_by=DealStatistics.snapshot_at.desc()
+            ).label("recency")
+        ).where(
+            DealStatistics.snapshot_at >= since,
+            DealStatistics.resolution.in_(("raw", "hour"))
+        ).subquery()
+
+        span_hours = func.greatest(
+            func.extract("epoch", ranked.c.snapshot_at - ranked.c.first_at) / 3600.0,
+            MIN_VELOCITY_SPAN_HOURS
+        )
+        velocity = ((ranked.c.engagement - ranked.c.first_engagement) / span_hours).label("velocity")
+
+        rows = db.execute(
+            select(ranked.c.deal_id, velocity).join(
+                Deal, Deal.id == ranked.c.deal_id
+            ).where(
+                ranked.c.recency == 1,
+                ranked.c.engagement > ranked.c.first_engagement,
+                Deal.is_active == True,
+                Deal.is_blocked == False,
+                Deal.deleted_at == None
+            ).order_by(velocity.desc(), ranked.c.deal_id.desc()).limit(limit)
+        ).all()
+
+        return [(row.deal_id, float(row.velocity)) for row in rows]
@@ -0,0 +1,285 @@
+"""
+Near-duplicate deal detection.
+The same deal is often posted on several communities within minutes. At
+ingest each new deal gets a MinHash signature of its normalized title
+tokens; deals whose estimated title similarity (Jaccard) reaches
+DEDUPE_MIN_SIMILARITY, with matching price and mall, are clustered under
+the earliest one (canonical_deal_id).
+
+Communities often add or drop descriptive words ("무선이어폰", "정품"), which
+pulls Jaccard down even when one title is contained in the other. So when
+both prices are known and agree, containment (shared tokens over the
+smaller title's tokens) reaching DEDUPE_MIN_CONTAINMENT is enough; it is
+estimated from the MinHash similarity and the two token counts.
+
+Candidate lookup is an LSH index in Redis: the signature is cut into
+DEDUPE_BANDS bands of DEDUPE_BAND_ROWS values, and deals sharing any whole
+band are candidates (likely from ~0.5 similarity, rare below ~0.2).
+
+Keys:
+    dedupe:band:<i>:<values>   sorted set of deal ids with that band,
+                               score = published_at timestamp
+    dedupe:sig:<deal_id>       "<canonical_id>|<price>|<mall>|<tokens>|<signature>"
+
+A lookup is two pipelined round trips (bands, then candidate signatures)
+regardless of index size; band members older than DEDUPE_WINDOW_HOURS are
+trimmed on insert, and keys expire when idle.
+"""
+import hashlib
+import re
+import struct
+from datetime import datetime, timedelta
+from typing import List, Optional, Tuple
+
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.models.deal import Deal
+from app.services.search import tokenize_search_text
+from app.utils.redis_client import get_redis
+
+
+BAND_KEY_PREFIX = "dedupe:band:"
+SIGNATURE_KEY_PREFIX = "dedupe:sig:"
+
+# Title parts that differ between communities for the same deal:
+# [mall/category tags], prices ("12,900원") and shipping/promo words
+TITLE_NOISE_PATTERN = re.compile(
+    r"\[[^\]]*\]|\d[\d,]*\s*원|무료배송|무배|배송비|택포|카드할인|최저가|역대가"
+)
+MALL_PATTERN = re.compile(r"[^0-9a-z가-힣]+")
+
+MIN_SIGNATURE_TOKENS = 3  # Shorter titles are too generic to cluster
+
+# One SHAKE-128 digest per token yields all of its MinHash values (one
+# independent 16-bit hash per position; collisions between unrelated tokens
+# are too rare at 1/65536 to move the similarity estimate)
+MINHASH_VALUE_BYTES = 2
+
+
+def normalize_title(title: Optional[str]) -> List[str]:
+    """Title tokens used for the signature (noise removed, see search tokens)."""
+    return tokenize_search_text(TITLE_NOISE_PATTERN.sub(" ", (title or "").lower()), include_words=False)
+
+
+def normalize_mall(mall_name: Optional[str]) -> str:
+    """Mall name reduced to lowercase letters/digits/Hangul ("" if unknown)."""
+    return MALL_PATTERN.sub("", (mall_name or "").lower())
+
+
+def minhash(tokens: List[str]) -> Tuple[int, ...]:
+    """MinHash signature (16-bit values) of a token set."""
+    size = settings.DEDUPE_BANDS * settings.DEDUPE_BAND_ROWS
+    layout = struct.Struct(f">{size}H")
+    rows = [
+        layout.unpack(hashlib.shake_128(token.encode()).digest(size * MINHASH_VALUE_BYTES))
+        for token in set(tokens)
+    ]
+    return tuple(map(min, zip(*rows)))
+
+
+def _band_keys(signature: Tuple[int, ...]) -> List[str]:
+    rows = settings.DEDUPE_BAND_ROWS
+    return [
+        f"{BAND_KEY_PREFIX}{band}:" + "".join(f"{value:04x}" for value in signature[band * rows:(band + 1) * rows])
+        for band in range(settings.DEDUPE_BANDS)
+    ]
+
+
+def _prices_match(price: Optional[int], other: Optional[int]) -> bool:
+    if not price or not other:
+        return True  # Unknown price: decided by title (and mall)
+    return abs(price - other) <= max(price, other) * settings.DEDUPE_PRICE_TOLERANCE
+
+
+class DealSignature:
+    """Duplicate-detection signature of one deal."""
+
+    __slots__ = ("deal_id", "canonical_id", "values", "price", "mall", "size")
+
+    def __init__(
+        self,
+        deal_id: Optional[int],
+        canonical_id: Optional[int],
+        values: Tuple[int, ...],
+        price: Optional[int],
+        mall: str,
+        size: Optional[int] = None
+    ):
+        self.deal_id = deal_id
+        self.canonical_id = canonical_id or deal_id
+        self.values = values
+        self.price = price
+        self.mall = mall
+        self.size = size
+
+    @classmethod
+    def of(cls, deal: Deal) -> Optional["DealSignature"]:
+        """Signature of a deal, or None if its title is too short to compare."""
+        tokens = set(normalize_title(deal.title))
+        if len(tokens) < MIN_SIGNATURE_TOKENS:
+            return None
+        return cls(
+            deal.id, deal.canonical_deal_id, minhash(tokens), deal.price, normalize_mall(deal.mall_name), len(tokens)
+        )
+
+    @classmethod
+    def loads(cls, deal_id: int, value: str) -> "DealSignature":
+        parts = value.split("|")
+        if len(parts) == 4:
+            # Written before token counts were stored (expires with the window)
+            canonical_id, price, mall, values = parts
+            size = ""
+        else:
+            canonical_id, price, mall, size, values = parts
+        return cls(
+            deal_id,
+            int(canonical_id),
+            tuple(int(values[i:i + 4], 16) for i in range(0, len(values), 4)),
+            int(price) if price else None,
+            mall,
+            int(size) if size else None
+        )
+
+    def dumps(self) -> str:
+        values = "".join(f"{value:04x}" for value in self.values)
+        return f"{self.canonical_id}|{self.price or ''}|{self.mall}|{self.size or ''}|{values}"
+
+    def similarity(self, other: "DealSignature") -> float:
+        """Estimated Jaccard similarity of the two titles' token sets."""
+        same = sum(1 for mine, theirs in zip(self.values, other.values) if mine == theirs)
+        return same / len(self.values)
+
+    def containment(self, other: "DealSignature") -> float:
+        """
+        Estimated share of the smaller title's tokens found in the other
+        title, from the Jaccard estimate J and the token counts:
+        |A ∩ B| = J * (|A| + |B|) / (1 + J). Falls back to the similarity
+        when a token count is unknown.
+        """
+        similarity = self.similarity(other)
+        if not self.size or not other.size:
+            return similarity
+        shared = similarity * (self.size + other.size) / (1 + similarity)
+        return min(1.0, shared / min(self.size, other.size))
+
+    def matches(self, other: "DealSignature") -> bool:
+        """
+        Near-duplicate: price within tolerance, same mall if both known, and
+        a similar title; with both prices known, a title contained in the
+        other is enough.
+        """
+        if (
+            len(self.values) != len(other.values)
+            or not _prices_match(self.price, other.price)
+            or (self.mall and other.mall and self.mall != other.mall)
+        ):
+            return False
+
+        if self.similarity(other) >= settings.DEDUPE_MIN_SIMILARITY:
+            return True
+        return bool(self.price and other.price) and self.containment(other) >= settings.DEDUPE_MIN_CONTAINMENT
+
+
+class DuplicateDetector:
+    """Service class for ingest-time duplicate clustering."""
+
+    @staticmethod
+    def is_enabled() -> bool:
+        """Check if duplicate detection is enabled."""
+        return settings.DEDUPE_ENABLED
+
+    @staticmethod
+    def find_canonical(deal: Deal, now: Optional[datetime] = None) -> Optional[int]:
+        """
+        Find the canonical deal a new deal duplicates. Never raises: if Redis
+        is unavailable the deal simply stays canonical.
+
+        Args:
+            deal: New deal (title, price and mall_name set; id not needed)
+            now: Reference time for the lookup window (default: utcnow)
+
+        Returns:
+            Canonical deal ID of the closest recent duplicate, or None
+        """
+        if not DuplicateDetector.is_enabled():
+            return None
+
+        signature = DealSignature.of(deal)
+        if signature is None:
+            return None
+
+        since = ((now or datetime.utcnow()) - timedelta(hours=settings.DEDUPE_WINDOW_HOURS)).timestamp()
+
+        try:
+            client = get_redis()
+            pipe = client.pipeline(transaction=False)
+            for key in _band_keys(signature.values):
+                pipe.zrangebyscore(key, since, "+inf")
+            candidate_ids = sorted({int(member) for bucket in pipe.execute() for member in bucket} - {deal.id})
+            if not candidate_ids:
+                return None
+            stored = client.mget([SIGNATURE_KEY_PREFIX + str(deal_id) for deal_id in candidate_ids])
+        except Exception as e:
+            print(f"⚠️ Duplicate lookup failed: {e}")
+            return None
+
+        best: Optional[Tuple[float, int]] = None
+        for deal_id, value in zip(candidate_ids, stored):
+            if value is None:
+                continue
+            candidate = DealSignature.loads(deal_id, value)
+            if not signature.matches(candidate):
+                continue
+            rank = (-signature.similarity(candidate), candidate.canonical_id)
+            if best is None or rank < best:
+                best = rank
+
+        return best[1] if best else None
+
+    @staticmethod
+    def index_deal(deal: Deal) -> None:
+        """
+        Add a saved deal to the LSH index and trim expired members from its
+        buckets. Never raises.
+
+        Args:
+            deal: Deal with id (and canonical_deal_id if it is a duplicate)
+        """
+        if not DuplicateDetector.is_enabled():
+            return
+
+        signature = DealSignature.of(deal)
+        if signature is None:
+            return
+
+        published_at = deal.published_at or datetime.utcnow()
+        since = (datetime.utcnow() - timedelta(hours=settings.DEDUPE_WINDOW_HOURS)).timestamp()
+        ttl = settings.DEDUPE_WINDOW_HOURS * 3600
+
+        try:
+            pipe = get_redis().pipeline(transaction=False)
+            pipe.set(SIGNATURE_KEY_PREFIX + str(deal.id), signature.dumps(), ex=ttl)
+            for key in _band_keys(signature.values):
+                pipe.zadd(key, {str(deal.id): published_at.timestamp()})
+                pipe.zremrangebyscore(key, "-inf", f"({since}")
+                pipe.expire(key, ttl)
+            pipe.execute()
+        except Exception as e:
+            print(f"⚠️ Duplicate index update failed: {e}")
+
+    @staticmethod
+    def cluster_ids(db: Session, deal: Deal) -> List[int]:
+        """
+        IDs of every deal in a deal's duplicate cluster (including itself).
+
+        Args:
+            db: Database session
+            deal: Any deal of the cluster
+
+        Returns:
+            List of deal IDs
+        """
+        canonical_id = deal.canonical_deal_id or deal.id
+        members = db.query(Deal.id).filter(Deal.canonical_deal_id == canonical_id).all()
+        return [canonical_id] + [row.id for row in members]
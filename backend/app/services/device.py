@@ -2,7 +2,7 @@
 Device management service for push notification tokens.
 Handles registration, deactivation, and querying of user devices.
 """
-from typing import List, Optional
+from typing import Dict, List, Optional
 from datetime import datetime
 from sqlalchemy.orm import Session
 
@@ -134,3 +134,29 @@ class DeviceService:
         ).all()
 
         return [d.device_token for d in devices]
+
+    @staticmethod
+    def get_active_device_tokens_by_user(db: Session, user_ids: List[int]) -> Dict[int, List[str]]:
+        """
+        Get active device tokens for many users in one query (outbox dispatch).
+
+        Args:
+            db: Database session
+            user_ids: User IDs
+
+        Returns:
+            Dictionary mapping user ID to its active device tokens
+        """
+        tokens: Dict[int, List[str]] = {user_id: [] for user_id in user_ids}
+        if not user_ids:
+            return tokens
+
+        devices = db.query(UserDevice.user_id, UserDevice.device_token).filter(
+            UserDevice.user_id.in_(user_ids),
+            UserDevice.is_active == True
+        ).all()
+
+        for d in devices:
+            tokens[d.user_id].append(d.device_token)
+
+        return tokens
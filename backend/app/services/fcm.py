@@ -1,6 +1,7 @@
 """
 Firebase Cloud Messaging (FCM) service for push notification delivery.
 Supports dry-run mode when FCM_SERVER_KEY is not configured.
+The endpoint comes from FCM_SEND_URL so load tests can point it at a mock server.
 """
 import json
 from typing import Dict, Any, List, Optional
@@ -9,7 +10,7 @@ import httpx
 from app.config import settings
 
 
-FCM_SEND_URL = "https://fcm.googleapis.com/fcm/send"
+_client: Optional[httpx.Client] = None
 
 
 class FCMService:
@@ -20,6 +21,14 @@ class FCMService:
         """Check if FCM is configured with a server key."""
         return bool(settings.FCM_SERVER_KEY)
 
+    @staticmethod
+    def _get_client() -> httpx.Client:
+        """Get the shared HTTP client (keeps connections to FCM alive between sends)."""
+        global _client
+        if _client is None:
+            _client = httpx.Client(timeout=10.0)
+        return _client
+
     @staticmethod
     def send_to_device(
         device_token: str,
@@ -66,14 +75,13 @@ class FCMService:
         }
 
         try:
-            with httpx.Client(timeout=10.0) as client:
-                response = client.post(
-                    FCM_SEND_URL,
-                    headers=headers,
-                    json=payload
-                )
-                result = response.json()
-                return result
+            response = FCMService._get_client().post(
+                settings.FCM_SEND_URL,
+                headers=headers,
+                json=payload
+            )
+            result = response.json()
+            return result
         except Exception as e:
             print(f"[FCM ERROR] Failed to send to {device_token[:20]}...: {e}")
             return {
@@ -105,8 +113,7 @@ class FCMService:
             return {"success": 0, "failure": 0, "skipped": True}
 
         if not FCMService.is_configured():
-            for token in device_tokens:
-                print(f"[FCM DRY RUN] → {token[:20]}... | {title}: {body}")
+            print(f"[FCM DRY RUN] → {len(device_tokens)} devices | {title}: {body}")
             return {
                 "dry_run": True,
                 "success": len(device_tokens),
@@ -133,14 +140,13 @@ class FCMService:
         }
 
         try:
-            with httpx.Client(timeout=10.0) as client:
-                response = client.post(
-                    FCM_SEND_URL,
-                    headers=headers,
-                    json=payload
-                )
-                result = response.json()
-                return result
+            response = FCMService._get_client().post(
+                settings.FCM_SEND_URL,
+                headers=headers,
+                json=payload
+            )
+            result = response.json()
+            return result
         except Exception as e:
             print(f"[FCM ERROR] Failed to send to {len(device_tokens)} devices: {e}")
             return {
@@ -0,0 +1,424 @@
+"""
+Hot feed cache service.
+Keeps the top HOT_FEED_SIZE listed deals by hot_score in Redis sorted sets
+(globally, per source and per category) with pre-serialized deal cards, so
+the default /deals view is served without querying PostgreSQL.
+
+Keys:
+    feed:hot:<scope>     sorted set, member = zero-padded deal id, score = hot_score
+                         (scope: "all", "source:<id>" or "category:<id>")
+    feed:hot:ready       set of scopes whose sorted set has been fully built
+    feed:hot:counts      hash of listed deal counts per scope (approximate)
+    feed:card:<deal_id>  deal card JSON (see app.services.deal_cards)
+
+Zero-padded members make Redis break score ties by id descending, the same
+order as the database query (hot_score DESC, id DESC), so cursors are
+interchangeable between the cache and the database fallback.
+
+Duplicates of a deal posted on another source (canonical_deal_id set) are
+only listed in their source's feed, so the global and category feeds show
+each deal once.
+"""
+import json
+from math import ceil
+from typing import Dict, Any, List, Optional, Iterable
+
+import orjson
+import redis
+from sqlalchemy import func
+from sqlalchemy.orm import Session, joinedload, undefer
+
+from app.config import settings
+from app.models.deal import Deal
+from app.services.deal_cards import DealCardService, dumps, project_card
+from app.utils.pagination import encode_cursor, decode_cursor, InvalidCursorError
+from app.utils.redis_client import get_redis
+
+
+FEED_KEY_PREFIX = "feed:hot:"
+READY_KEY = "feed:hot:ready"
+COUNTS_KEY = "feed:hot:counts"
+CARD_KEY_PREFIX = "feed:card:"
+
+CARD_LOAD_CHUNK = 500
+
+
+def feed_scope(source_id: Optional[int] = None, category_id: Optional[int] = None) -> str:
+    """Return the feed scope name for an optional source or category filter."""
+    if source_id:
+        return f"source:{source_id}"
+    if category_id:
+        return f"category:{category_id}"
+    return "all"
+
+
+def _member(deal_id: int) -> str:
+    return f"{deal_id:010d}"
+
+
+def _deal_scopes(source_id: Optional[int], category_id: Optional[int], is_canonical: bool = True) -> List[str]:
+    scopes = [f"source:{source_id}"]
+    if is_canonical:
+        scopes.append("all")
+        if category_id:
+            scopes.append(f"category:{category_id}")
+    return scopes
+
+
+def _is_listed(deal: Deal) -> bool:
+    return bool(deal.is_active) and not deal.is_blocked and deal.deleted_at is None
+
+
+class HotFeedCache:
+    """Service class for the Redis-backed hot deal feed."""
+
+    @staticmethod
+    def is_enabled() -> bool:
+        """Check if the hot feed cache is enabled."""
+        return settings.HOT_FEED_ENABLED
+
+    @staticmethod
+    def serialize_card(deal: Deal) -> str:
+        """Serialize a deal to its card JSON."""
+        return dumps(DealCardService.from_deal(deal))
+
+    @staticmethod
+    def index_deals(deals: Iterable[Deal], new_deal_ids: Iterable[int] = ()) -> None:
+        """
+        Add or refresh deals in the feed after ingest or a hot score change.
+        Unlisted deals (inactive, blocked, deleted) are removed, and existing
+        deals are removed from the category (and global) feeds they no longer
+        belong to, e.g. after a category change. Never raises: the feed
+        self-heals on the next rebuild.
+
+        Args:
+            deals: Deals to index (source/category are lazy-loaded if needed)
+            new_deal_ids: Deals that were just created (bump feed counts)
+        """
+        if not HotFeedCache.is_enabled():
+            return
+
+        new_ids = set(new_deal_ids)
+        limit = settings.HOT_FEED_SIZE
+
+        try:
+            client = get_redis()
+            category_scopes = [scope for scope in client.smembers(READY_KEY) if scope.startswith("category:")]
+
+            pipe = client.pipeline(transaction=False)
+            touched = set()
+
+            for deal in deals:
+                member = _member(deal.id)
+
+                if _is_listed(deal):
+                    scopes = _deal_scopes(deal.source_id, deal.category_id, deal.canonical_deal_id is None)
+                else:
+                    scopes = []
+
+                # The deal may sit in feeds it no longer belongs to (old category,
+                # or global/category feeds before it became a duplicate)
+                if deal.id not in new_ids:
+                    stale = set(_deal_scopes(deal.source_id, deal.category_id)).union(category_scopes)
+                    for scope in stale.difference(scopes):
+                        pipe.zrem(FEED_KEY_PREFIX + scope, member)
+
+                if not scopes:
+                    continue
+
+                pipe.set(CARD_KEY_PREFIX + str(deal.id), HotFeedCache.serialize_card(deal),
+                         ex=settings.HOT_FEED_CARD_TTL)
+                for scope in scopes:
+                    pipe.zadd(FEED_KEY_PREFIX + scope, {member: deal.hot_score or 0.0})
+                    if deal.id in new_ids:
+                        pipe.hincrby(COUNTS_KEY, scope, 1)
+                    touched.add(scope)
+
+            # Keep only the top-K members of each touched feed
+            for scope in touched:
+                pipe.zremrangebyrank(FEED_KEY_PREFIX + scope, 0, -(limit + 1))
+
+            pipe.execute()
+        except Exception as e:
+            print(f"⚠️ Hot feed update failed: {e}")
+
+    @staticmethod
+    def index_deal(deal: Deal, is_new: bool = False) -> None:
+        """Add or refresh a single deal in the feed (see index_deals)."""
+        HotFeedCache.index_deals([deal], [deal.id] if is_new else ())
+
+    @staticmethod
+    def reindex(db: Session, deal_ids: Iterable[int]) -> Dict[str, Any]:
+        """
+        Re-index deals changed by a batch job (hot score decay, blacklist,
+        category backfill, archiving) without rebuilding the whole feed.
+        Deals no longer in the deals table are removed from every feed.
+        Counts are left as they are until the next rebuild.
+
+        Args:
+            db: Database session
+            deal_ids: IDs of changed deals
+
+        Returns:
+            Dictionary with indexed/removed deal counts
+        """
+        if not HotFeedCache.is_enabled():
+            return {"indexed": 0, "removed": 0}
+
+        deal_ids = sorted(set(deal_ids))
+        indexed = 0
+        removed = 0
+
+        for start in range(0, len(deal_ids), CARD_LOAD_CHUNK):
+            chunk = deal_ids[start:start + CARD_LOAD_CHUNK]
+            deals = db.query(Deal).options(
+                joinedload(Deal.source),
+                joinedload(Deal.category),
+                undefer(Deal.ai_summary)
+            ).filter(Deal.id.in_(chunk)).all()
+
+            HotFeedCache.index_deals(deals)
+            indexed += len(deals)
+
+            found = {deal.id for deal in deals}
+            gone = [deal_id for deal_id in chunk if deal_id not in found]
+            if not gone:
+                continue
+
+            try:
+                client = get_redis()
+                scopes = client.smembers(READY_KEY)
+                pipe = client.pipeline(transaction=False)
+                for deal_id in gone:
+                    for scope in scopes:
+                        pipe.zrem(FEED_KEY_PREFIX + scope, _member(deal_id))
+                    pipe.delete(CARD_KEY_PREFIX + str(deal_id))
+                pipe.execute()
+                removed += len(gone)
+            except redis.RedisError as e:
+                print(f"⚠️ Hot feed update failed: {e}")
+
+        return {"indexed": indexed, "removed": removed}
+
+    @staticmethod
+    def rebuild(db: Session) -> Dict[str, Any]:
+        """
+        Rebuild every feed sorted set, card and count from the database.
+        Each sorted set is built under a temporary key and swapped in with
+        RENAME, so readers never see a partial feed.
+
+        Args:
+            db: Database session
+
+        Returns:
+            Dictionary with scope and card counts
+        """
+        limit = settings.HOT_FEED_SIZE
+        listed = (
+            Deal.is_active == True,
+            Deal.is_blocked == False,
+            Deal.deleted_at == None
+        )
+        ordering = (Deal.hot_score.desc(), Deal.id.desc())
+        is_duplicate = (Deal.canonical_deal_id != None).label("is_duplicate")
+
+        # Global and category ranks count canonical deals only
+        ranked = db.query(
+            Deal.id,
+            Deal.hot_score,
+            Deal.source_id,
+            Deal.category_id,
+            is_duplicate,
+            func.row_number().over(partition_by=is_duplicate, order_by=ordering).label("rank_all"),
+            func.row_number().over(partition_by=Deal.source_id, order_by=ordering).label("rank_source"),
+            func.row_number().over(partition_by=(Deal.category_id, is_duplicate), order_by=ordering).label("rank_category"),
+        ).filter(*listed).subquery()
+
+        rows = db.query(ranked).filter(
+            ((ranked.c.rank_all <= limit) & (ranked.c.is_duplicate == False))
+            | (ranked.c.rank_source <= limit)
+            | ((ranked.c.rank_category <= limit) & (ranked.c.is_duplicate == False) & (ranked.c.category_id != None))
+        ).all()
+
+        feeds: Dict[str, Dict[str, float]] = {"all": {}}
+        for row in rows:
+            member = _member(row.id)
+            if not row.is_duplicate and row.rank_all <= limit:
+                feeds["all"][member] = row.hot_score
+            if row.rank_source <= limit:
+                feeds.setdefault(f"source:{row.source_id}", {})[member] = row.hot_score
+            if row.category_id and not row.is_duplicate and row.rank_category <= limit:
+                feeds.setdefault(f"category:{row.category_id}", {})[member] = row.hot_score
+
+        counts = {"all": db.query(func.count(Deal.id)).filter(*listed, Deal.canonical_deal_id == None).scalar()}
+        for source_id, count in db.query(Deal.source_id, func.count(Deal.id)).filter(*listed).group_by(Deal.source_id):
+            counts[f"source:{source_id}"] = count
+        for category_id, count in db.query(Deal.category_id, func.count(Deal.id)).filter(
+            *listed, Deal.category_id != None, Deal.canonical_deal_id == None
+        ).group_by(Deal.category_id):
+            counts[f"category:{category_id}"] = count
+
+        client = get_redis()
+
+        # Cards first, so swapped-in feeds find them
+        deal_ids = [row.id for row in rows]
+        for start in range(0, len(deal_ids), CARD_LOAD_CHUNK):
+            cards = DealCardService.load_by_ids(db, deal_ids[start:start + CARD_LOAD_CHUNK])
+
+            pipe = client.pipeline(transaction=False)
+            for card in cards:
+                pipe.set(CARD_KEY_PREFIX + str(card["id"]), dumps(card), ex=settings.HOT_FEED_CARD_TTL)
+            pipe.execute()
+
+        stale_scopes = set(client.smembers(READY_KEY)) - set(feeds)
+
+        pipe = client.pipeline(transaction=True)
+        for scope, members in feeds.items():
+            if members:
+                tmp_key = f"{FEED_KEY_PREFIX}{scope}:rebuild"
+                pipe.delete(tmp_key)
+                pipe.zadd(tmp_key, members)
+                pipe.rename(tmp_key, FEED_KEY_PREFIX + scope)
+            else:
+                pipe.delete(FEED_KEY_PREFIX + scope)
+        for scope in stale_scopes:
+            pipe.delete(FEED_KEY_PREFIX + scope)
+        pipe.delete(COUNTS_KEY)
+        pipe.hset(COUNTS_KEY, mapping=counts)
+        pipe.delete(READY_KEY)
+        pipe.sadd(READY_KEY, *feeds.keys())
+        pipe.execute()
+
+        return {
+            "scopes": len(feeds),
+            "cards": len(deal_ids),
+            "listed_deals": counts["all"],
+        }
+
+    @staticmethod
+    def get_page(
+        db: Session,
+        source_id: Optional[int] = None,
+        category_id: Optional[int] = None,
+        page: int = 1,
+        page_size: int = 20,
+        cursor: Optional[str] = None,
+        include_total: bool = True,
+        fields: Optional[List[str]] = None
+    ) -> Optional[str]:
+        """
+        Serve one page of the hot feed as a DealListResponse JSON document.
+
+        Returns None (cache miss, caller queries the database) when the feed
+        is disabled or not built, Redis is unavailable, the page reaches past
+        the cached top-K, or the cursor's deal has moved since it was issued.
+        Missing cards are loaded from the database and re-cached.
+
+        Args:
+            db: Database session (only used for missing cards)
+            source_id: Optional source filter
+            category_id: Optional category filter (ignored with source_id)
+            page: Page number (ignored when cursor is given)
+            page_size: Items per page
+            cursor: Cursor from a previous page
+            include_total: Include the (approximate) total
+            fields: Sparse fieldset (cached cards are projected; content
+                isn't cached, so asking for it is a miss)
+
+        Returns:
+            Response JSON string, or None on a cache miss
+        """
+        if not HotFeedCache.is_enabled() or (fields and "content" in fields):
+            return None
+
+        scope = feed_scope(source_id, category_id)
+        key = FEED_KEY_PREFIX + scope
+        limit = settings.HOT_FEED_SIZE
+
+        try:
+            client = get_redis()
+
+            if cursor:
+                try:
+                    value, row_id = decode_cursor(cursor, "hot_score", "desc")
+                except InvalidCursorError:
+                    return None  # let the database path report it
+
+                pipe = client.pipeline(transaction=False)
+                pipe.sismember(READY_KEY, scope)
+                pipe.zscore(key, _member(row_id))
+                pipe.zrevrank(key, _member(row_id))
+                pipe.zcard(key)
+                ready, score, rank, size = pipe.execute()
+
+                if not ready or score is None or score != value:
+                    return None
+                start = rank + 1
+            else:
+                pipe = client.pipeline(transaction=False)
+                pipe.sismember(READY_KEY, scope)
+                pipe.zcard(key)
+                ready, size = pipe.execute()
+
+                if not ready:
+                    return None
+                start = (page - 1) * page_size
+
+            # The page (plus one look-ahead row) must lie inside the cached top-K,
+            # unless the feed holds every listed deal
+            if size >= limit and start + page_size + 1 > size:
+                return None
+
+            pipe = client.pipeline(transaction=False)
+            pipe.zrevrange(key, start, start + page_size, withscores=True)
+            pipe.hget(COUNTS_KEY, scope)
+            entries, total = pipe.execute()
+
+            has_next = len(entries) > page_size
+            entries = entries[:page_size]
+            deal_ids = [int(member) for member, _ in entries]
+
+            cards = client.mget([CARD_KEY_PREFIX + str(deal_id) for deal_id in deal_ids]) if deal_ids else []
+        except redis.RedisError as e:
+            print(f"⚠️ Hot feed read failed: {e}")
+            return None
+
+        missing = [deal_id for deal_id, card in zip(deal_ids, cards) if card is None]
+        if missing:
+            loaded = {card["id"]: dumps(card) for card in DealCardService.load_by_ids(db, missing)}
+            if len(loaded) < len(missing):
+                return None  # deal vanished; let the database answer
+
+            cards = [card if card is not None else loaded[deal_id] for deal_id, card in zip(deal_ids, cards)]
+            try:
+                pipe = client.pipeline(transaction=False)
+                for deal_id, card in loaded.items():
+                    pipe.set(CARD_KEY_PREFIX + str(deal_id), card, ex=settings.HOT_FEED_CARD_TTL)
+                pipe.execute()
+            except redis.RedisError:
+                pass
+
+        if fields is not None:
+            cards = [dumps(project_card(orjson.loads(card), fields)) for card in cards]
+
+        if include_total:
+            if total is None:
+                return None
+            total = int(total)
+        else:
+            total = None
+
+        next_cursor = None
+        if has_next:
+            member, score = entries[-1]
+            next_cursor = encode_cursor("hot_score", "desc", score, int(member))
+
+        meta = json.dumps({
+            "total": total,
+            "page": None if cursor else page,
+            "page_size": page_size,
+            "total_pages": (ceil(total / page_size) if total > 0 else 0) if total is not None else None,
+            "next_cursor": next_cursor,
+        }, separators=(",", ":"))
+
+        return '{"deals":[' + ",".join(cards) + "]," + meta[1:]
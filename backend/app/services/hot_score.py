@@ -0,0 +1,83 @@
+"""
+Hot score recomputation service.
+Deal.calculate_hot_score only runs when a crawler re-sees a deal, so deals
+that drop off the first listing pages keep a frozen, inflated hot_score.
+This service re-applies the same formula (Deal.hot_score_expression) to
+every listed deal with set-based UPDATEs, in id-range chunks so no single
+statement locks many rows for long.
+
+Only rows whose score moves by at least HOT_SCORE_MIN_CHANGE are written,
+and deals already decayed to 0 are skipped (votes and comments only change
+when a crawler re-sees the deal, which recomputes the score there).
+"""
+from datetime import datetime
+from typing import Any, Dict, Optional, Set
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.models.deal import Deal
+
+
+class HotScoreService:
+    """Service class for periodic hot score decay."""
+
+    @staticmethod
+    def recompute(
+        db: Session,
+        batch_size: Optional[int] = None,
+        now: Optional[datetime] = None
+    ) -> Dict[str, Any]:
+        """
+        Recompute hot_score for every listed deal with a positive score.
+
+        Args:
+            db: Database session (committed after each chunk)
+            batch_size: Id range per UPDATE (default: HOT_SCORE_RECOMPUTE_BATCH_SIZE)
+            now: Reference time (default: utcnow, fixed for the whole run)
+
+        Returns:
+            Dictionary with updated/chunk counts and the IDs and source IDs
+            of updated deals (for cache invalidation)
+        """
+        batch_size = batch_size or settings.HOT_SCORE_RECOMPUTE_BATCH_SIZE
+        now = now or datetime.utcnow()
+
+        candidates = (
+            Deal.is_active == True,
+            Deal.is_blocked == False,
+            Deal.deleted_at == None,
+            Deal.hot_score > 0
+        )
+
+        min_id, max_id = db.query(func.min(Deal.id), func.max(Deal.id)).filter(*candidates).one()
+        if min_id is None:
+            return {"updated": 0, "chunks": 0, "deal_ids": set(), "source_ids": set()}
+
+        new_score = Deal.hot_score_expression(now)
+        updated = 0
+        chunks = 0
+        deal_ids: Set[int] = set()
+        source_ids: Set[int] = set()
+
+        for start in range(min_id, max_id + 1, batch_size):
+            rows = db.execute(
+                Deal.__table__.update()
+                .where(
+                    Deal.id >= start,
+                    Deal.id < start + batch_size,
+                    *candidates,
+                    func.abs(Deal.hot_score - new_score) >= settings.HOT_SCORE_MIN_CHANGE
+                )
+                .values(hot_score=new_score)
+                .returning(Deal.id, Deal.source_id)
+            ).all()
+            db.commit()
+
+            chunks += 1
+            updated += len(rows)
+            deal_ids.update(row.id for row in rows)
+            source_ids.update(row.source_id for row in rows)
+
+        return {"updated": updated, "chunks": chunks, "deal_ids": deal_ids, "source_ids": source_ids}
@@ -6,7 +6,10 @@ from typing import List, Optional, Dict
 from sqlalchemy.orm import Session
 from sqlalchemy import func
 
+from app.config import settings
 from app.models.user import UserKeyword
+from app.services.autocomplete import AutocompleteService
+from app.utils.read_routing import mark_user_write
 
 
 class KeywordService:
@@ -64,6 +67,10 @@ class KeywordService:
         db.add(new_keyword)
         db.commit()
         db.refresh(new_keyword)
+        mark_user_write(user_id)
+
+        if is_inclusion:
+            AutocompleteService.add_terms({normalized_keyword: settings.AUTOCOMPLETE_USER_KEYWORD_WEIGHT})
 
         return new_keyword
 
@@ -137,6 +144,12 @@ class KeywordService:
         # Refresh all objects
         for kw in created_keywords:
             db.refresh(kw)
+        mark_user_write(user_id)
+
+        AutocompleteService.add_terms({
+            kw.keyword: settings.AUTOCOMPLETE_USER_KEYWORD_WEIGHT
+            for kw in created_keywords if kw.is_inclusion
+        })
 
         return created_keywords
 
@@ -223,6 +236,7 @@ class KeywordService:
         keyword.is_active = is_active
         db.commit()
         db.refresh(keyword)
+        mark_user_write(user_id)
 
         return keyword
 
@@ -250,6 +264,7 @@ class KeywordService:
 
         db.delete(keyword)
         db.commit()
+        mark_user_write(user_id)
 
     @staticmethod
     def _normalize_keyword(keyword: str) -> str:
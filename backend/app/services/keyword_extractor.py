@@ -7,6 +7,7 @@ from typing import List, Set
 from sqlalchemy.orm import Session
 
 from app.models import Deal, DealKeyword
+from app.services.autocomplete import AutocompleteService
 
 
 class KeywordExtractor:
@@ -87,7 +88,8 @@ class KeywordExtractor:
     @staticmethod
     def extract_and_save(db: Session, deal: Deal) -> int:
         """
-        Extract keywords from a deal and save to database.
+        Extract keywords from a deal and save to database. Keywords of
+        blocked deals are saved but not added to autocomplete.
 
         Args:
             db: Database session
@@ -143,6 +145,11 @@ class KeywordExtractor:
 
         db.commit()
 
+        # Feed the autocomplete prefix index incrementally (blacklisted deals
+        # are left out, like in AutocompleteService.rebuild)
+        if not deal.is_blocked:
+            AutocompleteService.add_terms({kw_dict["keyword"].lower(): 1 for kw_dict in unique_keywords})
+
         return len(unique_keywords)
 
     @staticmethod
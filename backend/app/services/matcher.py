@@ -2,15 +2,16 @@
 Keyword matching engine for personalized deal recommendations.
 Matches deals to users based on inclusion/exclusion keywords with DND support.
 """
-from typing import List, Dict
+from typing import List, Dict, Optional
 from datetime import datetime, timedelta, time as datetime_time
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.orm import Session, joinedload, undefer
 from sqlalchemy import func, and_, exists
 from math import ceil
 
 from app.models.deal import Deal
 from app.models.user import User, UserKeyword
 from app.models.analytics import DealKeyword
+from app.utils.pagination import keyset_paginate
 
 
 class KeywordMatcher:
@@ -92,7 +93,9 @@ class KeywordMatcher:
         user: User,
         page: int = 1,
         page_size: int = 20,
-        days: int = 7
+        days: int = 7,
+        cursor: Optional[str] = None,
+        include_total: bool = True
     ) -> Dict:
         """
         Get personalized deal feed for a user based on their keywords.
@@ -102,18 +105,23 @@ class KeywordMatcher:
         2. Find deals with matching keywords (OR condition)
         3. Filter out deals with matching exclusion keywords
         4. Apply time filter (recent N days)
-        5. Sort by hot_score DESC
-        6. Paginate results
+        5. Sort by hot_score DESC, id DESC
+        6. Paginate results (keyset when a cursor is given)
 
         Args:
             db: Database session
             user: User object
-            page: Page number (1-indexed)
+            page: Page number (1-indexed, ignored when cursor is given)
             page_size: Number of items per page
             days: Number of days to look back (default: 7)
+            cursor: Cursor from a previous page's next_cursor
+            include_total: Count all matching deals
 
         Returns:
-            Dictionary with deals, pagination info
+            Dictionary with deals, pagination info and next_cursor
+
+        Raises:
+            InvalidCursorError: If the cursor is invalid
         """
         # Get user's active inclusion keywords
         inclusion_keywords = db.query(UserKeyword.keyword).filter(
@@ -129,9 +137,10 @@ class KeywordMatcher:
             return {
                 "deals": [],
                 "total": 0,
-                "page": page,
+                "page": None if cursor else page,
                 "page_size": page_size,
-                "total_pages": 0
+                "total_pages": 0,
+                "next_cursor": None
             }
 
         # Get user's exclusion keywords
@@ -149,7 +158,8 @@ class KeywordMatcher:
         # Base query with eager loading to prevent N+1
         base_query = db.query(Deal).options(
             joinedload(Deal.source),
-            joinedload(Deal.category)
+            joinedload(Deal.category),
+            undefer(Deal.ai_summary)
         ).filter(
             Deal.is_active == True,
             Deal.is_blocked == False,
@@ -178,21 +188,28 @@ class KeywordMatcher:
             )
             base_query = base_query.filter(~exclusion_exists)
 
-        # Get total count before pagination
-        total = base_query.count()
+        # Get total count before pagination (optional)
+        total = base_query.count() if include_total else None
 
         # Apply sorting and pagination
-        offset = (page - 1) * page_size
-        deals = base_query.order_by(
-            Deal.hot_score.desc()
-        ).offset(offset).limit(page_size).all()
+        deals, next_cursor = keyset_paginate(
+            base_query,
+            sort_by="hot_score",
+            sort_column=Deal.hot_score,
+            id_column=Deal.id,
+            order="desc",
+            page_size=page_size,
+            cursor=cursor,
+            offset=(page - 1) * page_size
+        )
 
         return {
             "deals": deals,
             "total": total,
-            "page": page,
+            "page": None if cursor else page,
             "page_size": page_size,
-            "total_pages": ceil(total / page_size) if total > 0 else 0
+            "total_pages": (ceil(total / page_size) if total > 0 else 0) if total is not None else None,
+            "next_cursor": next_cursor
         }
 
     @staticmethod
@@ -1,15 +1,21 @@
 """
 Notification management service.
 Handles querying, reading, and clicking notifications for users.
+
+Unread counts are served from the denormalized users.unread_notification_count
+column, updated incrementally here and reconciled periodically. A
+notification is unread from the moment it is listed (inserted, including
+DND-scheduled ones) until read_at is set.
 """
 from typing import Dict, List, Optional
 from datetime import datetime
 from math import ceil
 from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import and_
+from sqlalchemy import and_, func, update, text
 
 from app.models.interaction import Notification, NotificationStatus
 from app.models.deal import Deal
+from app.models.user import User
 
 
 class NotificationService:
@@ -64,7 +70,10 @@ class NotificationService:
     def get_unread_count(db: Session, user_id: int) -> int:
         """
         Get count of unread notifications for a user.
-        A notification is unread if read_at is NULL and status is SENT or DELIVERED.
+        A notification is unread if read_at is NULL.
+
+        Reads the denormalized counter on the user row; the notifications
+        table is not touched.
 
         Args:
             db: Database session
@@ -73,14 +82,83 @@ class NotificationService:
         Returns:
             Number of unread notifications
         """
-        return db.query(Notification).filter(
-            Notification.user_id == user_id,
-            Notification.read_at == None,
-            Notification.status.in_([
-                NotificationStatus.SENT,
-                NotificationStatus.DELIVERED
-            ])
-        ).count()
+        count = db.query(User.unread_notification_count).filter(
+            User.id == user_id
+        ).scalar()
+        return count or 0
+
+    @staticmethod
+    def increment_unread_counts(db: Session, counts: Dict[int, int]) -> None:
+        """
+        Add new notifications to users' unread counters.
+        Does not commit; call inside the transaction that inserts them.
+
+        Args:
+            db: Database session
+            counts: Mapping of user ID to number of new notifications
+        """
+        params = [
+            {"user_id": user_id, "delta": delta}
+            for user_id, delta in counts.items() if delta
+        ]
+        if not params:
+            return
+
+        db.execute(
+            text(
+                "UPDATE users "
+                "SET unread_notification_count = unread_notification_count + :delta "
+                "WHERE id = :user_id"
+            ),
+            params
+        )
+
+    @staticmethod
+    def _decrement_unread_count(db: Session, user_id: int, delta: int) -> None:
+        """Subtract read notifications from a user's unread counter (never below zero)."""
+        if delta <= 0:
+            return
+
+        db.execute(
+            update(User).where(User.id == user_id).values(
+                unread_notification_count=func.greatest(
+                    User.unread_notification_count - delta, 0
+                )
+            )
+        )
+
+    @staticmethod
+    def reconcile_unread_counts(db: Session) -> int:
+        """
+        Recompute every user's unread counter from the notifications table.
+        Only rows whose stored counter drifted are updated.
+
+        Args:
+            db: Database session
+
+        Returns:
+            Number of users whose counter was corrected
+        """
+        result = db.execute(
+            text(
+                """
+                WITH counts AS (
+                    SELECT user_id, COUNT(*) AS unread
+                    FROM notifications
+                    WHERE read_at IS NULL
+                    GROUP BY user_id
+                )
+                UPDATE users
+                SET unread_notification_count = COALESCE(counts.unread, 0)
+                FROM users u
+                LEFT JOIN counts ON counts.user_id = u.id
+                WHERE users.id = u.id
+                  AND users.unread_notification_count <> COALESCE(counts.unread, 0)
+                """
+            )
+        )
+        db.commit()
+        return result.rowcount
 
     @staticmethod
     def mark_as_read(
@@ -100,14 +178,16 @@ class NotificationService:
             Number of notifications updated
         """
         now = datetime.utcnow()
-        updated = db.query(Notification).filter(
-            Notification.id.in_(notification_ids),
-            Notification.user_id == user_id,
-            Notification.read_at == None
-        ).update(
-            {"read_at": now},
-            synchronize_session="fetch"
-        )
+        updated = db.execute(
+            update(Notification).where(
+                Notification.id.in_(notification_ids),
+                Notification.user_id == user_id,
+                Notification.read_at == None
+            ).values(read_at=now),
+            execution_options={"synchronize_session": False}
+        ).rowcount
+
+        NotificationService._decrement_unread_count(db, user_id, updated)
 
         db.commit()
         return updated
@@ -138,6 +218,9 @@ class NotificationService:
             return None
 
         now = datetime.utcnow()
+        if notification.read_at is None:
+            NotificationService._decrement_unread_count(db, user_id, 1)
+
         notification.status = NotificationStatus.CLICKED
         if not notification.clicked_at:
             notification.clicked_at = now
@@ -166,7 +249,12 @@ class NotificationService:
             Notification.read_at == None
         ).update(
             {"read_at": now},
-            synchronize_session="fetch"
+            synchronize_session=False
+        )
+
+        db.query(User).filter(User.id == user_id).update(
+            {"unread_notification_count": 0},
+            synchronize_session=False
         )
 
         db.commit()
@@ -0,0 +1,156 @@
+"""
+Notification history retention service.
+Keeps monthly notification partitions created ahead of time and replaces
+partitions past the retention window with per-user/per-keyword rollups.
+"""
+from typing import Dict, Any, List, Optional
+from datetime import datetime
+from sqlalchemy.orm import Session
+from sqlalchemy import text
+
+from app.config import settings
+from app.utils.partitioning import (
+    add_months, month_start, ensure_monthly_partitions, partitions_before, drop_partition
+)
+
+
+NOTIFICATIONS_TABLE = "notifications"
+
+
+class NotificationRetentionService:
+    """Service class for notification partition maintenance and rollups."""
+
+    @staticmethod
+    def ensure_partitions(db: Session, months_ahead: Optional[int] = None) -> List[str]:
+        """
+        Create missing notification partitions for this and upcoming months.
+
+        Args:
+            db: Database session (committed here)
+            months_ahead: Future months to pre-create
+                (default: NOTIFICATION_PARTITION_MONTHS_AHEAD)
+
+        Returns:
+            Names of the partitions that were created
+        """
+        created = ensure_monthly_partitions(
+            db,
+            NOTIFICATIONS_TABLE,
+            months_ahead if months_ahead is not None else settings.NOTIFICATION_PARTITION_MONTHS_AHEAD
+        )
+        db.commit()
+        return created
+
+    @staticmethod
+    def rollup_partition(db: Session, partition: str, month) -> int:
+        """
+        Write delivery rollups for one notification partition.
+
+        One row per user with keyword NULL (all notifications), plus one row
+        per user and matched keyword.
+
+        Args:
+            db: Database session (caller commits)
+            partition: Partition table name
+            month: First day of the partition's month
+
+        Returns:
+            Number of rollup rows written
+        """
+        counts = """
+            COUNT(*),
+            COUNT(*) FILTER (WHERE n.status IN ('SENT', 'DELIVERED', 'CLICKED')),
+            COUNT(*) FILTER (WHERE n.read_at IS NOT NULL),
+            COUNT(*) FILTER (WHERE n.status = 'CLICKED'),
+            COUNT(*) FILTER (WHERE n.status = 'FAILED')
+        """
+
+        result = db.execute(
+            text(
+                f"""
+                INSERT INTO notification_rollups
+                    (user_id, month, keyword, total_count, sent_count, read_count,
+                     clicked_count, failed_count, created_at, updated_at)
+                SELECT n.user_id, :month, NULL, {counts}, NOW(), NOW()
+                FROM "{partition}" n
+                GROUP BY n.user_id
+                UNION ALL
+                SELECT n.user_id, :month, LEFT(kw.keyword, 100), {counts}, NOW(), NOW()
+                FROM "{partition}" n
+                CROSS JOIN LATERAL jsonb_array_elements_text(n.matched_keywords) AS kw(keyword)
+                WHERE jsonb_typeof(n.matched_keywords) = 'array'
+                GROUP BY n.user_id, LEFT(kw.keyword, 100)
+                """
+            ),
+            {"month": month}
+        )
+        return result.rowcount
+
+    @staticmethod
+    def prune_partition(db: Session, partition: str) -> None:
+        """
+        Remove a rolled-up partition together with its outbox rows and its
+        share of users' unread counters (caller commits).
+
+        Args:
+            db: Database session
+            partition: Partition table name
+        """
+        db.execute(text(
+            f"""
+            UPDATE users
+            SET unread_notification_count = GREATEST(unread_notification_count - counts.unread, 0)
+            FROM (
+                SELECT user_id, COUNT(*) AS unread
+                FROM "{partition}"
+                WHERE read_at IS NULL
+                GROUP BY user_id
+            ) counts
+            WHERE users.id = counts.user_id
+            """
+        ))
+        db.execute(text(
+            f"""
+            DELETE FROM notification_outbox o
+            USING "{partition}" n
+            WHERE o.notification_id = n.id
+            """
+        ))
+        drop_partition(db, partition)
+
+    @staticmethod
+    def apply_retention(db: Session, retention_months: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Roll up and drop every notification partition older than the
+        retention window. Each partition is handled in its own transaction.
+
+        Args:
+            db: Database session
+            retention_months: Months of history to keep
+                (default: NOTIFICATION_RETENTION_MONTHS)
+
+        Returns:
+            Dictionary with dropped partition names and rollup row count
+        """
+        retention_months = retention_months or settings.NOTIFICATION_RETENTION_MONTHS
+        cutoff = add_months(month_start(datetime.utcnow()), -retention_months)
+
+        dropped = []
+        rollup_rows = 0
+
+        for partition, month in partitions_before(db, NOTIFICATIONS_TABLE, cutoff):
+            try:
+                rollup_rows += NotificationRetentionService.rollup_partition(db, partition, month)
+                NotificationRetentionService.prune_partition(db, partition)
+                db.commit()
+                dropped.append(partition)
+                print(f"🗄️  Rolled up and dropped {partition}")
+            except Exception as e:
+                db.rollback()
+                print(f"❌ Failed to retire {partition}: {e}")
+
+        return {
+            "cutoff": cutoff.isoformat(),
+            "dropped_partitions": dropped,
+            "rollup_rows": rollup_rows,
+        }
@@ -0,0 +1,329 @@
+"""
+Notification outbox service.
+Writes notifications and their push outbox rows in one transaction and
+provides the claim/ack primitives used by the outbox dispatcher.
+"""
+from collections import defaultdict
+from typing import Dict, List, Any, Optional
+from datetime import datetime, timedelta
+from sqlalchemy.orm import Session
+from sqlalchemy import insert
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+from app.config import settings
+from app.models.deal import Deal
+from app.models.user import User, UserKeyword
+from app.models.interaction import (
+    Notification, NotificationStatus, NotificationOutbox, OutboxStatus,
+    notification_id_seq
+)
+from app.models.analytics import DealKeyword
+from app.services.dedupe import DuplicateDetector
+from app.services.matcher import KeywordMatcher
+from app.services.notification import NotificationService
+
+
+# Priority lanes (lower value is delivered first) and their Celery queues
+PRIORITY_HIGH = 0
+PRIORITY_NORMAL = 1
+PRIORITY_BULK = 2
+
+LANE_PRIORITIES = {
+    "high": PRIORITY_HIGH,
+    "normal": PRIORITY_NORMAL,
+    "bulk": PRIORITY_BULK,
+}
+
+LANE_QUEUES = {
+    "high": "notification.high",
+    "normal": "notification",
+    "bulk": "notification.bulk",
+}
+
+PRIORITY_LANES = {priority: lane for lane, priority in LANE_PRIORITIES.items()}
+
+
+class NotificationOutboxService:
+    """Service class for the transactional notification outbox."""
+
+    @staticmethod
+    def select_priority(deal: Deal, match_count: int) -> int:
+        """
+        Pick the delivery lane for a deal's notifications.
+
+        Specific matches (few users) go to the high lane and mass matches to
+        the bulk lane, so a popular keyword cannot starve rarer ones.
+        A hot deal is promoted one lane.
+
+        Args:
+            deal: Matched deal
+            match_count: Number of users matched to the deal
+
+        Returns:
+            Priority value (PRIORITY_HIGH, PRIORITY_NORMAL or PRIORITY_BULK)
+        """
+        if match_count <= settings.NOTIFICATION_HIGH_PRIORITY_MAX_MATCHES:
+            priority = PRIORITY_HIGH
+        elif match_count >= settings.NOTIFICATION_BULK_MIN_MATCHES:
+            priority = PRIORITY_BULK
+        else:
+            priority = PRIORITY_NORMAL
+
+        if (deal.hot_score or 0) >= settings.NOTIFICATION_HOT_SCORE_BOOST:
+            priority = max(PRIORITY_HIGH, priority - 1)
+
+        return priority
+
+    @staticmethod
+    def enqueue_deal_notifications(
+        db: Session,
+        deal: Deal,
+        users: List[User],
+        priority: Optional[int] = None
+    ) -> int:
+        """
+        Create Notification and outbox rows for users matched to a deal.
+
+        Runs inside the caller's transaction and does not commit, so the
+        notifications, their pending pushes and the users' unread counters
+        become visible atomically.
+        Users that already have a notification for this deal are skipped via
+        the outbox (user_id, deal_id) unique constraint, and users notified
+        about another post of the same deal (its duplicate cluster) are
+        skipped too. Notification and outbox rows share created_at so the
+        dispatcher can prune partitions.
+
+        Args:
+            db: Database session
+            deal: Matched deal
+            users: Users to notify
+            priority: Delivery lane (default: select_priority for len(users))
+
+        Returns:
+            Number of notifications queued
+        """
+        if not users:
+            return 0
+
+        # One push per deal, however many sources posted it
+        cluster_ids = [deal_id for deal_id in DuplicateDetector.cluster_ids(db, deal) if deal_id != deal.id]
+        if cluster_ids:
+            notified = {
+                row.user_id
+                for row in db.query(NotificationOutbox.user_id).filter(
+                    NotificationOutbox.deal_id.in_(cluster_ids),
+                    NotificationOutbox.user_id.in_([user.id for user in users])
+                )
+            }
+            users = [user for user in users if user.id not in notified]
+            if not users:
+                return 0
+
+        if priority is None:
+            priority = NotificationOutboxService.select_priority(deal, len(users))
+
+        user_ids = [user.id for user in users]
+
+        # Matched keywords for all users in one round trip
+        deal_kw_set = {
+            kw.keyword.lower()
+            for kw in db.query(DealKeyword.keyword).filter(DealKeyword.deal_id == deal.id).all()
+        }
+        user_keywords = db.query(UserKeyword.user_id, UserKeyword.keyword).filter(
+            UserKeyword.user_id.in_(user_ids),
+            UserKeyword.is_active == True,
+            UserKeyword.is_inclusion == True
+        ).all()
+
+        matched_by_user: Dict[int, set] = defaultdict(set)
+        for row in user_keywords:
+            keyword = row.keyword.lower()
+            if keyword in deal_kw_set:
+                matched_by_user[row.user_id].add(keyword)
+
+        now = datetime.utcnow()
+        notification_rows = {}
+        outbox_rows = []
+        for user in users:
+            matched_keywords = sorted(matched_by_user.get(user.id, ()))
+            title, body = NotificationOutboxService.build_message(deal, matched_keywords)
+
+            scheduled_for = None
+            if KeywordMatcher._is_in_dnd_period(user):
+                scheduled_for = KeywordMatcher._calculate_scheduled_time(user)
+
+            notification_rows[user.id] = {
+                "user_id": user.id,
+                "deal_id": deal.id,
+                "title": title,
+                "body": body,
+                "matched_keywords": matched_keywords,
+                "status": NotificationStatus.PENDING,
+                "scheduled_for": scheduled_for,
+                "created_at": now,
+                "updated_at": now,
+            }
+            outbox_rows.append({
+                "notification_id": notification_id_seq.next_value(),
+                "user_id": user.id,
+                "deal_id": deal.id,
+                "payload": {
+                    "title": title,
+                    "body": body,
+                    "data": {
+                        "deal_id": str(deal.id),
+                        "type": "scheduled" if scheduled_for else "keyword_match"
+                    }
+                },
+                "priority": priority,
+                "status": OutboxStatus.PENDING,
+                "available_at": scheduled_for or now,
+                "attempts": 0,
+                "created_at": now,
+                "updated_at": now,
+            })
+
+        # The outbox row claims (user_id, deal_id) and reserves the
+        # notification ID; only users that won the claim get a notification.
+        stmt = pg_insert(NotificationOutbox).values(outbox_rows).on_conflict_do_nothing(
+            constraint="uq_notification_outbox_user_deal"
+        ).returning(
+            NotificationOutbox.notification_id,
+            NotificationOutbox.user_id
+        )
+        inserted = db.execute(stmt).all()
+
+        if not inserted:
+            return 0
+
+        db.execute(insert(Notification), [
+            {"id": row.notification_id, **notification_rows[row.user_id]}
+            for row in inserted
+        ])
+        NotificationService.increment_unread_counts(db, {row.user_id: 1 for row in inserted})
+
+        return len(inserted)
+
+    @staticmethod
+    def build_message(deal: Deal, matched_keywords: List[str]) -> tuple:
+        """
+        Build push title and body for a matched deal.
+
+        Args:
+            deal: Matched deal
+            matched_keywords: Keywords that triggered the match
+
+        Returns:
+            Tuple of (title, body)
+        """
+        title = f"🔥 {matched_keywords[0] if matched_keywords else '새로운'} 핫딜!"
+        body = deal.title[:100]  # Truncate to 100 chars
+        return title, body
+
+    @staticmethod
+    def claim_batch(
+        db: Session,
+        batch_size: int,
+        priority: Optional[int] = None
+    ) -> List[NotificationOutbox]:
+        """
+        Lock a batch of due outbox rows for delivery.
+
+        Uses SELECT ... FOR UPDATE SKIP LOCKED so concurrent dispatchers
+        never claim the same row. Locks are held until the caller commits,
+        which it should do right after lease_batch.
+
+        Args:
+            db: Database session
+            batch_size: Maximum rows to claim
+            priority: Only claim rows of this lane (default: all lanes, highest first)
+
+        Returns:
+            List of locked NotificationOutbox rows
+        """
+        query = db.query(NotificationOutbox).filter(
+            NotificationOutbox.status == OutboxStatus.PENDING,
+            NotificationOutbox.available_at <= datetime.utcnow()
+        )
+
+        if priority is not None:
+            query = query.filter(NotificationOutbox.priority == priority)
+
+        return query.order_by(
+            NotificationOutbox.priority,
+            NotificationOutbox.available_at,
+            NotificationOutbox.id
+        ).limit(batch_size).with_for_update(skip_locked=True).all()
+
+    @staticmethod
+    def lease_batch(rows: List[NotificationOutbox]) -> None:
+        """
+        Take claimed rows out of the due set for NOTIFICATION_OUTBOX_LEASE_SECONDS
+        and count the delivery attempt. Commit right after: the lease, not
+        the row locks, keeps other dispatchers off while pushes are sent, and
+        rows a crashed dispatcher never finished become due again when it
+        runs out.
+
+        Args:
+            rows: Rows returned by claim_batch
+        """
+        lease_until = datetime.utcnow() + timedelta(seconds=settings.NOTIFICATION_OUTBOX_LEASE_SECONDS)
+        for row in rows:
+            row.available_at = lease_until
+            row.attempts += 1
+
+    @staticmethod
+    def mark_delivered(
+        row: NotificationOutbox,
+        notification: Optional[Notification],
+        push_response: Dict[str, Any]
+    ) -> None:
+        """
+        Mark an outbox row delivered and its notification sent.
+
+        Args:
+            row: Leased outbox row
+            notification: Notification the row belongs to (if still present)
+            push_response: FCM response to store on the notification
+        """
+        now = datetime.utcnow()
+        row.status = OutboxStatus.DELIVERED
+        row.delivered_at = now
+
+        if notification is not None:
+            notification.status = NotificationStatus.SENT
+            notification.sent_at = now
+            notification.scheduled_for = None
+            notification.push_response = push_response
+
+    @staticmethod
+    def mark_failed(
+        row: NotificationOutbox,
+        notification: Optional[Notification],
+        error: str
+    ) -> bool:
+        """
+        Record a failed delivery attempt (counted by lease_batch),
+        rescheduling with linear backoff.
+
+        Args:
+            row: Leased outbox row
+            notification: Notification the row belongs to (if still present)
+            error: Error description
+
+        Returns:
+            True if the row was given up on (max attempts reached)
+        """
+        row.last_error = error
+
+        if row.attempts >= settings.NOTIFICATION_OUTBOX_MAX_ATTEMPTS:
+            row.status = OutboxStatus.FAILED
+            if notification is not None:
+                notification.status = NotificationStatus.FAILED
+                notification.error_message = error
+            return True
+
+        row.available_at = datetime.utcnow() + timedelta(
+            seconds=settings.NOTIFICATION_OUTBOX_RETRY_DELAY * row.attempts
+        )
+        return False
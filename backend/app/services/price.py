@@ -1,13 +1,21 @@
 """
 Price tracking and signal calculation service.
 Handles historical price data analysis and price signal generation.
+
+Price signals read the product price index (ProductPriceIndex): one row per
+mall product ID and per normalized product name, updated as each price is
+recorded, so a product reposted in a new thread keeps its price history and
+a signal costs one indexed lookup. Per-deal statistics likewise read one
+DealPriceStats row instead of aggregating the deal's history.
 """
-from typing import Dict, Optional
+import re
+from typing import Any, Dict, Iterable, List, Optional
 from datetime import datetime, timedelta
 from sqlalchemy.orm import Session
-from sqlalchemy import func
+from sqlalchemy import func, delete, literal, select, union_all
+from sqlalchemy.dialects.postgresql import insert as pg_insert, aggregate_order_by, array_agg
 
-from app.models.analytics import PriceHistory
+from app.models.analytics import PriceHistory, DealPriceStats, ProductPriceIndex
 from app.models.deal import Deal
 
 
@@ -17,6 +25,64 @@ AVERAGE_THRESHOLD = 0.10  # 평균가 판정 기준 (±10%)
 MIN_HISTORY_RECORDS = 3   # 최소 히스토리 개수
 HISTORY_DAYS = 90         # 분석 기간 (90일)
 
+# Product name normalization: lowercase, keep only letters/digits/Hangul.
+# NAME_KEY_EXPRESSION mirrors it in SQL for index refreshes.
+PRODUCT_NAME_PATTERN = "[^0-9a-z가-힣]+"
+PRODUCT_NAME_MIN_LENGTH = 4  # Shorter names are too generic to share history
+
+_product_name_re = re.compile(PRODUCT_NAME_PATTERN)
+
+MALL_KEY_EXPRESSION = func.concat(
+    "mall:", func.coalesce(PriceHistory.mall_name, ""), ":", PriceHistory.mall_product_id
+)
+NORMALIZED_NAME_EXPRESSION = func.regexp_replace(
+    func.lower(PriceHistory.product_name), PRODUCT_NAME_PATTERN, "", "g"
+)
+NAME_KEY_EXPRESSION = func.concat("name:", NORMALIZED_NAME_EXPRESSION)
+
+
+def normalize_product_name(name: Optional[str]) -> Optional[str]:
+    """Normalize a product name for matching, or None if too short to match."""
+    if not name:
+        return None
+    normalized = _product_name_re.sub("", name.lower())
+    return normalized if len(normalized) >= PRODUCT_NAME_MIN_LENGTH else None
+
+
+def product_keys(
+    mall_name: Optional[str],
+    mall_product_id: Optional[str],
+    product_name: Optional[str]
+) -> List[str]:
+    """
+    Product price index keys of a product, most specific first.
+
+    Args:
+        mall_name: Shopping mall name
+        mall_product_id: Product ID within the mall
+        product_name: Product name
+
+    Returns:
+        "mall:<mall>:<id>" and/or "name:<normalized name>" keys
+    """
+    keys = []
+    if mall_product_id:
+        keys.append(f"mall:{mall_name or ''}:{mall_product_id}")
+    normalized = normalize_product_name(product_name)
+    if normalized:
+        keys.append(f"name:{normalized}")
+    return keys
+
+
+def _signal(current_price: float, min_price: float, avg_price: float) -> str:
+    """Price signal of a price against its history's minimum and average."""
+    if current_price <= min_price * (1 + LOWEST_THRESHOLD):
+        return 'lowest'
+    elif current_price <= avg_price * (1 + AVERAGE_THRESHOLD):
+        return 'average'
+    else:
+        return 'high'
+
 
 class PriceService:
     """Service class for price tracking and signal calculation."""
@@ -34,7 +100,10 @@ class PriceService:
             Price signal: 'lowest' (🟢), 'average' (🟡), 'high' (🔴), or None
 
         Algorithm:
-            1. Query last 90 days of price history
+            1. Look up the product price index (mall product ID, then
+               normalized name); fall back to the deal's own price
+               statistics if neither key has enough records (or to its last
+               90 days of history if it has prices older than that)
             2. Require minimum 3 records
             3. Calculate min_price and avg_price
             4. Determine signal:
@@ -46,9 +115,30 @@ class PriceService:
         if not deal.price:
             return None
 
-        # Query recent price history
+        keys = product_keys(deal.mall_name, deal.mall_product_id, deal.product_name)
+        if keys:
+            entries = {
+                entry.product_key: entry
+                for entry in db.query(ProductPriceIndex).filter(ProductPriceIndex.product_key.in_(keys))
+            }
+            for key in keys:
+                entry = entries.get(key)
+                if entry and entry.record_count >= MIN_HISTORY_RECORDS:
+                    return _signal(float(deal.price), float(entry.min_price), entry.avg_price)
+
         cutoff_date = datetime.utcnow() - timedelta(days=HISTORY_DAYS)
 
+        # The deal's running statistics, while all of its history is recent
+        deal_stats = db.get(DealPriceStats, deal.id)
+        if deal_stats is None:
+            return None
+        if deal_stats.first_recorded_at >= cutoff_date:
+            if deal_stats.record_count < MIN_HISTORY_RECORDS:
+                return None
+            return _signal(float(deal.price), float(deal_stats.min_price), deal_stats.avg_price)
+
+        # Query recent price history
+
         history_query = db.query(PriceHistory).filter(
             PriceHistory.deal_id == deal.id,
             PriceHistory.recorded_at >= cutoff_date
@@ -68,17 +158,188 @@ class PriceService:
         if not stats or not stats.min_price or not stats.avg_price:
             return None
 
-        min_price = float(stats.min_price)
-        avg_price = float(stats.avg_price)
-        current_price = float(deal.price)
+        return _signal(float(deal.price), float(stats.min_price), float(stats.avg_price))
+
+    @staticmethod
+    def record_price(db: Session, record: PriceHistory) -> None:
+        """
+        Add a price history record and fold it into the deal's statistics
+        and the product price index (caller commits).
+
+        Args:
+            db: Database session
+            record: New PriceHistory row (deal_id, price and recorded_at set)
+        """
+        db.add(record)
+        PriceService.index_deal_price(db, record.deal_id, record.price, record.recorded_at)
+        PriceService.index_product_price(
+            db,
+            record.mall_name,
+            record.mall_product_id,
+            record.product_name,
+            record.price,
+            record.recorded_at
+        )
+
+    @staticmethod
+    def index_deal_price(db: Session, deal_id: int, price: int, recorded_at: datetime) -> None:
+        """
+        Add a recorded price to the deal's running statistics (caller commits).
+
+        Args:
+            db: Database session
+            deal_id: Deal ID
+            price: Recorded price
+            recorded_at: Recording time
+        """
+        stmt = pg_insert(DealPriceStats).values(
+            deal_id=deal_id,
+            min_price=price,
+            max_price=price,
+            price_sum=price,
+            record_count=1,
+            last_price=price,
+            first_recorded_at=recorded_at,
+            last_recorded_at=recorded_at
+        )
+        db.execute(stmt.on_conflict_do_update(
+            index_elements=[DealPriceStats.deal_id],
+            set_={
+                "min_price": func.least(DealPriceStats.min_price, stmt.excluded.min_price),
+                "max_price": func.greatest(DealPriceStats.max_price, stmt.excluded.max_price),
+                "price_sum": DealPriceStats.price_sum + stmt.excluded.price_sum,
+                "record_count": DealPriceStats.record_count + 1,
+                "last_price": stmt.excluded.last_price,
+                "last_recorded_at": stmt.excluded.last_recorded_at,
+                "updated_at": stmt.excluded.updated_at,
+            }
+        ))
+
+    @staticmethod
+    def index_product_price(
+        db: Session,
+        mall_name: Optional[str],
+        mall_product_id: Optional[str],
+        product_name: Optional[str],
+        price: int,
+        recorded_at: datetime
+    ) -> int:
+        """
+        Add a recorded price to the product price index (caller commits).
+
+        Args:
+            db: Database session
+            mall_name: Shopping mall name
+            mall_product_id: Product ID within the mall
+            product_name: Product name
+            price: Recorded price
+            recorded_at: Recording time
+
+        Returns:
+            Number of index keys updated (0 if the product can't be keyed)
+        """
+        keys = product_keys(mall_name, mall_product_id, product_name)
+        if not keys:
+            return 0
+
+        stmt = pg_insert(ProductPriceIndex).values([
+            {
+                "product_key": key,
+                "min_price": price,
+                "max_price": price,
+                "price_sum": price,
+                "record_count": 1,
+                "last_price": price,
+                "window_start": recorded_at,
+                "last_recorded_at": recorded_at,
+            }
+            for key in keys
+        ])
+        db.execute(stmt.on_conflict_do_update(
+            index_elements=[ProductPriceIndex.product_key],
+            set_={
+                "min_price": func.least(ProductPriceIndex.min_price, stmt.excluded.min_price),
+                "max_price": func.greatest(ProductPriceIndex.max_price, stmt.excluded.max_price),
+                "price_sum": ProductPriceIndex.price_sum + stmt.excluded.price_sum,
+                "record_count": ProductPriceIndex.record_count + 1,
+                "last_price": stmt.excluded.last_price,
+                "last_recorded_at": stmt.excluded.last_recorded_at,
+                "updated_at": stmt.excluded.updated_at,
+            }
+        ))
+        return len(keys)
+
+    @staticmethod
+    def refresh_product_price_index(
+        db: Session,
+        full: bool = False,
+        now: Optional[datetime] = None
+    ) -> Dict[str, Any]:
+        """
+        Recompute product price index rows from the last 90 days of price
+        history. Incremental updates never drop old prices, so rows whose
+        window started more than 90 days ago are recomputed, and rows with
+        no price left in the window are deleted.
+
+        Args:
+            db: Database session (committed)
+            full: Recompute every key (backfill) instead of expired rows only
+            now: Reference time (default: utcnow)
+
+        Returns:
+            Dictionary with refreshed and deleted row counts
+        """
+        now = now or datetime.utcnow()
+        cutoff = now - timedelta(days=HISTORY_DAYS)
+
+        keyed = union_all(
+            select(MALL_KEY_EXPRESSION.label("product_key"), PriceHistory.price, PriceHistory.recorded_at).where(
+                PriceHistory.recorded_at >= cutoff,
+                PriceHistory.mall_product_id != None,
+                PriceHistory.mall_product_id != ""
+            ),
+            select(NAME_KEY_EXPRESSION.label("product_key"), PriceHistory.price, PriceHistory.recorded_at).where(
+                PriceHistory.recorded_at >= cutoff,
+                func.length(NORMALIZED_NAME_EXPRESSION) >= PRODUCT_NAME_MIN_LENGTH
+            )
+        ).subquery()
 
-        # Determine signal
-        if current_price <= min_price * (1 + LOWEST_THRESHOLD):
-            return 'lowest'
-        elif current_price <= avg_price * (1 + AVERAGE_THRESHOLD):
-            return 'average'
-        else:
-            return 'high'
+        aggregates = select(
+            keyed.c.product_key,
+            func.min(keyed.c.price),
+            func.max(keyed.c.price),
+            func.sum(keyed.c.price),
+            func.count(),
+            array_agg(aggregate_order_by(keyed.c.price, keyed.c.recorded_at.desc()))[1],
+            func.min(keyed.c.recorded_at),
+            func.max(keyed.c.recorded_at),
+            literal(now),
+            literal(now)
+        ).group_by(keyed.c.product_key)
+
+        if not full:
+            aggregates = aggregates.where(
+                keyed.c.product_key.in_(
+                    select(ProductPriceIndex.product_key).where(ProductPriceIndex.window_start < cutoff)
+                )
+            )
+
+        columns = [
+            "product_key", "min_price", "max_price", "price_sum", "record_count", "last_price",
+            "window_start", "last_recorded_at", "created_at", "updated_at"
+        ]
+        stmt = pg_insert(ProductPriceIndex).from_select(columns, aggregates)
+        refreshed = db.execute(stmt.on_conflict_do_update(
+            index_elements=[ProductPriceIndex.product_key],
+            set_={column: stmt.excluded[column] for column in columns if column not in ("product_key", "created_at")}
+        )).rowcount
+
+        deleted = db.execute(
+            delete(ProductPriceIndex).where(ProductPriceIndex.last_recorded_at < cutoff)
+        ).rowcount
+        db.commit()
+
+        return {"refreshed": refreshed, "deleted": deleted}
 
     @staticmethod
     def get_price_statistics(db: Session, deal: Deal) -> Dict:
@@ -97,15 +358,10 @@ class PriceService:
             - current: Current price
             - record_count: Number of price records
         """
-        # Query all price history for the deal
-        history_query = db.query(PriceHistory).filter(
-            PriceHistory.deal_id == deal.id
-        )
-
-        record_count = history_query.count()
+        stats = db.get(DealPriceStats, deal.id)
 
         # No history available
-        if record_count == 0:
+        if stats is None:
             return {
                 'lowest': deal.price,
                 'highest': deal.price,
@@ -114,19 +370,57 @@ class PriceService:
                 'record_count': 0
             }
 
-        # Calculate statistics
-        stats = history_query.with_entities(
-            func.min(PriceHistory.price).label('min_price'),
-            func.max(PriceHistory.price).label('max_price'),
-            func.avg(PriceHistory.price).label('avg_price')
-        ).first()
-
         return {
-            'lowest': int(stats.min_price) if stats.min_price else deal.price,
-            'highest': int(stats.max_price) if stats.max_price else deal.price,
-            'average': int(stats.avg_price) if stats.avg_price else deal.price,
+            'lowest': stats.min_price,
+            'highest': stats.max_price,
+            'average': int(stats.avg_price),
             'current': deal.price,
-            'record_count': record_count
+            'record_count': stats.record_count
+        }
+
+    @staticmethod
+    def get_price_statistics_bulk(db: Session, deal_ids: Iterable[int]) -> Dict[int, Dict]:
+        """
+        Get price statistics for many deals with one query.
+        Same fallbacks as get_price_statistics (no history: current price).
+
+        Args:
+            db: Database session
+            deal_ids: Deal IDs
+
+        Returns:
+            Dictionary of deal_id -> statistics with keys lowest_price,
+            highest_price, average_price, current_price, record_count and
+            price_signal (PriceStatistics fields)
+        """
+        deal_ids = list(deal_ids)
+        if not deal_ids:
+            return {}
+
+        rows = db.query(
+            Deal.id,
+            Deal.price,
+            Deal.price_signal,
+            DealPriceStats.min_price,
+            DealPriceStats.max_price,
+            DealPriceStats.price_sum,
+            DealPriceStats.record_count
+        ).outerjoin(
+            DealPriceStats, DealPriceStats.deal_id == Deal.id
+        ).filter(
+            Deal.id.in_(deal_ids)
+        ).all()
+
+        return {
+            row.id: {
+                'lowest_price': row.min_price if row.record_count else row.price,
+                'highest_price': row.max_price if row.record_count else row.price,
+                'average_price': row.price_sum // row.record_count if row.record_count else row.price,
+                'current_price': row.price,
+                'record_count': row.record_count or 0,
+                'price_signal': row.price_signal
+            }
+            for row in rows
         }
 
     @staticmethod
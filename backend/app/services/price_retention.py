@@ -0,0 +1,171 @@
+"""
+Price history retention service.
+Keeps monthly price_history partitions created ahead of time, replaces
+partitions past the retention window with daily min/max/close rollups, and
+reads a deal's history at daily resolution for long chart windows.
+"""
+from typing import Dict, Any, List, Optional
+from datetime import date, datetime, timedelta
+from sqlalchemy.orm import Session
+from sqlalchemy import func, text
+from sqlalchemy.dialects.postgresql import aggregate_order_by, array_agg
+
+from app.config import settings
+from app.models.analytics import PriceHistory, PriceHistoryDaily
+from app.utils.partitioning import ensure_monthly_partitions, partitions_before, drop_partition
+
+
+PRICE_HISTORY_TABLE = "price_history"
+
+
+class PriceHistoryRetentionService:
+    """Service class for price history partition maintenance and rollups."""
+
+    @staticmethod
+    def ensure_partitions(db: Session, months_ahead: Optional[int] = None) -> List[str]:
+        """
+        Create missing price history partitions for this and upcoming months.
+
+        Args:
+            db: Database session (committed here)
+            months_ahead: Future months to pre-create
+                (default: PRICE_HISTORY_PARTITION_MONTHS_AHEAD)
+
+        Returns:
+            Names of the partitions that were created
+        """
+        created = ensure_monthly_partitions(
+            db,
+            PRICE_HISTORY_TABLE,
+            months_ahead if months_ahead is not None else settings.PRICE_HISTORY_PARTITION_MONTHS_AHEAD
+        )
+        db.commit()
+        return created
+
+    @staticmethod
+    def rollup_partition(db: Session, partition: str) -> int:
+        """
+        Write daily min/max/close rollups for one price history partition
+        (caller commits). Days already rolled up are replaced.
+
+        Args:
+            db: Database session
+            partition: Partition table name
+
+        Returns:
+            Number of rollup rows written
+        """
+        result = db.execute(text(
+            f"""
+            INSERT INTO price_history_daily
+                (deal_id, day, min_price, max_price, close_price, record_count,
+                 created_at, updated_at)
+            SELECT
+                deal_id, recorded_at::date, MIN(price), MAX(price),
+                (array_agg(price ORDER BY recorded_at DESC, id DESC))[1], COUNT(*),
+                NOW(), NOW()
+            FROM "{partition}"
+            GROUP BY deal_id, recorded_at::date
+            ON CONFLICT (deal_id, day) DO UPDATE SET
+                min_price = EXCLUDED.min_price,
+                max_price = EXCLUDED.max_price,
+                close_price = EXCLUDED.close_price,
+                record_count = EXCLUDED.record_count,
+                updated_at = EXCLUDED.updated_at
+            """
+        ))
+        return result.rowcount
+
+    @staticmethod
+    def apply_retention(db: Session, retention_days: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Roll up and drop every price history partition that ends before the
+        retention window. Each partition is handled in its own transaction.
+
+        Args:
+            db: Database session
+            retention_days: Days of raw price history to keep
+                (default: PRICE_HISTORY_RETENTION_DAYS)
+
+        Returns:
+            Dictionary with dropped partition names and rollup row count
+        """
+        retention_days = retention_days or settings.PRICE_HISTORY_RETENTION_DAYS
+        cutoff = (datetime.utcnow() - timedelta(days=retention_days)).date()
+
+        dropped = []
+        rollup_rows = 0
+
+        for partition, _ in partitions_before(db, PRICE_HISTORY_TABLE, cutoff):
+            try:
+                rollup_rows += PriceHistoryRetentionService.rollup_partition(db, partition)
+                drop_partition(db, partition)
+                db.commit()
+                dropped.append(partition)
+                print(f"🗄️  Rolled up and dropped {partition}")
+            except Exception as e:
+                db.rollback()
+                print(f"❌ Failed to retire {partition}: {e}")
+
+        return {
+            "cutoff": cutoff.isoformat(),
+            "dropped_partitions": dropped,
+            "rollup_rows": rollup_rows,
+        }
+
+    @staticmethod
+    def get_daily_points(db: Session, deal_id: int, since: datetime) -> List[Dict[str, Any]]:
+        """
+        Get a deal's price history since a time as one point per day,
+        newest first. Raw rows (pruned to the partitions in range) are
+        bucketed in SQL; days already rolled up come from price_history_daily.
+
+        Args:
+            db: Database session
+            deal_id: Deal ID
+            since: Window start
+
+        Returns:
+            List of dictionaries with day, min_price, max_price, close_price
+            and record_count
+        """
+        day = func.date_trunc("day", PriceHistory.recorded_at)
+        raw = db.query(
+            day.label("day"),
+            func.min(PriceHistory.price).label("min_price"),
+            func.max(PriceHistory.price).label("max_price"),
+            array_agg(aggregate_order_by(
+                PriceHistory.price, PriceHistory.recorded_at.desc(), PriceHistory.id.desc()
+            ))[1].label("close_price"),
+            func.count().label("record_count")
+        ).filter(
+            PriceHistory.deal_id == deal_id,
+            PriceHistory.recorded_at >= since
+        ).group_by(day).all()
+
+        rolled = db.query(PriceHistoryDaily).filter(
+            PriceHistoryDaily.deal_id == deal_id,
+            PriceHistoryDaily.day >= since.date()
+        ).all()
+
+        points: Dict[date, Dict[str, Any]] = {
+            row.day: {
+                "day": row.day,
+                "min_price": row.min_price,
+                "max_price": row.max_price,
+                "close_price": row.close_price,
+                "record_count": row.record_count,
+            }
+            for row in rolled
+        }
+        # Raw rows win for days present in both
+        for row in raw:
+            points[row.day.date()] = {
+                "day": row.day.date(),
+                "min_price": row.min_price,
+                "max_price": row.max_price,
+                "close_price": row.close_price,
+                "record_count": row.record_count,
+            }
+
+        return [points[key] for key in sorted(points, reverse=True)]
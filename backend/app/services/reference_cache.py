@@ -0,0 +1,176 @@
+"""
+Reference data cache.
+In-process, read-through cache of deal sources and categories, tables that
+change about once a month but are read on every /sources and /categories
+call and by every crawler instance.
+
+Each process loads one snapshot (two queries) and reuses it for
+REFERENCE_CACHE_TTL seconds; invalidate() drops it at once after a write.
+The snapshot holds detached Pydantic copies (safe to share across sessions
+and threads), the category tree built from parent_id, and the list
+responses pre-serialized with their ETags, so the endpoints do no work per
+request and clients may cache them for REFERENCE_CACHE_MAX_AGE seconds.
+"""
+import threading
+import time
+from typing import Dict, List, Optional, Set, Tuple
+
+from fastapi import Request, Response
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.models.deal import DealSource, Category
+from app.schemas.deal import DealSourceResponse, CategoryResponse
+from app.services.deal_cards import dumps
+from app.services.response_cache import make_etag, etag_matches
+
+
+class ReferenceSnapshot:
+    """All deal sources and categories as loaded at one point in time."""
+
+    def __init__(self, sources: List[DealSourceResponse], categories: List[CategoryResponse]):
+        self.loaded_at = time.monotonic()
+
+        self.sources = sources
+        self.sources_by_id = {source.id: source for source in sources}
+        self.sources_by_name = {source.name: source for source in sources}
+
+        self.categories = categories
+        self.categories_by_id = {category.id: category for category in categories}
+        self.categories_by_slug = {category.slug: category for category in categories}
+        self.children: Dict[Optional[int], List[CategoryResponse]] = {}
+        for category in categories:
+            # Categories whose parent is missing are treated as roots
+            parent_id = category.parent_id if category.parent_id in self.categories_by_id else None
+            self.children.setdefault(parent_id, []).append(category)
+
+        # Pre-serialized responses: (kind, is_active filter) -> (body, etag)
+        self.bodies: Dict[Tuple[str, Optional[bool]], Tuple[str, str]] = {}
+        for is_active in (None, True, False):
+            self._store(("sources", is_active), [
+                source.model_dump() for source in sources
+                if is_active is None or source.is_active == is_active
+            ])
+            self._store(("categories", is_active), [
+                category.model_dump() for category in categories
+                if is_active is None or category.is_active == is_active
+            ])
+        self._store(("category_tree", None), self._tree(None, set()))
+
+    def _store(self, key: Tuple[str, Optional[bool]], payload) -> None:
+        body = dumps(payload)
+        self.bodies[key] = (body, make_etag(body))
+
+    def _tree(self, parent_id: Optional[int], seen: Set[int]) -> List[Dict]:
+        nodes = []
+        for category in self.children.get(parent_id, []):
+            if category.id in seen:
+                continue  # parent_id cycle
+            seen.add(category.id)
+            nodes.append({**category.model_dump(), "children": self._tree(category.id, seen)})
+        return nodes
+
+    def descendant_ids(self, category_id: int) -> List[int]:
+        """IDs of a category and all categories below it."""
+        ids, stack = [], [category_id]
+        while stack:
+            current = stack.pop()
+            if current in ids:
+                continue
+            ids.append(current)
+            stack.extend(child.id for child in self.children.get(current, []))
+        return ids
+
+
+class ReferenceCache:
+    """Service class for the in-process source/category cache."""
+
+    _snapshot: Optional[ReferenceSnapshot] = None
+    _lock = threading.Lock()
+
+    @staticmethod
+    def get(db: Session) -> ReferenceSnapshot:
+        """
+        Get the current snapshot, loading it if missing or older than
+        REFERENCE_CACHE_TTL (one thread loads, the others wait for it).
+
+        Args:
+            db: Database session (only used on a reload)
+
+        Returns:
+            ReferenceSnapshot
+        """
+        snapshot = ReferenceCache._snapshot
+        if snapshot is not None and time.monotonic() - snapshot.loaded_at < settings.REFERENCE_CACHE_TTL:
+            return snapshot
+
+        with ReferenceCache._lock:
+            snapshot = ReferenceCache._snapshot
+            if snapshot is None or time.monotonic() - snapshot.loaded_at >= settings.REFERENCE_CACHE_TTL:
+                snapshot = ReferenceCache._load(db)
+                ReferenceCache._snapshot = snapshot
+            return snapshot
+
+    @staticmethod
+    def _load(db: Session) -> ReferenceSnapshot:
+        sources = db.query(DealSource).order_by(DealSource.id).all()
+        categories = db.query(Category).order_by(Category.id).all()
+        return ReferenceSnapshot(
+            [DealSourceResponse.model_validate(source) for source in sources],
+            [CategoryResponse.model_validate(category) for category in categories]
+        )
+
+    @staticmethod
+    def invalidate() -> None:
+        """Drop this process's snapshot (call after writing sources or categories)."""
+        ReferenceCache._snapshot = None
+
+    @staticmethod
+    def get_source(db: Session, source_id: int) -> Optional[DealSourceResponse]:
+        """Get a deal source by ID."""
+        return ReferenceCache.get(db).sources_by_id.get(source_id)
+
+    @staticmethod
+    def get_source_by_name(db: Session, name: str) -> Optional[DealSourceResponse]:
+        """Get a deal source by its name (e.g. "ppomppu")."""
+        return ReferenceCache.get(db).sources_by_name.get(name)
+
+    @staticmethod
+    def get_category(db: Session, category_id: int) -> Optional[CategoryResponse]:
+        """Get a category by ID."""
+        return ReferenceCache.get(db).categories_by_id.get(category_id)
+
+    @staticmethod
+    def get_category_by_slug(db: Session, slug: str) -> Optional[CategoryResponse]:
+        """Get a category by its slug (e.g. "digital")."""
+        return ReferenceCache.get(db).categories_by_slug.get(slug)
+
+    @staticmethod
+    def get_descendant_ids(db: Session, category_id: int) -> List[int]:
+        """Get the IDs of a category and every category below it."""
+        return ReferenceCache.get(db).descendant_ids(category_id)
+
+    @staticmethod
+    def respond(request: Request, db: Session, kind: str, is_active: Optional[bool] = None) -> Response:
+        """
+        Serve a pre-serialized list ("sources", "categories" or
+        "category_tree") with an ETag and a long-lived Cache-Control header.
+
+        Args:
+            request: Incoming request (for If-None-Match)
+            db: Database session (only used on a reload)
+            kind: Which list to serve
+            is_active: Optional active-status filter (not for category_tree)
+
+        Returns:
+            200 response, or 304 if If-None-Match matches
+        """
+        body, etag = ReferenceCache.get(db).bodies[(kind, is_active)]
+        headers = {
+            "ETag": etag,
+            "Cache-Control": f"public, max-age={settings.REFERENCE_CACHE_MAX_AGE}",
+        }
+
+        if etag_matches(request, etag):
+            return Response(status_code=304, headers=headers)
+        return Response(content=body, media_type="application/json", headers=headers)
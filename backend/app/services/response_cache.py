@@ -0,0 +1,191 @@
+"""
+Response cache service.
+Caches rendered JSON responses in Redis and invalidates them by tag
+(deal:<id>, source:<id>, feed) when crawlers write deals.
+
+Invalidation bumps a per-tag version counter instead of deleting keys: the
+cache key of a response includes the current version of each of its tags,
+so a bump makes every entry carrying that tag unreachable at once (they
+expire via RESPONSE_CACHE_TTL). A response rendered while a write is in
+flight is stored under the old versions and never served afterwards.
+
+With a read replica, a response rendered right after an invalidation may
+come from a replica that hasn't replayed the write yet. Invalidation also
+marks each tag as settling for RESPONSE_CACHE_REPLICA_LAG_SECONDS, and
+responses carrying a settling tag are served but not stored.
+
+Every response carries an ETag; requests with a matching If-None-Match get
+an empty 304.
+"""
+import hashlib
+from typing import Callable, Iterable, List, Optional
+
+import redis
+from fastapi import Request, Response
+
+from app.config import settings
+from app.models.database import has_replica
+from app.utils.redis_client import get_redis
+
+
+RESPONSE_KEY_PREFIX = "resp:"
+TAG_VERSION_PREFIX = "resp:tagver:"
+TAG_SETTLING_PREFIX = "resp:settling:"
+
+FEED_TAG = "feed"
+
+
+def deal_tag(deal_id: int) -> str:
+    """Tag for responses containing one deal's detail."""
+    return f"deal:{deal_id}"
+
+
+def source_tag(source_id: int) -> str:
+    """Tag for deal lists filtered by one source."""
+    return f"source:{source_id}"
+
+
+def list_tags(source_id: Optional[int] = None) -> List[str]:
+    """
+    Tags for a deal list response: source-filtered lists only depend on that
+    source, every other list on the whole feed.
+    """
+    return [source_tag(source_id)] if source_id else [FEED_TAG]
+
+
+def make_etag(body: str) -> str:
+    """Weak ETag of a response body."""
+    return 'W/"' + hashlib.sha1(body.encode()).hexdigest()[:20] + '"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """Check the request's If-None-Match header against an ETag (weak comparison)."""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+
+    opaque = etag[2:] if etag.startswith("W/") else etag
+    for candidate in header.split(","):
+        candidate = candidate.strip()
+        if candidate == "*":
+            return True
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == opaque:
+            return True
+    return False
+
+
+class ResponseCache:
+    """Service class for tag-invalidated API response caching."""
+
+    @staticmethod
+    def is_enabled() -> bool:
+        """Check if the response cache is enabled."""
+        return settings.RESPONSE_CACHE_ENABLED
+
+    @staticmethod
+    def invalidate(tags: Iterable[str]) -> None:
+        """
+        Invalidate every cached response carrying any of the given tags.
+        Never raises: entries expire on their own if Redis is unreachable.
+
+        Args:
+            tags: Tags to invalidate
+        """
+        tags = set(tags)
+        if not tags or not ResponseCache.is_enabled():
+            return
+
+        settling = has_replica() and settings.RESPONSE_CACHE_REPLICA_LAG_SECONDS > 0
+
+        try:
+            pipe = get_redis().pipeline(transaction=False)
+            for tag in tags:
+                pipe.incr(TAG_VERSION_PREFIX + tag)
+                if settling:
+                    pipe.set(TAG_SETTLING_PREFIX + tag, 1, ex=settings.RESPONSE_CACHE_REPLICA_LAG_SECONDS)
+            pipe.execute()
+        except redis.RedisError as e:
+            print(f"⚠️ Response cache invalidation failed: {e}")
+
+    @staticmethod
+    def invalidate_deal(deal_id: int, source_id: Optional[int] = None) -> None:
+        """Invalidate a deal's detail and every list it can appear in."""
+        tags = [deal_tag(deal_id), FEED_TAG]
+        if source_id:
+            tags.append(source_tag(source_id))
+        ResponseCache.invalidate(tags)
+
+    @staticmethod
+    def _cache_key(request: Request, tags: List[str], versions: List[Optional[str]], variant: str) -> str:
+        query = "&".join(f"{k}={v}" for k, v in sorted(request.query_params.multi_items()))
+        tag_part = ",".join(f"{tag}@{version or 0}" for tag, version in zip(tags, versions))
+        raw = "|".join([request.url.path, query, variant, tag_part])
+        return RESPONSE_KEY_PREFIX + hashlib.sha1(raw.encode()).hexdigest()
+
+    @staticmethod
+    def respond(
+        request: Request,
+        tags: List[str],
+        render: Callable[[], str],
+        variant: str = "",
+        vary: Optional[str] = None
+    ) -> Response:
+        """
+        Serve a JSON response from the cache, rendering and storing it on a miss.
+
+        Exceptions raised by render (e.g. HTTPException) propagate and
+        nothing is cached. Responses with a tag invalidated in the last
+        RESPONSE_CACHE_REPLICA_LAG_SECONDS are rendered but not stored.
+
+        Args:
+            request: Incoming request (path and query form the cache key)
+            tags: Invalidation tags of the response
+            render: Callable returning the response body as a JSON string
+            variant: Extra cache key component (e.g. per-user state)
+            vary: Value for the Vary header, if the body depends on headers
+
+        Returns:
+            200 response with ETag, or 304 if If-None-Match matches
+        """
+        body = etag = key = None
+        client = None
+        settling = False
+
+        if ResponseCache.is_enabled():
+            try:
+                client = get_redis()
+                if tags:
+                    values = client.mget(
+                        [TAG_VERSION_PREFIX + tag for tag in tags] + [TAG_SETTLING_PREFIX + tag for tag in tags]
+                    )
+                    versions, settling = values[:len(tags)], any(values[len(tags):])
+                else:
+                    versions = []
+                key = ResponseCache._cache_key(request, tags, versions, variant)
+                etag, body = client.hmget(key, "etag", "body")
+            except redis.RedisError as e:
+                print(f"⚠️ Response cache read failed: {e}")
+                client = key = None
+
+        if body is None or etag is None:
+            body = render()
+            etag = make_etag(body)
+
+            if key is not None and not settling:
+                try:
+                    pipe = client.pipeline(transaction=False)
+                    pipe.hset(key, mapping={"etag": etag, "body": body})
+                    pipe.expire(key, settings.RESPONSE_CACHE_TTL)
+                    pipe.execute()
+                except redis.RedisError:
+                    pass
+
+        headers = {"ETag": etag, "Cache-Control": "no-cache"}
+        if vary:
+            headers["Vary"] = vary
+
+        if etag_matches(request, etag):
+            return Response(status_code=304, headers=headers)
+        return Response(content=body, media_type="application/json", headers=headers)
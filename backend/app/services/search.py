@@ -0,0 +1,260 @@
+"""
+Deal search service.
+Ranked keyword search over deal titles and product names.
+
+Candidates are found through index-backed predicates:
+    - trigram word similarity (`title %> :q`, i.e. `:q <% title`) and
+      substring ILIKE, both served by the gin_trgm_ops indexes
+    - optionally (SEARCH_USE_TSVECTOR) the `search_vector` tsvector column,
+      built with a Korean-friendly tokenizer: PostgreSQL has no Korean
+      parser, so Hangul runs are indexed as character bigrams, which
+      matches "아이폰" inside "아이폰15를" without morphological analysis
+
+Candidates are scored as relevance × recency × hotness and only the top
+SEARCH_MAX_RESULTS are ranked and paged; totals are capped at that bound
+instead of counting every match.
+"""
+import re
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import Float, case, cast, func, literal, or_, text
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.models.deal import Deal
+from app.services.deal_cards import DealCardService
+from app.utils.pagination import encode_cursor, decode_cursor
+
+
+TOKEN_PATTERN = re.compile(r"[0-9a-z]+|[가-힣]+")
+
+SEARCH_SORT_KEY = "relevance"
+
+
+def tokenize_search_text(value: Optional[str], include_words: bool = True) -> List[str]:
+    """
+    Split text into search tokens.
+
+    Latin/digit runs are kept whole (lowercased); Hangul runs are split into
+    overlapping character bigrams (single syllables are kept as is).
+
+    Args:
+        value: Text to tokenize
+        include_words: Also emit whole Hangul runs (documents only: a query
+            word must not be required to match a whole document word)
+
+    Returns:
+        List of tokens in order of appearance, without duplicates
+    """
+    if not value:
+        return []
+
+    tokens = []
+    for run in TOKEN_PATTERN.findall(value.lower()):
+        if run[0] >= "가" and len(run) > 1:
+            tokens.extend(run[i:i + 2] for i in range(len(run) - 1))
+            if include_words:
+                tokens.append(run)
+        else:
+            tokens.append(run)
+
+    return list(dict.fromkeys(tokens))
+
+
+def search_document(title: Optional[str], product_name: Optional[str] = None) -> str:
+    """Build the tokenized document indexed into Deal.search_vector."""
+    return " ".join(tokenize_search_text(f"{title or ''} {product_name or ''}"))
+
+
+def search_vector_expression(title: Optional[str], product_name: Optional[str] = None):
+    """SQL expression computing a deal's search_vector (assign it to the column)."""
+    return func.to_tsvector("simple", search_document(title, product_name))
+
+
+def search_query_expression(keyword: str):
+    """SQL tsquery matching every token of the keyword, or None if it has none."""
+    tokens = tokenize_search_text(keyword, include_words=False)
+    if not tokens:
+        return None
+    return func.to_tsquery("simple", " & ".join(tokens))
+
+
+class DealSearchService:
+    """Service class for ranked deal search."""
+
+    @staticmethod
+    def _score_expression(keyword: str, tsquery=None):
+        """relevance × recency × hotness for the current row."""
+        pattern = f"%{keyword}%"
+
+        relevance = func.greatest(
+            func.word_similarity(keyword, Deal.title),
+            func.word_similarity(keyword, func.coalesce(Deal.product_name, "")),
+            # Substring hits rank at least this high even when the text
+            # yields few trigrams (short Hangul words)
+            case(
+                (or_(Deal.title.ilike(pattern), Deal.product_name.ilike(pattern)),
+                 settings.SEARCH_SUBSTRING_RELEVANCE),
+                else_=0.0
+            )
+        )
+        if tsquery is not None:
+            # Normalization 32 maps the rank into [0, 1)
+            relevance = func.greatest(relevance, func.ts_rank_cd(Deal.search_vector, tsquery, 32))
+
+        age_hours = func.extract("epoch", func.timezone("utc", func.now()) - Deal.published_at) / 3600.0
+        recency = (1 - settings.SEARCH_RECENCY_WEIGHT) + settings.SEARCH_RECENCY_WEIGHT * func.power(
+            0.5, func.greatest(age_hours, 0) / settings.SEARCH_RECENCY_HALF_LIFE_HOURS
+        )
+        hotness = 1 + settings.SEARCH_HOTNESS_WEIGHT * func.ln(1 + func.greatest(Deal.hot_score, 0))
+
+        return cast(relevance * recency * hotness, Float)
+
+    @staticmethod
+    def _candidate_filter(keyword: str, tsquery=None):
+        """Index-backed predicate selecting search candidates."""
+        if tsquery is not None:
+            return Deal.search_vector.op("@@")(tsquery)
+
+        pattern = f"%{keyword}%"
+        return or_(
+            Deal.title.op("%>")(keyword),
+            Deal.product_name.op("%>")(keyword),
+            Deal.title.ilike(pattern),
+            Deal.product_name.ilike(pattern)
+        )
+
+    @staticmethod
+    def search(
+        db: Session,
+        keyword: str,
+        page: int = 1,
+        page_size: int = 20,
+        cursor: Optional[str] = None,
+        include_total: bool = False,
+        source_id: Optional[int] = None,
+        category_id: Optional[int] = None,
+        fields: Optional[List[str]] = None
+    ) -> Tuple[List[Dict[str, Any]], Optional[int], Optional[str]]:
+        """
+        Search deals ranked by relevance × recency × hotness.
+
+        Only the top SEARCH_MAX_RESULTS candidates are ranked; pages past
+        that bound are empty and the total (when requested) is capped at it.
+
+        Args:
+            db: Database session
+            keyword: Search keyword
+            page: Page number (ignored when cursor is given)
+            page_size: Results per page
+            cursor: Cursor from a previous page
+            include_total: Return the (capped) number of results
+            source_id: Optional source filter
+            category_id: Optional category filter
+            fields: Sparse fieldset of the cards (None: default card)
+
+        Returns:
+            Tuple of (deal cards, total or None, next_cursor)
+
+        Raises:
+            InvalidCursorError: If the cursor is invalid
+        """
+        keyword = keyword.strip()
+        limit = settings.SEARCH_MAX_RESULTS
+
+        if cursor:
+            offset, _ = decode_cursor(cursor, SEARCH_SORT_KEY, "desc")
+            if not isinstance(offset, int) or offset < 0:
+                offset = limit
+        else:
+            offset = (page - 1) * page_size
+
+        tsquery = search_query_expression(keyword) if settings.SEARCH_USE_TSVECTOR else None
+
+        # Word-similarity cutoff used by %> for this transaction only
+        db.execute(
+            text("SELECT set_config('pg_trgm.word_similarity_threshold', :threshold, true)"),
+            {"threshold": str(settings.SEARCH_WORD_SIMILARITY_THRESHOLD)}
+        )
+
+        score = DealSearchService._score_expression(keyword, tsquery).label("score")
+        top = db.query(Deal.id.label("id"), score).filter(
+            Deal.is_active == True,
+            Deal.is_blocked == False,
+            Deal.deleted_at == None,
+            DealSearchService._candidate_filter(keyword, tsquery)
+        )
+        if source_id:
+            top = top.filter(Deal.source_id == source_id)
+        if category_id:
+            top = top.filter(Deal.category_id == category_id)
+        top = top.order_by(score.desc(), Deal.id.desc()).limit(limit).subquery()
+
+        columns = [top.c.id]
+        if include_total:
+            columns.append(func.count().over().label("total"))
+        else:
+            columns.append(literal(None).label("total"))
+
+        rows = db.query(*columns).select_from(top).order_by(
+            top.c.score.desc(), top.c.id.desc()
+        ).offset(offset).limit(page_size + 1).all()
+
+        total = None
+        if include_total:
+            # The window count is only visible on returned rows
+            total = rows[0].total if rows else (
+                db.query(func.count()).select_from(top).scalar() if offset else 0
+            )
+
+        next_cursor = None
+        if len(rows) > page_size:
+            rows = rows[:page_size]
+            next_cursor = encode_cursor(SEARCH_SORT_KEY, "desc", offset + page_size, rows[-1].id)
+
+        cards = DealCardService.load_by_ids(db, [row.id for row in rows], fields)
+        return cards, total, next_cursor
+
+    @staticmethod
+    def backfill_search_vectors(db: Session, batch_size: int = 1000, max_batches: Optional[int] = None) -> int:
+        """
+        Fill search_vector for deals that don't have one yet.
+
+        Args:
+            db: Database session
+            batch_size: Deals per UPDATE batch
+            max_batches: Stop after this many batches (None: until done)
+
+        Returns:
+            Number of deals updated
+        """
+        updated = 0
+        batches = 0
+        last_id = 0
+
+        while max_batches is None or batches < max_batches:
+            rows = db.query(Deal.id, Deal.title, Deal.product_name).filter(
+                Deal.search_vector == None,
+                Deal.id > last_id
+            ).order_by(Deal.id).limit(batch_size).all()
+
+            if not rows:
+                break
+
+            db.execute(
+                text(
+                    "UPDATE deals SET search_vector = to_tsvector('simple', :document) "
+                    "WHERE id = :deal_id"
+                ),
+                [
+                    {"deal_id": row.id, "document": search_document(row.title, row.product_name)}
+                    for row in rows
+                ]
+            )
+            db.commit()
+
+            updated += len(rows)
+            batches += 1
+            last_id = rows[-1].id
+
+        return updated
@@ -5,11 +5,13 @@ Handles async generation of deal and comment summaries.
 from typing import Dict, Any
 from datetime import datetime
 from celery import Task
+from sqlalchemy.orm import undefer
 
 from app.celery_app import celery_app
 from app.models.database import SessionLocal
 from app.models.deal import Deal
 from app.services.ai_summary import AISummaryService
+from app.services.response_cache import ResponseCache, deal_tag
 
 
 class DatabaseTask(Task):
@@ -55,7 +57,10 @@ def generate_deal_summary(self, deal_id: int) -> Dict[str, Any]:
 
     try:
         # Get deal
-        deal = db.query(Deal).filter(Deal.id == deal_id).first()
+        deal = db.query(Deal).options(
+            undefer(Deal.content),
+            undefer(Deal.comments)
+        ).filter(Deal.id == deal_id).first()
 
         if not deal:
             return {
@@ -75,6 +80,7 @@ def generate_deal_summary(self, deal_id: int) -> Dict[str, Any]:
         deal.ai_summary = result['summary']
         deal.ai_summary_generated_at = datetime.utcnow()
         db.commit()
+        ResponseCache.invalidate([deal_tag(deal_id)])
 
         print(f"✅ Generated AI summary for deal {deal_id} using {result['provider']}")
 
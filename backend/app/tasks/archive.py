@@ -0,0 +1,67 @@
+"""
+Celery tasks for the deal archive.
+Moves old, not recently bookmarked deals to deals_archive daily.
+"""
+from typing import Dict, Any
+from celery import Task
+
+from app.celery_app import celery_app
+from app.models.database import SessionLocal
+from app.services.archive import DealArchiveService
+from app.services.feed_cache import HotFeedCache
+from app.services.response_cache import ResponseCache, FEED_TAG, source_tag
+
+
+class DatabaseTask(Task):
+    """Base task with database session handling."""
+    _db = None
+
+    def after_return(self, *args, **kwargs):
+        """Close database session after task completes."""
+        if self._db is not None:
+            self._db.close()
+
+
+@celery_app.task(
+    bind=True,
+    base=DatabaseTask,
+    name="app.tasks.archive.archive_old_deals"
+)
+def archive_old_deals(self) -> Dict[str, Any]:
+    """
+    Move deals past ARCHIVE_AFTER_DAYS to deals_archive, then refresh the
+    caches that listed them.
+
+    Returns:
+        Statistics dictionary
+    """
+    db = SessionLocal()
+    self._db = db
+
+    try:
+        stats = DealArchiveService.archive_deals(db)
+        print(f"🗄️  Archived {stats['archived']} deals in {stats['batches']} batches")
+
+        if stats["archived"]:
+            # Detail responses stay valid: archived deals render the same
+            ResponseCache.invalidate([FEED_TAG] + [source_tag(source_id) for source_id in stats["source_ids"]])
+            if HotFeedCache.is_enabled():
+                HotFeedCache.reindex(db, stats["deal_ids"])
+
+        return {
+            "status": "success",
+            "archived": stats["archived"],
+            "batches": stats["batches"]
+        }
+
+    except Exception as e:
+        db.rollback()
+        print(f"❌ Deal archiving failed: {e}")
+
+        return {
+            "status": "failed",
+            "error": str(e)
+        }
+
+    finally:
+        db.close()
@@ -0,0 +1,78 @@
+"""
+Celery tasks for the blacklist engine.
+Re-applies the blacklist rules to recent deals once the rules change, so
+adding a rule hides spam that was already ingested and removing one brings
+its deals back.
+"""
+from typing import Dict, Any
+from celery import Task
+
+from app.celery_app import celery_app
+from app.models.database import SessionLocal
+from app.services.blacklist import BlacklistEngine
+from app.services.feed_cache import HotFeedCache
+from app.services.response_cache import ResponseCache, FEED_TAG, deal_tag, source_tag
+
+
+class DatabaseTask(Task):
+    """Base task with database session handling."""
+    _db = None
+
+    def after_return(self, *args, **kwargs):
+        """Close database session after task completes."""
+        if self._db is not None:
+            self._db.close()
+
+
+@celery_app.task(
+    bind=True,
+    base=DatabaseTask,
+    name="app.tasks.blacklist.reevaluate_blacklist"
+)
+def reevaluate_blacklist(self, force: bool = False) -> Dict[str, Any]:
+    """
+    Re-evaluate recent deals against the current blacklist rules (a no-op
+    while the rules are unchanged), then refresh the caches listing them.
+
+    Args:
+        force: Re-evaluate even if the rules are unchanged
+
+    Returns:
+        Statistics dictionary
+    """
+    db = SessionLocal()
+    self._db = db
+
+    try:
+        stats = BlacklistEngine.reevaluate(db, force=force)
+        if stats["status"] == "unchanged":
+            return {"status": "skipped", "reason": "rules unchanged"}
+
+        print(f"🚫 Re-evaluated blacklist: {stats['blocked']} blocked, {stats['unblocked']} unblocked")
+
+        if stats["source_ids"]:
+            ResponseCache.invalidate(
+                [FEED_TAG]
+                + [source_tag(source_id) for source_id in stats["source_ids"]]
+                + [deal_tag(deal_id) for deal_id in stats["deal_ids"]]
+            )
+            if HotFeedCache.is_enabled():
+                HotFeedCache.reindex(db, stats["deal_ids"])
+
+        return {
+            "status": "success",
+            "blocked": stats["blocked"],
+            "unblocked": stats["unblocked"]
+        }
+
+    except Exception as e:
+        db.rollback()
+        print(f"❌ Blacklist re-evaluation failed: {e}")
+
+        return {
+            "status": "failed",
+            "error": str(e)
+        }
+
+    finally:
+        db.close()
@@ -0,0 +1,72 @@
+"""
+Celery tasks for deal categorization.
+Backfills categories of deals ingested before the classifier existed (or
+while it was disabled), and re-classifies everything after rule changes.
+Run on demand:
+    celery -A app.celery_app call app.tasks.category.backfill_deal_categories
+"""
+from typing import Dict, Any
+from celery import Task
+
+from app.celery_app import celery_app
+from app.models.database import SessionLocal
+from app.services.category_classifier import CategoryClassifier
+from app.services.feed_cache import HotFeedCache
+from app.services.response_cache import ResponseCache, FEED_TAG, source_tag
+
+
+class DatabaseTask(Task):
+    """Base task with database session handling."""
+    _db = None
+
+    def after_return(self, *args, **kwargs):
+        """Close database session after task completes."""
+        if self._db is not None:
+            self._db.close()
+
+
+@celery_app.task(
+    bind=True,
+    base=DatabaseTask,
+    name="app.tasks.category.backfill_deal_categories"
+)
+def backfill_deal_categories(self, reclassify: bool = False) -> Dict[str, Any]:
+    """
+    Classify uncategorized deals (or all deals with reclassify=True), then
+    refresh the caches listing them by category.
+
+    Args:
+        reclassify: Also re-classify deals that already have a category
+
+    Returns:
+        Statistics dictionary
+    """
+    db = SessionLocal()
+    self._db = db
+
+    try:
+        stats = CategoryClassifier.backfill(db, reclassify=reclassify)
+        print(f"🏷️  Categorized {stats['classified']} of {stats['scanned']} deals")
+
+        if stats["classified"]:
+            ResponseCache.invalidate([FEED_TAG] + [source_tag(source_id) for source_id in stats["source_ids"]])
+            if HotFeedCache.is_enabled():
+                HotFeedCache.reindex(db, stats["deal_ids"])
+
+        return {
+            "status": "success",
+            "scanned": stats["scanned"],
+            "classified": stats["classified"]
+        }
+
+    except Exception as e:
+        db.rollback()
+        print(f"❌ Category backfill failed: {e}")
+
+        return {
+            "status": "failed",
+            "error": str(e)
+        }
+
+    finally:
+        db.close()
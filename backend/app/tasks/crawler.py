@@ -11,9 +11,10 @@ from app.crawlers.ppomppu import PpomppuCrawler
 from app.crawlers.ruliweb import RuliwebCrawler
 from app.crawlers.quasarzone import QuasarzoneCrawler
 from app.crawlers.fmkorea import FmkoreaCrawler
+from app.config import settings
 from app.services.keyword_extractor import KeywordExtractor
-from app.services.matcher import KeywordMatcher
-from app.tasks.notification import send_push_notification
+from app.services.notification_queue import NotificationQueueMonitor
+from app.tasks.notification import match_and_enqueue, match_deals_for_notification
 
 
 class DatabaseTask(Task):
@@ -30,6 +31,10 @@ def _run_crawler_task(task, crawler, db, max_pages: int) -> Dict[str, Any]:
     """
     Common crawler execution logic.
     Runs the crawler, extracts keywords, matches users, and queues notifications.
+    Notifications are written to the outbox in the same transaction as the
+    match; matching is deferred while the outbox backlog is over threshold.
+    Pass task=None to raise failures instead of scheduling a Celery retry
+    (scripts/load_test_fanout.py drives the pipeline this way).
     """
     source_name = crawler.source_name
 
@@ -41,42 +46,44 @@ def _run_crawler_task(task, crawler, db, max_pages: int) -> Dict[str, Any]:
 
         # Get newly created deals from this run
         if crawler.crawler_run and stats["new_created"] > 0:
+            from sqlalchemy.orm import undefer
             from app.models.deal import Deal
             from datetime import datetime, timedelta
 
             cutoff = datetime.utcnow() - timedelta(minutes=5)
-            new_deals = db.query(Deal).filter(
+            new_deals = db.query(Deal).options(
+                undefer(Deal.content)  # keyword extraction reads the post body
+            ).filter(
                 Deal.source_id == crawler.source.id,
                 Deal.created_at >= cutoff
             ).all()
 
             print(f"🔍 Processing {len(new_deals)} new deals for keyword matching...")
 
-            total_matched_users = 0
-            total_notifications = 0
-
             for deal in new_deals:
                 keyword_count = KeywordExtractor.extract_and_save(db, deal)
                 print(f"   Deal #{deal.id}: {keyword_count} keywords extracted")
 
                 db.refresh(deal)
 
-                matched_users = KeywordMatcher.match_deal_to_users(db, deal)
-                total_matched_users += len(matched_users)
-
-                print(f"   Deal #{deal.id}: Matched {len(matched_users)} users")
-
-                for user in matched_users:
-                    send_push_notification.delay(user.id, deal.id)
-                    total_notifications += 1
-
-            stats["matched_users"] = total_matched_users
-            stats["notifications_queued"] = total_notifications
+            # Backpressure: when the outbox is backed up, hand the whole batch to a
+            # deferred matching task instead of adding to the backlog now
+            if NotificationQueueMonitor.is_backlogged(db):
+                match_deals_for_notification.apply_async(
+                    args=[[deal.id for deal in new_deals]],
+                    countdown=settings.NOTIFICATION_BACKPRESSURE_DELAY
+                )
+                stats["matched_users"] = 0
+                stats["notifications_queued"] = 0
+                stats["matching_deferred"] = len(new_deals)
+                print(f"⏸️  Notification backlog high, deferred matching for {len(new_deals)} deals")
+            else:
+                stats.update(match_and_enqueue(db, new_deals))
 
             print(f"✅ {source_name} crawler completed!")
             print(f"   - New deals: {stats['new_created']}")
-            print(f"   - Matched users: {total_matched_users}")
-            print(f"   - Notifications queued: {total_notifications}")
+            print(f"   - Matched users: {stats['matched_users']}")
+            print(f"   - Notifications queued: {stats['notifications_queued']}")
 
         else:
             stats["matched_users"] = 0
@@ -88,6 +95,9 @@ def _run_crawler_task(task, crawler, db, max_pages: int) -> Dict[str, Any]:
     except Exception as e:
         print(f"❌ {source_name} crawler task failed: {e}")
 
+        if task is None:
+            raise
+
         try:
             raise task.retry(exc=e, countdown=60 * (task.request.retries + 1))
         except task.MaxRetriesExceededError:
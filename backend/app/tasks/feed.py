@@ -0,0 +1,110 @@
+"""
+Celery tasks for the Redis hot feed.
+Periodically decays hot scores (re-indexing the deals that changed) and
+rebuilds the hot feed sorted sets from the database, so drift from missed
+incremental updates (Redis outages, manual edits) self-heals.
+"""
+from typing import Dict, Any
+from celery import Task
+
+from app.celery_app import celery_app
+from app.models.database import SessionLocal
+from app.services.feed_cache import HotFeedCache
+from app.services.hot_score import HotScoreService
+from app.services.response_cache import ResponseCache, FEED_TAG, source_tag
+
+
+class DatabaseTask(Task):
+    """Base task with database session handling."""
+    _db = None
+
+    def after_return(self, *args, **kwargs):
+        """Close database session after task completes."""
+        if self._db is not None:
+            self._db.close()
+
+
+@celery_app.task(
+    bind=True,
+    base=DatabaseTask,
+    name="app.tasks.feed.rebuild_hot_feed"
+)
+def rebuild_hot_feed(self) -> Dict[str, Any]:
+    """
+    Rebuild the hot feed sorted sets, cards and counts from the database.
+
+    Returns:
+        Statistics dictionary
+    """
+    if not HotFeedCache.is_enabled():
+        return {"status": "skipped", "reason": "hot feed disabled"}
+
+    db = SessionLocal()
+    self._db = db
+
+    try:
+        stats = HotFeedCache.rebuild(db)
+        print(f"🔥 Rebuilt hot feed: {stats['scopes']} scopes, {stats['cards']} cards")
+
+        return {
+            "status": "success",
+            **stats
+        }
+
+    except Exception as e:
+        print(f"❌ Hot feed rebuild failed: {e}")
+
+        return {
+            "status": "failed",
+            "error": str(e)
+        }
+
+    finally:
+        db.close()
+
+
+@celery_app.task(
+    bind=True,
+    base=DatabaseTask,
+    name="app.tasks.feed.recompute_hot_scores"
+)
+def recompute_hot_scores(self) -> Dict[str, Any]:
+    """
+    Re-apply the hot score formula (with its time decay) to every listed
+    deal, then refresh the caches that sort by it: cached list responses of
+    affected sources and the hot feed entries of updated deals.
+
+    Returns:
+        Statistics dictionary
+    """
+    db = SessionLocal()
+    self._db = db
+
+    try:
+        stats = HotScoreService.recompute(db)
+        print(f"📉 Recomputed hot scores: {stats['updated']} deals updated in {stats['chunks']} chunks")
+
+        feed = None
+        if stats["updated"]:
+            ResponseCache.invalidate([FEED_TAG] + [source_tag(source_id) for source_id in stats["source_ids"]])
+            if HotFeedCache.is_enabled():
+                feed = HotFeedCache.reindex(db, stats["deal_ids"])
+
+        return {
+            "status": "success",
+            "updated": stats["updated"],
+            "chunks": stats["chunks"],
+            "feed_cards": feed["indexed"] if feed else None
+        }
+
+    except Exception as e:
+        db.rollback()
+        print(f"❌ Hot score recomputation failed: {e}")
+
+        return {
+            "status": "failed",
+            "error": str(e)
+        }
+
+    finally:
+        db.close()
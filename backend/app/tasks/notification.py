@@ -1,21 +1,35 @@
 """
 Celery tasks for push notification handling.
 Manages notification scheduling, DND periods, and delivery via FCM.
+
+Notifications are written together with a notification_outbox row in the
+matching transaction; dispatch_notification_outbox drains the outbox and is
+the only place that talks to FCM.
+
+Delivery is at-least-once: each outbox row's outcome is committed right
+after its push, so a dispatcher that dies re-sends at most the push it was
+in the middle of (FCM accepted it, the commit never happened). Rows it had
+leased but not sent yet are delivered by another dispatcher once the lease
+(NOTIFICATION_OUTBOX_LEASE_SECONDS) runs out.
 """
-from typing import Dict, Any, Optional
-from datetime import datetime
+from typing import Dict, Any, List, Optional, Iterable
 from celery import Task
-from sqlalchemy.exc import IntegrityError
 
 from app.celery_app import celery_app
+from app.config import settings
 from app.models.database import SessionLocal
-from app.models.user import User, UserKeyword
+from app.models.user import User
 from app.models.deal import Deal
-from app.models.interaction import Notification, NotificationStatus
-from app.models.analytics import DealKeyword
-from app.services.matcher import KeywordMatcher
+from app.models.interaction import Notification
 from app.services.device import DeviceService
 from app.services.fcm import FCMService
+from app.services.matcher import KeywordMatcher
+from app.services.notification import NotificationService
+from app.services.notification_queue import NotificationQueueMonitor
+from app.services.notification_retention import NotificationRetentionService
+from app.services.outbox import (
+    NotificationOutboxService, LANE_PRIORITIES, LANE_QUEUES, PRIORITY_LANES
+)
 
 
 class DatabaseTask(Task):
@@ -28,6 +42,62 @@ class DatabaseTask(Task):
             self._db.close()
 
 
+def kick_dispatchers(lanes: Iterable[str]) -> None:
+    """Queue one outbox dispatcher run per lane on that lane's Celery queue."""
+    for lane in lanes:
+        dispatch_notification_outbox.apply_async(
+            kwargs={"lane": lane},
+            queue=LANE_QUEUES[lane]
+        )
+
+
+def match_and_enqueue(db, deals: List[Deal]) -> Dict[str, int]:
+    """
+    Match deals to users and write notifications to the outbox.
+    Each deal's notifications are committed in one transaction, then one
+    dispatcher per touched lane is kicked.
+
+    Args:
+        db: Database session
+        deals: Deals with extracted keywords
+
+    Returns:
+        Dictionary with matched_users and notifications_queued counts
+    """
+    total_matched_users = 0
+    total_notifications = 0
+    lanes = set()
+
+    for deal in deals:
+        if deal.is_blocked:
+            continue
+
+        matched_users = KeywordMatcher.match_deal_to_users(db, deal)
+        total_matched_users += len(matched_users)
+
+        print(f"   Deal #{deal.id}: Matched {len(matched_users)} users")
+
+        if not matched_users:
+            continue
+
+        priority = NotificationOutboxService.select_priority(deal, len(matched_users))
+        queued = NotificationOutboxService.enqueue_deal_notifications(
+            db, deal, matched_users, priority=priority
+        )
+        db.commit()
+
+        if queued:
+            total_notifications += queued
+            lanes.add(PRIORITY_LANES[priority])
+
+    kick_dispatchers(sorted(lanes, key=LANE_PRIORITIES.get))
+
+    return {
+        "matched_users": total_matched_users,
+        "notifications_queued": total_notifications
+    }
+
+
 @celery_app.task(
     bind=True,
     base=DatabaseTask,
@@ -37,14 +107,15 @@ class DatabaseTask(Task):
 )
 def send_push_notification(self, user_id: int, deal_id: int) -> Dict[str, Any]:
     """
-    Send push notification to a user about a matched deal.
+    Queue a push notification to a user about a matched deal.
 
     Process:
-    1. Check DND period
-       - If in DND: Create notification with scheduled_for, status PENDING
-       - If not in DND: Send immediately via FCM
-    2. Create Notification record (unique constraint prevents duplicates)
-    3. Send via FCM (or dry-run if not configured)
+    1. Create the Notification record and its outbox row in one transaction
+       (unique constraint prevents duplicates; DND sets scheduled_for)
+    2. Kick the outbox dispatcher, which sends via FCM (or dry-run)
+
+    The crawler pipeline enqueues in bulk through NotificationOutboxService;
+    this task remains for single ad-hoc notifications.
 
     Args:
         user_id: User ID to notify
@@ -67,87 +138,24 @@ def send_push_notification(self, user_id: int, deal_id: int) -> Dict[str, Any]:
                 "error": "User or deal not found"
             }
 
-        # Get matched keywords for this user
-        user_keywords = db.query(UserKeyword.keyword).filter(
-            UserKeyword.user_id == user_id,
-            UserKeyword.is_active == True,
-            UserKeyword.is_inclusion == True
-        ).all()
-
-        deal_keywords = db.query(DealKeyword.keyword).filter(
-            DealKeyword.deal_id == deal_id
-        ).all()
-
-        user_kw_set = {kw.keyword.lower() for kw in user_keywords}
-        deal_kw_set = {kw.keyword.lower() for kw in deal_keywords}
-
-        matched_keywords = list(user_kw_set & deal_kw_set)
-
-        # Create notification title and body
-        title = f"🔥 {matched_keywords[0] if matched_keywords else '새로운'} 핫딜!"
-        body = deal.title[:100]  # Truncate to 100 chars
-
-        # Check DND period
-        is_dnd = KeywordMatcher._is_in_dnd_period(user)
-
-        if is_dnd:
-            # Schedule for after DND
-            scheduled_time = KeywordMatcher._calculate_scheduled_time(user)
-            status = NotificationStatus.PENDING
-            sent_at = None
-            push_response = None
-            print(f"📅 Notification scheduled for {scheduled_time} (DND active)")
-        else:
-            # Send immediately via FCM
-            scheduled_time = None
-            status = NotificationStatus.SENT
-            sent_at = datetime.utcnow()
-
-            # Get user's device tokens and send
-            device_tokens = DeviceService.get_active_device_tokens(db, user_id)
-            if device_tokens:
-                fcm_data = {"deal_id": str(deal_id), "type": "keyword_match"}
-                push_response = FCMService.send_to_multiple_devices(
-                    device_tokens=device_tokens,
-                    title=title,
-                    body=body,
-                    data=fcm_data
-                )
-            else:
-                push_response = {"skipped": True, "reason": "no_devices"}
-                print(f"⚠️ No active devices for user {user_id}, notification saved only")
-
-            print(f"📤 Notification sent to user {user_id} ({len(device_tokens)} devices)")
-
-        # Create notification record
-        notification = Notification(
-            user_id=user_id,
-            deal_id=deal_id,
-            title=title,
-            body=body,
-            matched_keywords=matched_keywords,
-            status=status,
-            scheduled_for=scheduled_time,
-            sent_at=sent_at,
-            push_response=push_response
+        queued = NotificationOutboxService.enqueue_deal_notifications(
+            db, deal, [user], priority=LANE_PRIORITIES["high"]
         )
-
-        db.add(notification)
         db.commit()
-        db.refresh(notification)
 
-        return {
-            "status": "success",
-            "notification_id": notification.id,
-            "is_dnd": is_dnd,
-            "sent_immediately": not is_dnd
-        }
+        if not queued:
+            return {
+                "status": "skipped",
+                "reason": "duplicate",
+                "user_id": user_id,
+                "deal_id": deal_id
+            }
+
+        kick_dispatchers(["high"])
 
-    except IntegrityError:
-        db.rollback()
         return {
-            "status": "skipped",
-            "reason": "duplicate",
+            "status": "success",
+            "queued": queued,
             "user_id": user_id,
             "deal_id": deal_id
         }
@@ -160,21 +168,6 @@ def send_push_notification(self, user_id: int, deal_id: int) -> Dict[str, Any]:
         try:
             raise self.retry(exc=e)
         except self.MaxRetriesExceededError:
-            # Create failed notification record
-            try:
-                notification = Notification(
-                    user_id=user_id,
-                    deal_id=deal_id,
-                    title="Notification Failed",
-                    body="",
-                    status=NotificationStatus.FAILED,
-                    error_message=str(e)
-                )
-                db.add(notification)
-                db.commit()
-            except IntegrityError:
-                db.rollback()
-
             return {
                 "status": "failed",
                 "error": str(e),
@@ -185,6 +178,136 @@ def send_push_notification(self, user_id: int, deal_id: int) -> Dict[str, Any]:
         db.close()
 
 
+@celery_app.task(
+    bind=True,
+    base=DatabaseTask,
+    name="app.tasks.notification.dispatch_notification_outbox"
+)
+def dispatch_notification_outbox(
+    self,
+    batch_size: Optional[int] = None,
+    max_batches: Optional[int] = None,
+    lane: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Deliver due notification outbox rows via FCM.
+
+    Process (per batch):
+    1. Claim due PENDING rows with SELECT ... FOR UPDATE SKIP LOCKED, lease
+       them (available_at pushed out) and commit, releasing the locks
+    2. Load device tokens and notifications for the batch in bulk
+    3. Per row: send via FCM (or dry-run), mark it DELIVERED or reschedule
+       the failure, and commit
+
+    Any number of dispatchers can run concurrently; SKIP LOCKED and the
+    lease guarantee each row is claimed by one of them at a time, and no
+    lock is held during FCM calls. Each priority lane has its own Celery
+    queue so high-priority pushes never wait behind bulk ones. See the
+    module docstring for the delivery guarantee.
+
+    Args:
+        batch_size: Rows per batch (default: NOTIFICATION_OUTBOX_BATCH_SIZE)
+        max_batches: Batches per run (default: NOTIFICATION_OUTBOX_MAX_BATCHES)
+        lane: "high", "normal" or "bulk" (default: all lanes, highest first)
+
+    Returns:
+        Statistics dictionary
+    """
+    db = SessionLocal()
+    self._db = db
+    # Rows are committed one by one; keep the batch loaded across commits
+    db.expire_on_commit = False
+
+    batch_size = batch_size or settings.NOTIFICATION_OUTBOX_BATCH_SIZE
+    max_batches = max_batches or settings.NOTIFICATION_OUTBOX_MAX_BATCHES
+
+    sent_count = 0
+    failed_count = 0
+    batches = 0
+
+    try:
+        while batches < max_batches:
+            rows = NotificationOutboxService.claim_batch(
+                db, batch_size, priority=LANE_PRIORITIES.get(lane)
+            )
+            if not rows:
+                break
+            batches += 1
+
+            NotificationOutboxService.lease_batch(rows)
+            db.commit()
+
+            tokens_by_user = DeviceService.get_active_device_tokens_by_user(
+                db, list({row.user_id for row in rows})
+            )
+            # Outbox and notification rows share created_at, so the lower
+            # bound lets the planner skip older notification partitions
+            notifications = {
+                n.id: n for n in db.query(Notification).filter(
+                    Notification.id.in_([row.notification_id for row in rows]),
+                    Notification.created_at >= min(row.created_at for row in rows)
+                ).all()
+            }
+
+            for row in rows:
+                notification = notifications.get(row.notification_id)
+                device_tokens = tokens_by_user.get(row.user_id, [])
+
+                if device_tokens:
+                    push_response = FCMService.send_to_multiple_devices(
+                        device_tokens=device_tokens,
+                        title=row.payload["title"],
+                        body=row.payload["body"],
+                        data=row.payload.get("data")
+                    )
+                else:
+                    push_response = {"skipped": True, "reason": "no_devices"}
+
+                if "error" in push_response:
+                    NotificationOutboxService.mark_failed(row, notification, push_response["error"])
+                    failed_count += 1
+                else:
+                    NotificationOutboxService.mark_delivered(row, notification, push_response)
+                    sent_count += 1
+
+                db.commit()
+
+        if batches:
+            print(
+                f"📤 Outbox dispatch [{lane or 'all'}]: {sent_count} sent, "
+                f"{failed_count} failed ({batches} batches)"
+            )
+
+        # More work left: continue in a fresh task instead of hogging this worker
+        if batches >= max_batches:
+            dispatch_notification_outbox.apply_async(
+                args=[batch_size, max_batches, lane],
+                queue=LANE_QUEUES[lane or "normal"]
+            )
+
+        return {
+            "status": "success",
+            "lane": lane,
+            "sent_count": sent_count,
+            "failed_count": failed_count,
+            "batches": batches
+        }
+
+    except Exception as e:
+        db.rollback()
+        print(f"❌ Outbox dispatch failed: {e}")
+
+        return {
+            "status": "failed",
+            "error": str(e),
+            "sent_count": sent_count,
+            "failed_count": failed_count
+        }
+
+    finally:
+        db.close()
+
+
 @celery_app.task(
     bind=True,
     base=DatabaseTask,
@@ -193,12 +316,26 @@ def send_push_notification(self, user_id: int, deal_id: int) -> Dict[str, Any]:
 def send_scheduled_notifications(self) -> Dict[str, Any]:
     """
     Send pending notifications that are scheduled to be sent now.
-    Runs periodically to check for notifications after DND period.
 
-    Process:
-    1. Find PENDING notifications with scheduled_for <= NOW
-    2. Send via FCM (or dry-run)
-    3. Update status to SENT
+    DND-scheduled notifications are outbox rows whose available_at is the
+    end of the DND period, so this simply runs the outbox dispatcher.
+    Kept so already-queued beat messages for this task name still resolve.
+
+    Returns:
+        Statistics dictionary
+    """
+    return dispatch_notification_outbox()
+
+
+@celery_app.task(
+    bind=True,
+    base=DatabaseTask,
+    name="app.tasks.notification.reconcile_unread_counts"
+)
+def reconcile_unread_counts(self) -> Dict[str, Any]:
+    """
+    Correct drift in the denormalized unread notification counters.
+    Runs periodically; the counters are otherwise maintained incrementally.
 
     Returns:
         Statistics dictionary
@@ -207,54 +344,121 @@ def send_scheduled_notifications(self) -> Dict[str, Any]:
     self._db = db
 
     try:
-        now = datetime.utcnow()
-
-        # Find pending notifications ready to send
-        pending_notifications = db.query(Notification).filter(
-            Notification.status == NotificationStatus.PENDING,
-            Notification.scheduled_for != None,
-            Notification.scheduled_for <= now
-        ).all()
-
-        sent_count = 0
-        failed_count = 0
-
-        for notification in pending_notifications:
-            # Get user's device tokens
-            device_tokens = DeviceService.get_active_device_tokens(db, notification.user_id)
-
-            if device_tokens:
-                fcm_data = {"deal_id": str(notification.deal_id), "type": "scheduled"}
-                push_response = FCMService.send_to_multiple_devices(
-                    device_tokens=device_tokens,
-                    title=notification.title,
-                    body=notification.body,
-                    data=fcm_data
-                )
-                notification.push_response = push_response
-            else:
-                push_response = {"skipped": True, "reason": "no_devices"}
-                notification.push_response = push_response
-
-            # Update status
-            notification.status = NotificationStatus.SENT
-            notification.sent_at = datetime.utcnow()
-            notification.scheduled_for = None
-            sent_count += 1
+        corrected = NotificationService.reconcile_unread_counts(db)
 
-        db.commit()
+        if corrected:
+            print(f"🔧 Reconciled unread counters for {corrected} users")
+
+        return {
+            "status": "success",
+            "corrected_users": corrected
+        }
+
+    except Exception as e:
+        db.rollback()
+        print(f"❌ Unread counter reconcile failed: {e}")
+
+        return {
+            "status": "failed",
+            "error": str(e)
+        }
+
+    finally:
+        db.close()
+
+
+@celery_app.task(
+    bind=True,
+    base=DatabaseTask,
+    name="app.tasks.notification.maintain_notification_partitions"
+)
+def maintain_notification_partitions(self) -> Dict[str, Any]:
+    """
+    Create upcoming monthly notification partitions and retire expired ones.
+
+    Partitions older than NOTIFICATION_RETENTION_MONTHS are rolled up into
+    notification_rollups and dropped, which is far cheaper than deleting
+    rows and leaves no index bloat behind.
+
+    Returns:
+        Statistics dictionary
+    """
+    db = SessionLocal()
+    self._db = db
+
+    try:
+        created = NotificationRetentionService.ensure_partitions(db)
+        retention = NotificationRetentionService.apply_retention(db)
 
-        print(f"✅ Sent {sent_count} scheduled notifications")
+        if created:
+            print(f"🧱 Created notification partitions: {', '.join(created)}")
 
         return {
             "status": "success",
-            "sent_count": sent_count,
-            "failed_count": failed_count
+            "created_partitions": created,
+            **retention
+        }
+
+    except Exception as e:
+        db.rollback()
+        print(f"❌ Notification partition maintenance failed: {e}")
+
+        return {
+            "status": "failed",
+            "error": str(e)
         }
 
+    finally:
+        db.close()
+
+
+@celery_app.task(
+    bind=True,
+    base=DatabaseTask,
+    name="app.tasks.notification.match_deals_for_notification"
+)
+def match_deals_for_notification(self, deal_ids: List[int], deferrals: int = 0) -> Dict[str, Any]:
+    """
+    Match a batch of deals to users once the notification backlog allows.
+
+    Scheduled by the crawler pipeline when the outbox backlog exceeds
+    NOTIFICATION_BACKLOG_THRESHOLD. Defers itself again while the backlog
+    persists, up to NOTIFICATION_BACKPRESSURE_MAX_DEFERRALS times.
+
+    Args:
+        deal_ids: Deals to match (keywords already extracted)
+        deferrals: Times this batch has been deferred so far
+
+    Returns:
+        Statistics dictionary
+    """
+    db = SessionLocal()
+    self._db = db
+
+    try:
+        if (
+            deferrals < settings.NOTIFICATION_BACKPRESSURE_MAX_DEFERRALS
+            and NotificationQueueMonitor.is_backlogged(db)
+        ):
+            match_deals_for_notification.apply_async(
+                args=[deal_ids, deferrals + 1],
+                countdown=settings.NOTIFICATION_BACKPRESSURE_DELAY
+            )
+            print(f"⏸️  Notification backlog high, deferring {len(deal_ids)} deals (#{deferrals + 1})")
+            return {
+                "status": "deferred",
+                "deal_count": len(deal_ids),
+                "deferrals": deferrals + 1
+            }
+
+        deals = db.query(Deal).filter(Deal.id.in_(deal_ids)).order_by(Deal.id).all()
+        stats = match_and_enqueue(db, deals)
+
+        return {"status": "success", "deal_count": len(deals), **stats}
+
     except Exception as e:
         db.rollback()
-        print(f"❌ Scheduled notification task failed: {e}")
+        print(f"❌ Deferred matching failed: {e}")
 
         return {
             "status": "failed",
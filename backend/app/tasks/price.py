@@ -0,0 +1,112 @@
+"""
+Celery tasks for price tracking.
+Keeps the product price index within the price signal period: ingest only
+ever adds prices to it, so rows whose window has expired are recomputed
+from price history daily. Also maintains the monthly price_history
+partitions and rolls expired ones up to daily rows.
+"""
+from typing import Dict, Any
+from celery import Task
+
+from app.celery_app import celery_app
+from app.models.database import SessionLocal
+from app.services.price import PriceService
+from app.services.price_retention import PriceHistoryRetentionService
+
+
+class DatabaseTask(Task):
+    """Base task with database session handling."""
+    _db = None
+
+    def after_return(self, *args, **kwargs):
+        """Close database session after task completes."""
+        if self._db is not None:
+            self._db.close()
+
+
+@celery_app.task(
+    bind=True,
+    base=DatabaseTask,
+    name="app.tasks.price.refresh_product_price_index"
+)
+def refresh_product_price_index(self, full: bool = False) -> Dict[str, Any]:
+    """
+    Recompute expired product price index rows (or every row with full=True,
+    e.g. to rebuild the index after correcting price history).
+
+    Args:
+        full: Recompute every product key from price history
+
+    Returns:
+        Statistics dictionary
+    """
+    db = SessionLocal()
+    self._db = db
+
+    try:
+        stats = PriceService.refresh_product_price_index(db, full=full)
+        print(
+            f"💰 Refreshed product price index: {stats['refreshed']} refreshed, "
+            f"{stats['deleted']} deleted"
+        )
+
+        return {
+            "status": "success",
+            **stats
+        }
+
+    except Exception as e:
+        db.rollback()
+        print(f"❌ Product price index refresh failed: {e}")
+
+        return {
+            "status": "failed",
+            "error": str(e)
+        }
+
+    finally:
+        db.close()
+
+
+@celery_app.task(
+    bind=True,
+    base=DatabaseTask,
+    name="app.tasks.price.maintain_price_history_partitions"
+)
+def maintain_price_history_partitions(self) -> Dict[str, Any]:
+    """
+    Create upcoming monthly price history partitions and retire expired ones.
+
+    Partitions older than PRICE_HISTORY_RETENTION_DAYS are rolled up into
+    price_history_daily (min/max/close per deal and day) and dropped.
+
+    Returns:
+        Statistics dictionary
+    """
+    db = SessionLocal()
+    self._db = db
+
+    try:
+        created = PriceHistoryRetentionService.ensure_partitions(db)
+        retention = PriceHistoryRetentionService.apply_retention(db)
+
+        if created:
+            print(f"🧱 Created price history partitions: {', '.join(created)}")
+
+        return {
+            "status": "success",
+            "created_partitions": created,
+            **retention
+        }
+
+    except Exception as e:
+        db.rollback()
+        print(f"❌ Price history partition maintenance failed: {e}")
+
+        return {
+            "status": "failed",
+            "error": str(e)
+        }
+
+    finally:
+        db.close()
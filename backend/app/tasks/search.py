@@ -0,0 +1,104 @@
+"""
+Celery tasks for deal search maintenance.
+Backfills the tokenized search_vector column for existing deals and
+rebuilds the keyword autocomplete index.
+"""
+from typing import Dict, Any, Optional
+from celery import Task
+
+from app.celery_app import celery_app
+from app.models.database import SessionLocal
+from app.services.search import DealSearchService
+from app.services.autocomplete import AutocompleteService
+
+
+class DatabaseTask(Task):
+    """Base task with database session handling."""
+    _db = None
+
+    def after_return(self, *args, **kwargs):
+        """Close database session after task completes."""
+        if self._db is not None:
+            self._db.close()
+
+
+@celery_app.task(
+    bind=True,
+    base=DatabaseTask,
+    name="app.tasks.search.backfill_search_vectors"
+)
+def backfill_search_vectors(self, batch_size: int = 1000, max_batches: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Fill deals.search_vector for deals created before it existed.
+
+    Args:
+        batch_size: Deals per UPDATE batch
+        max_batches: Stop after this many batches (None: until done)
+
+    Returns:
+        Statistics dictionary
+    """
+    db = SessionLocal()
+    self._db = db
+
+    try:
+        updated = DealSearchService.backfill_search_vectors(db, batch_size, max_batches)
+        print(f"🔎 Backfilled search vectors for {updated} deals")
+
+        return {
+            "status": "success",
+            "updated": updated
+        }
+
+    except Exception as e:
+        db.rollback()
+        print(f"❌ Search vector backfill failed: {e}")
+
+        return {
+            "status": "failed",
+            "error": str(e)
+        }
+
+    finally:
+        db.close()
+
+
+@celery_app.task(
+    bind=True,
+    base=DatabaseTask,
+    name="app.tasks.search.rebuild_autocomplete_index"
+)
+def rebuild_autocomplete_index(self) -> Dict[str, Any]:
+    """
+    Rebuild the autocomplete prefix index from deal and user keywords.
+    Drops terms that aged out of the window or lost their followers, which
+    incremental updates never remove.
+
+    Returns:
+        Statistics dictionary
+    """
+    if not AutocompleteService.is_enabled():
+        return {"status": "skipped", "reason": "autocomplete disabled"}
+
+    db = SessionLocal()
+    self._db = db
+
+    try:
+        stats = AutocompleteService.rebuild(db)
+        print(f"🔤 Rebuilt autocomplete index: {stats['terms']} terms, {stats['prefixes']} prefixes")
+
+        return {
+            "status": "success",
+            **stats
+        }
+
+    except Exception as e:
+        print(f"❌ Autocomplete rebuild failed: {e}")
+
+        return {
+            "status": "failed",
+            "error": str(e)
+        }
+
+    finally:
+        db.close()
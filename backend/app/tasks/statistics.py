@@ -0,0 +1,61 @@
+"""
+Celery tasks for deal engagement statistics.
+Rolls crawler-captured engagement snapshots up to hourly and daily rows so
+the deal_statistics table stays bounded.
+"""
+from typing import Dict, Any
+from celery import Task
+
+from app.celery_app import celery_app
+from app.models.database import SessionLocal
+from app.services.deal_statistics import DealStatisticsService
+
+
+class DatabaseTask(Task):
+    """Base task with database session handling."""
+    _db = None
+
+    def after_return(self, *args, **kwargs):
+        """Close database session after task completes."""
+        if self._db is not None:
+            self._db.close()
+
+
+@celery_app.task(
+    bind=True,
+    base=DatabaseTask,
+    name="app.tasks.statistics.rollup_deal_statistics"
+)
+def rollup_deal_statistics(self) -> Dict[str, Any]:
+    """
+    Downsample engagement snapshots (raw -> hour -> day) and drop expired ones.
+
+    Returns:
+        Statistics dictionary
+    """
+    db = SessionLocal()
+    self._db = db
+
+    try:
+        stats = DealStatisticsService.rollup(db)
+        print(
+            f"📊 Rolled up deal statistics: {stats['hourly']} hourly, "
+            f"{stats['daily']} daily, {stats['expired']} expired"
+        )
+
+        return {
+            "status": "success",
+            **stats
+        }
+
+    except Exception as e:
+        db.rollback()
+        print(f"❌ Deal statistics rollup failed: {e}")
+
+        return {
+            "status": "failed",
+            "error": str(e)
+        }
+
+    finally:
+        db.close()
@@ -8,6 +8,12 @@ from app.utils.db_utils import (
     paginate,
     execute_raw_sql,
 )
+from app.utils.redis_client import get_redis
+from app.utils.partitioning import (
+    ensure_monthly_partitions,
+    list_monthly_partitions,
+    drop_partition,
+)
 
 __all__ = [
     "get_db_context",
@@ -15,4 +21,8 @@ __all__ = [
     "bulk_update",
     "paginate",
     "execute_raw_sql",
+    "get_redis",
+    "ensure_monthly_partitions",
+    "list_monthly_partitions",
+    "drop_partition",
 ]
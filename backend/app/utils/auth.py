@@ -170,6 +170,31 @@ def get_current_user_optional(
     Returns:
         Current authenticated User object or None
     """
+    user_id = get_token_user_id(request)
+    if user_id is None:
+        return None
+
+    # Query user from database
+    user = db.query(User).filter(
+        User.id == user_id,
+        User.is_active == True,
+        User.deleted_at == None
+    ).first()
+
+    return user
+
+
+def get_token_user_id(request: Request) -> Optional[int]:
+    """
+    Get the user ID from the request's bearer token without a database
+    lookup (the user may not exist or be inactive).
+
+    Args:
+        request: FastAPI Request object
+
+    Returns:
+        User ID, or None if no valid token is provided
+    """
     # Extract token from Authorization header
     auth_header = request.headers.get("Authorization")
     if not auth_header or not auth_header.startswith("Bearer "):
@@ -185,16 +210,7 @@ def get_current_user_optional(
         if user_id_str is None:
             return None
 
-        user_id = int(user_id_str)
-
-        # Query user from database
-        user = db.query(User).filter(
-            User.id == user_id,
-            User.is_active == True,
-            User.deleted_at == None
-        ).first()
-
-        return user
+        return int(user_id_str)
 
     except (JWTError, ValueError, TypeError):
         return None
@@ -45,13 +45,6 @@ def create_custom_indexes():
         WHERE mall_product_id IS NOT NULL;
         """,
 
-        # Index for notification delivery tracking
-        """
-        CREATE INDEX IF NOT EXISTS idx_notifications_pending
-        ON notifications(status, created_at)
-        WHERE status = 'PENDING';
-        """,
-
         # Index for user active keywords lookup
         """
         CREATE INDEX IF NOT EXISTS idx_user_keywords_lookup
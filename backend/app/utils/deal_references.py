@@ -0,0 +1,92 @@
+"""
+Referential integrity of bookmarks.deal_id.
+
+Bookmarks keep pointing at deals moved to deals_archive, so deal_id can't
+have a foreign key to either table. These triggers enforce the same rules
+instead:
+    - a bookmark's deal must exist in deals or deals_archive (insert/update
+      raises foreign_key_violation otherwise; the deal row is locked FOR
+      KEY SHARE like a foreign key check, so it can't be deleted under the
+      new bookmark)
+    - deleting a deal from deals or deals_archive deletes its bookmarks,
+      unless the deal still exists in the other table (archiving copies
+      the deal before deleting it, so its bookmarks stay)
+"""
+from typing import Union
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session
+
+
+Bind = Union[Session, Connection]
+
+CREATE_STATEMENTS = [
+    """
+    CREATE OR REPLACE FUNCTION bookmarks_check_deal() RETURNS trigger AS $$
+    BEGIN
+        PERFORM 1 FROM deals WHERE id = NEW.deal_id FOR KEY SHARE;
+        IF NOT FOUND THEN
+            PERFORM 1 FROM deals_archive WHERE id = NEW.deal_id FOR KEY SHARE;
+            IF NOT FOUND THEN
+                RAISE foreign_key_violation
+                    USING MESSAGE = format('deal %s of bookmark does not exist', NEW.deal_id);
+            END IF;
+        END IF;
+        RETURN NEW;
+    END
+    $$ LANGUAGE plpgsql
+    """,
+    """
+    CREATE OR REPLACE FUNCTION bookmarks_delete_for_deals() RETURNS trigger AS $$
+    BEGIN
+        DELETE FROM bookmarks b
+        USING removed_deals r
+        WHERE b.deal_id = r.id
+          AND NOT EXISTS (SELECT 1 FROM deals d WHERE d.id = r.id)
+          AND NOT EXISTS (SELECT 1 FROM deals_archive a WHERE a.id = r.id);
+        RETURN NULL;
+    END
+    $$ LANGUAGE plpgsql
+    """,
+    "DROP TRIGGER IF EXISTS bookmarks_check_deal ON bookmarks",
+    """
+    CREATE TRIGGER bookmarks_check_deal
+    BEFORE INSERT OR UPDATE OF deal_id ON bookmarks
+    FOR EACH ROW EXECUTE FUNCTION bookmarks_check_deal()
+    """,
+    "DROP TRIGGER IF EXISTS deals_delete_bookmarks ON deals",
+    """
+    CREATE TRIGGER deals_delete_bookmarks
+    AFTER DELETE ON deals
+    REFERENCING OLD TABLE AS removed_deals
+    FOR EACH STATEMENT EXECUTE FUNCTION bookmarks_delete_for_deals()
+    """,
+    "DROP TRIGGER IF EXISTS deals_archive_delete_bookmarks ON deals_archive",
+    """
+    CREATE TRIGGER deals_archive_delete_bookmarks
+    AFTER DELETE ON deals_archive
+    REFERENCING OLD TABLE AS removed_deals
+    FOR EACH STATEMENT EXECUTE FUNCTION bookmarks_delete_for_deals()
+    """,
+]
+
+DROP_STATEMENTS = [
+    "DROP TRIGGER IF EXISTS deals_archive_delete_bookmarks ON deals_archive",
+    "DROP TRIGGER IF EXISTS deals_delete_bookmarks ON deals",
+    "DROP TRIGGER IF EXISTS bookmarks_check_deal ON bookmarks",
+    "DROP FUNCTION IF EXISTS bookmarks_delete_for_deals()",
+    "DROP FUNCTION IF EXISTS bookmarks_check_deal()",
+]
+
+
+def ensure_bookmark_triggers(bind: Bind) -> None:
+    """Create (or replace) the bookmark integrity triggers."""
+    for statement in CREATE_STATEMENTS:
+        bind.execute(text(statement))
+
+
+def drop_bookmark_triggers(bind: Bind) -> None:
+    """Drop the bookmark integrity triggers."""
+    for statement in DROP_STATEMENTS:
+        bind.execute(text(statement))
@@ -0,0 +1,40 @@
+"""
+Keyword set matching helper.
+Compiles a set of literal keywords into one regex whose alternatives share
+their common prefixes (a trie), so the regex engine scans the text once
+instead of trying every keyword at every position.
+"""
+import re
+from typing import Any, Dict, Iterable
+
+
+def keyword_pattern(keywords: Iterable[str]) -> str:
+    """
+    Build a regex matching any of the keywords. A match is always a whole
+    keyword (the longest one starting at that position).
+
+    Args:
+        keywords: Literal keywords (matched case-sensitively; lowercase both
+            sides for case-insensitive matching)
+
+    Returns:
+        Regex source ("" for no keywords)
+    """
+    trie: Dict[str, Any] = {}
+    for keyword in keywords:
+        node = trie
+        for char in keyword:
+            node = node.setdefault(char, {})
+        node[""] = {}  # end of a keyword
+
+    def render(node: Dict[str, Any]) -> str:
+        branches = [re.escape(char) + render(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        if "" in node:
+            # A keyword ends here: the longer continuations are optional
+            body = (body if len(branches) > 1 else "(?:" + body + ")") + "?"
+        return body
+
+    return render(trie)
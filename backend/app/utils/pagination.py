@@ -0,0 +1,172 @@
+"""
+Keyset (cursor) pagination helpers.
+
+A cursor is an opaque, URL-safe token holding the sort key and id of the
+last row of a page. The next page is fetched with
+WHERE (sort_key, id) < (cursor_value, cursor_id) (or > for ascending), so
+it costs the same however deep it is, unlike OFFSET which scans and
+discards every earlier row.
+"""
+import json
+import base64
+import binascii
+from datetime import datetime
+from typing import Any, List, Optional, Tuple
+
+from sqlalchemy import DateTime, and_, or_, tuple_
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a cursor is malformed or was issued for another ordering."""
+
+
+def encode_cursor(sort_by: str, order: str, value: Any, row_id: int) -> str:
+    """
+    Encode a page boundary as an opaque cursor.
+
+    Args:
+        sort_by: Sort field the cursor belongs to
+        order: "asc" or "desc"
+        value: Sort key of the last row (None allowed)
+        row_id: Primary key of the last row
+
+    Returns:
+        URL-safe cursor string
+    """
+    if isinstance(value, datetime):
+        value = value.isoformat()
+
+    payload = json.dumps({"s": sort_by, "o": order, "v": value, "id": row_id}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, sort_by: str, order: str, sort_column=None) -> Tuple[Any, int]:
+    """
+    Decode a cursor and check it matches the requested ordering.
+
+    Args:
+        cursor: Cursor from a previous response
+        sort_by: Requested sort field
+        order: Requested sort order
+        sort_column: Sort column (used to restore datetime values)
+
+    Returns:
+        Tuple of (sort key value, row id)
+
+    Raises:
+        InvalidCursorError: If the cursor cannot be decoded or does not match
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        value, row_id = payload["v"], int(payload["id"])
+        cursor_sort, cursor_order = payload["s"], payload["o"]
+    except (ValueError, KeyError, TypeError, binascii.Error):
+        raise InvalidCursorError("Invalid cursor")
+
+    if cursor_sort != sort_by or cursor_order != order:
+        raise InvalidCursorError("Cursor does not match sort_by/order")
+
+    if value is not None and sort_column is not None and isinstance(sort_column.type, DateTime):
+        try:
+            value = datetime.fromisoformat(value)
+        except (TypeError, ValueError):
+            raise InvalidCursorError("Invalid cursor")
+
+    return value, row_id
+
+
+def keyset_filter(sort_column, id_column, order: str, value: Any, row_id: int):
+    """
+    Build the WHERE clause selecting rows after a cursor.
+
+    NULL sort keys sort as the largest value (PostgreSQL's default: last when
+    ascending, first when descending), matching the ORDER BY built by
+    keyset_order_by.
+
+    Args:
+        sort_column: Sort column
+        id_column: Unique tie-breaker column
+        order: "asc" or "desc"
+        value: Cursor sort key
+        row_id: Cursor id
+
+    Returns:
+        SQLAlchemy boolean clause
+    """
+    if order == "desc":
+        if value is None:
+            return or_(
+                and_(sort_column.is_(None), id_column < row_id),
+                sort_column.isnot(None)
+            )
+        return tuple_(sort_column, id_column) < tuple_(value, row_id)
+
+    if value is None:
+        return and_(sort_column.is_(None), id_column > row_id)
+    return or_(
+        tuple_(sort_column, id_column) > tuple_(value, row_id),
+        sort_column.is_(None)
+    )
+
+
+def keyset_order_by(sort_column, id_column, order: str) -> list:
+    """Return the ORDER BY clauses matching keyset_filter."""
+    if order == "desc":
+        return [sort_column.desc(), id_column.desc()]
+    return [sort_column.asc(), id_column.asc()]
+
+
+def keyset_paginate(
+    query,
+    sort_by: str,
+    sort_column,
+    id_column,
+    order: str = "desc",
+    page_size: int = 20,
+    cursor: Optional[str] = None,
+    offset: int = 0
+) -> Tuple[List[Any], Optional[str]]:
+    """
+    Fetch one page ordered by (sort_column, id_column) and the cursor for
+    the next page.
+
+    With a cursor the page starts right after it; without one, offset is
+    applied instead (legacy page-number requests). Fetches one extra row to
+    know whether a next page exists; no COUNT is issued.
+
+    Args:
+        query: SQLAlchemy query selecting model instances
+        sort_by: Sort field name (embedded in the cursor)
+        sort_column: Sort column
+        id_column: Unique tie-breaker column
+        order: "asc" or "desc"
+        page_size: Rows per page
+        cursor: Cursor from a previous page
+        offset: Rows to skip when no cursor is given
+
+    Returns:
+        Tuple of (rows, next_cursor or None on the last page)
+
+    Raises:
+        InvalidCursorError: If the cursor is invalid for this ordering
+    """
+    query = query.order_by(*keyset_order_by(sort_column, id_column, order))
+
+    if cursor:
+        value, row_id = decode_cursor(cursor, sort_by, order, sort_column)
+        query = query.filter(keyset_filter(sort_column, id_column, order, value, row_id))
+    elif offset:
+        query = query.offset(offset)
+
+    rows = query.limit(page_size + 1).all()
+
+    next_cursor = None
+    if len(rows) > page_size:
+        rows = rows[:page_size]
+        last = rows[-1]
+        next_cursor = encode_cursor(
+            sort_by, order, getattr(last, sort_column.key), getattr(last, id_column.key)
+        )
+
+    return rows, next_cursor
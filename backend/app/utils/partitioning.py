@@ -0,0 +1,140 @@
+"""
+Monthly range partition helpers.
+Creates and drops monthly partitions of tables declared with
+postgresql_partition_by="RANGE (<timestamp column>)".
+
+Partitions are named <table>_y<YYYY>m<MM> and cover [first day of month,
+first day of next month). There is no default partition, so partitions must
+exist before rows for their month arrive; create them ahead of time with
+ensure_monthly_partitions (run at startup and by a daily beat task).
+"""
+import re
+from datetime import date, datetime
+from typing import List, Optional, Tuple, Union
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session
+
+
+Bind = Union[Session, Connection]
+
+
+def month_start(value: Union[date, datetime]) -> date:
+    """Return the first day of the month containing value."""
+    return date(value.year, value.month, 1)
+
+
+def add_months(value: date, months: int) -> date:
+    """Shift a first-of-month date by a number of months."""
+    index = value.year * 12 + (value.month - 1) + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(table: str, month: date) -> str:
+    """Return the partition table name for a month, e.g. notifications_y2026m10."""
+    return f"{table}_y{month.year:04d}m{month.month:02d}"
+
+
+def ensure_monthly_partitions(
+    bind: Bind,
+    table: str,
+    months_ahead: int = 3,
+    start: Optional[date] = None
+) -> List[str]:
+    """
+    Create missing monthly partitions from start through months_ahead months
+    after the current month. Idempotent.
+
+    Args:
+        bind: Session or connection (caller commits)
+        table: Partitioned parent table name
+        months_ahead: Future months to pre-create
+        start: First month to cover (default: current month)
+
+    Returns:
+        Names of the partitions that were created
+    """
+    current = month_start(datetime.utcnow())
+    month = month_start(start) if start else current
+    last = add_months(current, months_ahead)
+
+    existing = {name for name, _ in list_monthly_partitions(bind, table)}
+    created = []
+
+    while month <= last:
+        name = partition_name(table, month)
+        if name not in existing:
+            bind.execute(text(
+                f'CREATE TABLE IF NOT EXISTS "{name}" PARTITION OF "{table}" '
+                f"FOR VALUES FROM ('{month.isoformat()}') "
+                f"TO ('{add_months(month, 1).isoformat()}')"
+            ))
+            created.append(name)
+        month = add_months(month, 1)
+
+    return created
+
+
+def list_monthly_partitions(bind: Bind, table: str) -> List[Tuple[str, date]]:
+    """
+    List a table's monthly partitions.
+
+    Args:
+        bind: Session or connection
+        table: Partitioned parent table name
+
+    Returns:
+        List of (partition name, month) tuples ordered by month
+    """
+    rows = bind.execute(
+        text(
+            """
+            SELECT child.relname
+            FROM pg_inherits
+            JOIN pg_class parent ON parent.oid = pg_inherits.inhparent
+            JOIN pg_class child ON child.oid = pg_inherits.inhrelid
+            WHERE parent.relname = :table
+            """
+        ),
+        {"table": table}
+    ).scalars().all()
+
+    pattern = re.compile(rf"^{re.escape(table)}_y(\d{{4}})m(\d{{2}})$")
+    partitions = []
+    for name in rows:
+        match = pattern.match(name)
+        if match:
+            partitions.append((name, date(int(match.group(1)), int(match.group(2)), 1)))
+
+    return sorted(partitions, key=lambda item: item[1])
+
+
+def partitions_before(bind: Bind, table: str, cutoff: date) -> List[Tuple[str, date]]:
+    """
+    List monthly partitions whose whole range ends on or before cutoff.
+
+    Args:
+        bind: Session or connection
+        table: Partitioned parent table name
+        cutoff: Retention boundary
+
+    Returns:
+        List of (partition name, month) tuples ordered by month
+    """
+    return [
+        (name, month)
+        for name, month in list_monthly_partitions(bind, table)
+        if add_months(month, 1) <= cutoff
+    ]
+
+
+def drop_partition(bind: Bind, name: str) -> None:
+    """
+    Drop a partition table (caller commits).
+
+    Args:
+        bind: Session or connection
+        name: Partition table name
+    """
+    bind.execute(text(f'DROP TABLE IF EXISTS "{name}"'))
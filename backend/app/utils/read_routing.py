@@ -0,0 +1,86 @@
+"""
+Read replica routing.
+Read-only endpoints depend on get_read_db instead of get_db, so their
+queries run on the replica (DATABASE_REPLICA_URL) and leave the primary to
+crawler writes and notification inserts.
+
+Read-your-writes: a user's own writes (bookmarks, keywords) mark the user
+in Redis for READ_YOUR_WRITES_SECONDS, and the user's reads go to the
+primary until the mark expires, so a list fetched right after a write
+never misses it because of replica lag. If Redis can't be read, reads of
+signed-in users go to the primary.
+
+Cached responses (app.services.response_cache) are not stored for
+RESPONSE_CACHE_REPLICA_LAG_SECONDS after an invalidation, so a render from
+a replica that hasn't replayed the write yet is never cached.
+"""
+from typing import Generator, Optional
+
+import redis
+from fastapi import Request
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.models.database import get_read_session, has_replica
+from app.utils.auth import get_token_user_id
+from app.utils.redis_client import get_redis
+
+
+PRIMARY_READS_KEY_PREFIX = "db:primary_reads:"
+
+
+def mark_user_write(user_id: int) -> None:
+    """
+    Route a user's reads to the primary for READ_YOUR_WRITES_SECONDS (call
+    after committing a write the user will read back). Never raises.
+
+    Args:
+        user_id: User ID
+    """
+    if not has_replica():
+        return
+
+    try:
+        get_redis().set(PRIMARY_READS_KEY_PREFIX + str(user_id), 1, ex=settings.READ_YOUR_WRITES_SECONDS)
+    except redis.RedisError as e:
+        print(f"⚠️ Read-your-writes mark failed: {e}")
+
+
+def reads_from_primary(user_id: Optional[int]) -> bool:
+    """
+    Check if a user's reads must go to the primary (recent write, or no
+    way to tell).
+
+    Args:
+        user_id: User ID, or None for anonymous requests
+
+    Returns:
+        True to read from the primary
+    """
+    if user_id is None:
+        return False
+
+    try:
+        return bool(get_redis().exists(PRIMARY_READS_KEY_PREFIX + str(user_id)))
+    except redis.RedisError as e:
+        print(f"⚠️ Read-your-writes check failed: {e}")
+        return True
+
+
+def get_read_db(request: Request) -> Generator[Session, None, None]:
+    """
+    FastAPI dependency for read-only database sessions: the replica, or the
+    primary for users who wrote recently.
+
+    Usage:
+        @app.get("/items/")
+        def read_items(db: Session = Depends(get_read_db)):
+            return db.query(Item).all()
+    """
+    use_primary = has_replica() and reads_from_primary(get_token_user_id(request))
+
+    db = get_read_session(use_primary)
+    try:
+        yield db
+    finally:
+        db.close()
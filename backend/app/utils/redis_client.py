@@ -0,0 +1,29 @@
+"""
+Redis client helpers.
+Provides lazily created, process-wide Redis clients for caches and metrics.
+"""
+from functools import lru_cache
+from typing import Optional
+
+import redis
+
+from app.config import settings
+
+
+@lru_cache(maxsize=None)
+def get_redis(url: Optional[str] = None) -> redis.Redis:
+    """
+    Get a shared Redis client (one connection pool per URL per process).
+
+    Args:
+        url: Redis URL (default: settings.REDIS_URL)
+
+    Returns:
+        Redis client with decoded string responses
+    """
+    return redis.Redis.from_url(
+        url or settings.REDIS_URL,
+        decode_responses=True,
+        socket_connect_timeout=1.0,
+        socket_timeout=1.0,
+    )
@@ -12,6 +12,7 @@ from sqlalchemy.exc import IntegrityError
 from app.models.database import SessionLocal, engine, Base
 from app.models.deal import DealSource, Category
 from app.models.blacklist import Blacklist
+from app.services.reference_cache import ReferenceCache
 
 
 def create_tables():
@@ -75,6 +76,7 @@ def seed_deal_sources(db):
             db.rollback()
             print(f"  - Skipped (already exists): {source_data['display_name']}")
 
+    ReferenceCache.invalidate()
     print(f"✓ Seeded {count} deal sources")
     return count
 
@@ -113,6 +115,7 @@ def seed_categories(db):
             db.rollback()
             print(f"  - Skipped (already exists): {cat_data['name']}")
 
+    ReferenceCache.invalidate()
     print(f"✓ Seeded {count} categories")
     return count
 
@@ -0,0 +1,90 @@
+"""
+Benchmark for ingest-time category classification.
+
+Times CategoryClassifier.classify_slug (the per-deal work in BaseCrawler;
+the slug -> id lookup is a dict hit in the reference cache) on synthetic
+deal titles, with and without a board category label, and reports
+p50/p95/max in microseconds, deals/sec and the category distribution.
+
+Needs no database or Redis.
+
+Usage:
+    python -m scripts.bench_category_classifier
+    python -m scripts.bench_category_classifier --deals 200000
+"""
+import sys
+import time
+import random
+import argparse
+from collections import Counter
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.services.category_classifier import CategoryClassifier, CATEGORY_KEYWORDS
+
+
+PREFIXES = ["[쿠팡]", "[11번가]", "[G마켓]", "[네이버]", "", ""]
+BRANDS = ["삼성", "LG", "애플", "농심", "나이키", "다이슨", "로지텍", "오뚜기", "코카콜라", "이케아"]
+FILLERS = ["특가", "역대가", "1+1", "무료배송", "한정수량", "타임딜", "카드할인", "대용량", "정품", "최신형"]
+BOARDS = [None, "컴퓨터", "디지털", "식품/건강", "의류/잡화", "가전/가구", "기타"]
+
+
+def make_title(rng: random.Random) -> str:
+    """A synthetic title: mostly one category keyword, sometimes none."""
+    words = [rng.choice(PREFIXES), rng.choice(BRANDS)]
+    if rng.random() < 0.9:
+        words.append(rng.choice(CATEGORY_KEYWORDS[rng.choice(list(CATEGORY_KEYWORDS))]))
+    words += rng.sample(FILLERS, 2)
+    words.append(f"{rng.randint(1, 500) * 1000:,}원")
+    return " ".join(word for word in words if word)
+
+
+def percentile(values: List[float], pct: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct))]
+
+
+def run(deals: List[Tuple[str, Optional[str]]]) -> Tuple[List[float], Counter]:
+    timings = []
+    slugs: Counter = Counter()
+    for title, board in deals:
+        started = time.perf_counter()
+        slug = CategoryClassifier.classify_slug(title, None, board)
+        timings.append((time.perf_counter() - started) * 1e6)
+        slugs[slug or "(none)"] += 1
+    return timings, slugs
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark category classification")
+    parser.add_argument("--deals", type=int, default=50_000, help="Titles to classify")
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    titles = [make_title(rng) for _ in range(args.deals)]
+    boards = [rng.choice(BOARDS) for _ in range(args.deals)]
+
+    print(f"{'mode':<12} {'p50':>8} {'p95':>8} {'max':>8}  (us)  {'deals/s':>10}")
+    for mode, deals in (
+        ("title", [(title, None) for title in titles]),
+        ("title+board", list(zip(titles, boards))),
+    ):
+        started = time.perf_counter()
+        timings, slugs = run(deals)
+        elapsed = time.perf_counter() - started
+        print(
+            f"{mode:<12} {percentile(timings, 0.5):>8.1f} {percentile(timings, 0.95):>8.1f} "
+            f"{max(timings):>8.1f}        {len(deals) / elapsed:>10,.0f}"
+        )
+
+    print("\nCategories (title only):")
+    _, slugs = run([(title, None) for title in titles])
+    for slug, count in slugs.most_common():
+        print(f"   {slug:<12} {count:>8,}")
+
+
+if __name__ == "__main__":
+    main()
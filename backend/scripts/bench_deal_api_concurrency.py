@@ -0,0 +1,174 @@
+"""
+Concurrency benchmark for the deal read path.
+
+Runs the API in-process on a single uvicorn worker and measures latency of
+GET /api/v1/deals under concurrent load while slow queries
+(SELECT pg_sleep) run alongside it, issued two ways:
+
+    on-loop     async def endpoint running a sync session query
+                (the old deal endpoint pattern: blocks the event loop)
+    threadpool  def endpoint with a sync session (the current deal endpoints)
+
+With the slow query on the loop, p99 of every other request grows to the
+slow query's duration; offloaded to the threadpool, it should stay near baseline.
+
+Usage:
+    python -m scripts.bench_deal_api_concurrency
+    python -m scripts.bench_deal_api_concurrency --concurrency 32 --duration 15 --slow-seconds 2
+"""
+import sys
+import time
+import asyncio
+import argparse
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import httpx
+import uvicorn
+from fastapi import Depends
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from app.main import app
+from app.models.database import get_db
+
+
+SLOW_ROUTES = {
+    "on-loop": "/_bench/slow-on-loop",
+    "threadpool": "/_bench/slow-threadpool",
+}
+
+
+@app.get("/_bench/slow-on-loop", include_in_schema=False)
+async def slow_on_loop(seconds: float, db: Session = Depends(get_db)):
+    db.execute(text("SELECT pg_sleep(:s)"), {"s": seconds})
+    return {"slept": seconds}
+
+
+@app.get("/_bench/slow-threadpool", include_in_schema=False)
+def slow_threadpool(seconds: float, db: Session = Depends(get_db)):
+    db.execute(text("SELECT pg_sleep(:s)"), {"s": seconds})
+    return {"slept": seconds}
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of a list of values."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, int(round(pct / 100 * len(ordered))) - 1))
+    return ordered[index]
+
+
+async def run_scenario(
+    base_url: str,
+    slow_route: Optional[str],
+    concurrency: int,
+    duration: float,
+    slow_seconds: float,
+    slow_clients: int
+) -> Dict[str, float]:
+    """Hammer the deal list endpoint while slow requests run; return latency stats."""
+    latencies: List[float] = []
+    errors = 0
+    deadline = time.monotonic() + duration
+
+    limits = httpx.Limits(max_connections=concurrency + slow_clients + 4)
+    async with httpx.AsyncClient(base_url=base_url, timeout=60.0, limits=limits) as client:
+
+        async def fast_worker():
+            nonlocal errors
+            while time.monotonic() < deadline:
+                started = time.perf_counter()
+                try:
+                    response = await client.get("/api/v1/deals", params={"page_size": 20})
+                    if response.status_code != 200:
+                        errors += 1
+                except httpx.HTTPError:
+                    errors += 1
+                latencies.append((time.perf_counter() - started) * 1000)
+
+        async def slow_worker():
+            while time.monotonic() < deadline:
+                try:
+                    await client.get(slow_route, params={"seconds": slow_seconds})
+                except httpx.HTTPError:
+                    pass
+
+        workers = [fast_worker() for _ in range(concurrency)]
+        if slow_route:
+            workers += [slow_worker() for _ in range(slow_clients)]
+        await asyncio.gather(*workers)
+
+    return {
+        "requests": len(latencies),
+        "rps": len(latencies) / duration,
+        "p50": percentile(latencies, 50),
+        "p95": percentile(latencies, 95),
+        "p99": percentile(latencies, 99),
+        "max": max(latencies) if latencies else 0.0,
+        "errors": errors,
+    }
+
+
+def start_server(port: int) -> uvicorn.Server:
+    """Start a single-worker uvicorn server in a background thread."""
+    server = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=port, log_level="warning"))
+    thread = threading.Thread(target=server.run, daemon=True)
+    thread.start()
+
+    while not server.started:
+        time.sleep(0.05)
+    return server
+
+
+def main():
+    """Main entry point for the deal API concurrency benchmark."""
+    parser = argparse.ArgumentParser(description="Deal API concurrency benchmark")
+    parser.add_argument("--port", type=int, default=8799, help="Port for the in-process server")
+    parser.add_argument("--concurrency", type=int, default=16, help="Concurrent deal list clients")
+    parser.add_argument("--duration", type=float, default=10.0, help="Seconds per scenario")
+    parser.add_argument("--slow-seconds", type=float, default=1.0, help="Duration of each slow query")
+    parser.add_argument("--slow-clients", type=int, default=1, help="Concurrent slow-query clients")
+
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("⏱️  Deal API Concurrency Benchmark")
+    print("=" * 60)
+    print(f"Fast clients: {args.concurrency} × GET /api/v1/deals")
+    print(f"Slow clients: {args.slow_clients} × pg_sleep({args.slow_seconds})")
+    print(f"Duration: {args.duration:.0f}s per scenario")
+    print("=" * 60)
+
+    server = start_server(args.port)
+    base_url = f"http://127.0.0.1:{args.port}"
+
+    scenarios = [("baseline", None)] + list(SLOW_ROUTES.items())
+    results = {}
+
+    try:
+        for name, route in scenarios:
+            print(f"▶️  {name}...")
+            results[name] = asyncio.run(run_scenario(
+                base_url, route, args.concurrency, args.duration,
+                args.slow_seconds, args.slow_clients
+            ))
+    finally:
+        server.should_exit = True
+
+    print()
+    print(f"{'scenario':<12}{'req/s':>9}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'max ms':>10}{'errors':>8}")
+    for name, stats in results.items():
+        print(
+            f"{name:<12}{stats['rps']:>9.1f}{stats['p50']:>10.1f}{stats['p95']:>10.1f}"
+            f"{stats['p99']:>10.1f}{stats['max']:>10.1f}{stats['errors']:>8}"
+        )
+
+
+if __name__ == "__main__":
+    main()
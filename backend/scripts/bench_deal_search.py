@@ -0,0 +1,234 @@
+"""
+Benchmark for deal search on a large deals table.
+
+Seeds synthetic deals server-side (generate_series, so millions of rows take
+seconds, not hours), then times three ways of answering the same keywords:
+
+    legacy    LIKE '%kw%' on title/product_name, ORDER BY hot_score, full COUNT
+              (the previous /deals/search query)
+    trigram   DealSearchService ranked search on the pg_trgm predicates
+    tsvector  DealSearchService ranked search on deals.search_vector
+              (only with --tsvector; backfills the column first and reports
+              backfill throughput)
+
+Prints p50/p95/max latency per mode and the EXPLAIN ANALYZE plan of one
+ranked query.
+
+Usage:
+    python -m scripts.bench_deal_search
+    python -m scripts.bench_deal_search --rows 5000000 --queries 200 --tsvector
+    python -m scripts.bench_deal_search --keep          # reuse rows next run with --rows 0
+"""
+import sys
+import time
+import random
+import argparse
+from pathlib import Path
+from typing import Callable, Dict, List
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from sqlalchemy import event, or_, text
+
+from app.config import settings
+from app.models.database import SessionLocal
+from app.models import Deal, DealSource
+from app.services.search import DealSearchService
+
+
+BENCH_PREFIX = "benchsearch"
+
+BRANDS = ["애플", "삼성", "엘지", "소니", "다이슨", "로지텍", "샤오미", "닌텐도", "레노버", "필립스"]
+PRODUCTS = [
+    "아이폰", "갤럭시", "에어팟", "버즈", "맥북", "아이패드", "모니터", "키보드", "마우스", "청소기",
+    "공기청정기", "노트북", "이어폰", "스위치", "충전기", "ssd", "rtx4070", "냉장고", "세탁기", "커피머신",
+]
+SUFFIXES = ["특가", "역대가", "핫딜", "할인", "최저가", "쿠폰", "무료배송", "한정수량", "타임딜", "카드할인"]
+
+QUERIES = PRODUCTS + ["애플 아이폰", "삼성 갤럭시", "로지텍 마우스", "무선 이어폰", "게이밍 모니터"]
+
+
+def seed_deals(db, rows: int) -> None:
+    """Insert synthetic deals with generate_series (one statement per million rows)."""
+    source_id = db.query(DealSource.id).order_by(DealSource.id).first()[0]
+    offset = db.query(Deal).filter(Deal.external_id.like(f"{BENCH_PREFIX}-%")).count()
+
+    for start in range(0, rows, 1_000_000):
+        count = min(1_000_000, rows - start)
+        db.execute(
+            text(
+                """
+                INSERT INTO deals (
+                    source_id, external_id, url, title, product_name, price,
+                    upvotes, downvotes, comment_count, view_count, bookmark_count, hot_score,
+                    is_active, is_blocked, published_at, created_at, updated_at
+                )
+                SELECT
+                    :source_id,
+                    :prefix || '-' || g,
+                    'https://example.com/' || g,
+                    (:brands)[1 + g % 10] || ' ' || (:products)[1 + (g / 10) % 20] || ' '
+                        || (g % 997) || ' ' || (:suffixes)[1 + (g / 200) % 10],
+                    CASE WHEN g % 3 = 0 THEN (:brands)[1 + g % 10] || ' ' || (:products)[1 + (g / 10) % 20] END,
+                    1000 + (g % 500) * 100,
+                    g % 50, g % 7, g % 30, g % 5000, g % 20,
+                    (g % 1000) / 10.0,
+                    true, false,
+                    now() AT TIME ZONE 'utc' - ((g % 2160) || ' hours')::interval,
+                    now() AT TIME ZONE 'utc', now() AT TIME ZONE 'utc'
+                FROM generate_series(:first, :last) AS g
+                """
+            ),
+            {
+                "source_id": source_id,
+                "prefix": BENCH_PREFIX,
+                "brands": BRANDS,
+                "products": PRODUCTS,
+                "suffixes": SUFFIXES,
+                "first": offset + start + 1,
+                "last": offset + start + count,
+            }
+        )
+        db.commit()
+        print(f"   seeded {start + count:,} / {rows:,}")
+
+    db.execute(text("ANALYZE deals"))
+    db.commit()
+
+
+def legacy_search(db, keyword: str, page_size: int) -> None:
+    """The previous /deals/search query: LIKE filter, hot_score order, full count."""
+    query = db.query(Deal).filter(
+        Deal.is_active == True,
+        Deal.is_blocked == False,
+        Deal.deleted_at == None,
+        or_(Deal.title.contains(keyword), Deal.product_name.contains(keyword))
+    )
+    query.order_by(None).count()
+    query.order_by(Deal.hot_score.desc(), Deal.id.desc()).limit(page_size + 1).all()
+
+
+def ranked_search(db, keyword: str, page_size: int) -> None:
+    """The new ranked search, first page with its capped total."""
+    DealSearchService.search(db, keyword, page=1, page_size=page_size, include_total=True)
+
+
+def time_queries(db, search: Callable, queries: List[str], page_size: int) -> Dict[str, float]:
+    """Run each query once (after one warm-up) and return latency stats in ms."""
+    search(db, queries[0], page_size)
+    db.rollback()
+
+    latencies = []
+    for keyword in queries:
+        started = time.perf_counter()
+        search(db, keyword, page_size)
+        latencies.append((time.perf_counter() - started) * 1000)
+        db.rollback()
+
+    latencies.sort()
+    return {
+        "p50": latencies[len(latencies) // 2],
+        "p95": latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))],
+        "max": latencies[-1],
+    }
+
+
+def explain_ranked(db, keyword: str) -> None:
+    """Print EXPLAIN ANALYZE of the ranked candidate query."""
+    statements = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if "score" in statement and "LIMIT" in statement:
+            statements.append(cursor.mogrify(statement, parameters).decode())
+
+    bind = db.get_bind()
+    event.listen(bind, "before_cursor_execute", capture)
+    try:
+        DealSearchService.search(db, keyword, page=1, page_size=20, include_total=True)
+    finally:
+        event.remove(bind, "before_cursor_execute", capture)
+
+    if statements:
+        for row in db.execute(text("EXPLAIN (ANALYZE, BUFFERS) " + statements[0])):
+            print(f"   {row[0]}")
+    db.rollback()
+
+
+def cleanup(db) -> None:
+    """Delete benchmark deals."""
+    db.query(Deal).filter(Deal.external_id.like(f"{BENCH_PREFIX}-%")).delete(synchronize_session=False)
+    db.commit()
+
+
+def main():
+    """Main entry point for the deal search benchmark."""
+    parser = argparse.ArgumentParser(description="Deal search benchmark")
+    parser.add_argument("--rows", type=int, default=2_000_000, help="Synthetic deals to seed (default: 2,000,000)")
+    parser.add_argument("--queries", type=int, default=100, help="Queries per mode (default: 100)")
+    parser.add_argument("--page-size", type=int, default=20, help="Results per page (default: 20)")
+    parser.add_argument("--tsvector", action="store_true", help="Backfill search_vector and benchmark it")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed")
+    parser.add_argument("--keep", action="store_true", help="Keep benchmark deals afterwards")
+
+    args = parser.parse_args()
+    random.seed(args.seed)
+    queries = [random.choice(QUERIES) for _ in range(args.queries)]
+
+    print("=" * 60)
+    print("🔎 Deal Search Benchmark")
+    print("=" * 60)
+    print(f"Rows: {args.rows:,} | Queries: {args.queries} | Top-K: {settings.SEARCH_MAX_RESULTS}")
+    print("=" * 60)
+
+    db = SessionLocal()
+    results = {}
+
+    try:
+        if args.rows:
+            print("🌱 Seeding deals...")
+            started = time.perf_counter()
+            seed_deals(db, args.rows)
+            print(f"   done in {time.perf_counter() - started:.1f}s")
+
+        total_rows = db.query(Deal).count()
+        print(f"📦 deals table: {total_rows:,} rows")
+
+        print("▶️  legacy...")
+        results["legacy"] = time_queries(db, legacy_search, queries, args.page_size)
+
+        settings.SEARCH_USE_TSVECTOR = False
+        print("▶️  trigram...")
+        results["trigram"] = time_queries(db, ranked_search, queries, args.page_size)
+        print("📋 Plan (trigram):")
+        explain_ranked(db, queries[0])
+
+        if args.tsvector:
+            print("🧱 Backfilling search_vector...")
+            started = time.perf_counter()
+            updated = DealSearchService.backfill_search_vectors(db, batch_size=5000)
+            elapsed = time.perf_counter() - started
+            print(f"   {updated:,} deals in {elapsed:.1f}s ({updated / elapsed if elapsed else 0:,.0f}/s)")
+            db.execute(text("ANALYZE deals"))
+            db.commit()
+
+            settings.SEARCH_USE_TSVECTOR = True
+            print("▶️  tsvector...")
+            results["tsvector"] = time_queries(db, ranked_search, queries, args.page_size)
+            print("📋 Plan (tsvector):")
+            explain_ranked(db, queries[0])
+
+    finally:
+        if not args.keep:
+            print("🧹 Cleaning up benchmark deals...")
+            cleanup(db)
+        db.close()
+
+    print()
+    print(f"{'mode':<10}{'p50 ms':>10}{'p95 ms':>10}{'max ms':>10}")
+    for name, stats in results.items():
+        print(f"{name:<10}{stats['p50']:>10.1f}{stats['p95']:>10.1f}{stats['max']:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,194 @@
+"""
+Benchmark for deal list serialization.
+
+Compares building a DealListResponse page two ways:
+
+    orm     db.query(Deal) with joinedload(source, category), full ORM
+            hydration (content and comments included), Pydantic
+            model_validate + model_dump_json (the previous list path)
+    fast    DealCardService: projected card columns only, tuples -> dicts,
+            orjson (the current list path)
+
+Seeds deals with realistic post bodies and comment JSON so the cost of
+loading heavy columns shows up, then reports ms per page (query and
+serialization separately), pages/sec and payload size for each page size.
+
+Usage:
+    python -m scripts.bench_deal_serialization
+    python -m scripts.bench_deal_serialization --deals 5000 --iterations 300 --page-sizes 20 100
+"""
+import sys
+import time
+import random
+import argparse
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Callable, Dict, Tuple
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from sqlalchemy.orm import joinedload, undefer
+
+from app.models.database import SessionLocal
+from app.models import Deal, DealSource, Category
+from app.schemas.deal import DealListResponse
+from app.services.deal_cards import DealCardService
+
+
+BENCH_PREFIX = "benchserial"
+
+LISTED = (
+    Deal.is_active == True,
+    Deal.is_blocked == False,
+    Deal.deleted_at == None,
+)
+
+
+def seed_deals(db, count: int, rng: random.Random) -> None:
+    """Seed benchmark deals with ~4 KB bodies and 40 comments each."""
+    source_ids = [row.id for row in db.query(DealSource.id).all()]
+    category_ids = [row.id for row in db.query(Category.id).all()] + [None]
+    now = datetime.utcnow()
+    body = "상세 내용 " * 400
+
+    deals = []
+    for i in range(count):
+        deals.append(Deal(
+            source_id=rng.choice(source_ids),
+            category_id=rng.choice(category_ids),
+            external_id=f"{BENCH_PREFIX}-{i}",
+            url=f"https://example.com/deal/{i}",
+            title=f"[벤치] 테스트 상품 {i} 특가",
+            content=body,
+            comments=[{"author": f"user{j}", "content": "좋은 딜 감사합니다 " * 3} for j in range(40)],
+            thumbnail_url=f"//img.example.com/{i}.jpg",
+            product_name=f"테스트 상품 {i}",
+            mall_name="테스트몰",
+            mall_product_url=f"https://mall.example.com/p/{i}",
+            price=rng.randint(1, 500) * 1000,
+            original_price=600000,
+            discount_rate=round(rng.uniform(0, 80), 1),
+            upvotes=rng.randint(0, 100),
+            comment_count=40,
+            view_count=rng.randint(0, 10000),
+            hot_score=rng.uniform(0, 500),
+            ai_summary="세 줄 요약입니다.",
+            published_at=now - timedelta(minutes=rng.randint(0, 10000)),
+        ))
+    db.add_all(deals)
+    db.commit()
+
+
+def orm_page(db, page_size: int) -> Tuple[float, str]:
+    """Previous path: hydrate Deal entities and serialize through Pydantic."""
+    started = time.perf_counter()
+    deals = db.query(Deal).options(
+        joinedload(Deal.source),
+        joinedload(Deal.category),
+        # Heavy columns are deferred on the model now; load them like the old path did
+        undefer(Deal.content),
+        undefer(Deal.ai_summary),
+        undefer(Deal.comments)
+    ).filter(*LISTED).order_by(Deal.hot_score.desc(), Deal.id.desc()).limit(page_size).all()
+    queried = time.perf_counter()
+
+    body = DealListResponse(
+        deals=deals, total=None, page=1, page_size=page_size, total_pages=None, next_cursor=None
+    ).model_dump_json()
+    return queried - started, body
+
+
+def fast_page(db, page_size: int) -> Tuple[float, str]:
+    """Current path: projected columns, dict cards, orjson."""
+    started = time.perf_counter()
+    rows = DealCardService.query(db).filter(*LISTED).order_by(
+        Deal.hot_score.desc(), Deal.id.desc()
+    ).limit(page_size).all()
+    queried = time.perf_counter()
+
+    body = DealCardService.list_payload(
+        [DealCardService.from_row(row) for row in rows],
+        total=None, page=1, page_size=page_size, total_pages=None, next_cursor=None
+    )
+    return queried - started, body
+
+
+def run(db, render: Callable, page_size: int, iterations: int) -> Dict[str, float]:
+    """Render the first page repeatedly; return per-page timings."""
+    render(db, page_size)
+    db.expunge_all()
+
+    query_time = 0.0
+    started = time.perf_counter()
+    for _ in range(iterations):
+        elapsed, body = render(db, page_size)
+        query_time += elapsed
+        db.expunge_all()  # no identity-map reuse between requests
+    total_time = time.perf_counter() - started
+
+    return {
+        "ms_per_page": total_time / iterations * 1000,
+        "query_ms": query_time / iterations * 1000,
+        "serialize_ms": (total_time - query_time) / iterations * 1000,
+        "pages_per_sec": iterations / total_time,
+        "bytes": len(body.encode()),
+    }
+
+
+def cleanup(db) -> None:
+    """Delete benchmark deals."""
+    db.query(Deal).filter(Deal.external_id.like(f"{BENCH_PREFIX}-%")).delete(synchronize_session=False)
+    db.commit()
+
+
+def main():
+    """Main entry point for the serialization benchmark."""
+    parser = argparse.ArgumentParser(description="Deal list serialization benchmark")
+    parser.add_argument("--deals", type=int, default=2000, help="Deals to seed (default: 2000)")
+    parser.add_argument("--iterations", type=int, default=200, help="Pages rendered per case (default: 200)")
+    parser.add_argument("--page-sizes", type=int, nargs="+", default=[20, 100], help="Page sizes to test")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed")
+    parser.add_argument("--keep", action="store_true", help="Keep benchmark deals afterwards")
+
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("⏱️  Deal List Serialization Benchmark")
+    print("=" * 60)
+    print(f"Deals: {args.deals} | Iterations: {args.iterations} | Page sizes: {args.page_sizes}")
+    print("=" * 60)
+
+    db = SessionLocal()
+    results = {}
+
+    try:
+        print("🌱 Seeding deals...")
+        seed_deals(db, args.deals, random.Random(args.seed))
+
+        for page_size in args.page_sizes:
+            for name, render in (("orm", orm_page), ("fast", fast_page)):
+                print(f"▶️  {name} × {page_size}...")
+                results[(name, page_size)] = run(db, render, page_size, args.iterations)
+
+    finally:
+        if not args.keep:
+            print("🧹 Cleaning up benchmark deals...")
+            cleanup(db)
+        db.close()
+
+    print()
+    print(f"{'path':<6}{'size':>6}{'ms/page':>10}{'query':>9}{'serialize':>11}{'pages/s':>10}{'KB':>8}")
+    for (name, page_size), stats in results.items():
+        print(
+            f"{name:<6}{page_size:>6}{stats['ms_per_page']:>10.2f}{stats['query_ms']:>9.2f}"
+            f"{stats['serialize_ms']:>11.2f}{stats['pages_per_sec']:>10.1f}{stats['bytes'] / 1024:>8.1f}"
+        )
+
+    for page_size in args.page_sizes:
+        orm, fast = results[("orm", page_size)], results[("fast", page_size)]
+        print(f"📈 page_size={page_size}: {orm['ms_per_page'] / fast['ms_per_page']:.1f}× faster")
+
+
+if __name__ == "__main__":
+    main()
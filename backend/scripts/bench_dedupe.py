@@ -0,0 +1,127 @@
+"""
+Benchmark for ingest-time duplicate detection.
+
+Indexes synthetic recent deals into the Redis LSH index (no database rows;
+deals are transient objects with ids above --id-offset), then times
+DuplicateDetector.find_canonical for new deals, half of them reposts of an
+indexed deal with different tags/spacing/price text (and, for half of
+them, without the trailing descriptive words).
+
+Prints p50/p95/max per lookup (signature + Redis round trips), recall on
+reposts and false matches on new products.
+
+Usage:
+    python -m scripts.bench_dedupe
+    python -m scripts.bench_dedupe --deals 300000 --lookups 2000
+"""
+import sys
+import time
+import random
+import argparse
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import List
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.models import Deal
+from app.services.dedupe import SIGNATURE_KEY_PREFIX, DealSignature, DuplicateDetector, _band_keys
+from app.utils.redis_client import get_redis
+
+
+BRANDS = ["애플", "삼성", "엘지", "소니", "다이슨", "로지텍", "샤오미", "닌텐도", "레노버", "필립스"]
+PRODUCTS = [
+    "아이폰", "갤럭시", "에어팟", "버즈", "맥북", "아이패드", "모니터", "키보드", "마우스", "청소기",
+    "공기청정기", "노트북", "이어폰", "스위치", "충전기", "ssd", "rtx4070", "냉장고", "세탁기", "커피머신",
+]
+WORDS = ["블루투스", "무선", "게이밍", "프로", "울트라", "미니", "256gb", "화이트", "블랙", "정품", "2024", "대용량"]
+MALLS = ["쿠팡", "11번가", "G마켓", "옥션", "네이버"]
+
+
+def make_deal(deal_id: int, rng: random.Random, now: datetime) -> Deal:
+    """A synthetic deal with a random product title."""
+    words = rng.sample(WORDS, 3)
+    title = f"{rng.choice(BRANDS)} {rng.choice(PRODUCTS)} {rng.randint(1, 999)} {' '.join(words)}"
+    return Deal(
+        id=deal_id,
+        title=title,
+        price=rng.randint(10, 2000) * 1000,
+        mall_name=rng.choice(MALLS),
+        published_at=now - timedelta(minutes=rng.randint(0, 47 * 60))
+    )
+
+
+def repost(deal: Deal, rng: random.Random) -> Deal:
+    """The same deal as another community would title it."""
+    title = deal.title.replace(" ", "", 1) if rng.random() < 0.5 else deal.title
+    if rng.random() < 0.5:
+        title = title.rsplit(" ", 2)[0]
+    return Deal(
+        title=f"[{deal.mall_name}] {title} ({deal.price:,}원/무료배송)",
+        price=deal.price,
+        mall_name=deal.mall_name
+    )
+
+
+def percentile(values: List[float], pct: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct))]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark duplicate detection")
+    parser.add_argument("--deals", type=int, default=200_000, help="Deals to index")
+    parser.add_argument("--lookups", type=int, default=1000, help="Lookups to time")
+    parser.add_argument("--id-offset", type=int, default=900_000_000, help="First synthetic deal id")
+    parser.add_argument("--keep", action="store_true", help="Keep the indexed signatures")
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    now = datetime.utcnow()
+
+    print(f"📦 Indexing {args.deals:,} deals...")
+    indexed = []
+    started = time.perf_counter()
+    for i in range(args.deals):
+        deal = make_deal(args.id_offset + i, rng, now)
+        DuplicateDetector.index_deal(deal)
+        indexed.append(deal)
+    elapsed = time.perf_counter() - started
+    print(f"   {args.deals / elapsed:,.0f} deals/s ({elapsed * 1e6 / args.deals:.0f} us per index_deal)")
+
+    timings = []
+    found = 0
+    false_matches = 0
+    for i in range(args.lookups):
+        is_repost = i % 2 == 0
+        original = rng.choice(indexed)
+        deal = repost(original, rng) if is_repost else make_deal(None, rng, now)
+
+        started = time.perf_counter()
+        canonical_id = DuplicateDetector.find_canonical(deal, now)
+        timings.append((time.perf_counter() - started) * 1000)
+
+        if is_repost and canonical_id == original.id:
+            found += 1
+        elif not is_repost and canonical_id is not None:
+            false_matches += 1
+
+    reposts = (args.lookups + 1) // 2
+    print(f"\n{'lookup':<10} {'p50':>8} {'p95':>8} {'max':>8}  (ms)")
+    print(f"{'':<10} {percentile(timings, 0.5):>8.3f} {percentile(timings, 0.95):>8.3f} {max(timings):>8.3f}")
+    print(f"\nrepost recall: {found}/{reposts}")
+    print(f"new products matched: {false_matches}/{args.lookups - reposts}")
+
+    if not args.keep:
+        pipe = get_redis().pipeline(transaction=False)
+        for deal in indexed:
+            pipe.delete(SIGNATURE_KEY_PREFIX + str(deal.id))
+            for key in _band_keys(DealSignature.of(deal).values):
+                pipe.zrem(key, str(deal.id))
+        pipe.execute()
+        print("🧹 Removed benchmark deals from the index")
+
+
+if __name__ == "__main__":
+    main()
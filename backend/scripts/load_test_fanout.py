@@ -0,0 +1,332 @@
+"""
+Fan-out load test for the match → outbox → FCM pipeline.
+
+Seeds load-test users, devices and keywords, runs a crawl with synthetic
+deals through the regular crawler pipeline (keyword extraction, matching,
+outbox, dispatch) and sends pushes to a local mock FCM HTTP server.
+
+Reports notifications/sec, time-to-first-push, time-to-last-push and DB
+queries per notification.
+
+Modes:
+    eager   Celery tasks run in-process (no broker or worker needed)
+    broker  Dispatchers go through the configured Redis broker; start a
+            worker pointed at the mock FCM server first, e.g.
+                FCM_SERVER_KEY=loadtest FCM_SEND_URL=http://127.0.0.1:8765/fcm/send \\
+                celery -A app.celery_app worker -Q notification.high,notification,notification.bulk
+            (DB queries are then only counted for the crawl/match side)
+
+Usage:
+    python -m scripts.load_test_fanout
+    python -m scripts.load_test_fanout --users 5000 --deals 50 --fcm-latency-ms 20
+    python -m scripts.load_test_fanout --mode broker --timeout 300
+"""
+import sys
+import json
+import time
+import random
+import argparse
+import threading
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import List, Dict, Any, Optional
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from sqlalchemy import event, insert, func
+
+from app.config import settings
+from app.celery_app import celery_app
+from app.crawlers.base_crawler import BaseCrawler
+from app.models.database import SessionLocal, engine
+from app.models import Deal, User, UserKeyword, UserDevice, AuthProvider
+from app.models.interaction import NotificationOutbox, OutboxStatus
+from app.tasks.crawler import _run_crawler_task
+
+
+LOADTEST_PREFIX = "loadtest"
+
+KEYWORD_POOL = [
+    "rtx4090", "rtx4070", "아이폰", "갤럭시", "에어팟", "맥북", "아이패드", "닌텐도",
+    "플스5", "다이슨", "로봇청소기", "모니터", "ssd", "키보드", "마우스", "노트북",
+    "커피", "생수", "라면", "기저귀",
+]
+
+
+class MockFCMServer:
+    """Local stand-in for the FCM legacy HTTP endpoint that records receipt times."""
+
+    def __init__(self, port: int, latency_ms: int = 0):
+        self.port = port
+        self.latency = latency_ms / 1000.0
+        self.lock = threading.Lock()
+        self.requests = 0
+        self.tokens = 0
+        self.first_at: Optional[float] = None
+        self.last_at: Optional[float] = None
+        self.server = ThreadingHTTPServer(("127.0.0.1", port), self._handler())
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.port}/fcm/send"
+
+    def _handler(self):
+        mock = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                length = int(self.headers.get("Content-Length", 0))
+                payload = json.loads(self.rfile.read(length) or b"{}")
+                tokens = payload.get("registration_ids") or [payload.get("to")]
+
+                if mock.latency:
+                    time.sleep(mock.latency)
+
+                now = time.monotonic()
+                with mock.lock:
+                    mock.requests += 1
+                    mock.tokens += len(tokens)
+                    if mock.first_at is None:
+                        mock.first_at = now
+                    mock.last_at = now
+
+                body = json.dumps({
+                    "multicast_id": mock.requests,
+                    "success": len(tokens),
+                    "failure": 0,
+                    "results": [{"message_id": f"{LOADTEST_PREFIX}-{mock.requests}"} for _ in tokens]
+                }).encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        return Handler
+
+    def start(self):
+        self.thread.start()
+
+    def stop(self):
+        self.server.shutdown()
+
+
+class QueryCounter:
+    """Counts SQL statements executed through the application engine."""
+
+    def __init__(self):
+        self.count = 0
+        event.listen(engine, "before_cursor_execute", self._on_execute)
+
+    def _on_execute(self, *args, **kwargs):
+        self.count += 1
+
+    def close(self):
+        event.remove(engine, "before_cursor_execute", self._on_execute)
+
+
+class SyntheticCrawler(BaseCrawler):
+    """Crawler that yields generated deals instead of fetching a site."""
+
+    def __init__(self, db, deals: List[Dict[str, Any]], source_name: str = "ppomppu"):
+        super().__init__(db, source_name)
+        self.synthetic_deals = deals
+
+    def fetch_deals(self, max_pages: int = 5) -> List[Dict[str, Any]]:
+        return [self.parse_deal(raw) for raw in self.synthetic_deals]
+
+    def parse_deal(self, raw_data: Any) -> Optional[Dict[str, Any]]:
+        return dict(raw_data)
+
+    def _respect_rate_limit(self):
+        pass
+
+
+def seed_users(db, users: int, devices_per_user: int, keywords_per_user: int, rng: random.Random) -> None:
+    """Bulk insert load-test users with devices and inclusion keywords."""
+    user_rows = [
+        {
+            "email": f"{LOADTEST_PREFIX}+{i}@dealmoa.test",
+            "auth_provider": AuthProvider.EMAIL,
+            "auth_provider_id": f"{LOADTEST_PREFIX}-{i}",
+            "dnd_enabled": False,
+        }
+        for i in range(users)
+    ]
+    user_ids = db.execute(insert(User).returning(User.id), user_rows).scalars().all()
+
+    device_rows = [
+        {
+            "user_id": user_id,
+            "device_type": "android",
+            "device_token": f"{LOADTEST_PREFIX}-token-{user_id}-{j}",
+        }
+        for user_id in user_ids
+        for j in range(devices_per_user)
+    ]
+    keyword_rows = [
+        {"user_id": user_id, "keyword": keyword, "is_inclusion": True}
+        for user_id in user_ids
+        for keyword in rng.sample(KEYWORD_POOL, keywords_per_user)
+    ]
+
+    if device_rows:
+        db.execute(insert(UserDevice), device_rows)
+    db.execute(insert(UserKeyword), keyword_rows)
+    db.commit()
+
+
+def build_deals(count: int, run_id: str, rng: random.Random) -> List[Dict[str, Any]]:
+    """Generate synthetic deal dictionaries mentioning one or two pool keywords."""
+    deals = []
+    for k in range(count):
+        keywords = rng.sample(KEYWORD_POOL, rng.choice([1, 2]))
+        price = rng.randrange(10_000, 2_000_000, 1_000)
+        deals.append({
+            "external_id": f"{LOADTEST_PREFIX}-{run_id}-{k}",
+            "url": f"https://example.com/{LOADTEST_PREFIX}/{run_id}/{k}",
+            "title": f"[테스트몰] {' '.join(keywords)} 특가 ({price:,}원/무료)",
+            "price": price,
+            "mall_name": "테스트몰",
+            "upvotes": rng.randint(0, 50),
+            "downvotes": 0,
+            "comment_count": rng.randint(0, 20),
+            "view_count": rng.randint(0, 5000),
+            "published_at": datetime.utcnow(),
+        })
+    return deals
+
+
+def wait_for_delivery(db, deal_ids: List[int], timeout: float) -> int:
+    """Wait until no outbox row for the given deals is pending; return pending count."""
+    deadline = time.monotonic() + timeout
+    while True:
+        pending = db.query(func.count(NotificationOutbox.id)).filter(
+            NotificationOutbox.deal_id.in_(deal_ids),
+            NotificationOutbox.status == OutboxStatus.PENDING
+        ).scalar()
+        db.rollback()  # fresh snapshot on the next poll
+        if not pending or time.monotonic() >= deadline:
+            return pending
+        time.sleep(0.5)
+
+
+def cleanup(db) -> None:
+    """Delete load-test users (cascades devices, keywords, notifications) and deals."""
+    deal_ids = [
+        row.id for row in db.query(Deal.id).filter(Deal.external_id.like(f"{LOADTEST_PREFIX}-%")).all()
+    ]
+    if deal_ids:
+        db.query(NotificationOutbox).filter(
+            NotificationOutbox.deal_id.in_(deal_ids)
+        ).delete(synchronize_session=False)
+        db.query(Deal).filter(Deal.id.in_(deal_ids)).delete(synchronize_session=False)
+    db.query(User).filter(
+        User.auth_provider_id.like(f"{LOADTEST_PREFIX}-%")
+    ).delete(synchronize_session=False)
+    db.commit()
+
+
+def main():
+    """Main entry point for the fan-out load test."""
+    parser = argparse.ArgumentParser(description="Notification fan-out load test")
+    parser.add_argument("--users", type=int, default=1000, help="Users to seed (default: 1000)")
+    parser.add_argument("--devices-per-user", type=int, default=1, help="Devices per user (default: 1)")
+    parser.add_argument("--keywords-per-user", type=int, default=3, help="Keywords per user (default: 3)")
+    parser.add_argument("--deals", type=int, default=20, help="Synthetic deals to crawl (default: 20)")
+    parser.add_argument("--mode", choices=["eager", "broker"], default="eager", help="Task execution mode")
+    parser.add_argument("--fcm-port", type=int, default=8765, help="Mock FCM server port (default: 8765)")
+    parser.add_argument("--fcm-latency-ms", type=int, default=0, help="Mock FCM response latency")
+    parser.add_argument("--timeout", type=float, default=120.0, help="Seconds to wait for delivery (broker mode)")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed")
+    parser.add_argument("--keep", action="store_true", help="Keep load-test data afterwards")
+
+    args = parser.parse_args()
+    rng = random.Random(args.seed)
+    run_id = datetime.utcnow().strftime("%Y%m%d%H%M%S")
+
+    print("=" * 60)
+    print("📣 Notification Fan-out Load Test")
+    print("=" * 60)
+    print(f"Users: {args.users} × {args.devices_per_user} devices, {args.keywords_per_user} keywords each")
+    print(f"Deals: {args.deals}")
+    print(f"Mode: {args.mode}")
+    print("=" * 60)
+
+    fcm = MockFCMServer(args.fcm_port, args.fcm_latency_ms)
+    fcm.start()
+    settings.FCM_SERVER_KEY = settings.FCM_SERVER_KEY or LOADTEST_PREFIX
+    settings.FCM_SEND_URL = fcm.url
+    celery_app.conf.task_always_eager = args.mode == "eager"
+
+    db = SessionLocal()
+
+    try:
+        cleanup(db)
+
+        print("🌱 Seeding users...")
+        seed_users(db, args.users, args.devices_per_user, args.keywords_per_user, rng)
+
+        crawler = SyntheticCrawler(db, build_deals(args.deals, run_id, rng))
+        queries = QueryCounter()
+
+        print("🕷️  Running synthetic crawl...")
+        started = time.monotonic()
+        result = _run_crawler_task(None, crawler, SessionLocal(), max_pages=1)
+        crawl_done = time.monotonic()
+
+        deal_ids = [
+            row.id for row in db.query(Deal.id).filter(
+                Deal.external_id.like(f"{LOADTEST_PREFIX}-{run_id}-%")
+            ).all()
+        ]
+        pending = wait_for_delivery(db, deal_ids, args.timeout if args.mode == "broker" else 0)
+        finished = time.monotonic()
+        queries.close()
+
+        delivered = db.query(func.count(NotificationOutbox.id)).filter(
+            NotificationOutbox.deal_id.in_(deal_ids),
+            NotificationOutbox.status == OutboxStatus.DELIVERED
+        ).scalar()
+
+        elapsed = (fcm.last_at or finished) - started
+        stats = result["stats"]
+
+        print()
+        print("=" * 60)
+        print("📊 Load Test Results")
+        print("=" * 60)
+        print(f"New deals: {stats['new_created']}")
+        print(f"Matched users: {stats.get('matched_users', 0)}")
+        print(f"Notifications queued: {stats.get('notifications_queued', 0)}")
+        print(f"Notifications delivered: {delivered} ({pending} still pending)")
+        print(f"FCM requests: {fcm.requests} ({fcm.tokens} tokens)")
+        print(f"Crawl + match time: {crawl_done - started:.2f}s")
+        if fcm.first_at is not None:
+            print(f"Time to first push: {fcm.first_at - started:.2f}s")
+            print(f"Time to last push: {fcm.last_at - started:.2f}s")
+        print(f"Notifications/sec: {delivered / elapsed if elapsed > 0 else 0:.1f}")
+        print(f"DB queries: {queries.count} ({queries.count / delivered if delivered else 0:.2f} per notification)")
+        print("=" * 60)
+
+    except Exception as e:
+        print(f"\n❌ Error: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
+    finally:
+        if not args.keep:
+            db.rollback()
+            cleanup(db)
+        db.close()
+        fcm.stop()
+
+
+if __name__ == "__main__":
+    main()
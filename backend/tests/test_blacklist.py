@@ -0,0 +1,129 @@
+"""
+Tests for compiled blacklist rules and the keyword trie pattern.
+"""
+import re
+
+import pytest
+
+from app.models.blacklist import Blacklist
+from app.models.deal import Deal
+from app.services.blacklist import BlacklistEngine, BlacklistRules
+from app.utils.keyword_pattern import keyword_pattern
+
+
+def rule(rule_id, pattern, pattern_type="keyword", target_field="title", reason=None):
+    return Blacklist(
+        id=rule_id, pattern=pattern, pattern_type=pattern_type,
+        target_field=target_field, reason=reason, is_active=True
+    )
+
+
+@pytest.fixture
+def rules():
+    return BlacklistRules("v1", [
+        rule(1, "광고", reason="advertising"),
+        rule(2, "광고대행"),
+        rule(3, "  Casino "),
+        rule(4, r"(?:카톡|텔레)\s*[:：]?\s*[a-z0-9_]{4,}", "regex", "content", reason="contact spam"),
+        rule(5, r"(\w)\1{5,}", "regex", "content"),
+        rule(6, "spam_bot", target_field="author"),
+    ])
+
+
+@pytest.mark.parametrize("keywords, text, expected", [
+    (["광고", "광고대행", "casino"], "이건 광고대행 글", "광고대행"),
+    (["광고", "광고대행", "casino"], "이건 광고 글", "광고"),
+    (["ab", "abc", "abd"], "xxabdxx", "abd"),
+    (["a.b", "c+"], "a.b", "a.b"),
+])
+def test_keyword_pattern_matches_whole_keywords_longest_first(keywords, text, expected):
+    assert re.search(keyword_pattern(keywords), text).group(0) == expected
+
+
+def test_keyword_pattern_escapes_regex_syntax():
+    pattern = re.compile(keyword_pattern(["a.b", "c+"]))
+
+    assert pattern.search("axb") is None
+    assert pattern.search("cc") is None
+
+
+def test_keyword_pattern_without_keywords():
+    assert keyword_pattern([]) == ""
+
+
+def test_keyword_rule_matches_case_insensitively(rules):
+    found = rules.match({"title": "CASINO 무료 쿠폰"})
+
+    assert (found.rule_id, found.field) == (3, "title")
+
+
+def test_longest_keyword_wins(rules):
+    assert rules.match({"title": "광고대행 문의"}).rule_id == 2
+    assert rules.match({"title": "광고 문의"}).rule_id == 1
+
+
+def test_rules_only_apply_to_their_field(rules):
+    assert rules.match({"content": "광고", "author": "casino"}) is None
+    assert rules.match({"author": "spam_bot"}).rule_id == 6
+
+
+def test_regex_rule(rules):
+    found = rules.match({"title": "에어팟 특가", "content": "문의는 카톡: deal_seller"})
+
+    assert (found.rule_id, found.field) == (4, "content")
+    assert found.block_reason == "blacklist #4: contact spam"
+
+
+def test_regex_rule_with_backreference(rules):
+    assert rules.match({"content": "최저가ㅋㅋㅋㅋㅋㅋ"}).rule_id == 5
+
+
+def test_clean_deal(rules):
+    assert rules.match({"title": "삼성 갤럭시 버즈2 프로", "content": "쿠팡 최저가", "author": None}) is None
+
+
+def test_invalid_and_unknown_rules_are_skipped():
+    compiled = BlacklistRules("v1", [
+        rule(1, "(unclosed", "regex"),
+        rule(2, "광고", target_field="mall_name"),
+        rule(3, "광고", pattern_type="glob"),
+        rule(4, "   "),
+        rule(5, "스팸"),
+    ])
+
+    assert compiled.rule_count == 1
+    assert compiled.match({"title": "광고 스팸"}).rule_id == 5
+
+
+def test_block_reason_is_truncated():
+    long_reason = BlacklistRules("v1", [rule(1, "광고", reason="x" * 300)]).match({"title": "광고"})
+
+    assert len(long_reason.block_reason) == 255
+
+
+def test_apply_blocks_and_unblocks_engine_blocked_deals(rules, monkeypatch):
+    monkeypatch.setattr(BlacklistEngine, "get", staticmethod(lambda db: rules))
+    deal = Deal(title="광고 문의", is_blocked=False)
+
+    assert BlacklistEngine.apply(None, deal) is True
+    assert (deal.is_blocked, deal.block_reason) == (True, "blacklist #1: advertising")
+
+    deal.title = "광고대행 문의"
+    assert BlacklistEngine.apply(None, deal) is False
+    assert deal.block_reason == "blacklist #2"
+
+    deal.title = "삼성 갤럭시 버즈2"
+    assert BlacklistEngine.apply(None, deal) is True
+    assert (deal.is_blocked, deal.block_reason) == (False, None)
+
+
+def test_apply_leaves_deals_blocked_for_other_reasons(rules, monkeypatch):
+    monkeypatch.setattr(BlacklistEngine, "get", staticmethod(lambda db: rules))
+    deal = Deal(title="광고 문의", is_blocked=True, block_reason="manual: reported")
+
+    assert BlacklistEngine.apply(None, deal) is False
+    assert deal.block_reason == "manual: reported"
+
+    deal.title = "삼성 갤럭시 버즈2"
+    assert BlacklistEngine.apply(None, deal) is False
+    assert deal.is_blocked
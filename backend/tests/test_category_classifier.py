@@ -0,0 +1,88 @@
+"""
+Tests for the rule-based category classifier.
+"""
+from types import SimpleNamespace
+
+import pytest
+
+from app.services.category_classifier import CATEGORY_KEYWORDS, CategoryClassifier
+from app.services.reference_cache import ReferenceCache
+
+
+classify_slug = CategoryClassifier.classify_slug
+
+
+def test_every_keyword_belongs_to_one_category():
+    keywords = [keyword for keywords in CATEGORY_KEYWORDS.values() for keyword in keywords]
+
+    assert len(keywords) == len(set(keywords))
+
+
+@pytest.mark.parametrize("title, expected", [
+    ("LG 울트라기어 게이밍 모니터 27인치", "digital"),
+    ("농심 신라면 40개입", "food"),
+    ("다이슨 무선 청소기 V15", "electronics"),
+])
+def test_single_category_titles(title, expected):
+    assert classify_slug(title) == expected
+
+
+def test_no_keyword_stays_uncategorized():
+    assert classify_slug("오늘의 특가 모음") is None
+    assert classify_slug(None) is None
+
+
+def test_tie_goes_to_the_keyword_found_later():
+    # Korean titles end with the head noun
+    assert classify_slug("캠핑 의자") == "furniture"
+    assert classify_slug("의자 캠핑") == "sports"
+
+
+def test_higher_score_beats_a_later_keyword():
+    assert classify_slug("캠핑 텐트 의자") == "sports"
+
+
+def test_repeated_keyword_counts_once():
+    # 의자 scores once (first position), so 캠핑 wins the tie by position
+    assert classify_slug("의자 의자 캠핑") == "sports"
+
+
+def test_product_name_is_scanned_after_the_title():
+    assert classify_slug("오늘의 특가", "삼성 오디세이 모니터") == "digital"
+    assert classify_slug("캠핑용품", "접이식 의자") == "furniture"
+
+
+def test_longer_keyword_wins_over_one_inside_it():
+    assert classify_slug("빙그레 아이스크림 24개") == "food"
+    assert classify_slug("로지텍 무선 키보드") == "digital"
+
+
+def test_board_hint_outweighs_one_keyword():
+    assert classify_slug("캠핑 의자", board_category="[등산/캠핑]") == "sports"
+    assert classify_slug("게이밍 의자", board_category="[컴퓨터]") == "digital"
+
+
+def test_board_hint_alone():
+    assert classify_slug("오늘의 특가 모음", board_category="[가전/가구]") == "electronics"
+
+
+def test_board_hint_tie_goes_to_keywords_in_the_title():
+    # furniture (hint only) and sports (two keywords) both score 2
+    assert classify_slug("캠핑 텐트", board_category="[가구]") == "sports"
+
+
+def test_unknown_board_label_is_ignored():
+    assert classify_slug("캠핑 의자", board_category="[기타]") == "furniture"
+
+
+def test_classify_maps_slug_to_active_category(monkeypatch):
+    categories = {
+        "furniture": SimpleNamespace(id=9, is_active=True),
+        "sports": SimpleNamespace(id=8, is_active=False),
+    }
+    monkeypatch.setattr(ReferenceCache, "get_category_by_slug", staticmethod(lambda db, slug: categories.get(slug)))
+
+    assert CategoryClassifier.classify(None, "캠핑 의자") == 9
+    assert CategoryClassifier.classify(None, "의자 캠핑") is None  # inactive
+    assert CategoryClassifier.classify(None, "농심 신라면") is None  # missing
+    assert CategoryClassifier.classify(None, "오늘의 특가") is None
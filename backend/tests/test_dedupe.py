@@ -0,0 +1,126 @@
+"""
+Tests for near-duplicate deal signatures.
+"""
+import pytest
+
+from app.config import settings
+from app.models.deal import Deal
+from app.services.dedupe import DealSignature, _band_keys, _prices_match, normalize_mall, normalize_title
+
+
+def signature(title, price=129000, mall_name="쿠팡", deal_id=1):
+    return DealSignature.of(Deal(id=deal_id, title=title, price=price, mall_name=mall_name))
+
+
+def test_normalize_title_drops_tags_prices_and_shipping_words():
+    assert normalize_title("[쿠팡] 삼성 갤럭시 버즈2 (129,000원/무료배송)") == [
+        "삼성", "갤럭", "럭시", "버즈", "2"
+    ]
+
+
+def test_normalize_title_ignores_case_and_mall_tags():
+    assert normalize_title("Apple 에어팟 프로 2세대") == normalize_title("[11번가] apple 에어팟 프로 2세대")
+
+
+def test_normalize_mall():
+    assert normalize_mall(" G마켓 ") == "g마켓"
+    assert normalize_mall(None) == ""
+
+
+def test_titles_too_short_have_no_signature():
+    assert signature("[쿠팡] 아이폰 (990,000원)") is None
+
+
+def test_signature_round_trip():
+    original = signature("삼성 갤럭시 버즈2 프로 무선이어폰", deal_id=7)
+    loaded = DealSignature.loads(7, original.dumps())
+
+    assert (loaded.canonical_id, loaded.values, loaded.price, loaded.mall, loaded.size) == (
+        7, original.values, 129000, "쿠팡", original.size
+    )
+
+
+def test_signature_without_token_count_still_loads():
+    original = signature("삼성 갤럭시 버즈2 프로 무선이어폰", deal_id=7)
+    canonical_id, price, mall, _, values = original.dumps().split("|")
+    loaded = DealSignature.loads(7, "|".join([canonical_id, price, mall, values]))
+
+    assert loaded.size is None
+    assert loaded.containment(original) == loaded.similarity(original)
+
+
+def test_identical_titles_are_similar():
+    a = signature("[쿠팡] 삼성 갤럭시 버즈2 프로 (129,000원)")
+    b = signature("삼성 갤럭시 버즈2 프로 129,000원 무배")
+
+    assert a.similarity(b) == 1.0
+    assert a.matches(b)
+
+
+def test_unrelated_titles_do_not_match():
+    a = signature("삼성 갤럭시 버즈2 프로")
+    b = signature("다이슨 무선 청소기 v15")
+
+    assert a.similarity(b) < 0.2
+    assert not a.matches(b)
+
+
+def test_title_with_extra_words_matches_on_containment():
+    a = signature("[쿠팡] 삼성 갤럭시 버즈2 프로 무선이어폰 (129,000원/무료배송)")
+    b = signature("[쿠팡] 삼성 갤럭시 버즈2 프로 (129,000원)", mall_name=None)
+
+    assert a.similarity(b) < settings.DEDUPE_MIN_SIMILARITY
+    assert a.containment(b) >= settings.DEDUPE_MIN_CONTAINMENT
+    assert a.matches(b) and b.matches(a)
+
+
+def test_containment_needs_both_prices():
+    a = signature("삼성 갤럭시 버즈2 프로 무선이어폰")
+    b = signature("삼성 갤럭시 버즈2 프로", price=None)
+
+    assert a.similarity(b) < settings.DEDUPE_MIN_SIMILARITY
+    assert not a.matches(b)
+
+
+def test_different_prices_do_not_match():
+    a = signature("삼성 갤럭시 버즈2 프로", price=129000)
+    b = signature("삼성 갤럭시 버즈2 프로", price=159000)
+
+    assert not a.matches(b)
+
+
+def test_different_known_malls_do_not_match():
+    a = signature("삼성 갤럭시 버즈2 프로", mall_name="쿠팡")
+    b = signature("삼성 갤럭시 버즈2 프로", mall_name="11번가")
+
+    assert not a.matches(b)
+    assert a.matches(signature("삼성 갤럭시 버즈2 프로", mall_name=None))
+
+
+@pytest.mark.parametrize("price, other, expected", [
+    (100000, 103000, True),
+    (100000, 97000, True),
+    (100000, 104000, False),
+    (None, 100000, True),
+    (100000, 0, True),
+])
+def test_price_tolerance(price, other, expected):
+    assert _prices_match(price, other) is expected
+
+
+def test_band_keys():
+    values = signature("삼성 갤럭시 버즈2 프로").values
+    keys = _band_keys(values)
+    rows = settings.DEDUPE_BAND_ROWS
+
+    assert len(values) == settings.DEDUPE_BANDS * rows
+    assert len(set(keys)) == settings.DEDUPE_BANDS
+    assert keys[0] == "dedupe:band:0:" + "".join(f"{value:04x}" for value in values[:rows])
+    assert keys[-1].startswith(f"dedupe:band:{settings.DEDUPE_BANDS - 1}:")
+
+
+def test_identical_titles_share_every_band():
+    a = signature("[쿠팡] 삼성 갤럭시 버즈2 프로")
+    b = signature("삼성 갤럭시 버즈2 프로 (무료배송)", price=None)
+
+    assert _band_keys(a.values) == _band_keys(b.values)
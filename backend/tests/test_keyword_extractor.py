@@ -0,0 +1,54 @@
+"""
+Tests for saving extracted deal keywords.
+"""
+import pytest
+
+from app.models.deal import Deal
+from app.services.autocomplete import AutocompleteService
+from app.services.keyword_extractor import KeywordExtractor
+
+
+class FakeSession:
+    def __init__(self):
+        self.added = []
+
+    def query(self, model):
+        return self
+
+    def filter_by(self, **kwargs):
+        return self
+
+    def delete(self):
+        return 0
+
+    def add(self, row):
+        self.added.append(row)
+
+    def commit(self):
+        pass
+
+
+@pytest.fixture
+def autocomplete_terms(monkeypatch):
+    terms = []
+    monkeypatch.setattr(AutocompleteService, "add_terms", staticmethod(terms.append))
+    return terms
+
+
+def test_keywords_are_added_to_autocomplete(autocomplete_terms):
+    db = FakeSession()
+    deal = Deal(id=1, title="다이슨 무선청소기 특가", is_blocked=False)
+
+    count = KeywordExtractor.extract_and_save(db, deal)
+
+    assert count == len(db.added) > 0
+    assert autocomplete_terms == [{row.keyword.lower(): 1 for row in db.added}]
+
+
+def test_blocked_deal_keywords_stay_out_of_autocomplete(autocomplete_terms):
+    db = FakeSession()
+    deal = Deal(id=1, title="카지노 광고대행 문의", is_blocked=True)
+
+    assert KeywordExtractor.extract_and_save(db, deal) > 0
+    assert db.added
+    assert autocomplete_terms == []
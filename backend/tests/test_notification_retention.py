@@ -0,0 +1,64 @@
+"""
+Tests for dropping retired notification partitions.
+
+Runs against DATABASE_URL on temporary tables (they shadow the real ones for
+this connection) and is skipped when the database is unreachable.
+"""
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.services.notification_retention import NotificationRetentionService
+
+
+PARTITION = "notifications_2000_01"
+
+
+@pytest.fixture
+def db():
+    engine = create_engine(settings.DATABASE_URL)
+    try:
+        connection = engine.connect()
+    except OperationalError:
+        engine.dispose()
+        pytest.skip("database is not available")
+
+    session = Session(bind=connection)
+    session.execute(text("CREATE TEMP TABLE users (id INTEGER PRIMARY KEY, unread_notification_count INTEGER)"))
+    session.execute(text("CREATE TEMP TABLE notification_outbox (notification_id INTEGER)"))
+    session.execute(text(
+        f'CREATE TEMP TABLE "{PARTITION}" (id INTEGER, user_id INTEGER, status VARCHAR, read_at TIMESTAMP)'
+    ))
+    try:
+        yield session
+    finally:
+        session.rollback()
+        session.close()
+        connection.close()
+        engine.dispose()
+
+
+def test_prune_partition_counts_every_unread_status(db):
+    db.execute(text("INSERT INTO users VALUES (1, 6), (2, 1)"))
+    db.execute(text(
+        f"""
+        INSERT INTO "{PARTITION}" VALUES
+            (1, 1, 'PENDING', NULL),
+            (2, 1, 'FAILED', NULL),
+            (3, 1, 'SENT', NULL),
+            (4, 1, 'DELIVERED', NULL),
+            (5, 1, 'CLICKED', NOW()),
+            (6, 2, 'FAILED', NULL),
+            (7, 2, 'PENDING', NULL)
+        """
+    ))
+    db.execute(text("INSERT INTO notification_outbox VALUES (1), (6), (99)"))
+
+    NotificationRetentionService.prune_partition(db, PARTITION)
+
+    counts = dict(db.execute(text("SELECT id, unread_notification_count FROM users")).all())
+    assert counts == {1: 2, 2: 0}
+    assert db.execute(text("SELECT notification_id FROM notification_outbox")).scalars().all() == [99]
+    assert db.execute(text("SELECT to_regclass(:name)"), {"name": PARTITION}).scalar() is None
@@ -0,0 +1,116 @@
+"""
+Tests for keyset (cursor) pagination helpers.
+"""
+import base64
+import json
+from datetime import datetime
+
+import pytest
+from sqlalchemy import DateTime, Integer, column, table
+from sqlalchemy.dialects import postgresql
+
+from app.utils.pagination import (
+    InvalidCursorError,
+    decode_cursor,
+    encode_cursor,
+    keyset_filter,
+    keyset_order_by,
+)
+
+
+deals = table(
+    "deals",
+    column("id", Integer),
+    column("price", Integer),
+    column("published_at", DateTime),
+)
+
+
+def compile_sql(clause) -> str:
+    return str(clause.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}))
+
+
+@pytest.mark.parametrize("order", ["asc", "desc"])
+def test_cursor_round_trip(order):
+    cursor = encode_cursor("price", order, 12900, 42)
+
+    assert "=" not in cursor
+    assert decode_cursor(cursor, "price", order) == (12900, 42)
+
+
+def test_cursor_restores_datetime_for_datetime_columns():
+    published_at = datetime(2026, 10, 19, 8, 30, 15, 123456)
+    cursor = encode_cursor("published_at", "desc", published_at, 7)
+
+    assert decode_cursor(cursor, "published_at", "desc", deals.c.published_at) == (published_at, 7)
+    # Without the column the ISO string is returned as-is
+    assert decode_cursor(cursor, "published_at", "desc") == (published_at.isoformat(), 7)
+
+
+def test_cursor_with_null_sort_value():
+    cursor = encode_cursor("published_at", "asc", None, 3)
+
+    assert decode_cursor(cursor, "published_at", "asc", deals.c.published_at) == (None, 3)
+
+
+@pytest.mark.parametrize("sort_by, order", [("published_at", "desc"), ("price", "asc")])
+def test_cursor_from_another_ordering_is_rejected(sort_by, order):
+    cursor = encode_cursor("price", "desc", 12900, 42)
+
+    with pytest.raises(InvalidCursorError):
+        decode_cursor(cursor, sort_by, order)
+
+
+@pytest.mark.parametrize("cursor", [
+    "not a cursor",
+    "eyJzIjoicHJpY2Ui",  # truncated JSON
+    base64.urlsafe_b64encode(b'{"s":"price","o":"desc","v":1}').decode(),  # no id
+    base64.urlsafe_b64encode(b'{"s":"price","o":"desc","v":1,"id":"x"}').decode(),
+])
+def test_malformed_cursor_is_rejected(cursor):
+    with pytest.raises(InvalidCursorError):
+        decode_cursor(cursor, "price", "desc")
+
+
+def test_tampered_datetime_value_is_rejected():
+    payload = json.dumps({"s": "published_at", "o": "desc", "v": "yesterday", "id": 1})
+    cursor = base64.urlsafe_b64encode(payload.encode()).decode()
+
+    with pytest.raises(InvalidCursorError):
+        decode_cursor(cursor, "published_at", "desc", deals.c.published_at)
+
+
+def test_keyset_filter_desc():
+    sql = compile_sql(keyset_filter(deals.c.price, deals.c.id, "desc", 12900, 42))
+
+    assert sql == "(deals.price, deals.id) < (12900, 42)"
+
+
+def test_keyset_filter_desc_after_null_moves_to_non_null_rows():
+    # NULLs come first when descending: after the last NULL row come the
+    # remaining NULL rows with smaller ids, then every non-NULL row
+    sql = compile_sql(keyset_filter(deals.c.price, deals.c.id, "desc", None, 42))
+
+    assert sql == "deals.price IS NULL AND deals.id < 42 OR deals.price IS NOT NULL"
+
+
+def test_keyset_filter_asc_includes_trailing_nulls():
+    sql = compile_sql(keyset_filter(deals.c.price, deals.c.id, "asc", 12900, 42))
+
+    assert sql == "(deals.price, deals.id) > (12900, 42) OR deals.price IS NULL"
+
+
+def test_keyset_filter_asc_after_null_stays_in_null_rows():
+    sql = compile_sql(keyset_filter(deals.c.price, deals.c.id, "asc", None, 42))
+
+    assert sql == "deals.price IS NULL AND deals.id > 42"
+
+
+@pytest.mark.parametrize("order, expected", [
+    ("asc", ["deals.price ASC", "deals.id ASC"]),
+    ("desc", ["deals.price DESC", "deals.id DESC"]),
+])
+def test_keyset_order_by(order, expected):
+    clauses = keyset_order_by(deals.c.price, deals.c.id, order)
+
+    assert [compile_sql(clause) for clause in clauses] == expected
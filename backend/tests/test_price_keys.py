@@ -0,0 +1,46 @@
+"""
+Tests for product price index key normalization.
+"""
+import pytest
+
+from app.services.price import normalize_product_name, product_keys
+
+
+@pytest.mark.parametrize("name, expected", [
+    ("삼성 갤럭시 버즈2 프로", "삼성갤럭시버즈2프로"),
+    ("Apple AirPods Pro (2세대)", "appleairpodspro2세대"),
+    ("LG 그램 16\" 2024 / i7-1360P", "lg그램162024i71360p"),
+    ("  농심 신라면 120g x 40개  ", "농심신라면120gx40개"),
+])
+def test_normalize_product_name(name, expected):
+    assert normalize_product_name(name) == expected
+
+
+def test_spacing_case_and_punctuation_variants_share_a_name():
+    variants = ["Apple AirPods Pro 2", "apple airpods-pro 2", "[APPLE] AirPods Pro2!"]
+
+    assert len({normalize_product_name(name) for name in variants}) == 1
+
+
+@pytest.mark.parametrize("name", [None, "", "   ", "!!!", "TV", "라면 1"])
+def test_names_too_short_to_match_are_dropped(name):
+    assert normalize_product_name(name) is None
+
+
+def test_product_keys_most_specific_first():
+    assert product_keys("쿠팡", "7712345", "삼성 갤럭시 버즈2 프로") == [
+        "mall:쿠팡:7712345",
+        "name:삼성갤럭시버즈2프로",
+    ]
+
+
+def test_product_keys_without_mall_product_id():
+    assert product_keys("쿠팡", None, "삼성 갤럭시 버즈2 프로") == ["name:삼성갤럭시버즈2프로"]
+
+
+def test_product_keys_without_mall_name():
+    assert product_keys(None, "7712345", None) == ["mall::7712345"]
+
+
+def test_product_keys_with_nothing_to_match():
+    assert product_keys("쿠팡", "", "TV") == []
@@ -0,0 +1,61 @@
+"""
+Tests for the Korean-friendly search tokenizer.
+"""
+from sqlalchemy.dialects import postgresql
+
+from app.services.search import search_document, search_query_expression, tokenize_search_text
+
+
+def test_hangul_runs_become_bigrams_and_the_whole_word():
+    assert tokenize_search_text("아이폰") == ["아이", "이폰", "아이폰"]
+
+
+def test_query_tokens_leave_out_whole_words():
+    assert tokenize_search_text("아이폰", include_words=False) == ["아이", "이폰"]
+
+
+def test_query_bigrams_are_found_inside_longer_document_words():
+    document = set(tokenize_search_text("아이폰15를 싸게"))
+    query = tokenize_search_text("아이폰", include_words=False)
+
+    assert set(query) <= document
+
+
+def test_latin_and_digit_runs_are_kept_whole_and_lowercased():
+    assert tokenize_search_text("Galaxy S24 Ultra 512GB") == ["galaxy", "s24", "ultra", "512gb"]
+
+
+def test_mixed_script_runs_are_split_at_the_script_boundary():
+    assert tokenize_search_text("갤럭시S24") == ["갤럭", "럭시", "갤럭시", "s24"]
+
+
+def test_single_syllables_are_kept():
+    assert tokenize_search_text("새 책") == ["새", "책"]
+
+
+def test_punctuation_and_symbols_are_dropped():
+    assert tokenize_search_text("[쿠팡] 129,000원 / 무료배송!") == [
+        "쿠팡", "129", "000", "원", "무료", "료배", "배송", "무료배송"
+    ]
+
+
+def test_duplicates_are_removed_in_order_of_appearance():
+    assert tokenize_search_text("사과 사과 apple APPLE") == ["사과", "apple"]
+
+
+def test_empty_input():
+    assert tokenize_search_text(None) == []
+    assert tokenize_search_text("") == []
+    assert tokenize_search_text("!!! ---") == []
+
+
+def test_search_document_joins_title_and_product_name():
+    assert search_document("아이폰 15", "Apple iPhone") == "아이 이폰 아이폰 15 apple iphone"
+    assert search_document(None) == ""
+
+
+def test_search_query_expression():
+    compiled = search_query_expression("아이폰 케이스").compile(dialect=postgresql.dialect())
+
+    assert list(compiled.params.values()) == ["simple", "아이 & 이폰 & 케이 & 이스"]
+    assert search_query_expression("!!!") is None